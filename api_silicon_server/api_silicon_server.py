@@ -15,7 +15,7 @@ with intelligent fallbacks to ensure reliability across all deployment scenarios
 """
 
 from fastapi import FastAPI, HTTPException, UploadFile, File, Form, Request, Query
-from fastapi.responses import JSONResponse, FileResponse, HTMLResponse
+from fastapi.responses import JSONResponse, FileResponse, HTMLResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
@@ -45,7 +45,19 @@ try:
         MLX_LM_MODELS, MLX_WHISPER_MODELS, PERFORMANCE_MONITORING,
         get_mlx_status, should_use_mlx, get_model_path,
         OLLAMA_BASE_URL, DEFAULT_OLLAMA_MODEL, WHISPER_MODEL,
-        PIPER_BINARY, VOICES_DIR, DEFAULT_VOICE, MOCK_MLX_ERRORS
+        PIPER_BINARY, VOICES_DIR, DEFAULT_VOICE, MOCK_MLX_ERRORS,
+        PIPER_VOICE_POOL_SIZE, PIPER_VOICE_POOL_MEMORY_MB, PIPER_PREWARM_DEFAULT_VOICE,
+        ENABLE_STREAMING, FACULTY_EXECUTOR_WORKERS, FACULTY_QUEUE_DEPTH, UPSTREAM_CLIENTS,
+        LLM_RESPONSE_CACHE_ENABLED, LLM_RESPONSE_CACHE_DIR, LLM_RESPONSE_CACHE_TTL_HOURS, LLM_RESPONSE_CACHE_MB,
+        RESEARCH_LIBRARY_DIR, RESEARCH_LIBRARY_DB,
+        WORKFLOW_PROGRESS_RETENTION_MINUTES, WORKFLOW_PROGRESS_HEARTBEAT_SECONDS,
+        WORKFLOW_CHECKPOINT_DB, WORKFLOW_CHECKPOINT_RETENTION_DAYS,
+        WORKFLOW_CONTEXT_TOKEN_BUDGET, WORKFLOW_CONTEXT_PACKING_MODE, WORKFLOW_CONTEXT_MAP_REDUCE_THRESHOLD,
+        WHISPER_MAX_CACHED_MODELS, WHISPER_PIN_DEFAULT_MODEL,
+        MLX_MEMORY_LIMIT, MLX_LM_MAX_RESIDENT_MODELS,
+        MLX_LM_BATCHING, MLX_LM_BATCH_WINDOW_MS, MLX_LM_MAX_BATCH_SIZE, MLX_LM_BATCH_STEPS_PER_JOB,
+        MLX_PROMPT_CACHE_ENTRIES, MLX_PROMPT_CACHE_MB,
+        ALTERNATIVE_VOICES_DIRS, VOICE_CATALOG_REFRESH_SECONDS
     )
     CONFIG_AVAILABLE = True
 except ImportError:
@@ -97,6 +109,48 @@ except ImportError:
     MLX_VOICE_TRAINING_AVAILABLE = False
     print("❌ MLX Voice Training: Not available")
 
+# Piper Voice Pool (resident TTS voices) and indexed voice lookup
+from voice_pool import PiperVoicePool
+from voice_catalog import VoiceCatalog
+from audio_streaming import synthesize_wav_bytes, stream_wav
+
+# Faculty executors (blocking model work off the event loop)
+from faculty_executors import FacultyExecutors, FacultyBusyError
+
+# Pooled keep-alive HTTP clients for Ollama and Hugging Face
+from upstream_clients import UpstreamClients
+
+# Persistent cache of generated text for research workflows
+from llm_response_cache import LLMResponseCache, record_generation_model
+
+# Indexed research library (SQLite + FTS5)
+from research_library_store import ResearchLibraryStore
+
+# Live research workflow progress over Server-Sent Events
+from workflow_progress import WorkflowProgressHub, sse_progress_frame
+
+# Durable step checkpoints so interrupted research resumes instead of restarting
+from workflow_checkpoints import WorkflowCheckpointStore, ACTIVE_STATUSES
+
+# OpenAI Whisper model cache for the fallback transcription path
+from whisper_registry import WhisperModelRegistry
+
+# Multi-model MLX-LM residency
+from mlx_model_residency import MLXModelResidency, parse_memory_size
+
+# Continuous batching of concurrent MLX-LM prompts
+from mlx_batching import MLXBatchScheduler
+
+# Prefilled KV state for repeated system-prompt prefixes
+from mlx_prompt_cache import PromptPrefixCache
+
+# Token streaming (SSE framing, MLX and Ollama token sources)
+from llm_streaming import (
+    TokenStreamMetrics, sse_event, SSE_DONE, SSE_MEDIA_TYPE, SSE_HEADERS,
+    openai_chat_chunk, openai_completion_chunk, prefetch_first,
+    iter_mlx_tokens, iter_ollama_stream
+)
+
 # -------- COMPREHENSIVE LOGGING SETUP -------- #
 # Set up multiple log handlers for different purposes
 def setup_logging():
@@ -155,6 +209,12 @@ def setup_logging():
 # Initialize loggers
 logger, mlx_logger, perf_logger = setup_logging()
 
+# Per-faculty worker pools shared by the services and routes below
+faculty_executors = FacultyExecutors(
+    workers=FACULTY_EXECUTOR_WORKERS if CONFIG_AVAILABLE else None,
+    queue_depths=FACULTY_QUEUE_DEPTH if CONFIG_AVAILABLE else None
+)
+
 def log_event(message: str, logger_type: str = "main"):
     """Centralized logging function"""
     if logger_type == "mlx":
@@ -180,6 +240,51 @@ def log_mlx_operation(operation: str, model: str, success: bool, error: str = ""
         message += f" | Metrics: {metrics}"
     mlx_logger.info(message)
 
+# Process-wide OpenAI Whisper models, loaded once per size
+whisper_registry = WhisperModelRegistry(
+    max_models=WHISPER_MAX_CACHED_MODELS if CONFIG_AVAILABLE else 2,
+    perf_log=log_performance
+)
+
+# One pooled HTTP client per upstream service, shared by every route
+upstream_clients = UpstreamClients(
+    base_urls={
+        "ollama": OLLAMA_BASE_URL if CONFIG_AVAILABLE else "http://localhost:11434",
+        "huggingface": "https://huggingface.co"
+    },
+    settings=UPSTREAM_CLIENTS if CONFIG_AVAILABLE else None,
+    perf_log=log_performance
+)
+
+# Generated text keyed by (model, prompt, sampling params), kept across restarts
+llm_response_cache = LLMResponseCache(
+    cache_dir=LLM_RESPONSE_CACHE_DIR if CONFIG_AVAILABLE else "cache/llm_responses",
+    ttl_seconds=(LLM_RESPONSE_CACHE_TTL_HOURS if CONFIG_AVAILABLE else 168) * 3600,
+    max_bytes=int((LLM_RESPONSE_CACHE_MB if CONFIG_AVAILABLE else 256) * 1024 ** 2),
+    enabled=LLM_RESPONSE_CACHE_ENABLED if CONFIG_AVAILABLE else True
+)
+
+# Saved research, searchable and paginated without reading every item
+research_library = ResearchLibraryStore(
+    db_path=RESEARCH_LIBRARY_DB if CONFIG_AVAILABLE else "research_library/library.sqlite3",
+    legacy_dir=RESEARCH_LIBRARY_DIR if CONFIG_AVAILABLE else "research_library"
+)
+
+# Step events and results of running/recent research workflows, by execution id
+workflow_progress = WorkflowProgressHub(
+    retention_seconds=(WORKFLOW_PROGRESS_RETENTION_MINUTES if CONFIG_AVAILABLE else 60) * 60,
+    heartbeat_seconds=WORKFLOW_PROGRESS_HEARTBEAT_SECONDS if CONFIG_AVAILABLE else 15
+)
+
+# Research runs left unfinished by a previous process become resumable (flagged at startup)
+workflow_checkpoints = WorkflowCheckpointStore(
+    db_path=WORKFLOW_CHECKPOINT_DB if CONFIG_AVAILABLE else "workflow_checkpoints/checkpoints.sqlite3",
+    retention_days=WORKFLOW_CHECKPOINT_RETENTION_DAYS if CONFIG_AVAILABLE else 7
+)
+
+# Sampling used by _generate_with_fallback (part of the response cache key)
+FALLBACK_GENERATION_PARAMS = {"max_tokens": 512, "temperature": 0.7}
+
 # Log MLX status on startup
 if CONFIG_AVAILABLE:
     mlx_status = get_mlx_status()
@@ -312,39 +417,98 @@ class MLXLanguageModelService:
     """MLX-LM service wrapper with fallback support"""
     
     def __init__(self):
-        self.model = None
-        self.tokenizer = None
         self.current_model_name = None
         self.available = MLX_LM_AVAILABLE and should_use_mlx("lm") if CONFIG_AVAILABLE else False
+        self.prompt_cache = PromptPrefixCache(
+            max_entries=MLX_PROMPT_CACHE_ENTRIES if CONFIG_AVAILABLE else 16,
+            memory_budget_bytes=(MLX_PROMPT_CACHE_MB if CONFIG_AVAILABLE else 1024) * 1024 * 1024
+        )
+        self.residency = MLXModelResidency(
+            loader=lambda model_id: load(model_id),
+            max_models=MLX_LM_MAX_RESIDENT_MODELS if CONFIG_AVAILABLE else 2,
+            memory_budget_bytes=parse_memory_size(MLX_MEMORY_LIMIT) if CONFIG_AVAILABLE else None,
+            on_evict=self.prompt_cache.evict_model
+        )
+        self.batcher = MLXBatchScheduler(
+            faculty_executors["llm"],
+            window_ms=MLX_LM_BATCH_WINDOW_MS if CONFIG_AVAILABLE else 20,
+            max_batch_size=MLX_LM_MAX_BATCH_SIZE if CONFIG_AVAILABLE else 8,
+            max_steps_per_job=MLX_LM_BATCH_STEPS_PER_JOB if CONFIG_AVAILABLE else 32,
+            perf_log=log_performance
+        )
+        self.batching_enabled = self.batcher.available and (MLX_LM_BATCHING if CONFIG_AVAILABLE else True)
+    
+    @property
+    def model(self):
+        """Most recently used resident model (None when nothing is loaded)"""
+        entry = self.residency.peek(self.current_model_name)
+        return entry.model if entry else None
+    
+    @property
+    def tokenizer(self):
+        entry = self.residency.peek(self.current_model_name)
+        return entry.tokenizer if entry else None
+    
+    def resolve_model_name(self, model_name: str) -> str:
+        """Map a configured alias (default, small, code...) to its model id"""
+        return MLX_LM_MODELS.get(model_name, model_name) if CONFIG_AVAILABLE else model_name
         
     async def load_model(self, model_name: str = "default"):
-        """Load MLX-LM model with caching"""
+        """Make an MLX-LM model resident, reusing it if already loaded"""
         if not self.available:
             raise Exception("MLX-LM not available")
             
         try:
             # Use configured model name
-            actual_model = MLX_LM_MODELS.get(model_name, model_name) if CONFIG_AVAILABLE else model_name
+            actual_model = self.resolve_model_name(model_name)
             
-            if self.current_model_name != actual_model:
+            entry = self.residency.lookup(actual_model)
+            if entry is None:
                 log_mlx_operation("LOAD_MODEL", actual_model, False, "Starting load...")
                 start_time = time.time()
                 
-                self.model, self.tokenizer = load(actual_model)
-                self.current_model_name = actual_model
+                entry = await faculty_executors.run("llm", self.residency.load, actual_model)
                 
                 load_time = time.time() - start_time
                 log_mlx_operation("LOAD_MODEL", actual_model, True, metrics={"load_time": load_time})
-                
-            return True
+            
+            self.current_model_name = actual_model
+            return entry
         except Exception as e:
             log_mlx_operation("LOAD_MODEL", model_name, False, str(e))
             raise
     
-    async def generate(self, prompt: str, **kwargs):
-        """Generate text with MLX-LM"""
-        if not self.model or not self.tokenizer:
-            await self.load_model()
+    async def _resident(self, model_name: Optional[str] = None):
+        """Resident entry for model_name (or the most recent model, or default)"""
+        # One residency lookup per request, so hits and misses count each request once
+        return await self.load_model(model_name or self.current_model_name or "default")
+    
+    async def pin_model(self, model_name: str):
+        """Load a model and keep it resident until unpinned"""
+        if not self.available:
+            raise Exception("MLX-LM not available")
+        actual_model = self.resolve_model_name(model_name)
+        await faculty_executors.run("llm", self.residency.pin, actual_model)
+        log_mlx_operation("PIN_MODEL", actual_model, True)
+        return actual_model
+    
+    def unpin_model(self, model_name: str) -> bool:
+        return self.residency.unpin(self.resolve_model_name(model_name))
+    
+    def _prefixed_tokens(self, entry, prompt: str, prefix: Optional[str], max_tokens: int, temperature: float):
+        """Token stream that reuses a cached prefix KV state (runs on the llm faculty thread)"""
+        tokens, prompt_cache = self.prompt_cache.prepare(entry, prompt, prefix)
+        yield from iter_mlx_tokens(entry.model, entry.tokenizer, tokens, max_tokens=max_tokens,
+                                   temperature=temperature, prompt_cache=prompt_cache)
+    
+    async def generate(self, prompt: str, model_name: Optional[str] = None, prefix: Optional[str] = None, **kwargs):
+        """
+        Generate text with MLX-LM on the given (or most recent) resident model.
+        
+        prefix is the shared leading part of prompt (e.g. the formatted system
+        prompt); its prefilled KV state is cached and reused across requests.
+        """
+        entry = await self._resident(model_name)
             
         try:
             start_time = time.time()
@@ -353,11 +517,40 @@ class MLXLanguageModelService:
             max_tokens = kwargs.get("max_tokens", 512)
             temperature = kwargs.get("temperature", 0.7)
             
+            # Reuse a prefilled prefix when idle; under concurrent load batching wins.
+            # Short prefixes are never cached, so they always go to the batcher.
+            if self.prompt_cache.is_cacheable(entry, prefix) and (
+                    not self.batching_enabled or self.batcher.claim_solo()):
+                try:
+                    response = await faculty_executors.run(
+                        "llm",
+                        lambda: "".join(self._prefixed_tokens(entry, prompt, prefix, max_tokens, temperature))
+                    )
+                finally:
+                    if self.batching_enabled:
+                        self.batcher.release_solo()
+                
+                generation_time = time.time() - start_time
+                log_performance("MLX_LM_GENERATE", generation_time, True, 
+                              f"Tokens: {len(response.split())} | Model: {entry.model_id} | Prefix cache")
+                return response
+            
+            if self.batching_enabled:
+                # Concurrent callers for the same model share decode steps
+                response = await self.batcher.generate(entry, prompt, max_tokens=max_tokens, temperature=temperature)
+                
+                generation_time = time.time() - start_time
+                log_performance("MLX_LM_GENERATE", generation_time, True, 
+                              f"Tokens: {len(response.split())} | Model: {entry.model_id} | Batched")
+                return response
+            
             # Generate response using current MLX-LM API
             # Use the correct parameter names for current MLX-LM version
-            response = generate(
-                self.model, 
-                self.tokenizer, 
+            response = await faculty_executors.run(
+                "llm",
+                generate,
+                entry.model, 
+                entry.tokenizer, 
                 prompt=prompt,
                 max_tokens=max_tokens,
                 temperature=temperature,  # Current MLX-LM uses 'temperature'
@@ -366,13 +559,35 @@ class MLXLanguageModelService:
             
             generation_time = time.time() - start_time
             log_performance("MLX_LM_GENERATE", generation_time, True, 
-                          f"Tokens: {len(response.split())} | Model: {self.current_model_name}")
+                          f"Tokens: {len(response.split())} | Model: {entry.model_id}")
             
             return response
         except Exception as e:
             generation_time = time.time() - start_time
             log_performance("MLX_LM_GENERATE", generation_time, False, f"Error: {e}")
             raise
+    
+    async def stream(self, prompt: str, model_name: Optional[str] = None, prefix: Optional[str] = None, **kwargs):
+        """Stream text segments with MLX-LM stream_generate (prefix as in generate)"""
+        entry = await self._resident(model_name)
+        
+        max_tokens = kwargs.get("max_tokens", 512)
+        temperature = kwargs.get("temperature", 0.7)
+        
+        metrics = TokenStreamMetrics("MLX_LM_STREAM", entry.model_id, log_performance)
+        completed = False
+        try:
+            if prefix and self.prompt_cache.available:
+                tokens = self._prefixed_tokens(entry, prompt, prefix, max_tokens, temperature)
+            else:
+                tokens = iter_mlx_tokens(entry.model, entry.tokenizer, prompt,
+                                         max_tokens=max_tokens, temperature=temperature)
+            async for text in faculty_executors.stream("llm", tokens):
+                metrics.record(text)
+                yield text
+            completed = True
+        finally:
+            metrics.finish(completed, "" if completed else "Stream interrupted")
 
 
 class MLXWhisperService:
@@ -396,7 +611,7 @@ class MLXWhisperService:
                 log_mlx_operation("LOAD_WHISPER", actual_model, False, "Starting load...")
                 start_time = time.time()
                 
-                self.model = mlx_whisper.load_model(actual_model)
+                self.model = await faculty_executors.run("stt", mlx_whisper.load_model, actual_model)
                 self.current_model_name = actual_model
                 
                 load_time = time.time() - start_time
@@ -415,7 +630,7 @@ class MLXWhisperService:
         try:
             start_time = time.time()
             
-            result = self.model.transcribe(audio_path)
+            result = await faculty_executors.run("stt", self.model.transcribe, audio_path)
             transcript = result["text"] if isinstance(result, dict) else result
             
             transcription_time = time.time() - start_time
@@ -447,6 +662,7 @@ class CognitiveConfiguration:
     # Piper Configuration
     PIPER_BINARY = PIPER_BINARY if CONFIG_AVAILABLE else "piper"
     VOICES_DIR = VOICES_DIR if CONFIG_AVAILABLE else os.path.expanduser("~/piper/voices")
+    ALTERNATIVE_VOICES_DIRS = ALTERNATIVE_VOICES_DIRS if CONFIG_AVAILABLE else []
     DEFAULT_VOICE = DEFAULT_VOICE if CONFIG_AVAILABLE else "en_US-amy-medium"
     
     # AudioCraft Configuration (proxy to main server)
@@ -744,10 +960,49 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
             
             return response
         
+        # Executions a previous process left running are flagged once, before any request is served
+        @self.app.on_event("startup")
+        async def recover_workflow_checkpoints():
+            await asyncio.to_thread(workflow_checkpoints.mark_interrupted)
+            await asyncio.to_thread(workflow_checkpoints.prune)
+        
+        # Pooled upstream connections are closed with the app
+        @self.app.on_event("shutdown")
+        async def close_upstream_clients():
+            await upstream_clients.aclose()
+        
+        # Saturated faculties answer with 503 + Retry-After instead of queueing forever
+        @self.app.exception_handler(FacultyBusyError)
+        async def faculty_busy_handler(request: Request, exc: FacultyBusyError):
+            logger.warning(f"⏳ BACKPRESSURE | {request.url.path} | {exc}")
+            return JSONResponse(
+                status_code=503,
+                content={
+                    "status": "busy",
+                    "error": str(exc),
+                    "faculty": exc.faculty,
+                    "retry_after": exc.retry_after
+                },
+                headers={"Retry-After": str(exc.retry_after)}
+            )
+        
         # Initialize MLX services
         self.mlx_lm_service = MLXLanguageModelService()
         self.mlx_whisper_service = MLXWhisperService()
         
+        # Voice id -> model/config index shared by every voice lookup
+        self.voice_catalog = VoiceCatalog(
+            list(dict.fromkeys([CognitiveConfiguration.VOICES_DIR] + CognitiveConfiguration.ALTERNATIVE_VOICES_DIRS)),
+            refresh_interval=VOICE_CATALOG_REFRESH_SECONDS if CONFIG_AVAILABLE else 2.0
+        )
+        
+        # Resident Piper voices shared by /tts, /chat and /speech/speak
+        self.voice_pool = PiperVoicePool(
+            max_voices=PIPER_VOICE_POOL_SIZE if CONFIG_AVAILABLE else 4,
+            memory_budget_mb=PIPER_VOICE_POOL_MEMORY_MB if CONFIG_AVAILABLE else 512,
+            piper_binary=CognitiveConfiguration.PIPER_BINARY
+        )
+        
         # Cognitive state tracking with MLX metrics
         self.synthesis_sessions = {}
         self.cognitive_metrics = {
@@ -795,9 +1050,33 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
         log_event(f"   • Piper: {'✅ Available' if self.piper_available else '❌ Unavailable'}")
         log_event(f"   • AudioCraft: {'✅ Available' if self.audiocraft_available else '❌ Unavailable'}")
         
+        # Pre-warm the default voice in the background so startup is not delayed
+        self.voice_pool.piper_binary = CognitiveConfiguration.PIPER_BINARY
+        if self.piper_available and (PIPER_PREWARM_DEFAULT_VOICE if CONFIG_AVAILABLE else True):
+            threading.Thread(target=self._prewarm_default_voice, daemon=True).start()
+        
+        # Pin the default Whisper size when OpenAI Whisper is the primary recognizer
+        # (with MLX-Whisper present the fallback loads lazily on first failure)
+        if self.whisper_available and not self.mlx_whisper_available and (WHISPER_PIN_DEFAULT_MODEL if CONFIG_AVAILABLE else True):
+            threading.Thread(
+                target=whisper_registry.pin, args=(CognitiveConfiguration.WHISPER_MODEL,), daemon=True
+            ).start()
+        
         print("✨ MLX-accelerated cognitive faculties initialized")
     
     
+    def _prewarm_default_voice(self):
+        """Load DEFAULT_VOICE into the voice pool ahead of the first TTS request"""
+        voice = CognitiveConfiguration.DEFAULT_VOICE
+        voice_model_path = self._find_voice_model(voice)
+        voice_config_path = self._find_voice_config(voice)
+        
+        if voice_model_path and voice_config_path:
+            start_time = time.time()
+            success = self.voice_pool.prewarm(voice, voice_model_path, voice_config_path)
+            log_performance("PIPER_VOICE_PREWARM", time.time() - start_time, success, f"Voice: {voice}")
+    
+    
     def _test_mlx_lm_availability(self):
         """Test MLX-LM service availability"""
         try:
@@ -906,18 +1185,12 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
             print(f"❌ Piper: Voices directory not found at {voices_dir}")
             return False
         
-        voice_files = list(voices_dir.glob("*.onnx"))
-        if len(voice_files) == 0:
-            # Also check subdirectories
-            for subdir in voices_dir.iterdir():
-                if subdir.is_dir():
-                    voice_files.extend(subdir.glob("*.onnx"))
-        
-        if len(voice_files) == 0:
+        voice_count = len(self.voice_catalog)
+        if voice_count == 0:
             print("❌ Piper: No voice models found")
             return False
         
-        print(f"✅ Piper: Found {len(voice_files)} voice models")
+        print(f"✅ Piper: Found {voice_count} voice models")
         
         # Try to detect Piper binary locations but with timeout protection
         detected_binary = CognitiveConfiguration.detect_piper_binary()
@@ -950,7 +1223,7 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
         except ImportError:
             print("⚠️  Piper: No binary or Python module, but voice files exist")
             # Still return True if we have voice files - we'll handle errors in TTS
-            return len(voice_files) > 0
+            return voice_count > 0
     
     
     def _test_audiocraft_availability(self):
@@ -1014,6 +1287,18 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                     "piper_fallback": FALLBACK_TO_PIPER if CONFIG_AVAILABLE else True
                 },
                 "metrics": self.cognitive_metrics,
+                "voice_pool": self.voice_pool.get_status(),
+                "voice_catalog": self.voice_catalog.get_status(),
+                "faculty_executors": faculty_executors.get_status(),
+                "upstream_clients": upstream_clients.get_status(),
+                "whisper_models": whisper_registry.get_status(),
+                "mlx_lm_residency": self.mlx_lm_service.residency.get_status(),
+                "mlx_lm_batching": self.mlx_lm_service.batcher.get_status(),
+                "mlx_prompt_cache": self.mlx_lm_service.prompt_cache.get_status(),
+                "llm_response_cache": llm_response_cache.get_status(),
+                "research_library": research_library.get_status(),
+                "workflow_progress": workflow_progress.get_status(),
+                "workflow_checkpoints": workflow_checkpoints.get_status(),
                 "active_sessions": len(self.synthesis_sessions),
                 "timestamp": datetime.now().isoformat()
             }
@@ -1187,9 +1472,9 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                 
                 # Clear MLX model caches
                 try:
-                    if hasattr(self.mlx_lm_service, 'model') and self.mlx_lm_service.model:
-                        self.mlx_lm_service.model = None
-                        self.mlx_lm_service.tokenizer = None
+                    if self.mlx_lm_service.residency.get_status()["resident_models"]:
+                        self.mlx_lm_service.residency.clear(include_pinned=True)
+                        self.mlx_lm_service.prompt_cache.clear()
                         self.mlx_lm_service.current_model_name = None
                         log_mlx_operation("MODEL_RESET", "mlx_lm", True)
                     
@@ -1197,6 +1482,12 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                         self.mlx_whisper_service.model = None
                         self.mlx_whisper_service.current_model_name = None
                         log_mlx_operation("MODEL_RESET", "mlx_whisper", True)
+                    
+                    self.voice_pool.clear()
+                    log_mlx_operation("MODEL_RESET", "piper_voice_pool", True)
+                    
+                    whisper_registry.clear()
+                    log_mlx_operation("MODEL_RESET", "whisper_registry", True)
                 except Exception as e:
                     log_mlx_operation("MODEL_RESET", "unknown", False, str(e))
                 
@@ -1270,7 +1561,8 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
             model: Optional[str] = Form(CognitiveConfiguration.DEFAULT_MODEL, description="Ollama model to use", example="tinydolphin:1.1b"),
             voice: Optional[str] = Form(CognitiveConfiguration.DEFAULT_VOICE, description="Piper voice for TTS", example="en_US-amy-medium"),
             response_format: str = Form("audio", description="Response format: text, audio, or both", example="audio"),
-            system_prompt: Optional[str] = Form("You are a helpful AI assistant", description="System prompt for the LLM", example="You are a friendly robot assistant")
+            system_prompt: Optional[str] = Form("You are a helpful AI assistant", description="System prompt for the LLM", example="You are a friendly robot assistant"),
+            stream_audio: bool = Form(False, description="Stream audio as chunked WAV while each sentence is synthesized (audio format only)")
         ):
             """
             🗣️ **Unified Conversational AI Pipeline**
@@ -1289,6 +1581,9 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
             **Audio → Text**: Send speech, receive text response
             - Upload `audio_input` file and set `response_format=text`
             
+            Set `stream_audio=true` with `response_format=audio` to receive a chunked
+            WAV stream that starts playing after the first sentence is synthesized.
+            
             The server automatically handles:
             - Speech-to-text conversion (Whisper)
             - LLM processing (Ollama)
@@ -1334,23 +1629,44 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                         
                         # Use Python piper module
                         try:
-                            import piper
-                            import wave
-                            tts_model = piper.PiperVoice.load(voice_model_path, config_path=voice_config_path)
+                            tts_model = await faculty_executors.run(
+                                "tts", self.voice_pool.get_voice, voice, voice_model_path, voice_config_path
+                            )
                             
-                            # Generate audio using stream method
-                            audio_bytes = b''
-                            for audio_chunk in tts_model.synthesize_stream_raw(llm_response):
-                                audio_bytes += audio_chunk
+                            # Streaming: send WAV header + PCM per sentence, no temp file
+                            if stream_audio and response_format == "audio" and (ENABLE_STREAMING if CONFIG_AVAILABLE else True):
+                                faculty_executors["tts"].check_capacity()
+                                processing_time = time.time() - start_time
+                                self.synthesis_sessions[session_id] = {
+                                    "timestamp": datetime.now().isoformat(),
+                                    "input_text": text_input,
+                                    "output_text": llm_response,
+                                    "processing_time": processing_time
+                                }
+                                self.cognitive_metrics["total_syntheses"] += 1
+                                
+                                return StreamingResponse(
+                                    faculty_executors.stream("tts", stream_wav(tts_model, llm_response, label="CHAT_TTS_STREAM")),
+                                    media_type="audio/wav",
+                                    headers={
+                                        "X-Session-ID": session_id,
+                                        "X-Processing-Time": str(processing_time),
+                                        "X-Pipeline": "stt→llm→tts" if audio_input else "text→llm→tts",
+                                        "X-TTS-Status": "streaming",
+                                        "X-Chat-Complete": "true",
+                                        "Access-Control-Expose-Headers": "X-TTS-Status,X-Chat-Complete,X-Session-ID,X-Processing-Time",
+                                        "Cache-Control": "no-cache"
+                                    }
+                                )
                             
-                            # Write WAV file
-                            with wave.open(output_path, 'wb') as wav_file:
-                                wav_file.setnchannels(1)  # mono
-                                wav_file.setsampwidth(2)  # 16-bit
-                                wav_file.setframerate(tts_model.config.sample_rate)
-                                wav_file.writeframes(audio_bytes)
+                            # Generate audio and write WAV file
+                            wav_bytes = await faculty_executors.run("tts", synthesize_wav_bytes, tts_model, llm_response)
+                            with open(output_path, "wb") as wav_file:
+                                wav_file.write(wav_bytes)
                             
                             synthesis_success = True
+                        except FacultyBusyError:
+                            raise
                         except Exception as e:
                             print(f"❌ Piper synthesis error: {e}")
                             synthesis_success = False
@@ -1404,6 +1720,8 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                     "processing_time": processing_time
                 })
                 
+            except FacultyBusyError:
+                raise
             except Exception as e:
                 return JSONResponse(
                     status_code=500,
@@ -1434,7 +1752,9 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                 temp_output = f"/tmp/music_{uuid.uuid4().hex}.wav"
                 
                 # Use local music generation
-                success = self._generate_music_locally(temp_output, prompt, duration, genre, tempo, mood)
+                success = await faculty_executors.run(
+                    "audiocraft", self._generate_music_locally, temp_output, prompt, duration, genre, tempo, mood
+                )
                 
                 if success:
                     self.cognitive_metrics["sonic_imaginations"] += 1
@@ -1453,6 +1773,8 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                 else:
                     raise Exception("Local music generation failed")
                     
+            except FacultyBusyError:
+                raise
             except Exception as e:
                 return JSONResponse(
                     status_code=500,
@@ -1477,7 +1799,9 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                 temp_output = f"/tmp/sound_{uuid.uuid4().hex}.wav"
                 
                 # Use local sound generation
-                success = self._generate_sound_locally(temp_output, prompt, duration, intensity)
+                success = await faculty_executors.run(
+                    "audiocraft", self._generate_sound_locally, temp_output, prompt, duration, intensity
+                )
                 
                 if success:
                     self.cognitive_metrics["sonic_imaginations"] += 1
@@ -1496,6 +1820,8 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                 else:
                     raise Exception("Local sound generation failed")
                     
+            except FacultyBusyError:
+                raise
             except Exception as e:
                 return JSONResponse(
                     status_code=500,
@@ -1531,7 +1857,8 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                         buffer.write(content)
                 
                 # Use local MelodyFlow generation
-                success = self._generate_melodyflow_locally(
+                success = await faculty_executors.run(
+                    "audiocraft", self._generate_melodyflow_locally,
                     temp_output, prompt, duration, fidelity, mode, dynamics, source_audio_path
                 )
                 
@@ -1557,6 +1884,8 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                 else:
                     raise Exception("Local MelodyFlow generation failed")
                     
+            except FacultyBusyError:
+                raise
             except Exception as e:
                 return JSONResponse(
                     status_code=500,
@@ -1872,6 +2201,10 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                     "timestamp": datetime.now().isoformat()
                 })
                 
+            except FacultyBusyError:
+                if os.path.exists(temp_audio):
+                    os.remove(temp_audio)
+                raise
             except Exception as e:
                 if os.path.exists(temp_audio):
                     os.remove(temp_audio)
@@ -1898,7 +2231,8 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
         async def text_to_speech(
             request: Request,
             text: str = Form(..., description="Text to convert to speech", example="Hello, this is a test of text-to-speech synthesis"),
-            voice: str = Form(CognitiveConfiguration.DEFAULT_VOICE, description="Voice model to use", example="en_US-amy-medium")
+            voice: str = Form(CognitiveConfiguration.DEFAULT_VOICE, description="Voice model to use", example="en_US-amy-medium"),
+            stream: bool = Form(False, description="Stream chunked WAV audio as each sentence is synthesized")
         ):
             """
             🔊 **Convert Text to Speech**
@@ -1910,6 +2244,7 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
             - Multiple languages and speakers
             - Fast synthesis speed
             - WAV audio output
+            - Optional chunked streaming (`stream=true`) for low time-to-first-audio
             
             Use `/voices` endpoint to see all available voice options.
             """
@@ -1989,15 +2324,8 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                     logger.error(f"🔍 Voices directory: {voices_dir}")
                     logger.error(f"🔍 Directory exists: {voices_dir.exists()}")
                     if voices_dir.exists():
-                        voice_files = list(voices_dir.glob("*.onnx"))
-                        logger.error(f"🔍 Found {len(voice_files)} .onnx files: {[f.name for f in voice_files[:5]]}")
-                        
-                        # Check subdirectories too
-                        for subdir in voices_dir.iterdir():
-                            if subdir.is_dir():
-                                sub_voice_files = list(subdir.glob("*.onnx"))
-                                if sub_voice_files:
-                                    logger.error(f"🔍 Found {len(sub_voice_files)} .onnx files in {subdir.name}: {[f.name for f in sub_voice_files[:3]]}")
+                        indexed = self.voice_catalog.list_voices()
+                        logger.error(f"🔍 Found {len(indexed)} indexed voices: {[v.voice_id for v in indexed[:5]]}")
                     
                     raise Exception(f"Voice files not found for: {voice}. Check /api/tts/test for diagnostics.")
                 
@@ -2006,22 +2334,35 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                 # Try Python piper module first (if available)
                 synthesis_success = False
                 try:
-                    import piper
-                    import wave
-                    
-                    tts_model = piper.PiperVoice.load(voice_model_path, config_path=voice_config_path)
+                    tts_model = await faculty_executors.run(
+                        "tts", self.voice_pool.get_voice, voice, voice_model_path, voice_config_path
+                    )
                     
-                    # Generate audio using stream method
-                    audio_bytes = b''
-                    for audio_chunk in tts_model.synthesize_stream_raw(text):
-                        audio_bytes += audio_chunk
+                    # Streaming: send WAV header + PCM per sentence, no temp file
+                    if stream and (ENABLE_STREAMING if CONFIG_AVAILABLE else True):
+                        faculty_executors["tts"].check_capacity()
+                        self.cognitive_metrics["vocal_expressions"] += 1
+                        processing_time = time.time() - start_time
+                        log_response("/tts", client_ip, "streaming", processing_time)
+                        
+                        return StreamingResponse(
+                            faculty_executors.stream("tts", stream_wav(tts_model, text)),
+                            media_type="audio/wav",
+                            headers={
+                                "X-Voice-Used": voice,
+                                "X-Text-Length": str(len(text)),
+                                "X-Original-Length": str(len(original_text)),
+                                "X-Text-Cleaned": "true" if original_text != text else "false",
+                                "X-TTS-Status": "streaming",
+                                "Access-Control-Expose-Headers": "X-TTS-Status,X-Voice-Used",
+                                "Cache-Control": "no-cache"
+                            }
+                        )
                     
-                    # Write WAV file
-                    with wave.open(output_path, 'wb') as wav_file:
-                        wav_file.setnchannels(1)  # mono
-                        wav_file.setsampwidth(2)  # 16-bit
-                        wav_file.setframerate(tts_model.config.sample_rate)
-                        wav_file.writeframes(audio_bytes)
+                    # Generate audio and write WAV file
+                    wav_bytes = await faculty_executors.run("tts", synthesize_wav_bytes, tts_model, text)
+                    with open(output_path, "wb") as wav_file:
+                        wav_file.write(wav_bytes)
                     
                     synthesis_success = True
                     print(f"✅ Used Piper Python module for TTS")
@@ -2037,30 +2378,23 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                         if not piper_binary:
                             raise Exception("Piper binary not found")
                     
-                    # Use subprocess to call Piper binary with timeout protection
+                    # Use a resident Piper binary process with timeout protection
                     try:
-                        result = subprocess.run(
-                            [piper_binary, 
-                             "--model", voice_model_path,
-                             "--config", voice_config_path,
-                             "--output_file", output_path],
-                            input=text,
-                            text=True,
-                            capture_output=True,
+                        self.voice_pool.piper_binary = piper_binary
+                        wav_bytes = await faculty_executors.run(
+                            "tts", self.voice_pool.synthesize_with_binary,
+                            voice, voice_model_path, voice_config_path, text,
                             timeout=15  # Reduced timeout
                         )
                         
-                        if result.returncode != 0:
-                            error_msg = result.stderr or f"Piper binary failed with return code {result.returncode}"
-                            # Log the specific error
-                            print(f"❌ Piper binary error: {error_msg}")
-                            raise Exception(f"Piper TTS failed: {error_msg}")
+                        with open(output_path, "wb") as f:
+                            f.write(wav_bytes)
                         
                         synthesis_success = True
                         print(f"✅ Used Piper binary for TTS")
                         
-                    except subprocess.TimeoutExpired:
-                        error_msg = "Piper TTS timed out after 15 seconds"
+                    except TimeoutError as e:
+                        error_msg = str(e)
                         print(f"❌ Piper timeout: {error_msg}")
                         raise Exception(error_msg)
                     except FileNotFoundError:
@@ -2095,6 +2429,8 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                     }
                 )
                 
+            except FacultyBusyError:
+                raise
             except Exception as e:
                 error_msg = str(e)
                 processing_time = time.time() - start_time
@@ -2132,7 +2468,8 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
             prompt: str = Form(..., description="Your message/question for the AI", example="What is the meaning of life?"),
             model: str = Form(CognitiveConfiguration.DEFAULT_MODEL, description="Ollama model to use", example="tinydolphin:1.1b"),
             system_prompt: Optional[str] = Form("You are a helpful AI assistant", description="System prompt to set AI behavior", example="You are a wise philosopher"),
-            temperature: float = Form(0.7, description="Creativity level (0.0-1.0)", example=0.7, ge=0.0, le=1.0)
+            temperature: float = Form(0.7, description="Creativity level (0.0-1.0)", example=0.7, ge=0.0, le=1.0),
+            stream: bool = Form(False, description="Stream tokens as Server-Sent Events")
         ):
             """
             🤖 **Direct LLM Chat**
@@ -2143,6 +2480,7 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
             - **Temperature**: Controls randomness (0.0 = deterministic, 1.0 = very creative)
             - **System Prompt**: Sets the AI's personality and behavior
             - **Model**: Choose from available Ollama models
+            - **Stream**: Send `{"token": ...}` SSE frames as they are generated
             
             Use `/models` endpoint to see all available models.
             
@@ -2162,6 +2500,35 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                 raise HTTPException(status_code=503, detail="Ollama service unavailable")
             
             try:
+                if stream and (ENABLE_STREAMING if CONFIG_AVAILABLE else True):
+                    service_used, tokens = await self._stream_with_fallback(
+                        prompt, model, system_prompt, temperature=temperature
+                    )
+                    self.cognitive_metrics["linguistic_calls"] += 1
+                    
+                    async def llm_events():
+                        response_length = 0
+                        try:
+                            async for text in tokens:
+                                response_length += len(text)
+                                yield sse_event({"token": text})
+                        except Exception as e:
+                            logger.error(f"❌ LLM STREAM ERROR | Client: {client_ip} | Error: {e}")
+                            yield sse_event({"status": "error", "error": str(e)})
+                            return
+                        
+                        processing_time = time.time() - start_time
+                        log_response("/llm", client_ip, "success", processing_time)
+                        logger.info(f"🤖 LLM STREAM SUCCESS | Client: {client_ip} | Service: {service_used} | Model: {model} | Response length: {response_length} | Processing time: {processing_time:.2f}s")
+                        yield sse_event({
+                            "status": "success",
+                            "done": True,
+                            "model_used": f"{service_used}-{model}",
+                            "timestamp": datetime.now().isoformat()
+                        })
+                    
+                    return StreamingResponse(llm_events(), media_type=SSE_MEDIA_TYPE, headers=SSE_HEADERS)
+                
                 # Use MLX-LM with fallback to Ollama
                 llm_response = await self._generate_with_fallback(prompt, model, system_prompt)
                 self.cognitive_metrics["linguistic_calls"] += 1
@@ -2182,6 +2549,8 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                     "timestamp": datetime.now().isoformat()
                 })
                 
+            except FacultyBusyError:
+                raise
             except Exception as e:
                 error_msg = str(e)
                 processing_time = time.time() - start_time
@@ -2268,7 +2637,7 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
             
             if self.ollama_available and fallback_enabled and not strict_mlx:
                 try:
-                    response = requests.get(f"{CognitiveConfiguration.OLLAMA_BASE_URL}/api/tags", timeout=10)
+                    response = await upstream_clients["ollama"].get("/api/tags", timeout=10)
                     response.raise_for_status()
                     
                     models_data = response.json()
@@ -2336,55 +2705,7 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
             
             try:
                 voices_dir = Path(CognitiveConfiguration.VOICES_DIR)
-                available_voices = []
-                
-                if voices_dir.exists():
-                    # Find all .onnx model files
-                    voice_files = []
-                    
-                    # Search in root voices directory
-                    voice_files.extend(voices_dir.glob("*.onnx"))
-                    
-                    # Search in subdirectories
-                    for subdir in voices_dir.iterdir():
-                        if subdir.is_dir():
-                            voice_files.extend(subdir.glob("*.onnx"))
-                    
-                    for voice_file in voice_files:
-                        voice_name = voice_file.stem
-                        
-                        # Look for corresponding config file
-                        config_file = voice_file.with_suffix(".onnx.json")
-                        config_exists = config_file.exists()
-                        
-                        # Extract voice info from filename/path
-                        path_parts = voice_file.parts
-                        language = "unknown"
-                        speaker = "unknown"
-                        quality = "unknown"
-                        
-                        # Try to parse voice name (e.g., en_US-amy-medium)
-                        if "-" in voice_name:
-                            parts = voice_name.split("-")
-                            if len(parts) >= 3:
-                                language = parts[0]
-                                speaker = parts[1]
-                                quality = parts[2]
-                            elif len(parts) == 2:
-                                language = parts[0]
-                                speaker = parts[1]
-                        
-                        voice_info = {
-                            "name": voice_name,
-                            "language": language,
-                            "speaker": speaker,
-                            "quality": quality,
-                            "model_path": str(voice_file),
-                            "config_available": config_exists,
-                            "file_size": voice_file.stat().st_size if voice_file.exists() else 0
-                        }
-                        
-                        available_voices.append(voice_info)
+                available_voices = [voice.to_dict() for voice in self.voice_catalog.list_voices()]
                 
                 # Sort by language, then speaker
                 available_voices.sort(key=lambda x: (x["language"], x["speaker"]))
@@ -2972,27 +3293,13 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                 
                 # Check for available voices
                 if test_results["voices_dir_exists"]:
-                    voices_dir = Path(CognitiveConfiguration.VOICES_DIR)
-                    voice_files = []
-                    
-                    # Search in root
-                    voice_files.extend(voices_dir.glob("*.onnx"))
-                    
-                    # Search in subdirectories
-                    for subdir in voices_dir.iterdir():
-                        if subdir.is_dir():
-                            voice_files.extend(subdir.glob("*.onnx"))
-                    
-                    for voice_file in voice_files[:10]:  # Limit to first 10
-                        voice_name = voice_file.stem
-                        config_file = voice_file.with_suffix(".onnx.json")
-                        
+                    for voice in self.voice_catalog.list_voices()[:10]:  # Limit to first 10
                         test_results["available_voices"].append({
-                            "name": voice_name,
-                            "model_path": str(voice_file),
-                            "config_exists": config_file.exists(),
-                            "config_path": str(config_file) if config_file.exists() else None,
-                            "size_mb": round(voice_file.stat().st_size / 1024 / 1024, 1)
+                            "name": voice.voice_id,
+                            "model_path": voice.model_path,
+                            "config_exists": voice.config_path is not None,
+                            "config_path": voice.config_path,
+                            "size_mb": round(voice.size / 1024 / 1024, 1)
                         })
                     
                     # Pick a test voice
@@ -3113,7 +3420,6 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
             Dynamically searches Hugging Face repositories for real-time results.
             """
             try:
-                import requests
                 import json
                 
                 all_voices = []
@@ -3121,8 +3427,8 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                 # Search MLX voice models (prioritized for Apple Silicon)
                 if voice_type in ["mlx", "both"]:
                     try:
-                        mlx_response = requests.get(
-                            "https://huggingface.co/api/models",
+                        mlx_response = await upstream_clients["huggingface"].get(
+                            "/api/models",
                             params={
                                 "search": f"mlx voice {query}",
                                 "limit": limit // 2 if voice_type == "both" else limit,
@@ -3160,8 +3466,8 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                 if voice_type in ["piper", "both"]:
                     try:
                         # Search Hugging Face API for piper voices
-                        piper_response = requests.get(
-                            "https://huggingface.co/api/repos/rhasspy/piper-voices/tree/main",
+                        piper_response = await upstream_clients["huggingface"].get(
+                            "/api/repos/rhasspy/piper-voices/tree/main",
                             timeout=10
                         )
                         
@@ -3325,6 +3631,7 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                             self.active_downloads[download_id]["status"] = "completed"
                             self.active_downloads[download_id]["progress"] = 100
                         
+                        self.voice_catalog.invalidate()
                         log_event(f"✅ Voice download completed: {voice_name}")
                         
                         # Clean up tracking after delay
@@ -3410,6 +3717,8 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                     removed_files.append(config_path)
                 
                 if removed_files:
+                    self.voice_catalog.invalidate()
+                    self.voice_pool.evict(voice_name)
                     log_event(f"🗑️ Removed voice model: {voice_name}")
                     return JSONResponse(content={
                         "status": "success",
@@ -3799,6 +4108,7 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                 if CONFIG_AVAILABLE and model_name in MLX_LM_MODELS:
                     model_id = MLX_LM_MODELS[model_name]
                     del MLX_LM_MODELS[model_name]
+                    self.mlx_lm_service.residency.evict(model_id)
                     
                     log_event(f"🗑️ Removed model '{model_name}' ({model_id}) from configuration")
                     
@@ -3821,6 +4131,78 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                 )
         
         
+        @self.app.get("/api/models/mlx/resident",
+                      tags=["mlx"],
+                      summary="Resident MLX Models",
+                      description="List MLX-LM models currently loaded in memory")
+        async def list_resident_mlx_models():
+            """
+            🧠 **Resident MLX Models**
+            
+            Shows which MLX-LM models are loaded, which are pinned, their
+            estimated memory footprint, hit counts and the residency budget.
+            """
+            return JSONResponse(content={
+                "status": "success",
+                "residency": self.mlx_lm_service.residency.get_status(),
+                "timestamp": datetime.now().isoformat()
+            })
+        
+        
+        @self.app.post("/api/models/mlx/{model_name}/pin",
+                       tags=["mlx"],
+                       summary="Pin MLX Model",
+                       description="Load an MLX-LM model and keep it resident")
+        async def pin_mlx_model(model_name: str):
+            """
+            📌 **Pin MLX Model**
+            
+            Loads the model if needed and exempts it from LRU eviction.
+            Accepts a configured alias (default, small, code...) or a model id.
+            """
+            if not self.mlx_lm_available:
+                raise HTTPException(status_code=503, detail="MLX-LM service unavailable")
+            
+            try:
+                model_id = await self.mlx_lm_service.pin_model(model_name)
+                return JSONResponse(content={
+                    "status": "success",
+                    "message": f"Model '{model_name}' pinned",
+                    "model_id": model_id,
+                    "timestamp": datetime.now().isoformat()
+                })
+            except FacultyBusyError:
+                raise
+            except Exception as e:
+                return JSONResponse(
+                    status_code=500,
+                    content={"status": "error", "error": f"Pin error: {str(e)}"}
+                )
+        
+        
+        @self.app.delete("/api/models/mlx/{model_name}/pin",
+                         tags=["mlx"],
+                         summary="Unpin MLX Model",
+                         description="Allow an MLX-LM model to be evicted again")
+        async def unpin_mlx_model(model_name: str):
+            """
+            📍 **Unpin MLX Model**
+            
+            The model stays loaded until the residency budget needs its slot.
+            """
+            if not self.mlx_lm_service.unpin_model(model_name):
+                return JSONResponse(
+                    status_code=404,
+                    content={"status": "error", "error": f"Model '{model_name}' is not pinned"}
+                )
+            
+            return JSONResponse(content={
+                "status": "success",
+                "message": f"Model '{model_name}' unpinned",
+                "timestamp": datetime.now().isoformat()
+            })
+        
+        
         # ============================================================
         # OLLAMA API COMPATIBILITY ENDPOINTS
         # ============================================================
@@ -3835,7 +4217,7 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                 raise HTTPException(status_code=503, detail="Ollama service unavailable")
             
             try:
-                response = requests.get(f"{CognitiveConfiguration.OLLAMA_BASE_URL}/api/tags", timeout=10)
+                response = await upstream_clients["ollama"].get("/api/tags", timeout=10)
                 response.raise_for_status()
                 return JSONResponse(content=response.json())
             except Exception as e:
@@ -3852,20 +4234,25 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                 raise HTTPException(status_code=503, detail="Ollama service unavailable")
             
             try:
-                response = requests.post(
-                    f"{CognitiveConfiguration.OLLAMA_BASE_URL}/api/generate",
-                    json=request,
-                    timeout=120
-                )
+                # Ollama streams by default when "stream" is omitted
+                if request.get("stream", True):
+                    chunks = await prefetch_first(self._stream_ollama("generate", request))
+                    self.cognitive_metrics["linguistic_calls"] += 1
+                    
+                    async def ndjson_lines():
+                        async for chunk in chunks:
+                            yield json.dumps(chunk) + "\n"
+                    
+                    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+                
+                response = await upstream_clients["ollama"].post("/api/generate", json=request, timeout=120)
                 response.raise_for_status()
                 
                 self.cognitive_metrics["linguistic_calls"] += 1
-                
-                if request.get("stream", False):
-                    return response.iter_content(chunk_size=8192)
-                else:
-                    return JSONResponse(content=response.json())
+                return JSONResponse(content=response.json())
                     
+            except FacultyBusyError:
+                raise
             except Exception as e:
                 return JSONResponse(status_code=500, content={"error": str(e)})
         
@@ -3880,20 +4267,25 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                 raise HTTPException(status_code=503, detail="Ollama service unavailable")
             
             try:
-                response = requests.post(
-                    f"{CognitiveConfiguration.OLLAMA_BASE_URL}/api/chat",
-                    json=request,
-                    timeout=120
-                )
+                # Ollama streams by default when "stream" is omitted
+                if request.get("stream", True):
+                    chunks = await prefetch_first(self._stream_ollama("chat", request))
+                    self.cognitive_metrics["linguistic_calls"] += 1
+                    
+                    async def ndjson_lines():
+                        async for chunk in chunks:
+                            yield json.dumps(chunk) + "\n"
+                    
+                    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+                
+                response = await upstream_clients["ollama"].post("/api/chat", json=request, timeout=120)
                 response.raise_for_status()
                 
                 self.cognitive_metrics["linguistic_calls"] += 1
-                
-                if request.get("stream", False):
-                    return response.iter_content(chunk_size=8192)
-                else:
-                    return JSONResponse(content=response.json())
+                return JSONResponse(content=response.json())
                     
+            except FacultyBusyError:
+                raise
             except Exception as e:
                 return JSONResponse(status_code=500, content={"error": str(e)})
         
@@ -3908,11 +4300,7 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                 raise HTTPException(status_code=503, detail="Ollama service unavailable")
             
             try:
-                response = requests.post(
-                    f"{CognitiveConfiguration.OLLAMA_BASE_URL}/api/embeddings",
-                    json=request,
-                    timeout=60
-                )
+                response = await upstream_clients["ollama"].post("/api/embeddings", json=request, timeout=60)
                 response.raise_for_status()
                 return JSONResponse(content=response.json())
                 
@@ -3930,7 +4318,7 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                 raise HTTPException(status_code=503, detail="Ollama service unavailable")
             
             try:
-                response = requests.get(f"{CognitiveConfiguration.OLLAMA_BASE_URL}/api/ps", timeout=10)
+                response = await upstream_clients["ollama"].get("/api/ps", timeout=10)
                 response.raise_for_status()
                 return JSONResponse(content=response.json())
             except Exception as e:
@@ -3947,11 +4335,7 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                 raise HTTPException(status_code=503, detail="Ollama service unavailable")
             
             try:
-                response = requests.post(
-                    f"{CognitiveConfiguration.OLLAMA_BASE_URL}/api/show",
-                    json=request,
-                    timeout=30
-                )
+                response = await upstream_clients["ollama"].post("/api/show", json=request, timeout=30)
                 response.raise_for_status()
                 return JSONResponse(content=response.json())
             except Exception as e:
@@ -3990,26 +4374,18 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                     })
                 
                 # Download model file
-                import requests
                 model_url = f"{base_url}/en_US-amy-medium.onnx"
                 config_url = f"{base_url}/en_US-amy-medium.onnx.json"
                 
                 # Download voice model
                 print(f"📥 Downloading voice model: {voice_name}")
-                response = requests.get(model_url, stream=True, timeout=60)
-                response.raise_for_status()
-                
-                with open(voice_file, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
+                await upstream_clients["huggingface"].download(model_url, voice_file, timeout=60)
                 
                 # Download config
                 print(f"📥 Downloading voice config: {voice_name}")
-                config_response = requests.get(config_url, timeout=30)
-                config_response.raise_for_status()
+                await upstream_clients["huggingface"].download(config_url, config_file, timeout=30)
                 
-                with open(config_file, 'wb') as f:
-                    f.write(config_response.content)
+                self.voice_catalog.invalidate()
                 
                 # Verify files
                 if voice_file.exists() and config_file.exists():
@@ -4050,9 +4426,9 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                 if not voice:
                     voices_dir = Path(CognitiveConfiguration.VOICES_DIR)
                     if voices_dir.exists():
-                        voice_files = list(voices_dir.glob("*.onnx"))
+                        voice_files = self.voice_catalog.list_voices()
                         if voice_files:
-                            voice = voice_files[0].stem
+                            voice = voice_files[0].voice_id
                         else:
                             return JSONResponse(
                                 status_code=404,
@@ -4228,22 +4604,20 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                             voice_config_path = self._find_voice_config(active_voice)
                             
                             if voice_model_path and voice_config_path:
-                                # Use Piper for TTS generation
-                                piper_cmd = [
-                                    CognitiveConfiguration.PIPER_BINARY,
-                                    "--model", voice_model_path,
-                                    "--config", voice_config_path,
-                                    "--output_file", output_path
-                                ]
-                                
-                                result = subprocess.run(
-                                    piper_cmd,
-                                    input=cleaned_text,
-                                    text=True,
-                                    capture_output=True
-                                )
+                                # Use a resident Piper binary process for TTS generation
+                                try:
+                                    self.voice_pool.piper_binary = CognitiveConfiguration.PIPER_BINARY
+                                    wav_bytes = await faculty_executors.run(
+                                        "tts", self.voice_pool.synthesize_with_binary,
+                                        active_voice, voice_model_path, voice_config_path, cleaned_text
+                                    )
+                                    with open(output_path, "wb") as f:
+                                        f.write(wav_bytes)
+                                    synthesis_error = None
+                                except Exception as e:
+                                    synthesis_error = str(e)
                                 
-                                if result.returncode == 0 and os.path.exists(output_path):
+                                if synthesis_error is None and os.path.exists(output_path):
                                     # Get audio file info
                                     file_size = os.path.getsize(output_path)
                                     
@@ -4262,7 +4636,7 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                                         }
                                     )
                                 else:
-                                    log_event(f"❌ TTS generation failed: {result.stderr}")
+                                    log_event(f"❌ TTS generation failed: {synthesis_error}")
                             
                         except Exception as tts_error:
                             log_event(f"❌ TTS generation error: {str(tts_error)}")
@@ -4495,7 +4869,9 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
             workflow_type: str = Form("comprehensive", description="Workflow type: comprehensive, quick, academic, creative, technical", example="comprehensive"),
             academic_level: str = Form("graduate", description="Academic level: undergraduate, graduate, doctoral", example="graduate"),
             citation_style: str = Form("academic", description="Citation style preference", example="academic"),
-            max_search_results: int = Form(10, description="Maximum search results to process", example=10)
+            max_search_results: int = Form(10, description="Maximum search results to process", example=10),
+            bypass_cache: bool = Form(False, description="Regenerate every step instead of reusing cached generations"),
+            background: bool = Form(False, description="Return 202 with an execution id at once; follow progress via /events")
         ):
             """
             🧠 **AgentWorkflow Research System**
@@ -4523,16 +4899,54 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
             - 🌐 DuckDuckGo + ArXiv research integration
             - 📚 Academic formatting and structure
             - 🔍 Real-time progress tracking
+            
+            **Live Progress**: every run gets an `execution_id`. Stream its step events and
+            finished section text from `GET /api/workflow/research/{execution_id}/events` (SSE).
+            With `background=true` the request returns 202 immediately and the finished result
+            is fetched from `GET /api/workflow/research/{execution_id}`, so long runs never
+            hold an HTTP request open past proxy timeouts.
             """
             client_ip = request.client.host
             start_time = time.time()
+            execution_id = uuid.uuid4().hex[:12]
             
             log_request("/api/workflow/research", client_ip, {
                 "research_query": research_query[:100] + "..." if len(research_query) > 100 else research_query,
                 "workflow_type": workflow_type,
-                "academic_level": academic_level
+                "academic_level": academic_level,
+                "execution_id": execution_id,
+                "background": background
             })
             
+            execution = workflow_progress.start(
+                execution_id,
+                research_query=research_query[:200],
+                workflow_type=workflow_type,
+                academic_level=academic_level,
+                client_ip=client_ip
+            )
+            
+            workflow_run = execute_research_workflow(
+                execution_id, research_query, workflow_type, academic_level, citation_style,
+                max_search_results, bypass_cache, client_ip, start_time
+            )
+            
+            if background:
+                execution.task = asyncio.create_task(workflow_run)
+                return JSONResponse(status_code=202, content={
+                    "status": "accepted",
+                    "execution_id": execution_id,
+                    "events_url": f"/api/workflow/research/{execution_id}/events",
+                    "result_url": f"/api/workflow/research/{execution_id}",
+                    "timestamp": datetime.now().isoformat()
+                })
+            
+            return await workflow_run
+        
+        async def execute_research_workflow(execution_id: str, research_query: str, workflow_type: str,
+                                           academic_level: str, citation_style: str, max_search_results: int,
+                                           bypass_cache: bool, client_ip: str, start_time: float) -> JSONResponse:
+            """Run one research workflow, publishing progress and the outcome to workflow_progress"""
             try:
                 # Import workflow components
                 from workflows.research_workflow import run_research_workflow, create_research_context
@@ -4556,6 +4970,11 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                     citation_style=citation_style,
                     search_max_results=max_search_results,
                     
+                    # Search results are packed into this many prompt tokens for summarize/synthesize
+                    context_token_budget=WORKFLOW_CONTEXT_TOKEN_BUDGET if CONFIG_AVAILABLE else 3072,
+                    context_packing_mode=WORKFLOW_CONTEXT_PACKING_MODE if CONFIG_AVAILABLE else "auto",
+                    context_map_reduce_threshold=WORKFLOW_CONTEXT_MAP_REDUCE_THRESHOLD if CONFIG_AVAILABLE else 0.5,
+                    
                     # Silicon Server metadata
                     server_instance=self,
                     client_ip=client_ip,
@@ -4566,6 +4985,27 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                     workflow_engine_class=AgentWorkflow
                 )
                 
+                # Identical prompts from a re-run (same query and sources) come from the response cache
+                context["generate_with_fallback"] = llm_response_cache.wrap(
+                    self._generate_with_fallback, self._generation_cache_model(),
+                    FALLBACK_GENERATION_PARAMS, context=context, bypass=bypass_cache
+                )
+                
+                # Step events and finished sections go to /api/workflow/research/{execution_id}/events
+                context["progress_sink"] = workflow_progress.sink(execution_id)
+                
+                # Checkpoint every completed step; a resumed execution skips the ones already done
+                context["checkpoint_store"] = workflow_checkpoints
+                context["checkpoint_execution_id"] = execution_id
+                context["checkpoint_metadata"] = {
+                    "research_query": research_query,
+                    "workflow_type": workflow_type,
+                    "academic_level": academic_level,
+                    "citation_style": citation_style,
+                    "max_search_results": max_search_results,
+                    "client_ip": client_ip
+                }
+                
                 # Run the research workflow
                 log_event(f"🧠 Starting {workflow_type} research workflow: {research_query[:50]}...")
                 research_result = await run_research_workflow(
@@ -4587,6 +5027,7 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                 # Prepare response data with enhanced workflow tracking
                 response_data = {
                     "status": "success",
+                    "execution_id": execution_id,
                     "research_content": research_result,
                     "workflow_type": workflow_type,
                     "academic_level": academic_level,
@@ -4615,7 +5056,8 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                             "total_processing_time": processing_time,
                             "search_results_processed": context.get("search_results_processed", 0),
                             "content_synthesis_quality": context.get("synthesis_quality", "unknown"),
-                            "step_efficiency": context.get("step_efficiency_metrics", {})
+                            "step_efficiency": context.get("step_efficiency_metrics", {}),
+                            "llm_cache": context.get("llm_cache_stats", {})
                         }
                     },
                     "timestamp": datetime.now().isoformat()
@@ -4631,24 +5073,211 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                     log_event(f"⚠️ Failed to save to research library: {str(e)}")
                     response_data["saved_to_library"] = False
                 
+                workflow_progress.finish(execution_id, response_data)
                 return JSONResponse(content=response_data)
                 
+            except asyncio.CancelledError:
+                # Client disconnected (or the task was cancelled) mid-run: close the execution out
+                processing_time = time.time() - start_time
+                log_response("/api/workflow/research", client_ip, "cancelled", processing_time)
+                log_event(f"🛑 Research workflow cancelled: {execution_id}")
+                
+                workflow_progress.finish(execution_id, {
+                    "status": "cancelled",
+                    "execution_id": execution_id,
+                    "error": "Research workflow cancelled before it finished",
+                    "workflow_type": workflow_type,
+                    "processing_time": processing_time,
+                    "timestamp": datetime.now().isoformat()
+                }, success=False, cancelled=True)
+                
+                # Completed steps stay checkpointed, so the run can be resumed
+                try:
+                    workflow_checkpoints.set_status(execution_id, "interrupted")
+                except Exception as e:
+                    log_event(f"⚠️ Could not mark cancelled workflow {execution_id} as interrupted: {str(e)}")
+                raise
+                
             except Exception as e:
                 processing_time = time.time() - start_time
                 error_msg = str(e)
                 log_response("/api/workflow/research", client_ip, "error", processing_time, error_msg)
                 log_event(f"❌ Research workflow failed: {error_msg}")
                 
+                error_data = {
+                    "status": "error",
+                    "execution_id": execution_id,
+                    "error": f"Research workflow failed: {error_msg}",
+                    "workflow_type": workflow_type,
+                    "processing_time": processing_time,
+                    "timestamp": datetime.now().isoformat()
+                }
+                workflow_progress.finish(execution_id, error_data, success=False)
+                return JSONResponse(status_code=500, content=error_data)
+        
+        @self.app.post("/api/workflow/research/{execution_id}/resume",
+                       tags=["research"],
+                       summary="♻️ Resume Research Workflow",
+                       description="Resume an interrupted or failed research workflow from its last completed step")
+        async def resume_research_workflow(
+            execution_id: str,
+            request: Request,
+            bypass_cache: bool = Form(False, description="Regenerate remaining steps instead of reusing cached generations")
+        ):
+            """
+            ♻️ **Resume Research Workflow**
+            
+            Runs started before a restart or crash are listed by `GET /api/workflow/executions`
+            with status `interrupted`. Resuming restores the saved context, skips every step that
+            already completed and runs the rest in the background (202); follow it through the
+            usual `/events` stream and result endpoint.
+            """
+            execution = await asyncio.to_thread(workflow_checkpoints.get_execution, execution_id)
+            if execution is None:
                 return JSONResponse(
-                    status_code=500,
+                    status_code=404,
                     content={
                         "status": "error",
-                        "error": f"Research workflow failed: {error_msg}",
-                        "workflow_type": workflow_type,
-                        "processing_time": processing_time,
+                        "error": f"Workflow execution {execution_id} not found",
+                        "timestamp": datetime.now().isoformat()
+                    }
+                )
+            
+            live = workflow_progress.get(execution_id)
+            if execution["status"] not in ("interrupted", "failed") or (live and live.status == "running"):
+                return JSONResponse(
+                    status_code=409,
+                    content={
+                        "status": "error",
+                        "error": f"Workflow execution {execution_id} is {execution['status']} and cannot be resumed",
+                        "timestamp": datetime.now().isoformat()
+                    }
+                )
+            
+            params = execution["metadata"]
+            client_ip = request.client.host
+            log_event(f"♻️ Resuming research workflow {execution_id} "
+                      f"({execution['completed_steps']}/{execution['total_steps']} steps checkpointed)")
+            
+            progress = workflow_progress.start(
+                execution_id,
+                research_query=params.get("research_query", "")[:200],
+                workflow_type=params.get("workflow_type", "comprehensive"),
+                academic_level=params.get("academic_level", "graduate"),
+                client_ip=client_ip,
+                resumed_steps=execution["completed_steps"]
+            )
+            progress.task = asyncio.create_task(execute_research_workflow(
+                execution_id,
+                params.get("research_query", ""),
+                params.get("workflow_type", "comprehensive"),
+                params.get("academic_level", "graduate"),
+                params.get("citation_style", "academic"),
+                params.get("max_search_results", 10),
+                bypass_cache, client_ip, time.time()
+            ))
+            
+            return JSONResponse(status_code=202, content={
+                "status": "accepted",
+                "execution_id": execution_id,
+                "resumed_from_step": execution["completed_steps"],
+                "total_steps": execution["total_steps"],
+                "events_url": f"/api/workflow/research/{execution_id}/events",
+                "result_url": f"/api/workflow/research/{execution_id}",
+                "timestamp": datetime.now().isoformat()
+            })
+        
+        @self.app.get("/api/workflow/executions",
+                      tags=["research"],
+                      summary="💾 Research Executions",
+                      description="Running, paused and interrupted research workflows from the checkpoint store")
+        async def list_research_executions(
+            status: Optional[str] = Query(None, description="Comma-separated statuses (default: running,paused,interrupted)")
+        ):
+            """
+            💾 **Research Executions**
+            
+            Served from the durable checkpoint store, so runs cut short by a restart are listed
+            (status `interrupted`) with how many steps they completed and can be resumed.
+            """
+            statuses = tuple(s.strip() for s in status.split(",") if s.strip()) if status else ACTIVE_STATUSES
+            executions = await asyncio.to_thread(workflow_checkpoints.list_executions, statuses)
+            for execution in executions:
+                execution["resumable"] = execution["status"] in ("interrupted", "failed")
+            
+            return JSONResponse(content={
+                "status": "success",
+                "total": len(executions),
+                "executions": executions,
+                "timestamp": datetime.now().isoformat()
+            })
+        
+        @self.app.get("/api/workflow/research/{execution_id}/events",
+                      tags=["research"],
+                      summary="📡 Research Progress Stream",
+                      description="Server-Sent Events stream of a research workflow's step progress and section text")
+        async def stream_research_progress(
+            execution_id: str,
+            request: Request,
+            last_event_id: int = Query(0, description="Replay only events after this id (the Last-Event-ID header also works)")
+        ):
+            """
+            📡 **Research Progress Stream**
+            
+            Events (JSON `data` frames with an `id` for resuming): `workflow_start`, `pipeline_start`,
+            `step_start`, `step_progress`, `step_completion`, `step_failure`, `step_skip`,
+            `section_text`, `pipeline_complete` and finally `workflow_complete` or `workflow_failed`,
+            followed by `[DONE]`. Events already published are replayed first, so the stream
+            can be opened at any point of the run. Idle periods send keep-alive comments.
+            """
+            if workflow_progress.get(execution_id) is None:
+                return JSONResponse(
+                    status_code=404,
+                    content={
+                        "status": "error",
+                        "error": f"Workflow execution {execution_id} not found",
                         "timestamp": datetime.now().isoformat()
                     }
                 )
+            
+            header_id = request.headers.get("last-event-id", "")
+            resume_from = int(header_id) if header_id.isdigit() else last_event_id
+            
+            async def progress_events():
+                async for event in workflow_progress.subscribe(execution_id, resume_from):
+                    yield sse_progress_frame(event)
+                yield SSE_DONE
+            
+            return StreamingResponse(progress_events(), media_type=SSE_MEDIA_TYPE, headers=SSE_HEADERS)
+        
+        @self.app.get("/api/workflow/research/{execution_id}",
+                      tags=["research"],
+                      summary="📄 Research Execution Result",
+                      description="Status of a research workflow run and, once finished, its full result")
+        async def get_research_execution(execution_id: str):
+            """
+            📄 **Research Execution Result**
+            
+            Poll a run started with `background=true`. While running, returns its progress
+            summary; when finished, `result` holds the same body the synchronous request returns.
+            """
+            execution = workflow_progress.get(execution_id)
+            if execution is None:
+                return JSONResponse(
+                    status_code=404,
+                    content={
+                        "status": "error",
+                        "error": f"Workflow execution {execution_id} not found",
+                        "timestamp": datetime.now().isoformat()
+                    }
+                )
+            
+            return JSONResponse(content={
+                "status": "success",
+                "execution": execution.summary(),
+                "result": execution.result,
+                "timestamp": datetime.now().isoformat()
+            })
         
         @self.app.get("/api/workflow/status",
                       tags=["research"],
@@ -4673,7 +5302,7 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                 try:
                     from workflows.research_workflow import get_available_workflows
                     from workflows.proto_consciousness import ProtoConsciousness
-                    from workflows.tools.search import search_web_info
+                    from workflows.tools.search import search_web_info, get_search_status
                     
                     workflow_available = True
                     proto_available = True
@@ -4681,9 +5310,11 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                     
                     # Get available workflow types
                     available_workflows = get_available_workflows()
+                    search_status = get_search_status()
                     
                 except ImportError as e:
                     available_workflows = {"error": f"Workflow system not available: {str(e)}"}
+                    search_status = None
                 
                 # Check MLX integration
                 mlx_integration = {
@@ -4721,6 +5352,7 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
                     "available_workflows": available_workflows,
                     "mlx_integration": mlx_integration,
                     "dependencies": dependencies,
+                    "search": search_status,
                     "features": {
                         "cbt_clarification": proto_available,
                         "web_search": search_available and dependencies["duckduckgo_search"],
@@ -4794,30 +5426,46 @@ A high-performance, Apple Silicon optimized API that orchestrates multiple AI se
             workflow_type: Optional[str] = Query(None, description="Filter by workflow type", example="comprehensive"),
             academic_level: Optional[str] = Query(None, description="Filter by academic level", example="graduate"),
             limit: int = Query(50, description="Maximum number of results", example=50),
-            offset: int = Query(0, description="Offset for pagination", example=0)
+            offset: int = Query(0, description="Offset for pagination (ignored when a cursor is given)", example=0),
+            cursor: Optional[str] = Query(None, description="next_cursor from the previous page")
         ):
             """
             📚 **Research Library**
             
             Get all saved research items with optional filtering and search capabilities.
+            Search uses the full-text index; page through results with next_cursor.
             """
             try:
-                library_items = await self._get_research_library(search, workflow_type, academic_level, limit, offset)
+                library_items, next_cursor = await self._get_research_library(
+                    search, workflow_type, academic_level, limit, offset, cursor
+                )
                 
                 return JSONResponse(content={
                     "status": "success",
                     "total_items": len(library_items),
                     "library": library_items,
+                    "next_cursor": next_cursor,
+                    "has_more": next_cursor is not None,
                     "filters": {
                         "search": search,
                         "workflow_type": workflow_type,
                         "academic_level": academic_level,
                         "limit": limit,
-                        "offset": offset
+                        "offset": offset,
+                        "cursor": cursor
                     },
                     "timestamp": datetime.now().isoformat()
                 })
                 
+            except ValueError as e:
+                return JSONResponse(
+                    status_code=400,
+                    content={
+                        "status": "error",
+                        "error": str(e),
+                        "timestamp": datetime.now().isoformat()
+                    }
+                )
             except Exception as e:
                 return JSONResponse(
                     status_code=500,
@@ -5013,16 +5661,20 @@ Requirements:
 
 Please write the complete research paper now."""
 
-                # Generate research using selected model with fallback
+                # Generate research using selected model with fallback (re-runs hit the response cache)
+                generate = llm_response_cache.wrap(
+                    self._generate_with_fallback, self._generation_cache_model(model or "default"),
+                    FALLBACK_GENERATION_PARAMS, bypass=bool(research_config.get('bypass_cache', False))
+                )
                 if model == 'default' or not model:
                     # Use the best available model for research generation
-                    research_content = await self._generate_with_fallback(
+                    research_content = await generate(
                         research_prompt, 
                         "default", 
                         f"You are an expert academic researcher specializing in {topic}. Generate high-quality, comprehensive research content suitable for {academic_level} level academic work."
                     )
                 else:
-                    research_content = await self._generate_with_fallback(
+                    research_content = await generate(
                         research_prompt, 
                         model, 
                         f"You are an expert academic researcher specializing in {topic}. Generate high-quality, comprehensive research content suitable for {academic_level} level academic work."
@@ -5127,7 +5779,7 @@ Format the outline clearly with proper hierarchy and numbering."""
                 raise HTTPException(status_code=503, detail="Ollama service unavailable")
             
             try:
-                response = requests.get(f"{CognitiveConfiguration.OLLAMA_BASE_URL}/api/tags", timeout=10)
+                response = await upstream_clients["ollama"].get("/api/tags", timeout=10)
                 response.raise_for_status()
                 
                 ollama_models = response.json().get("models", [])
@@ -5179,39 +5831,57 @@ Format the outline clearly with proper hierarchy and numbering."""
                 if request.get("stop"):
                     ollama_data["options"]["stop"] = request["stop"]
                 
-                response = requests.post(
-                    f"{CognitiveConfiguration.OLLAMA_BASE_URL}/api/chat",
-                    json=ollama_data,
-                    timeout=120
-                )
-                response.raise_for_status()
-                
                 if request.get("stream", False):
-                    return response.iter_content(chunk_size=8192)
-                else:
-                    ollama_response = response.json()
+                    chunks = await prefetch_first(self._stream_ollama("chat", ollama_data))
+                    self.cognitive_metrics["linguistic_calls"] += 1
                     
-                    # Convert Ollama response to OpenAI format
-                    openai_response = {
-                        "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
-                        "object": "chat.completion",
-                        "created": int(time.time()),
-                        "model": request.get("model"),
-                        "choices": [{
-                            "index": 0,
-                            "message": ollama_response.get("message", {}),
-                            "finish_reason": "stop"
-                        }],
-                        "usage": {
-                            "prompt_tokens": ollama_response.get("prompt_eval_count", 0),
-                            "completion_tokens": ollama_response.get("eval_count", 0),
-                            "total_tokens": ollama_response.get("prompt_eval_count", 0) + ollama_response.get("eval_count", 0)
-                        }
-                    }
+                    completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+                    created = int(time.time())
+                    model_name = request.get("model")
                     
-                    self.cognitive_metrics["linguistic_calls"] += 1
-                    return JSONResponse(content=openai_response)
+                    async def chat_events():
+                        yield sse_event(openai_chat_chunk(completion_id, model_name, created, role="assistant"))
+                        try:
+                            async for chunk in chunks:
+                                content = chunk.get("message", {}).get("content", "")
+                                if content:
+                                    yield sse_event(openai_chat_chunk(completion_id, model_name, created, content=content))
+                        except Exception as e:
+                            yield sse_event({"error": {"message": str(e), "type": "api_error"}})
+                            return
+                        yield sse_event(openai_chat_chunk(completion_id, model_name, created, finish_reason="stop"))
+                        yield SSE_DONE
                     
+                    return StreamingResponse(chat_events(), media_type=SSE_MEDIA_TYPE, headers=SSE_HEADERS)
+                
+                response = await upstream_clients["ollama"].post("/api/chat", json=ollama_data, timeout=120)
+                response.raise_for_status()
+                
+                ollama_response = response.json()
+                
+                # Convert Ollama response to OpenAI format
+                openai_response = {
+                    "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": request.get("model"),
+                    "choices": [{
+                        "index": 0,
+                        "message": ollama_response.get("message", {}),
+                        "finish_reason": "stop"
+                    }],
+                    "usage": {
+                        "prompt_tokens": ollama_response.get("prompt_eval_count", 0),
+                        "completion_tokens": ollama_response.get("eval_count", 0),
+                        "total_tokens": ollama_response.get("prompt_eval_count", 0) + ollama_response.get("eval_count", 0)
+                    }
+                }
+                
+                self.cognitive_metrics["linguistic_calls"] += 1
+                return JSONResponse(content=openai_response)
+                
+            except FacultyBusyError:
+                raise
             except Exception as e:
                 return JSONResponse(status_code=500, content={"error": {"message": str(e), "type": "api_error"}})
         
@@ -5240,40 +5910,57 @@ Format the outline clearly with proper hierarchy and numbering."""
                 if request.get("stop"):
                     ollama_data["options"]["stop"] = request["stop"]
                 
-                response = requests.post(
-                    f"{CognitiveConfiguration.OLLAMA_BASE_URL}/api/generate",
-                    json=ollama_data,
-                    timeout=120
-                )
-                response.raise_for_status()
-                
                 if request.get("stream", False):
-                    return response.iter_content(chunk_size=8192)
-                else:
-                    ollama_response = response.json()
+                    chunks = await prefetch_first(self._stream_ollama("generate", ollama_data))
+                    self.cognitive_metrics["linguistic_calls"] += 1
                     
-                    # Convert Ollama response to OpenAI format
-                    openai_response = {
-                        "id": f"cmpl-{uuid.uuid4().hex[:12]}",
-                        "object": "text_completion",
-                        "created": int(time.time()),
-                        "model": request.get("model"),
-                        "choices": [{
-                            "text": ollama_response.get("response", ""),
-                            "index": 0,
-                            "logprobs": None,
-                            "finish_reason": "stop"
-                        }],
-                        "usage": {
-                            "prompt_tokens": ollama_response.get("prompt_eval_count", 0),
-                            "completion_tokens": ollama_response.get("eval_count", 0),
-                            "total_tokens": ollama_response.get("prompt_eval_count", 0) + ollama_response.get("eval_count", 0)
-                        }
-                    }
+                    completion_id = f"cmpl-{uuid.uuid4().hex[:12]}"
+                    created = int(time.time())
+                    model_name = request.get("model")
                     
-                    self.cognitive_metrics["linguistic_calls"] += 1
-                    return JSONResponse(content=openai_response)
+                    async def completion_events():
+                        try:
+                            async for chunk in chunks:
+                                text = chunk.get("response", "")
+                                if text:
+                                    yield sse_event(openai_completion_chunk(completion_id, model_name, created, text=text))
+                        except Exception as e:
+                            yield sse_event({"error": {"message": str(e), "type": "api_error"}})
+                            return
+                        yield sse_event(openai_completion_chunk(completion_id, model_name, created, finish_reason="stop"))
+                        yield SSE_DONE
                     
+                    return StreamingResponse(completion_events(), media_type=SSE_MEDIA_TYPE, headers=SSE_HEADERS)
+                
+                response = await upstream_clients["ollama"].post("/api/generate", json=ollama_data, timeout=120)
+                response.raise_for_status()
+                
+                ollama_response = response.json()
+                
+                # Convert Ollama response to OpenAI format
+                openai_response = {
+                    "id": f"cmpl-{uuid.uuid4().hex[:12]}",
+                    "object": "text_completion",
+                    "created": int(time.time()),
+                    "model": request.get("model"),
+                    "choices": [{
+                        "text": ollama_response.get("response", ""),
+                        "index": 0,
+                        "logprobs": None,
+                        "finish_reason": "stop"
+                    }],
+                    "usage": {
+                        "prompt_tokens": ollama_response.get("prompt_eval_count", 0),
+                        "completion_tokens": ollama_response.get("eval_count", 0),
+                        "total_tokens": ollama_response.get("prompt_eval_count", 0) + ollama_response.get("eval_count", 0)
+                    }
+                }
+                
+                self.cognitive_metrics["linguistic_calls"] += 1
+                return JSONResponse(content=openai_response)
+                
+            except FacultyBusyError:
+                raise
             except Exception as e:
                 return JSONResponse(status_code=500, content={"error": {"message": str(e), "type": "api_error"}})
         
@@ -5297,11 +5984,7 @@ Format the outline clearly with proper hierarchy and numbering."""
                     "prompt": input
                 }
                 
-                response = requests.post(
-                    f"{CognitiveConfiguration.OLLAMA_BASE_URL}/api/embeddings",
-                    json=ollama_data,
-                    timeout=60
-                )
+                response = await upstream_clients["ollama"].post("/api/embeddings", json=ollama_data, timeout=60)
                 response.raise_for_status()
                 ollama_response = response.json()
                 
@@ -5322,6 +6005,8 @@ Format the outline clearly with proper hierarchy and numbering."""
                 
                 return JSONResponse(content=openai_response)
                 
+            except FacultyBusyError:
+                raise
             except Exception as e:
                 return JSONResponse(status_code=500, content={"error": {"message": str(e), "type": "api_error"}})
         
@@ -5344,21 +6029,12 @@ Format the outline clearly with proper hierarchy and numbering."""
                     content = await file.read()
                     buffer.write(content)
                 
-                # Transcribe with Whisper
+                # Transcribe with the cached Whisper model
+                whisper_size = CognitiveConfiguration.WHISPER_MODEL
                 try:
-                    import whisper
-                    whisper_model = whisper.load_model("base")
-                    result = whisper_model.transcribe(temp_audio)
-                    transcript = result["text"]
-                except:
-                    result = subprocess.run(
-                        ["whisper", temp_audio, "--model", "base", "--output_format", "txt"],
-                        capture_output=True, text=True, timeout=300
-                    )
-                    transcript_file = temp_audio.replace(".wav", ".txt")
-                    with open(transcript_file, "r") as f:
-                        transcript = f.read().strip()
-                    os.remove(transcript_file)
+                    transcript = await faculty_executors.run("stt", whisper_registry.transcribe, whisper_size, temp_audio)
+                except ImportError:
+                    transcript = await faculty_executors.run("stt", self._transcribe_with_whisper_cli, temp_audio, whisper_size)
                 
                 os.remove(temp_audio)
                 self.cognitive_metrics["auditory_transcriptions"] += 1
@@ -5368,6 +6044,10 @@ Format the outline clearly with proper hierarchy and numbering."""
                     "text": transcript
                 })
                 
+            except FacultyBusyError:
+                if os.path.exists(temp_audio):
+                    os.remove(temp_audio)
+                raise
             except Exception as e:
                 if os.path.exists(temp_audio):
                     os.remove(temp_audio)
@@ -5410,22 +6090,15 @@ Format the outline clearly with proper hierarchy and numbering."""
                 
                 output_path = f"/tmp/openai_tts_{uuid.uuid4().hex}.wav"
                 
-                # Use Python piper module
-                import piper
-                import wave
-                tts_model = piper.PiperVoice.load(voice_model_path, config_path=voice_config_path)
-                
-                # Generate audio using stream method
-                audio_bytes = b''
-                for audio_chunk in tts_model.synthesize_stream_raw(input):
-                    audio_bytes += audio_chunk
+                # Use Python piper module via the resident voice pool
+                tts_model = await faculty_executors.run(
+                    "tts", self.voice_pool.get_voice, piper_voice, voice_model_path, voice_config_path
+                )
                 
-                # Write WAV file
-                with wave.open(output_path, 'wb') as wav_file:
-                    wav_file.setnchannels(1)  # mono
-                    wav_file.setsampwidth(2)  # 16-bit
-                    wav_file.setframerate(tts_model.config.sample_rate)
-                    wav_file.writeframes(audio_bytes)
+                # Generate audio and write WAV file
+                wav_bytes = await faculty_executors.run("tts", synthesize_wav_bytes, tts_model, input)
+                with open(output_path, "wb") as wav_file:
+                    wav_file.write(wav_bytes)
                 
                 self.cognitive_metrics["vocal_expressions"] += 1
                 
@@ -5439,6 +6112,8 @@ Format the outline clearly with proper hierarchy and numbering."""
                     }
                 )
                 
+            except FacultyBusyError:
+                raise
             except Exception as e:
                 return JSONResponse(
                     status_code=500,
@@ -5463,6 +6138,8 @@ Format the outline clearly with proper hierarchy and numbering."""
                 
                 return transcript
                 
+            except FacultyBusyError:
+                raise
             except Exception as e:
                 log_event(f"❌ MLX-Whisper failed: {e}", "mlx")
                 if not (CONFIG_AVAILABLE and FALLBACK_TO_OPENAI_WHISPER):
@@ -5475,20 +6152,10 @@ Format the outline clearly with proper hierarchy and numbering."""
                 start_time = time.time()
                 
                 try:
-                    import whisper
-                    whisper_model = whisper.load_model(model)
-                    result = whisper_model.transcribe(audio_path)
-                    transcript = result["text"]
+                    transcript = await faculty_executors.run("stt", whisper_registry.transcribe, model, audio_path)
                 except ImportError:
                     # CLI fallback
-                    result = subprocess.run(
-                        ["whisper", audio_path, "--model", model, "--output_format", "txt"],
-                        capture_output=True, text=True, timeout=300
-                    )
-                    transcript_file = audio_path.replace(".wav", ".txt")
-                    with open(transcript_file, "r") as f:
-                        transcript = f.read().strip()
-                    os.remove(transcript_file)
+                    transcript = await faculty_executors.run("stt", self._transcribe_with_whisper_cli, audio_path, model)
                 
                 self.cognitive_metrics["whisper_fallbacks"] += 1
                 
@@ -5504,13 +6171,48 @@ Format the outline clearly with proper hierarchy and numbering."""
         raise Exception("No speech recognition service available")
     
     
+    def _transcribe_with_whisper_cli(self, audio_path: str, model: str = "base") -> str:
+        """Transcribe with the whisper CLI when the Python module is not installed"""
+        import tempfile
+        
+        start_time = time.time()
+        with tempfile.TemporaryDirectory(prefix="whisper_cli_") as output_dir:
+            result = subprocess.run(
+                ["whisper", audio_path, "--model", model, "--output_format", "txt", "--output_dir", output_dir],
+                capture_output=True, text=True, timeout=300
+            )
+            transcript_file = Path(output_dir) / f"{Path(audio_path).stem}.txt"
+            if result.returncode != 0 or not transcript_file.exists():
+                log_performance("WHISPER_CLI_TRANSCRIBE", time.time() - start_time, False, f"Model: {model}")
+                raise Exception(f"Whisper CLI failed: {result.stderr.strip() or result.returncode}")
+            
+            transcript = transcript_file.read_text().strip()
+        
+        log_performance("WHISPER_CLI_TRANSCRIBE", time.time() - start_time, True,
+                        f"Model: {model} | Text length: {len(transcript)}")
+        return transcript
+    
+    
+    def _generation_cache_model(self, model: str = "default") -> str:
+        """
+        Backend and model id _generate_with_fallback will most likely use (response
+        cache lookup key; responses are stored under the backend that actually answered)
+        """
+        if self.mlx_lm_available and (not CONFIG_AVAILABLE or should_use_mlx("lm")):
+            mlx_model = model if model in MLX_LM_MODELS else "default"
+            return f"mlx:{self.mlx_lm_service.resolve_model_name(mlx_model)}"
+        ollama_model = model if model in ["tinydolphin:1.1b", "llama2", "codellama"] else CognitiveConfiguration.DEFAULT_MODEL
+        return f"ollama:{ollama_model}"
+    
     async def _generate_with_fallback(self, prompt: str, model: str = "default", system_prompt: str = None) -> str:
         """Generate text using MLX-LM with fallback to Ollama"""
         
         # Prepare full prompt with proper chat formatting
+        # The system part is a stable prefix whose KV state MLX-LM can reuse across turns
+        prompt_prefix = f"System: {system_prompt}\n\n" if system_prompt else None
         if system_prompt:
             # Use a more compatible chat format that works across models
-            full_prompt = f"System: {system_prompt}\n\nHuman: {prompt}\n\nAssistant:"
+            full_prompt = f"{prompt_prefix}Human: {prompt}\n\nAssistant:"
         else:
             full_prompt = f"Human: {prompt}\n\nAssistant:"
         
@@ -5522,15 +6224,17 @@ Format the outline clearly with proper hierarchy and numbering."""
                 
                 # Map model name to MLX model if needed
                 mlx_model = model if model in MLX_LM_MODELS else "default"
-                await self.mlx_lm_service.load_model(mlx_model)
                 
+                # generate() makes the model resident (a single residency lookup)
                 response = await self.mlx_lm_service.generate(
                     full_prompt,
-                    max_tokens=512,
-                    temperature=0.7
+                    model_name=mlx_model,
+                    prefix=prompt_prefix,
+                    **FALLBACK_GENERATION_PARAMS
                 )
                 
                 self.cognitive_metrics["mlx_lm_calls"] += 1
+                record_generation_model(f"mlx:{self.mlx_lm_service.resolve_model_name(mlx_model)}")
                 
                 duration = time.time() - start_time
                 log_performance("MLX_LM_GENERATION", duration, True, 
@@ -5538,6 +6242,8 @@ Format the outline clearly with proper hierarchy and numbering."""
                 
                 return response.strip()
                 
+            except FacultyBusyError:
+                raise
             except Exception as e:
                 log_event(f"❌ MLX-LM failed: {e}", "mlx")
                 if not (CONFIG_AVAILABLE and FALLBACK_TO_OLLAMA):
@@ -5556,8 +6262,8 @@ Format the outline clearly with proper hierarchy and numbering."""
                 # Use configured Ollama model if MLX model mapping fails
                 ollama_model = model if model in ["tinydolphin:1.1b", "llama2", "codellama"] else CognitiveConfiguration.DEFAULT_MODEL
                 
-                response = requests.post(
-                    f"{CognitiveConfiguration.OLLAMA_BASE_URL}/api/chat",
+                response = await upstream_clients["ollama"].post(
+                    "/api/chat",
                     json={"model": ollama_model, "messages": messages, "stream": False},
                     timeout=120
                 )
@@ -5565,6 +6271,7 @@ Format the outline clearly with proper hierarchy and numbering."""
                 
                 llm_response = response.json()["message"]["content"]
                 self.cognitive_metrics["ollama_fallbacks"] += 1
+                record_generation_model(f"ollama:{ollama_model}")
                 
                 duration = time.time() - start_time
                 log_performance("OLLAMA_GENERATION", duration, True, 
@@ -5579,72 +6286,98 @@ Format the outline clearly with proper hierarchy and numbering."""
         raise Exception("No language model service available")
     
     
+    async def _stream_ollama(self, endpoint: str, payload: dict):
+        """Stream NDJSON chunks from Ollama /api/<endpoint> over the pooled Ollama client"""
+        metrics = TokenStreamMetrics(f"OLLAMA_{endpoint.upper()}_STREAM", payload.get("model", "unknown"), log_performance)
+        completed = False
+        try:
+            async for chunk in iter_ollama_stream(upstream_clients["ollama"], f"/api/{endpoint}", payload):
+                metrics.record(chunk.get("response") or chunk.get("message", {}).get("content", ""))
+                if chunk.get("done") and chunk.get("eval_count"):
+                    metrics.set_token_count(chunk["eval_count"])
+                yield chunk
+            completed = True
+        finally:
+            metrics.finish(completed, "" if completed else "Stream interrupted")
+    
+    
+    async def _stream_with_fallback(self, prompt: str, model: str = "default", system_prompt: str = None,
+                                    temperature: float = 0.7, max_tokens: int = 512):
+        """
+        Stream text using MLX-LM with fallback to Ollama.
+        
+        Returns (service_used, token_stream). The first token is fetched before
+        returning so a failing backend can still fall back before any output is sent.
+        """
+        prompt_prefix = f"System: {system_prompt}\n\n" if system_prompt else None
+        if system_prompt:
+            full_prompt = f"{prompt_prefix}Human: {prompt}\n\nAssistant:"
+        else:
+            full_prompt = f"Human: {prompt}\n\nAssistant:"
+        
+        # Try MLX-LM first
+        if self.mlx_lm_available and (not CONFIG_AVAILABLE or should_use_mlx("lm")):
+            try:
+                log_event("🔥 Using MLX-LM for streaming generation", "mlx")
+                mlx_model = model if model in MLX_LM_MODELS else "default"
+                
+                # stream() makes the model resident; a load failure surfaces with the first token
+                tokens = await prefetch_first(
+                    self.mlx_lm_service.stream(full_prompt, model_name=mlx_model, prefix=prompt_prefix,
+                                               max_tokens=max_tokens, temperature=temperature)
+                )
+                self.cognitive_metrics["mlx_lm_calls"] += 1
+                return "mlx-lm", tokens
+                
+            except FacultyBusyError:
+                raise
+            except Exception as e:
+                log_event(f"❌ MLX-LM streaming failed: {e}", "mlx")
+                if not (CONFIG_AVAILABLE and FALLBACK_TO_OLLAMA):
+                    raise
+        
+        # Fallback to Ollama
+        if self.ollama_available and (not CONFIG_AVAILABLE or FALLBACK_TO_OLLAMA):
+            log_event("🔄 Falling back to Ollama (streaming)", "main")
+            
+            messages = [{"role": "user", "content": prompt}]
+            if system_prompt:
+                messages.insert(0, {"role": "system", "content": system_prompt})
+            
+            ollama_model = model if model in ["tinydolphin:1.1b", "llama2", "codellama"] else CognitiveConfiguration.DEFAULT_MODEL
+            chunks = self._stream_ollama("chat", {
+                "model": ollama_model,
+                "messages": messages,
+                "options": {"temperature": temperature, "num_predict": max_tokens}
+            })
+            
+            async def ollama_tokens():
+                async for chunk in chunks:
+                    content = chunk.get("message", {}).get("content", "")
+                    if content:
+                        yield content
+            
+            tokens = await prefetch_first(ollama_tokens())
+            self.cognitive_metrics["ollama_fallbacks"] += 1
+            return "ollama", tokens
+        
+        raise Exception("No language model service available")
+    
+    
     def _find_voice_model(self, voice_id):
-        """Find the .onnx model file for a voice - Mac compatible version"""
-        # Create list of directories to search
-        search_dirs = [CognitiveConfiguration.VOICES_DIR]
-        
-        # Add alternative directories from config if available
-        if hasattr(CognitiveConfiguration, 'ALTERNATIVE_VOICES_DIRS'):
-            search_dirs.extend(CognitiveConfiguration.ALTERNATIVE_VOICES_DIRS)
-        
-        for voices_dir_path in search_dirs:
-            voices_dir = Path(voices_dir_path)
-            if not voices_dir.exists():
-                continue
-                
-            # Search for voice model file in root
-            for pattern in [f"{voice_id}.onnx", f"{voice_id}-*.onnx"]:
-                matches = list(voices_dir.glob(pattern))
-                if matches:
-                    print(f"🔍 Found voice model: {matches[0]}")
-                    return str(matches[0])
-            
-            # Search subdirectories
-            for subdir in voices_dir.iterdir():
-                if subdir.is_dir():
-                    for pattern in [f"{voice_id}.onnx", f"{voice_id}-*.onnx"]:
-                        matches = list(subdir.glob(pattern))
-                        if matches:
-                            print(f"🔍 Found voice model in subdir: {matches[0]}")
-                            return str(matches[0])
-        
-        print(f"❌ Voice model not found for: {voice_id}")
-        return None
+        """Find the .onnx model file for a voice via the voice catalog"""
+        model_path = self.voice_catalog.find_model(voice_id)
+        if not model_path:
+            logger.warning(f"❌ Voice model not found for: {voice_id}")
+        return model_path
     
     
     def _find_voice_config(self, voice_id):
-        """Find the .onnx.json config file for a voice - Mac compatible version"""
-        # Create list of directories to search
-        search_dirs = [CognitiveConfiguration.VOICES_DIR]
-        
-        # Add alternative directories from config if available
-        if hasattr(CognitiveConfiguration, 'ALTERNATIVE_VOICES_DIRS'):
-            search_dirs.extend(CognitiveConfiguration.ALTERNATIVE_VOICES_DIRS)
-        
-        for voices_dir_path in search_dirs:
-            voices_dir = Path(voices_dir_path)
-            if not voices_dir.exists():
-                continue
-                
-            # Search for voice config file in root
-            for pattern in [f"{voice_id}.onnx.json", f"{voice_id}-*.onnx.json"]:
-                matches = list(voices_dir.glob(pattern))
-                if matches:
-                    print(f"🔍 Found voice config: {matches[0]}")
-                    return str(matches[0])
-            
-            # Search subdirectories
-            for subdir in voices_dir.iterdir():
-                if subdir.is_dir():
-                    for pattern in [f"{voice_id}.onnx.json", f"{voice_id}-*.onnx.json"]:
-                        matches = list(subdir.glob(pattern))
-                        if matches:
-                            print(f"🔍 Found voice config in subdir: {matches[0]}")
-                            return str(matches[0])
-        
-        print(f"❌ Voice config not found for: {voice_id}")
-        return None
+        """Find the .onnx.json config file for a voice via the voice catalog"""
+        config_path = self.voice_catalog.find_config(voice_id)
+        if not config_path:
+            logger.warning(f"❌ Voice config not found for: {voice_id}")
+        return config_path
     
     
     def _generate_music_locally(self, output_path, prompt, duration, genre, tempo, mood):
@@ -6207,10 +6940,6 @@ Format the outline clearly with proper hierarchy and numbering."""
     async def _save_to_research_library(self, research_content: str, research_query: str, metadata: dict) -> str:
         """Save research to the library"""
         try:
-            # Create research library directory if it doesn't exist
-            library_dir = Path("research_library")
-            library_dir.mkdir(exist_ok=True)
-            
             # Generate unique ID for this research
             research_id = f"research_{int(time.time())}_{uuid.uuid4().hex[:8]}"
             
@@ -6230,11 +6959,7 @@ Format the outline clearly with proper hierarchy and numbering."""
                 }
             }
             
-            # Save to JSON file
-            file_path = library_dir / f"{research_id}.json"
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(research_item, f, indent=2, ensure_ascii=False)
-            
+            await asyncio.to_thread(research_library.save, research_item)
             return research_id
             
         except Exception as e:
@@ -6242,58 +6967,13 @@ Format the outline clearly with proper hierarchy and numbering."""
             raise e
     
     async def _get_research_library(self, search: str = None, workflow_type: str = None, 
-                                   academic_level: str = None, limit: int = 50, offset: int = 0) -> list:
-        """Get research items from the library with filtering"""
+                                   academic_level: str = None, limit: int = 50, offset: int = 0,
+                                   cursor: str = None) -> tuple:
+        """Get one page of research items from the library with filtering; returns (items, next_cursor)"""
         try:
-            library_dir = Path("research_library")
-            if not library_dir.exists():
-                return []
-            
-            research_items = []
-            
-            # Load all research files
-            for file_path in library_dir.glob("*.json"):
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        item = json.load(f)
-                    
-                    # Apply filters
-                    if workflow_type and item["metadata"].get("workflow_type") != workflow_type:
-                        continue
-                    
-                    if academic_level and item["metadata"].get("academic_level") != academic_level:
-                        continue
-                    
-                    if search:
-                        search_text = f"{item['query']} {item['content']}".lower()
-                        if search.lower() not in search_text:
-                            continue
-                    
-                    # Create summary for library view
-                    content_preview = item["content"][:300] + "..." if len(item["content"]) > 300 else item["content"]
-                    
-                    library_item = {
-                        "id": item["id"],
-                        "query": item["query"],
-                        "content_preview": content_preview,
-                        "metadata": item["metadata"],
-                        "word_count": item["metadata"].get("word_count", 0),
-                        "created_at": item["metadata"].get("created_at"),
-                        "workflow_type": item["metadata"].get("workflow_type"),
-                        "academic_level": item["metadata"].get("academic_level")
-                    }
-                    
-                    research_items.append(library_item)
-                    
-                except Exception as e:
-                    log_event(f"⚠️ Failed to load research file {file_path}: {str(e)}")
-                    continue
-            
-            # Sort by creation date (newest first)
-            research_items.sort(key=lambda x: x["created_at"], reverse=True)
-            
-            # Apply pagination
-            return research_items[offset:offset+limit]
+            return await asyncio.to_thread(
+                research_library.list, search, workflow_type, academic_level, limit, cursor, offset
+            )
             
         except Exception as e:
             log_event(f"❌ Failed to get research library: {str(e)}")
@@ -6302,14 +6982,7 @@ Format the outline clearly with proper hierarchy and numbering."""
     async def _get_research_item(self, research_id: str) -> dict:
         """Get a specific research item by ID"""
         try:
-            library_dir = Path("research_library")
-            file_path = library_dir / f"{research_id}.json"
-            
-            if not file_path.exists():
-                return None
-            
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return await asyncio.to_thread(research_library.get, research_id)
                 
         except Exception as e:
             log_event(f"❌ Failed to get research item {research_id}: {str(e)}")
@@ -6318,13 +6991,13 @@ Format the outline clearly with proper hierarchy and numbering."""
     async def _delete_research_item(self, research_id: str) -> bool:
         """Delete a research item from the library"""
         try:
-            library_dir = Path("research_library")
-            file_path = library_dir / f"{research_id}.json"
-            
-            if not file_path.exists():
+            if not await asyncio.to_thread(research_library.delete, research_id):
                 return False
             
-            file_path.unlink()
+            # Drop the pre-SQLite copy too so a forced re-import cannot bring it back
+            legacy_file = Path(research_library.legacy_dir or "research_library") / f"{research_id}.json"
+            if legacy_file.exists():
+                legacy_file.unlink()
             log_event(f"🗑️ Deleted research item: {research_id}")
             return True
             
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Streaming Audio Helpers for API Silicon Server
+
+Turns Piper's per-sentence PCM output into either a single WAV payload or a
+chunked WAV stream. Streaming sends the RIFF header first and then each
+sentence's PCM as soon as Piper finishes it, so the first audio reaches the
+client after one sentence instead of after the whole reply.
+"""
+
+import struct
+import time
+import logging
+from typing import Iterator
+
+perf_logger = logging.getLogger("Performance.AudioStreaming")
+
+# Placeholder RIFF/data sizes for streams of unknown length.
+# Players treat 0xFFFFFFFF as "read until end of stream".
+STREAMING_SIZE_PLACEHOLDER = 0xFFFFFFFF
+
+
+def build_wav_header(sample_rate: int, channels: int = 1, sample_width: int = 2,
+                     data_size: int = STREAMING_SIZE_PLACEHOLDER) -> bytes:
+    """Build a 44-byte PCM WAV header"""
+    byte_rate = sample_rate * channels * sample_width
+    block_align = channels * sample_width
+    riff_size = STREAMING_SIZE_PLACEHOLDER if data_size == STREAMING_SIZE_PLACEHOLDER else 36 + data_size
+
+    return (
+        b"RIFF" + struct.pack("<I", riff_size) + b"WAVE" +
+        b"fmt " + struct.pack("<IHHIIHH", 16, 1, channels, sample_rate, byte_rate, block_align, sample_width * 8) +
+        b"data" + struct.pack("<I", data_size)
+    )
+
+
+def synthesize_wav_bytes(tts_model, text: str) -> bytes:
+    """Synthesize text with a loaded PiperVoice and return a complete WAV payload"""
+    # Collect chunks and join once - repeated bytes += is quadratic in reply length
+    pcm = b"".join(tts_model.synthesize_stream_raw(text))
+    return build_wav_header(tts_model.config.sample_rate, data_size=len(pcm)) + pcm
+
+
+def stream_wav(tts_model, text: str, label: str = "TTS_STREAM") -> Iterator[bytes]:
+    """
+    Yield a WAV header followed by PCM chunks as Piper finishes each sentence.
+
+    This is a blocking generator; Starlette iterates sync generators in its
+    threadpool, so it can be handed straight to StreamingResponse.
+    """
+    start_time = time.time()
+    first_chunk_time = None
+    total_bytes = 0
+
+    yield build_wav_header(tts_model.config.sample_rate)
+
+    for pcm_chunk in tts_model.synthesize_stream_raw(text):
+        if first_chunk_time is None:
+            first_chunk_time = time.time() - start_time
+        total_bytes += len(pcm_chunk)
+        yield pcm_chunk
+
+    perf_logger.info(
+        f"🔊 {label} | Time to first audio: {(first_chunk_time or 0.0):.3f}s | "
+        f"Total: {time.time() - start_time:.3f}s | PCM bytes: {total_bytes}"
+    )
@@ -68,8 +68,48 @@ MLX_WHISPER_MODELS = {
 # ====== PERFORMANCE SETTINGS ====== #
 MLX_MEMORY_LIMIT = "8GB"       # MLX memory usage limit
 MLX_CACHE_SIZE = 100           # Number of models to keep in cache
+MLX_LM_MAX_RESIDENT_MODELS = 3 # MLX-LM models kept loaded at once (also bounded by MLX_MEMORY_LIMIT)
+MLX_LM_BATCHING = True         # Decode concurrent generate() calls together (needs mlx_lm BatchGenerator)
+MLX_LM_BATCH_WINDOW_MS = 20    # How long the first request waits for others to join a batch
+MLX_LM_MAX_BATCH_SIZE = 8      # Maximum prompts decoded together per model
+MLX_LM_BATCH_STEPS_PER_JOB = 32  # Decode rounds before a batch yields the llm faculty to queued work
+MLX_PROMPT_CACHE_ENTRIES = 16  # Prefilled system-prompt prefixes kept across requests
+MLX_PROMPT_CACHE_MB = 1024     # KV memory budget for cached prompt prefixes
 PERFORMANCE_MONITORING = True   # Enable detailed performance logging
 
+# Faculty executors - bounded worker pools that keep blocking model calls off the event loop
+FACULTY_EXECUTOR_WORKERS = {"llm": 1, "stt": 1, "tts": 2, "audiocraft": 1}  # Concurrent jobs per faculty
+FACULTY_QUEUE_DEPTH = {"llm": 8, "stt": 4, "tts": 8, "audiocraft": 2}       # Waiting jobs before 503
+
+# Upstream HTTP clients - pooled keep-alive connections per upstream service
+UPSTREAM_CLIENTS = {
+    "ollama": {"max_concurrency": 8, "max_queue": 32, "timeout": 120.0},      # HTTP/1.1, local
+    "huggingface": {"max_concurrency": 4, "max_queue": 16, "timeout": 30.0}   # HTTP/2 when h2 is installed
+}
+
+# LLM response cache - research re-runs reuse identical generations from disk
+LLM_RESPONSE_CACHE_ENABLED = True
+LLM_RESPONSE_CACHE_DIR = Path("cache/llm_responses")
+LLM_RESPONSE_CACHE_TTL_HOURS = 168   # Entries older than a week are regenerated
+LLM_RESPONSE_CACHE_MB = 256          # Disk budget, least recently used entries evicted first
+
+# Research library - SQLite with full-text search; legacy JSON files are imported once
+RESEARCH_LIBRARY_DIR = Path("research_library")
+RESEARCH_LIBRARY_DB = RESEARCH_LIBRARY_DIR / "library.sqlite3"
+
+# Live research progress (SSE) - finished runs and their results stay fetchable for the retention period
+WORKFLOW_PROGRESS_RETENTION_MINUTES = 60
+WORKFLOW_PROGRESS_HEARTBEAT_SECONDS = 15   # Keep-alive comments on idle streams (beats proxy timeouts)
+
+# Workflow checkpoints - completed steps survive restarts; interrupted runs resume by execution id
+WORKFLOW_CHECKPOINT_DB = Path("workflow_checkpoints/checkpoints.sqlite3")
+WORKFLOW_CHECKPOINT_RETENTION_DAYS = 7   # Finished executions are pruned after this
+
+# Research context packing - search results are fitted to this many prompt tokens (resident model's tokenizer)
+WORKFLOW_CONTEXT_TOKEN_BUDGET = 3072
+WORKFLOW_CONTEXT_PACKING_MODE = "auto"   # "fill" drops low-ranked sources; "auto" map-reduces them when over budget
+WORKFLOW_CONTEXT_MAP_REDUCE_THRESHOLD = 0.5   # "auto" only map-reduces when more than this share of source tokens would be dropped
+
 # ====== LEGACY SERVICE CONFIGURATION ====== #
 # Ollama Configuration  
 OLLAMA_BASE_URL = "http://localhost:11434"
@@ -77,6 +117,8 @@ DEFAULT_OLLAMA_MODEL = "tinydolphin:1.1b"
 
 # Whisper Configuration
 WHISPER_MODEL = "base"
+WHISPER_MAX_CACHED_MODELS = 2       # OpenAI Whisper sizes kept loaded by the fallback path
+WHISPER_PIN_DEFAULT_MODEL = True    # Load and pin WHISPER_MODEL at startup when the fallback is active
 
 # Piper Configuration - Mac optimized
 if platform.system() == "Darwin":  # macOS
@@ -110,6 +152,12 @@ else:
     ]
 
 DEFAULT_VOICE = "en_US-amy-medium"
+VOICE_CATALOG_REFRESH_SECONDS = 2.0  # Minimum interval between voice directory mtime checks
+
+# Piper Voice Pool - keep loaded voices resident between requests
+PIPER_VOICE_POOL_SIZE = 4           # Maximum number of voices kept loaded
+PIPER_VOICE_POOL_MEMORY_MB = 512    # Approximate memory budget for resident voices
+PIPER_PREWARM_DEFAULT_VOICE = True  # Load DEFAULT_VOICE at startup
 
 # AudioCraft Configuration
 AUDIOCRAFT_BASE_URL = "http://localhost:8000"
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Faculty Executors for API Silicon Server
+
+Bounded thread pools that keep blocking model work (MLX-LM, Whisper, Piper,
+AudioCraft) off the asyncio event loop.
+
+Each cognitive faculty gets its own pool so a long LLM generation cannot
+starve speech recognition or TTS, and each pool has a queue-depth limit.
+When a faculty is saturated new work is rejected immediately with
+FacultyBusyError, which the server turns into a 503 with Retry-After instead
+of letting requests pile up behind the running ones.
+"""
+
+import asyncio
+import functools
+import threading
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, Optional
+
+logger = logging.getLogger("SiliconServer.Executors")
+
+# Default pool sizing per faculty: MLX and Whisper hold one model on the GPU,
+# so they run one job at a time; Piper sessions are cheap to run in parallel.
+DEFAULT_FACULTY_WORKERS = {
+    "llm": 1,
+    "stt": 1,
+    "tts": 2,
+    "audiocraft": 1
+}
+
+DEFAULT_FACULTY_QUEUE_DEPTH = {
+    "llm": 8,
+    "stt": 4,
+    "tts": 8,
+    "audiocraft": 2
+}
+
+_STREAM_END = object()
+
+
+class FacultyBusyError(Exception):
+    """Raised when a faculty's workers and queue are all occupied"""
+
+    def __init__(self, faculty: str, retry_after: int = 5):
+        self.faculty = faculty
+        self.retry_after = retry_after
+        super().__init__(f"{faculty.upper()} faculty is at capacity, retry in {retry_after}s")
+
+
+class FacultyExecutor:
+    """
+    A bounded thread pool for one faculty.
+
+    Args:
+        name: Faculty name (llm, stt, tts, audiocraft)
+        max_workers: Jobs that run concurrently
+        max_queue_depth: Jobs allowed to wait for a worker before rejecting
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue_depth: int):
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self.max_queue_depth = max(0, max_queue_depth)
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=f"faculty-{name}")
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._running = 0
+
+        self.stats = {
+            "completed": 0,
+            "failed": 0,
+            "rejected": 0,
+            "total_wait_time": 0.0,
+            "total_run_time": 0.0
+        }
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.max_queue_depth
+
+    def _admit(self):
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                self.stats["rejected"] += 1
+                raise FacultyBusyError(self.name)
+            self._in_flight += 1
+
+    def check_capacity(self):
+        """
+        Raise FacultyBusyError now if the faculty is saturated.
+
+        Used before handing a stream() to a StreamingResponse, where a
+        rejection raised on first iteration would arrive after the 200 headers.
+        """
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                self.stats["rejected"] += 1
+                raise FacultyBusyError(self.name)
+
+    def _release(self):
+        with self._lock:
+            self._in_flight -= 1
+
+    def _timed(self, func: Callable, submitted_at: float) -> Callable:
+        """Wrap func so queue wait and run time are recorded from the worker thread"""
+        def runner():
+            started_at = time.time()
+            with self._lock:
+                self._running += 1
+                self.stats["total_wait_time"] += started_at - submitted_at
+            try:
+                return func()
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self.stats["total_run_time"] += time.time() - started_at
+        return runner
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a blocking callable on this faculty's pool and await its result"""
+        self._admit()
+        try:
+            job = self._timed(functools.partial(func, *args, **kwargs), time.time())
+            future = self._pool.submit(job)
+        except Exception:
+            self._release()
+            raise
+
+        # Release the slot when the worker finishes, not when the caller stops
+        # waiting - a cancelled request's job still occupies its thread.
+        future.add_done_callback(lambda _: self._release())
+        try:
+            result = await asyncio.wrap_future(future)
+            self.stats["completed"] += 1
+            return result
+        except Exception:
+            self.stats["failed"] += 1
+            raise
+
+    async def stream(self, iterator: Iterator[Any]) -> AsyncIterator[Any]:
+        """
+        Drain a blocking iterator on this faculty's pool.
+
+        The stream holds one admission slot until it is exhausted, and each
+        item is produced on a worker thread so the event loop stays free.
+        """
+        self._admit()
+        try:
+            loop = asyncio.get_running_loop()
+            while True:
+                job = self._timed(functools.partial(next, iterator, _STREAM_END), time.time())
+                item = await loop.run_in_executor(self._pool, job)
+                if item is _STREAM_END:
+                    break
+                yield item
+            self.stats["completed"] += 1
+        except Exception:
+            self.stats["failed"] += 1
+            raise
+        finally:
+            self._release()
+
+    def get_status(self) -> Dict[str, Any]:
+        with self._lock:
+            finished = self.stats["completed"] + self.stats["failed"]
+            return {
+                "workers": self.max_workers,
+                "max_queue_depth": self.max_queue_depth,
+                "running": self._running,
+                "queued": max(0, self._in_flight - self._running),
+                "avg_wait_time": round(self.stats["total_wait_time"] / finished, 3) if finished else 0.0,
+                "avg_run_time": round(self.stats["total_run_time"] / finished, 3) if finished else 0.0,
+                **self.stats
+            }
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+class FacultyExecutors:
+    """Registry of per-faculty executors"""
+
+    def __init__(self, workers: Optional[Dict[str, int]] = None, queue_depths: Optional[Dict[str, int]] = None):
+        workers = {**DEFAULT_FACULTY_WORKERS, **(workers or {})}
+        queue_depths = {**DEFAULT_FACULTY_QUEUE_DEPTH, **(queue_depths or {})}
+
+        self.executors: Dict[str, FacultyExecutor] = {
+            name: FacultyExecutor(name, workers[name], queue_depths.get(name, 0))
+            for name in workers
+        }
+        logger.info("🧵 Faculty executors ready: " +
+                    ", ".join(f"{name}={ex.max_workers}+{ex.max_queue_depth}" for name, ex in self.executors.items()))
+
+    def __getitem__(self, faculty: str) -> FacultyExecutor:
+        return self.executors[faculty]
+
+    async def run(self, faculty: str, func: Callable, *args, **kwargs) -> Any:
+        """Run a blocking callable on the named faculty's pool"""
+        return await self.executors[faculty].run(func, *args, **kwargs)
+
+    def stream(self, faculty: str, iterator: Iterator[Any]) -> AsyncIterator[Any]:
+        """Drain a blocking iterator on the named faculty's pool"""
+        return self.executors[faculty].stream(iterator)
+
+    def get_status(self) -> Dict[str, Any]:
+        return {name: executor.get_status() for name, executor in self.executors.items()}
+
+    def shutdown(self):
+        for executor in self.executors.values():
+            executor.shutdown()
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+LLM Response Cache for API Silicon Server
+
+Persistent, content-addressed cache of generated text. Entries are keyed by
+(model, prompt hash, sampling parameters) and stored as small JSON files
+under the cache directory, so re-running a research workflow with the same
+query and search results (or resuming/retrying a step) returns the earlier
+generations instead of regenerating them.
+
+Entries expire after a TTL and the directory is kept under a disk budget by
+evicting the least recently used files (hits refresh a file's mtime).
+Callers can bypass reads per request; fresh results are still written back.
+
+A generate function that can fall back to another backend reports the one
+that actually answered with record_generation_model(), and wrap() stores the
+response under that model, so a fallback answer is never served as if the
+preferred backend had produced it.
+"""
+
+import os
+import json
+import asyncio
+import contextvars
+import hashlib
+import threading
+import time
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger("SiliconServer.ResponseCache")
+
+# Backend/model that produced the most recent generation in this task
+_generation_model: contextvars.ContextVar = contextvars.ContextVar("generation_model", default=None)
+
+
+def record_generation_model(model: str):
+    """Called by a generate function with the backend/model key that actually answered"""
+    _generation_model.set(model)
+
+
+def make_cache_key(model: str, prompt: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Content address for one generation: sha256 over model, prompt hash and sampling params"""
+    prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    material = json.dumps({"model": model, "prompt": prompt_hash, "params": params or {}},
+                          sort_keys=True, default=str)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    Disk-backed response cache with TTL and size budget.
+
+    Args:
+        cache_dir: Directory for cached responses (created on first write)
+        ttl_seconds: Age after which an entry is ignored and removed
+        max_bytes: Disk budget; least recently used entries are evicted beyond it
+        enabled: When False every lookup misses and nothing is written
+    """
+
+    def __init__(self, cache_dir: str, ttl_seconds: float = 7 * 24 * 3600,
+                 max_bytes: int = 256 * 1024 ** 2, enabled: bool = True):
+        self.cache_dir = str(cache_dir)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+
+        self._lock = threading.Lock()
+        self._index: Optional[Dict[str, list]] = None  # key -> [size, mtime], loaded on first use
+        self._total_bytes = 0
+
+        self.stats = {"hits": 0, "misses": 0, "bypassed": 0, "writes": 0, "expired": 0, "evictions": 0}
+
+    # -------- INDEX -------- #
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def _load_index(self):
+        """Scan the cache directory once (caller holds the lock)"""
+        if self._index is not None:
+            return
+        self._index, self._total_bytes = {}, 0
+        if not os.path.isdir(self.cache_dir):
+            return
+        for shard in os.scandir(self.cache_dir):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith(".json"):
+                    stat = entry.stat()
+                    self._index[entry.name[:-len(".json")]] = [stat.st_size, stat.st_mtime]
+                    self._total_bytes += stat.st_size
+        logger.info(f"🗄️ Response cache indexed {len(self._index)} entries "
+                    f"({self._total_bytes / (1024 ** 2):.1f} MB) in {self.cache_dir}")
+
+    def _remove(self, key: str):
+        """Drop an entry from disk and the index (caller holds the lock)"""
+        size, _ = self._index.pop(key, (0, 0))
+        self._total_bytes -= size
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def _evict_over_budget(self):
+        """Evict least recently used entries until the cache fits its budget (caller holds the lock)"""
+        if self._total_bytes <= self.max_bytes:
+            return
+        for key, _ in sorted(self._index.items(), key=lambda item: item[1][1]):
+            if self._total_bytes <= self.max_bytes:
+                break
+            self._remove(key)
+            self.stats["evictions"] += 1
+
+    # -------- LOOKUP -------- #
+
+    def get(self, model: str, prompt: str, params: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """Cached response text, or None on a miss or expired entry"""
+        if not self.enabled:
+            return None
+        key = make_cache_key(model, prompt, params)
+
+        with self._lock:
+            self._load_index()
+            if key not in self._index:
+                self.stats["misses"] += 1
+                return None
+
+            path = self._path(key)
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                self._remove(key)
+                self.stats["misses"] += 1
+                return None
+
+            if time.time() - entry.get("created_at", 0) > self.ttl_seconds:
+                self._remove(key)
+                self.stats["expired"] += 1
+                self.stats["misses"] += 1
+                return None
+
+            # Touch for LRU eviction
+            now = time.time()
+            try:
+                os.utime(path, (now, now))
+                self._index[key][1] = now
+            except OSError:
+                pass
+            self.stats["hits"] += 1
+            return entry.get("response")
+
+    def put(self, model: str, prompt: str, response: str, params: Optional[Dict[str, Any]] = None):
+        if not self.enabled or not response:
+            return
+        key = make_cache_key(model, prompt, params)
+        payload = json.dumps({
+            "model": model,
+            "params": params or {},
+            "prompt_chars": len(prompt),
+            "created_at": time.time(),
+            "response": response
+        }, default=str)
+
+        with self._lock:
+            self._load_index()
+            path = self._path(key)
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = f"{path}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write(payload)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning(f"⚠️ Could not write response cache entry: {e}")
+                return
+
+            size = os.path.getsize(path)
+            old_size, _ = self._index.get(key, (0, 0))
+            self._index[key] = [size, time.time()]
+            self._total_bytes += size - old_size
+            self.stats["writes"] += 1
+            self._evict_over_budget()
+
+    def wrap(self, generate: Callable[..., Awaitable[str]], model: str, params: Optional[Dict[str, Any]] = None,
+             context: Optional[Dict[str, Any]] = None, bypass: bool = False) -> Callable[..., Awaitable[str]]:
+        """
+        Cache an async generate(prompt, *args, **kwargs) function.
+
+        model is the backend/model expected to answer; lookups use it, and
+        writes use whatever generate reported via record_generation_model().
+        Extra positional/keyword arguments (model alias, system prompt) are part
+        of the key. With a context dict, per-run counters are kept in
+        context["llm_cache_stats"] and context["llm_cache_bypass"] turns on
+        bypass for that run.
+        """
+        run_stats = {"hits": 0, "misses": 0, "bypassed": 0}
+        if context is not None:
+            context["llm_cache_stats"] = run_stats
+
+        async def cached_generate(prompt: str, *args, **kwargs) -> str:
+            key_params = {**(params or {}), "args": list(args), "kwargs": kwargs} if (args or kwargs) else params
+            skip_read = bypass or (context is not None and context.get("llm_cache_bypass", False))
+
+            if skip_read:
+                run_stats["bypassed"] += 1
+                self.stats["bypassed"] += 1
+            else:
+                cached = await asyncio.to_thread(self.get, model, prompt, key_params)
+                if cached is not None:
+                    run_stats["hits"] += 1
+                    return cached
+                run_stats["misses"] += 1
+
+            token = _generation_model.set(None)
+            try:
+                response = await generate(prompt, *args, **kwargs)
+                produced_by = _generation_model.get() or model
+            finally:
+                _generation_model.reset(token)
+            await asyncio.to_thread(self.put, produced_by, prompt, response, key_params)
+            return response
+
+        return cached_generate
+
+    # -------- MAINTENANCE -------- #
+
+    def clear(self):
+        with self._lock:
+            self._load_index()
+            for key in list(self._index):
+                self._remove(key)
+
+    def get_status(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.stats["hits"] + self.stats["misses"]
+            return {
+                "enabled": self.enabled,
+                "cache_dir": self.cache_dir,
+                "entries": len(self._index) if self._index is not None else None,
+                "size_mb": round(self._total_bytes / (1024 ** 2), 2),
+                "max_mb": round(self.max_bytes / (1024 ** 2), 1),
+                "ttl_hours": round(self.ttl_seconds / 3600, 1),
+                "hit_rate": round(self.stats["hits"] / lookups, 3) if lookups else 0.0,
+                **self.stats
+            }
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Token Streaming Helpers for API Silicon Server
+
+Server-Sent Events framing, OpenAI-style chunk builders and token sources for
+incremental LLM output. MLX-LM tokens come from mlx_lm.stream_generate (a
+blocking generator the server drains on the llm faculty pool); Ollama tokens
+come from its NDJSON stream read through the shared Ollama upstream client
+(see upstream_clients.py).
+
+Every stream records time-to-first-token and tokens/sec through
+TokenStreamMetrics so they land in the performance log.
+"""
+
+import json
+import time
+import logging
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, Optional
+
+# MLX-LM streaming (optional)
+try:
+    from mlx_lm import stream_generate
+    MLX_STREAM_AVAILABLE = True
+except ImportError:
+    MLX_STREAM_AVAILABLE = False
+
+try:
+    from mlx_lm.sample_utils import make_sampler
+except ImportError:
+    make_sampler = None
+
+
+logger = logging.getLogger("SiliconServer.LLMStreaming")
+
+SSE_MEDIA_TYPE = "text/event-stream"
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no"  # keep reverse proxies from buffering frames
+}
+SSE_DONE = "data: [DONE]\n\n"
+
+
+# -------- METRICS -------- #
+
+class TokenStreamMetrics:
+    """
+    Time-to-first-token and throughput for one streamed generation.
+
+    Args:
+        operation: Performance log operation name (e.g. MLX_LM_STREAM)
+        model: Model name included in the log details
+        perf_log: Callable(operation, duration, success, details)
+    """
+
+    def __init__(self, operation: str, model: str, perf_log: Optional[Callable] = None):
+        self.operation = operation
+        self.model = model
+        self.perf_log = perf_log
+        self.start_time = time.time()
+        self.first_token_time: Optional[float] = None
+        self.tokens = 0
+        self.reported_tokens: Optional[int] = None
+
+    def record(self, text: str, tokens: int = 1):
+        if not text:
+            return
+        if self.first_token_time is None:
+            self.first_token_time = time.time()
+        self.tokens += tokens
+
+    def set_token_count(self, tokens: int):
+        """Use the upstream's own token count (e.g. Ollama eval_count) when it reports one"""
+        self.reported_tokens = tokens
+
+    @property
+    def time_to_first_token(self) -> float:
+        return (self.first_token_time - self.start_time) if self.first_token_time else 0.0
+
+    @property
+    def tokens_per_second(self) -> float:
+        if self.first_token_time is None:
+            return 0.0
+        elapsed = time.time() - self.first_token_time
+        tokens = self.reported_tokens if self.reported_tokens is not None else self.tokens
+        return tokens / elapsed if elapsed > 0 else 0.0
+
+    def finish(self, success: bool = True, details: str = ""):
+        tokens = self.reported_tokens if self.reported_tokens is not None else self.tokens
+        summary = (f"Model: {self.model} | TTFT: {self.time_to_first_token:.3f}s | "
+                   f"Tokens: {tokens} | Tok/s: {self.tokens_per_second:.1f}")
+        if details:
+            summary += f" | {details}"
+        if self.perf_log:
+            self.perf_log(self.operation, time.time() - self.start_time, success, summary)
+
+
+# -------- FRAMING -------- #
+
+def sse_event(payload: Any) -> str:
+    """Encode one Server-Sent Events data frame"""
+    data = payload if isinstance(payload, str) else json.dumps(payload)
+    return f"data: {data}\n\n"
+
+
+def openai_chat_chunk(completion_id: str, model: str, created: int, content: Optional[str] = None,
+                      role: Optional[str] = None, finish_reason: Optional[str] = None) -> Dict[str, Any]:
+    """Build an OpenAI chat.completion.chunk object"""
+    delta = {}
+    if role:
+        delta["role"] = role
+    if content is not None:
+        delta["content"] = content
+    return {
+        "id": completion_id,
+        "object": "chat.completion.chunk",
+        "created": created,
+        "model": model,
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]
+    }
+
+
+def openai_completion_chunk(completion_id: str, model: str, created: int, text: str = "",
+                            finish_reason: Optional[str] = None) -> Dict[str, Any]:
+    """Build an OpenAI text_completion streaming object"""
+    return {
+        "id": completion_id,
+        "object": "text_completion",
+        "created": created,
+        "model": model,
+        "choices": [{"text": text, "index": 0, "logprobs": None, "finish_reason": finish_reason}]
+    }
+
+
+async def prefetch_first(stream: AsyncIterator[Any]) -> AsyncIterator[Any]:
+    """
+    Pull the first item of a stream before the response starts.
+
+    Connection errors, upstream HTTP errors and FacultyBusyError then surface
+    as a normal error response (or trigger a fallback) instead of arriving
+    after 200 headers have been sent.
+    """
+    iterator = stream.__aiter__()
+    try:
+        first = await iterator.__anext__()
+    except StopAsyncIteration:
+        first = None
+        exhausted = True
+    else:
+        exhausted = False
+
+    async def chained():
+        if exhausted:
+            return
+        yield first
+        async for item in iterator:
+            yield item
+
+    return chained()
+
+
+# -------- TOKEN SOURCES -------- #
+
+def iter_mlx_tokens(model, tokenizer, prompt, max_tokens: int = 512,
+                    temperature: float = 0.7, prompt_cache=None) -> Iterator[str]:
+    """
+    Yield text segments from mlx_lm.stream_generate (blocking).
+
+    prompt may be a string or token ids; with a prompt_cache holding an
+    already-prefilled prefix, pass only the remaining suffix tokens.
+    """
+    if not MLX_STREAM_AVAILABLE:
+        raise ImportError("mlx_lm.stream_generate not available")
+
+    if make_sampler is not None:
+        sampling = {"sampler": make_sampler(temp=temperature)}
+    else:
+        sampling = {"temp": temperature}
+
+    if prompt_cache is not None:
+        sampling["prompt_cache"] = prompt_cache
+
+    for response in stream_generate(model, tokenizer, prompt, max_tokens=max_tokens, **sampling):
+        # Newer mlx_lm yields GenerationResponse objects, older versions yield strings
+        text = getattr(response, "text", response)
+        if text:
+            yield text
+
+
+async def iter_ollama_stream(client, path: str, payload: Dict[str, Any],
+                             timeout: float = 120.0) -> AsyncIterator[Dict[str, Any]]:
+    """Yield parsed NDJSON chunks from a streaming Ollama endpoint over a pooled UpstreamClient"""
+    payload = {**payload, "stream": True}
+    async for line in client.stream_lines("POST", path, json=payload, timeout=timeout):
+        yield json.loads(line)
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+MLX-LM Request Batching for API Silicon Server
+
+Concurrent generate() calls for the same resident model are decoded together
+instead of one prompt at a time. The first request opens a short collection
+window; everything that arrives during the window (and anything that arrives
+while the batch is decoding) is inserted into a shared mlx_lm BatchGenerator,
+so new requests join at the next decode step rather than waiting for the
+whole batch to finish.
+
+Each request keeps its own max_tokens and can be cancelled independently.
+Requests are grouped by (model, temperature) because a BatchGenerator uses a
+single sampler. The decode loop runs on the llm faculty pool in slices of at
+most max_steps_per_job decode rounds; between slices it goes to the back of
+the faculty queue, so other MLX work waiting there is not starved by a batch
+that keeps receiving new requests.
+"""
+
+import asyncio
+import threading
+import time
+import logging
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional
+
+# Batched decoding (optional, newer mlx_lm releases)
+try:
+    from mlx_lm.generate import BatchGenerator
+    MLX_BATCHING_AVAILABLE = True
+except ImportError:
+    MLX_BATCHING_AVAILABLE = False
+
+try:
+    from mlx_lm.sample_utils import make_sampler
+except ImportError:
+    make_sampler = None
+
+from faculty_executors import FacultyExecutor, FacultyBusyError
+
+
+logger = logging.getLogger("SiliconServer.MLXBatching")
+
+
+class BatchRequest:
+    """One caller's prompt, its decode state and its result future"""
+
+    def __init__(self, entry, prompt: str, max_tokens: int, temperature: float):
+        self.entry = entry  # ResidentModel
+        self.prompt = prompt
+        self.max_tokens = max_tokens
+        self.temperature = temperature
+        self.future: Future = Future()
+        self.tokens: List[int] = []
+        self.prompt_tokens = 0
+        self.uid: Optional[int] = None
+        self.cancelled = threading.Event()
+        self.submitted_at = time.time()
+
+    @property
+    def group_key(self):
+        return (self.entry.model_id, round(self.temperature, 3))
+
+    def cancel(self):
+        self.cancelled.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self.cancelled.is_set() or self.future.cancelled()
+
+
+class _BatchGroup:
+    """A BatchGenerator shared by requests with the same model and temperature"""
+
+    def __init__(self, entry, temperature: float):
+        self.entry = entry
+        tokenizer = entry.tokenizer
+        stop_tokens = getattr(tokenizer, "eos_token_ids", None) or {tokenizer.eos_token_id}
+        self.stop_tokens = set(stop_tokens)
+
+        kwargs = {"stop_tokens": self.stop_tokens}
+        if make_sampler is not None:
+            kwargs["sampler"] = make_sampler(temp=temperature)
+        self.generator = BatchGenerator(entry.model, **kwargs)
+        self.requests: Dict[int, BatchRequest] = {}
+
+    def insert(self, request: BatchRequest):
+        prompt_tokens = self.entry.tokenizer.encode(request.prompt)
+        request.prompt_tokens = len(prompt_tokens)
+        request.uid = self.generator.insert([prompt_tokens], [request.max_tokens])[0]
+        self.requests[request.uid] = request
+
+    def remove(self, request: BatchRequest):
+        self.requests.pop(request.uid, None)
+        if hasattr(self.generator, "remove"):
+            self.generator.remove([request.uid])
+
+    def close(self):
+        if hasattr(self.generator, "close"):
+            self.generator.close()
+
+
+class MLXBatchScheduler:
+    """
+    Collects concurrent MLX-LM prompts and decodes them as a batch.
+
+    Args:
+        executor: The llm FacultyExecutor the decode loop runs on
+        window_ms: How long the first request waits for others to join
+        max_batch_size: Maximum requests decoded together per group
+        max_pending: Requests allowed to wait for a batch slot before rejecting
+        max_steps_per_job: Decode rounds per llm faculty job before yielding the worker
+        perf_log: Optional callable(operation, duration, success, details)
+    """
+
+    def __init__(self, executor: FacultyExecutor, window_ms: int = 20, max_batch_size: int = 8,
+                 max_pending: int = 32, max_steps_per_job: int = 32, perf_log: Optional[Callable] = None):
+        self.executor = executor
+        self.window = window_ms / 1000.0
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_pending = max_pending
+        self.max_steps_per_job = max(1, max_steps_per_job)
+        self.perf_log = perf_log
+        self.available = MLX_BATCHING_AVAILABLE
+
+        self._lock = threading.Lock()
+        self._pending: List[BatchRequest] = []
+        self._groups: Dict[Any, _BatchGroup] = {}  # Decode state carried between slices
+        self._draining = False
+        self._solo_jobs = 0  # Unbatched generations (prefix-cache hits) holding the llm faculty
+        self._drain_task: Optional[asyncio.Future] = None
+
+        self.stats = {
+            "requests": 0,
+            "completed": 0,
+            "cancelled": 0,
+            "failed": 0,
+            "decode_steps": 0,
+            "drain_jobs": 0,
+            "solo": 0,
+            "peak_batch_size": 0,
+            "tokens_generated": 0,
+            "total_decode_time": 0.0
+        }
+
+    @property
+    def is_busy(self) -> bool:
+        """True while a batch is collecting or decoding, or a solo generation runs"""
+        return self._draining or bool(self._pending) or self._solo_jobs > 0
+
+    def claim_solo(self) -> bool:
+        """
+        Reserve the model for one unbatched generation if nothing else is
+        running. Check and claim are atomic, so of several concurrent callers
+        one goes solo and the rest are batched. Pair with release_solo().
+        """
+        with self._lock:
+            if self._draining or self._pending or self._solo_jobs:
+                return False
+            self._solo_jobs += 1
+            self.stats["solo"] += 1
+            return True
+
+    def release_solo(self):
+        with self._lock:
+            self._solo_jobs -= 1
+
+    # -------- SUBMISSION -------- #
+
+    async def generate(self, entry, prompt: str, max_tokens: int = 512, temperature: float = 0.7) -> str:
+        """Queue a prompt for batched decoding and await its own completion"""
+        request = BatchRequest(entry, prompt, max_tokens, temperature)
+
+        with self._lock:
+            if len(self._pending) >= self.max_pending:
+                self.stats["requests"] += 1
+                self.stats["failed"] += 1
+                raise FacultyBusyError(self.executor.name)
+            self._pending.append(request)
+            self.stats["requests"] += 1
+            start_drain = not self._draining
+            self._draining = True
+
+        if start_drain:
+            self._drain_task = asyncio.ensure_future(self._run_drain())
+
+        try:
+            return await asyncio.wrap_future(request.future)
+        except asyncio.CancelledError:
+            # Client went away - free the batch slot at the next decode step
+            request.cancel()
+            raise
+
+    async def _run_drain(self):
+        first_slice = True
+        try:
+            while True:
+                try:
+                    finished = await self.executor.run(self._drain, first_slice)
+                except FacultyBusyError:
+                    if first_slice:
+                        raise
+                    # Requests are mid-decode - wait for a queue slot rather than failing them
+                    await asyncio.sleep(self.window or 0.01)
+                    continue
+                if finished:
+                    return
+                first_slice = False
+        except Exception as e:
+            # Admission failure or a crashed loop: fail whatever is still waiting
+            with self._lock:
+                pending, self._pending = self._pending, []
+                groups, self._groups = self._groups, {}
+                self._draining = False
+            active = [request for group in groups.values() for request in group.requests.values()]
+            for group in groups.values():
+                group.close()
+            for request in pending + active:
+                if not request.future.done():
+                    request.future.set_exception(e)
+
+    # -------- DECODE LOOP (llm faculty thread) -------- #
+
+    def _drain(self, first_slice: bool = True) -> bool:
+        """
+        Decode up to max_steps_per_job rounds. Returns True once no request
+        is pending or active, False when the batch should be re-enqueued.
+        """
+        if first_slice:
+            time.sleep(self.window)
+        self.stats["drain_jobs"] += 1
+        groups = self._groups
+        admitted: List[BatchRequest] = []
+
+        try:
+            for _ in range(self.max_steps_per_job):
+                with self._lock:
+                    if not self._pending and not groups:
+                        self._draining = False
+                        return True
+                    admitted = self._admit_pending(groups)
+
+                for request in admitted:
+                    group = groups.get(request.group_key)
+                    if group is None:
+                        group = groups[request.group_key] = _BatchGroup(request.entry, request.temperature)
+                    group.insert(request)
+
+                for key, group in list(groups.items()):
+                    self._step(group)
+                    if not group.requests:
+                        group.close()
+                        del groups[key]
+                admitted = []
+
+            with self._lock:
+                if not self._pending and not groups:
+                    self._draining = False
+                    return True
+            # Give other llm faculty jobs a turn before the next slice
+            return False
+        except Exception as e:
+            logger.error(f"❌ Batched decode failed: {e}")
+            active = [r for group in groups.values() for r in group.requests.values()]
+            for request in active + admitted:
+                if not request.future.done():
+                    request.future.set_exception(e)
+                    self.stats["failed"] += 1
+            for group in groups.values():
+                group.close()
+            groups.clear()
+            raise
+
+    def _admit_pending(self, groups: Dict[Any, _BatchGroup]) -> List[BatchRequest]:
+        """Move pending requests into batches that have room (caller holds the lock)"""
+        admitted, waiting = [], []
+        for request in self._pending:
+            if request.is_cancelled:
+                request.future.cancel()
+                self.stats["cancelled"] += 1
+                continue
+            group = groups.get(request.group_key)
+            active = len(group.requests) if group else 0
+            active += sum(1 for r in admitted if r.group_key == request.group_key)
+            (admitted if active < self.max_batch_size else waiting).append(request)
+        self._pending = waiting
+        return admitted
+
+    def _step(self, group: _BatchGroup):
+        """Run one decode step for a group and hand finished results back"""
+        for request in list(group.requests.values()):
+            if request.is_cancelled:
+                group.remove(request)
+                request.future.cancel()
+                self.stats["cancelled"] += 1
+
+        if not group.requests:
+            return
+
+        start_time = time.time()
+        responses = group.generator.next()
+        self.stats["decode_steps"] += 1
+        self.stats["total_decode_time"] += time.time() - start_time
+        self.stats["peak_batch_size"] = max(self.stats["peak_batch_size"], len(group.requests))
+
+        for response in responses:
+            request = group.requests.get(response.uid)
+            if request is None:
+                continue
+            if response.token not in group.stop_tokens:
+                request.tokens.append(response.token)
+                self.stats["tokens_generated"] += 1
+            if response.finish_reason is not None:
+                group.requests.pop(response.uid, None)
+                self._complete(request)
+
+    def _complete(self, request: BatchRequest):
+        text = request.entry.tokenizer.decode(request.tokens)
+        if not request.future.done():
+            request.future.set_result(text)
+        self.stats["completed"] += 1
+
+        if self.perf_log:
+            self.perf_log("MLX_LM_BATCH_REQUEST", time.time() - request.submitted_at, True,
+                          f"Model: {request.entry.model_id} | Prompt tokens: {request.prompt_tokens} | "
+                          f"Tokens: {len(request.tokens)}")
+
+    # -------- STATUS -------- #
+
+    def get_status(self) -> Dict[str, Any]:
+        with self._lock:
+            decode_time = self.stats["total_decode_time"]
+            return {
+                "available": self.available,
+                "window_ms": round(self.window * 1000),
+                "max_batch_size": self.max_batch_size,
+                "pending": len(self._pending),
+                "decoding": self._draining,
+                "solo_running": self._solo_jobs,
+                "tokens_per_second": round(self.stats["tokens_generated"] / decode_time, 1) if decode_time else 0.0,
+                **self.stats
+            }
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+MLX Model Residency for API Silicon Server
+
+Keeps several MLX-LM models loaded at once so requests that alternate between
+models (research workflows, personalities) reuse resident weights instead of
+reloading from disk on every switch. Residency is bounded by a model count and
+by a unified-memory byte budget; unpinned models are evicted in
+least-recently-used order. Pinned models are never evicted.
+"""
+
+import re
+import threading
+import time
+import logging
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# MLX (optional) - used for weight sizes and releasing the Metal cache
+try:
+    import mlx.core as mx
+    from mlx.utils import tree_flatten
+    MLX_CORE_AVAILABLE = True
+except ImportError:
+    MLX_CORE_AVAILABLE = False
+
+
+logger = logging.getLogger("SiliconServer.MLXResidency")
+
+_SIZE_UNITS = {"B": 1, "KB": 1024, "MB": 1024 ** 2, "GB": 1024 ** 3, "TB": 1024 ** 4}
+
+
+def parse_memory_size(value) -> Optional[int]:
+    """Parse a size such as "8GB" or "512 MB" into bytes (None if empty or invalid)"""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+
+    match = re.fullmatch(r"\s*([\d.]+)\s*([KMGT]?B)?\s*", str(value).upper())
+    if not match:
+        return None
+    return int(float(match.group(1)) * _SIZE_UNITS[match.group(2) or "B"])
+
+
+def estimate_model_bytes(model) -> int:
+    """Sum the parameter array sizes of an MLX model (0 when MLX is unavailable)"""
+    if not MLX_CORE_AVAILABLE:
+        return 0
+    try:
+        return sum(array.nbytes for _, array in tree_flatten(model.parameters()))
+    except Exception:
+        return 0
+
+
+def _release_metal_cache():
+    if not MLX_CORE_AVAILABLE:
+        return
+    clear_cache = getattr(mx, "clear_cache", None) or getattr(getattr(mx, "metal", None), "clear_cache", None)
+    if clear_cache:
+        clear_cache()
+
+
+class ResidentModel:
+    """A loaded model/tokenizer pair and its usage counters"""
+
+    def __init__(self, model_id: str, model: Any, tokenizer: Any, estimated_bytes: int, load_time: float):
+        self.model_id = model_id
+        self.model = model
+        self.tokenizer = tokenizer
+        self.estimated_bytes = estimated_bytes
+        self.load_time = load_time
+        self.loaded_at = time.time()
+        self.last_used = self.loaded_at
+        self.hits = 0
+
+
+class MLXModelResidency:
+    """
+    LRU residency manager for MLX-LM models.
+
+    Args:
+        loader: Callable(model_id) -> (model, tokenizer), e.g. mlx_lm.load
+        max_models: Maximum number of models kept loaded
+        memory_budget_bytes: Unified-memory budget for resident weights (None = count only)
+        on_evict: Optional callable(model_id) run when a model leaves residency
+    """
+
+    def __init__(self, loader: Callable[[str], Tuple[Any, Any]], max_models: int = 2,
+                 memory_budget_bytes: Optional[int] = None, on_evict: Optional[Callable[[str], None]] = None):
+        self.loader = loader
+        self.on_evict = on_evict
+        self.max_models = max(1, max_models)
+        self.memory_budget_bytes = memory_budget_bytes
+
+        self._models: "OrderedDict[str, ResidentModel]" = OrderedDict()
+        self._pinned = set()
+        self._lock = threading.RLock()
+        self._load_locks: Dict[str, threading.Lock] = {}
+
+        self.stats = {"hits": 0, "misses": 0, "loads": 0, "evictions": 0, "total_load_time": 0.0}
+
+    # -------- LOOKUP -------- #
+
+    def lookup(self, model_id: str) -> Optional[ResidentModel]:
+        """Return the resident entry for model_id without loading (marks it recently used)"""
+        with self._lock:
+            entry = self._models.get(model_id)
+            if entry is None:
+                return None
+            self._models.move_to_end(model_id)
+            entry.last_used = time.time()
+            entry.hits += 1
+            self.stats["hits"] += 1
+            return entry
+
+    def peek(self, model_id: str) -> Optional[ResidentModel]:
+        """Return the resident entry without touching LRU order or hit counts"""
+        with self._lock:
+            return self._models.get(model_id)
+
+    def load(self, model_id: str) -> ResidentModel:
+        """Return the resident entry for model_id, loading it if needed (blocking)"""
+        entry = self.lookup(model_id)
+        if entry:
+            return entry
+
+        with self._lock:
+            load_lock = self._load_locks.setdefault(model_id, threading.Lock())
+
+        # Concurrent requests for the same model wait for one load
+        with load_lock:
+            entry = self.lookup(model_id)
+            if entry:
+                return entry
+
+            with self._lock:
+                self.stats["misses"] += 1
+
+            start_time = time.time()
+            model, tokenizer = self.loader(model_id)
+            load_time = time.time() - start_time
+
+            entry = ResidentModel(model_id, model, tokenizer, estimate_model_bytes(model), load_time)
+            with self._lock:
+                self._models[model_id] = entry
+                self.stats["loads"] += 1
+                self.stats["total_load_time"] += load_time
+                self._evict_over_budget(keep=model_id)
+
+            logger.info(f"🧠 Resident MLX model loaded: {model_id} in {load_time:.2f}s "
+                        f"(~{entry.estimated_bytes / (1024 ** 3):.2f} GB)")
+            return entry
+
+    # -------- RESIDENCY -------- #
+
+    @property
+    def resident_bytes(self) -> int:
+        return sum(entry.estimated_bytes for entry in self._models.values())
+
+    def _over_budget(self) -> bool:
+        if len(self._models) > self.max_models:
+            return True
+        return bool(self.memory_budget_bytes) and self.resident_bytes > self.memory_budget_bytes
+
+    def _evict_over_budget(self, keep: str):
+        """Evict least-recently-used unpinned models until count and memory fit (caller holds the lock)"""
+        evicted = False
+        for model_id in list(self._models.keys()):
+            if not self._over_budget():
+                break
+            if model_id == keep or model_id in self._pinned:
+                continue
+            del self._models[model_id]
+            self.stats["evictions"] += 1
+            evicted = True
+            self._notify_evicted(model_id)
+            logger.info(f"♻️ Evicted MLX model: {model_id}")
+
+        if evicted:
+            _release_metal_cache()
+
+    def _notify_evicted(self, model_id: str):
+        if self.on_evict:
+            self.on_evict(model_id)
+
+    def pin(self, model_id: str) -> ResidentModel:
+        """Load model_id if needed and exempt it from eviction"""
+        entry = self.load(model_id)
+        with self._lock:
+            self._pinned.add(model_id)
+        logger.info(f"📌 Pinned MLX model: {model_id}")
+        return entry
+
+    def unpin(self, model_id: str) -> bool:
+        with self._lock:
+            if model_id not in self._pinned:
+                return False
+            self._pinned.discard(model_id)
+            self._evict_over_budget(keep="")
+        return True
+
+    def evict(self, model_id: str) -> bool:
+        """Drop a model regardless of pinning"""
+        with self._lock:
+            self._pinned.discard(model_id)
+            removed = self._models.pop(model_id, None) is not None
+        if removed:
+            self._notify_evicted(model_id)
+            _release_metal_cache()
+        return removed
+
+    def clear(self, include_pinned: bool = False):
+        with self._lock:
+            for model_id in list(self._models.keys()):
+                if include_pinned or model_id not in self._pinned:
+                    del self._models[model_id]
+                    self._notify_evicted(model_id)
+            if include_pinned:
+                self._pinned.clear()
+        _release_metal_cache()
+
+    def get_status(self) -> Dict[str, Any]:
+        """Residency, pinning and hit counters for /status"""
+        with self._lock:
+            lookups = self.stats["hits"] + self.stats["misses"]
+            return {
+                "resident_models": [
+                    {
+                        "model": entry.model_id,
+                        "pinned": entry.model_id in self._pinned,
+                        "estimated_gb": round(entry.estimated_bytes / (1024 ** 3), 2),
+                        "load_time": round(entry.load_time, 2),
+                        "hits": entry.hits,
+                        "idle_seconds": round(time.time() - entry.last_used, 1)
+                    }
+                    for entry in reversed(self._models.values())
+                ],
+                "max_models": self.max_models,
+                "memory_budget_gb": round(self.memory_budget_bytes / (1024 ** 3), 2) if self.memory_budget_bytes else None,
+                "resident_gb": round(self.resident_bytes / (1024 ** 3), 2),
+                "hit_rate": round(self.stats["hits"] / lookups, 3) if lookups else 0.0,
+                **self.stats
+            }
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+MLX Prompt Prefix Cache for API Silicon Server
+
+Keeps the prefilled KV state of recently seen prompt prefixes (long
+personality/system prompts) for each resident MLX model. A request whose
+tokens start with a cached prefix copies that KV state and prefills only the
+new suffix, instead of re-running the whole system prompt through the model
+on every turn.
+
+Entries are matched on token ids (longest cached prefix wins), bounded by an
+entry count and a memory budget, and evicted least-recently-used.
+"""
+
+import copy
+import threading
+import time
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+# MLX-LM prompt caches (optional)
+try:
+    import mlx.core as mx
+    from mlx.utils import tree_flatten
+    from mlx_lm.models.cache import make_prompt_cache
+    MLX_PROMPT_CACHE_AVAILABLE = True
+except ImportError:
+    MLX_PROMPT_CACHE_AVAILABLE = False
+
+
+logger = logging.getLogger("SiliconServer.PromptCache")
+
+# Prefill long prefixes in slices so peak activation memory stays bounded
+PREFILL_STEP_SIZE = 2048
+
+# Distinct prefixes whose token counts are remembered for is_cacheable()
+PREFIX_LENGTH_MEMO = 256
+
+
+def _cache_bytes(prompt_cache) -> int:
+    try:
+        return sum(array.nbytes for _, array in tree_flatten([layer.state for layer in prompt_cache]))
+    except Exception:
+        return 0
+
+
+class _PrefixEntry:
+    def __init__(self, model_id: str, tokens: Tuple[int, ...], prompt_cache: List[Any], prefill_time: float):
+        self.model_id = model_id
+        self.tokens = tokens
+        self.prompt_cache = prompt_cache
+        self.estimated_bytes = _cache_bytes(prompt_cache)
+        self.prefill_time = prefill_time
+        self.last_used = time.time()
+        self.hits = 0
+
+
+class PromptPrefixCache:
+    """
+    Memory-bounded LRU of prefilled prompt prefixes per model.
+
+    Args:
+        max_entries: Maximum cached prefixes across all models
+        memory_budget_bytes: Approximate KV memory allowed for cached prefixes
+        min_prefix_tokens: Prefixes shorter than this are not worth caching
+    """
+
+    def __init__(self, max_entries: int = 16, memory_budget_bytes: int = 1024 ** 3, min_prefix_tokens: int = 32):
+        self.max_entries = max(1, max_entries)
+        self.memory_budget_bytes = memory_budget_bytes
+        self.min_prefix_tokens = min_prefix_tokens
+        self.available = MLX_PROMPT_CACHE_AVAILABLE
+
+        self._entries: "OrderedDict[Tuple[str, Tuple[int, ...]], _PrefixEntry]" = OrderedDict()
+        self._prefix_lengths: "OrderedDict[Tuple[str, str], int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "prefills": 0,
+            "evictions": 0,
+            "reused_tokens": 0,
+            "total_prefill_time": 0.0
+        }
+
+    # -------- LOOKUP -------- #
+
+    def prepare(self, resident, prompt: str, prefix: Optional[str] = None) -> Tuple[List[int], Optional[List[Any]]]:
+        """
+        Tokenize prompt and attach a KV cache for its longest cached prefix.
+
+        Returns (tokens_to_prefill, prompt_cache). When prefix is given and not
+        yet cached it is prefilled and stored first, so the next request that
+        shares it only prefills its own suffix. Runs on the llm faculty thread.
+        """
+        tokenizer = resident.tokenizer
+        tokens = list(tokenizer.encode(prompt))
+        if not self.available:
+            return tokens, None
+
+        entry = self._longest_prefix(resident.model_id, tokens)
+
+        if entry is None and prefix:
+            prefix_tokens = list(tokenizer.encode(prefix))
+            # Only reuse when the prefix tokenizes identically inside the full prompt
+            if (len(prefix_tokens) >= self.min_prefix_tokens and len(prefix_tokens) < len(tokens)
+                    and tokens[:len(prefix_tokens)] == prefix_tokens):
+                entry = self._prefill(resident, tuple(prefix_tokens))
+
+        with self._lock:
+            if entry is None:
+                self.stats["misses"] += 1
+                return tokens, None
+            entry.hits += 1
+            entry.last_used = time.time()
+            self.stats["hits"] += 1
+            self.stats["reused_tokens"] += len(entry.tokens)
+
+        # Generation appends to the cache, so each request works on its own copy
+        return tokens[len(entry.tokens):], copy.deepcopy(entry.prompt_cache)
+
+    def is_cacheable(self, resident, prefix: Optional[str]) -> bool:
+        """
+        True when prefix is long enough to be cached (or reused) for this
+        model. Token counts are remembered per prefix, so the tokenizer runs
+        once per distinct system prompt.
+        """
+        if not prefix or not self.available:
+            return False
+        key = (resident.model_id, prefix)
+        with self._lock:
+            length = self._prefix_lengths.get(key)
+            if length is not None:
+                self._prefix_lengths.move_to_end(key)
+        if length is None:
+            length = len(resident.tokenizer.encode(prefix))
+            with self._lock:
+                self._prefix_lengths[key] = length
+                while len(self._prefix_lengths) > PREFIX_LENGTH_MEMO:
+                    self._prefix_lengths.popitem(last=False)
+        return length >= self.min_prefix_tokens
+
+    def _longest_prefix(self, model_id: str, tokens: List[int]) -> Optional[_PrefixEntry]:
+        with self._lock:
+            best = None
+            for (entry_model, entry_tokens), entry in self._entries.items():
+                if entry_model != model_id or len(entry_tokens) >= len(tokens):
+                    continue
+                if best is not None and len(entry_tokens) <= len(best.tokens):
+                    continue
+                if tuple(tokens[:len(entry_tokens)]) == entry_tokens:
+                    best = entry
+            if best is not None:
+                self._entries.move_to_end((model_id, best.tokens))
+            return best
+
+    # -------- PREFILL -------- #
+
+    def _prefill(self, resident, prefix_tokens: Tuple[int, ...]) -> _PrefixEntry:
+        start_time = time.time()
+        prompt_cache = make_prompt_cache(resident.model)
+
+        remaining = mx.array(prefix_tokens)
+        while remaining.size > 0:
+            step = remaining[:PREFILL_STEP_SIZE]
+            resident.model(step[None], cache=prompt_cache)
+            mx.eval([layer.state for layer in prompt_cache])
+            remaining = remaining[PREFILL_STEP_SIZE:]
+
+        prefill_time = time.time() - start_time
+        entry = _PrefixEntry(resident.model_id, prefix_tokens, prompt_cache, prefill_time)
+
+        with self._lock:
+            self._entries[(resident.model_id, prefix_tokens)] = entry
+            self.stats["prefills"] += 1
+            self.stats["total_prefill_time"] += prefill_time
+            self._evict_over_budget()
+
+        logger.info(f"🧩 Cached prompt prefix: {len(prefix_tokens)} tokens for {resident.model_id} "
+                    f"in {prefill_time:.2f}s (~{entry.estimated_bytes / (1024 ** 2):.1f} MB)")
+        return entry
+
+    # -------- RESIDENCY -------- #
+
+    @property
+    def resident_bytes(self) -> int:
+        return sum(entry.estimated_bytes for entry in self._entries.values())
+
+    def _evict_over_budget(self):
+        """Evict least-recently-used prefixes until count and memory fit (caller holds the lock)"""
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries or self.resident_bytes > self.memory_budget_bytes
+        ):
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def evict_model(self, model_id: str):
+        """Drop every prefix for a model (its KV state is useless once the weights are gone)"""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == model_id]:
+                del self._entries[key]
+            for key in [key for key in self._prefix_lengths if key[0] == model_id]:
+                del self._prefix_lengths[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._prefix_lengths.clear()
+
+    def get_status(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.stats["hits"] + self.stats["misses"]
+            return {
+                "available": self.available,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "resident_mb": round(self.resident_bytes / (1024 ** 2), 1),
+                "memory_budget_mb": round(self.memory_budget_bytes / (1024 ** 2), 1),
+                "hit_rate": round(self.stats["hits"] / lookups, 3) if lookups else 0.0,
+                **self.stats
+            }
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Research Library Store for API Silicon Server
+
+Embedded SQLite store for saved research. Items live in one table indexed by
+(created_at, id) and by the workflow_type / academic_level filters, with an
+FTS5 index over query, title and content. Library listings are served with
+keyset pagination (an opaque cursor of the last item's created_at and id), so
+a page costs the same however many research runs have been saved.
+
+Research saved by earlier versions as one JSON file per item in
+research_library/ is imported once on first start; the JSON files are left
+in place. If the SQLite build lacks FTS5, search falls back to LIKE matching.
+"""
+
+import base64
+import json
+import sqlite3
+import threading
+import time
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger("SiliconServer.ResearchLibrary")
+
+PREVIEW_CHARS = 300
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS research_items (
+    pk INTEGER PRIMARY KEY,
+    id TEXT UNIQUE NOT NULL,
+    query TEXT NOT NULL,
+    title TEXT NOT NULL,
+    content TEXT NOT NULL,
+    workflow_type TEXT,
+    academic_level TEXT,
+    word_count INTEGER DEFAULT 0,
+    created_at TEXT NOT NULL,
+    metadata TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_research_created ON research_items (created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_research_workflow ON research_items (workflow_type, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_research_level ON research_items (academic_level, created_at DESC, id DESC);
+CREATE TABLE IF NOT EXISTS library_meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS research_fts USING fts5(
+    query, title, content, content='research_items', content_rowid='pk'
+);
+CREATE TRIGGER IF NOT EXISTS research_items_ai AFTER INSERT ON research_items BEGIN
+    INSERT INTO research_fts (rowid, query, title, content) VALUES (new.pk, new.query, new.title, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS research_items_ad AFTER DELETE ON research_items BEGIN
+    INSERT INTO research_fts (research_fts, rowid, query, title, content)
+    VALUES ('delete', old.pk, old.query, old.title, old.content);
+END;
+CREATE TRIGGER IF NOT EXISTS research_items_au AFTER UPDATE ON research_items BEGIN
+    INSERT INTO research_fts (research_fts, rowid, query, title, content)
+    VALUES ('delete', old.pk, old.query, old.title, old.content);
+    INSERT INTO research_fts (rowid, query, title, content) VALUES (new.pk, new.query, new.title, new.content);
+END;
+"""
+
+
+def derive_title(content: str, query: str) -> str:
+    """First markdown heading of the document, or the research query"""
+    for line in content.splitlines()[:20]:
+        stripped = line.strip()
+        if stripped.startswith("#"):
+            title = stripped.lstrip("#").strip()
+            if title:
+                return title[:200]
+    return query[:200]
+
+
+def encode_cursor(created_at: str, research_id: str) -> str:
+    return base64.urlsafe_b64encode(json.dumps([created_at, research_id]).encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    try:
+        created_at, research_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return str(created_at), str(research_id)
+    except Exception:
+        raise ValueError("Invalid library cursor")
+
+
+def _fts_query(search: str) -> str:
+    """Turn free text into an FTS5 query: every word must match (as a prefix)"""
+    terms = [term.replace('"', '""') for term in search.split() if term.strip()]
+    return " AND ".join(f'"{term}"*' for term in terms)
+
+
+class ResearchLibraryStore:
+    """
+    SQLite-backed research library.
+
+    Args:
+        db_path: SQLite database file (created with its directory if missing)
+        legacy_dir: Directory of per-item JSON files to import once
+    """
+
+    def __init__(self, db_path: str, legacy_dir: Optional[str] = None):
+        self.db_path = Path(db_path)
+        self.legacy_dir = Path(legacy_dir) if legacy_dir else None
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+        try:
+            self._conn.executescript(FTS_SCHEMA)
+            self.fts_available = True
+        except sqlite3.OperationalError as e:
+            logger.warning(f"⚠️ SQLite FTS5 not available ({e}) - library search uses LIKE matching")
+            self.fts_available = False
+        self._conn.commit()
+
+        self.stats = {"saved": 0, "listed": 0, "searches": 0, "imported": 0, "total_query_time": 0.0}
+
+        if self.legacy_dir:
+            self.import_json_dir(self.legacy_dir)
+
+    # -------- WRITES -------- #
+
+    def save(self, item: Dict[str, Any]):
+        """Insert or replace one research item ({id, query, content, metadata})"""
+        metadata = item.get("metadata", {})
+        with self._lock:
+            self._insert(item, metadata, replace=True)
+            self._conn.commit()
+        self.stats["saved"] += 1
+
+    def _insert(self, item: Dict[str, Any], metadata: Dict[str, Any], replace: bool) -> bool:
+        """Insert one item (caller holds the lock and commits)"""
+        content = item.get("content", "")
+        query = item.get("query", "")
+        # An upsert (not INSERT OR REPLACE) so the FTS update trigger fires for re-saved items
+        conflict = ("DO UPDATE SET query = excluded.query, title = excluded.title, content = excluded.content, "
+                    "workflow_type = excluded.workflow_type, academic_level = excluded.academic_level, "
+                    "word_count = excluded.word_count, created_at = excluded.created_at, metadata = excluded.metadata"
+                    if replace else "DO NOTHING")
+        cursor = self._conn.execute(
+            f"""INSERT INTO research_items
+                (id, query, title, content, workflow_type, academic_level, word_count, created_at, metadata)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) {conflict}""",
+            (
+                item["id"], query, item.get("title") or derive_title(content, query), content,
+                metadata.get("workflow_type"), metadata.get("academic_level"),
+                int(metadata.get("word_count") or 0), metadata.get("created_at") or "",
+                json.dumps(metadata, ensure_ascii=False, default=str)
+            )
+        )
+        return cursor.rowcount > 0
+
+    def delete(self, research_id: str) -> bool:
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM research_items WHERE id = ?", (research_id,))
+            self._conn.commit()
+            return cursor.rowcount > 0
+
+    def import_json_dir(self, directory: Path, force: bool = False) -> int:
+        """One-time import of legacy per-item JSON files; returns the number of items added"""
+        with self._lock:
+            done = self._conn.execute(
+                "SELECT value FROM library_meta WHERE key = 'json_import_done'"
+            ).fetchone()
+            if done and not force:
+                return 0
+
+            imported = 0
+            start_time = time.time()
+            if directory.is_dir():
+                for file_path in sorted(directory.glob("*.json")):
+                    try:
+                        with open(file_path, "r", encoding="utf-8") as f:
+                            item = json.load(f)
+                        if self._insert(item, item.get("metadata", {}), replace=False):
+                            imported += 1
+                    except Exception as e:
+                        logger.warning(f"⚠️ Skipped research file {file_path.name}: {e}")
+
+            self._conn.execute(
+                "INSERT OR REPLACE INTO library_meta (key, value) VALUES ('json_import_done', ?)",
+                (time.strftime("%Y-%m-%dT%H:%M:%S"),)
+            )
+            self._conn.commit()
+
+        self.stats["imported"] += imported
+        if imported:
+            logger.info(f"📚 Imported {imported} research items from {directory} in {time.time() - start_time:.2f}s")
+        return imported
+
+    # -------- READS -------- #
+
+    def get(self, research_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id, query, title, content, metadata FROM research_items WHERE id = ?", (research_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "id": row["id"],
+            "query": row["query"],
+            "title": row["title"],
+            "content": row["content"],
+            "metadata": json.loads(row["metadata"])
+        }
+
+    def list(self, search: Optional[str] = None, workflow_type: Optional[str] = None,
+             academic_level: Optional[str] = None, limit: int = 50, cursor: Optional[str] = None,
+             offset: int = 0) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        One page of library summaries, newest first.
+
+        Pass the returned next_cursor to fetch the following page; offset is
+        honoured only without a cursor (for older clients).
+        Returns (items, next_cursor).
+        """
+        conditions, params = [], []
+
+        if search and search.strip():
+            if self.fts_available and _fts_query(search):
+                conditions.append("r.pk IN (SELECT rowid FROM research_fts WHERE research_fts MATCH ?)")
+                params.append(_fts_query(search))
+            else:
+                conditions.append("(r.query LIKE ? OR r.title LIKE ? OR r.content LIKE ?)")
+                pattern = f"%{search.strip()}%"
+                params.extend([pattern, pattern, pattern])
+            self.stats["searches"] += 1
+        if workflow_type:
+            conditions.append("r.workflow_type = ?")
+            params.append(workflow_type)
+        if academic_level:
+            conditions.append("r.academic_level = ?")
+            params.append(academic_level)
+        if cursor:
+            created_at, research_id = decode_cursor(cursor)
+            conditions.append("(r.created_at < ? OR (r.created_at = ? AND r.id < ?))")
+            params.extend([created_at, created_at, research_id])
+
+        limit = max(1, min(int(limit), 500))
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        sql = f"""
+            SELECT r.id, r.query, r.title, substr(r.content, 1, {PREVIEW_CHARS + 1}) AS preview,
+                   r.workflow_type, r.academic_level, r.word_count, r.created_at, r.metadata
+            FROM research_items r
+            {where}
+            ORDER BY r.created_at DESC, r.id DESC
+            LIMIT ? OFFSET ?
+        """
+        params.extend([limit + 1, 0 if cursor else max(0, int(offset))])
+
+        start_time = time.time()
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        self.stats["total_query_time"] += time.time() - start_time
+        self.stats["listed"] += 1
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        items = []
+        for row in rows:
+            preview = row["preview"]
+            items.append({
+                "id": row["id"],
+                "query": row["query"],
+                "title": row["title"],
+                "content_preview": preview[:PREVIEW_CHARS] + "..." if len(preview) > PREVIEW_CHARS else preview,
+                "metadata": json.loads(row["metadata"]),
+                "word_count": row["word_count"],
+                "created_at": row["created_at"],
+                "workflow_type": row["workflow_type"],
+                "academic_level": row["academic_level"]
+            })
+
+        next_cursor = encode_cursor(rows[-1]["created_at"], rows[-1]["id"]) if has_more and rows else None
+        return items, next_cursor
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM research_items").fetchone()[0]
+
+    def get_status(self) -> Dict[str, Any]:
+        listed = self.stats["listed"]
+        return {
+            "db_path": str(self.db_path),
+            "items": self.count(),
+            "fts5": self.fts_available,
+            "avg_list_ms": round(self.stats["total_query_time"] / listed * 1000, 2) if listed else 0.0,
+            **self.stats
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
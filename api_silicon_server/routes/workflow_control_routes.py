@@ -6,6 +6,7 @@ Flask routes for interactive workflow control, providing:
 - Step modification controls  
 - Execution monitoring and analytics
 - Pipeline customization interface
+- Durable checkpoints: interrupted executions resume from their last completed step
 """
 
 import asyncio
@@ -26,6 +27,13 @@ from ..workflows.research_workflow import (
     create_research_context,
     WORKFLOW_REGISTRY
 )
+from ..workflow_checkpoints import WorkflowCheckpointStore, ACTIVE_STATUSES
+
+try:
+    from ..config import WORKFLOW_CHECKPOINT_DB, WORKFLOW_CHECKPOINT_RETENTION_DAYS
+except ImportError:
+    WORKFLOW_CHECKPOINT_DB = "workflow_checkpoints/checkpoints.sqlite3"
+    WORKFLOW_CHECKPOINT_RETENTION_DAYS = 7
 
 # Set up blueprint and logger
 workflow_control_bp = Blueprint('workflow_control', __name__)
@@ -35,6 +43,11 @@ control_logger.setLevel(logging.INFO)
 # Store active controllers for real-time updates
 active_controllers = {}
 
+# Executions, step results and context snapshots survive restarts here.
+# The server flags executions a previous process left running when it starts;
+# doing it again at import would mark runs started since then as interrupted.
+checkpoint_store = WorkflowCheckpointStore(WORKFLOW_CHECKPOINT_DB, WORKFLOW_CHECKPOINT_RETENTION_DAYS)
+
 
 @workflow_control_bp.route('/workflow-control')
 def workflow_control_interface():
@@ -60,6 +73,115 @@ def get_available_workflows():
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+def _launch_interactive_workflow(query: str, workflow_type: str, user_session: str,
+                                 execution_id: str = None) -> InteractiveWorkflowController:
+    """
+    Build a workflow, wrap it in a checkpointed controller and schedule it.
+    
+    Passing the execution_id of an interrupted run resumes it from its
+    last completed step.
+    """
+    # Create workflow context (you'll need to adapt this to your specific setup)
+    context = create_research_context(
+        # Add your model, tokenizer, etc. here based on your setup
+        # model=your_model,
+        # tokenizer=your_tokenizer,
+        # proto_ai=your_proto_ai,
+    )
+    
+    # Build the requested workflow
+    if workflow_type in WORKFLOW_REGISTRY:
+        workflow = WORKFLOW_REGISTRY[workflow_type](context)
+    else:
+        workflow = build_research_workflow(context)
+    
+    # Create interactive controller with enhanced real-time feedback
+    def feedback_callback(feedback):
+        """Send comprehensive real-time feedback via WebSocket"""
+        detailed_feedback = {
+            'execution_id': feedback.step_id.split('_')[0] if '_' in feedback.step_id else feedback.step_id,
+            'step_feedback': {
+                'step_id': feedback.step_id,
+                'step_label': feedback.step_label,
+                'status': feedback.status.value,
+                'progress_percent': feedback.progress_percent,
+                'current_action': feedback.current_action,
+                'actions_completed': feedback.actions_completed,
+                'data_summary': feedback.data_summary,
+                'performance_metrics': feedback.performance_metrics,
+                'timestamp': feedback.timestamp,
+                'duration': feedback.duration,
+                'can_modify': feedback.can_modify,
+                'modification_suggestions': feedback.modification_suggestions or [],
+                # Enhanced tracking information
+                'input_summary': getattr(feedback, 'input_summary', None),
+                'output_summary': getattr(feedback, 'output_summary', None),
+                'error_details': getattr(feedback, 'error_details', None),
+                'execution_phase': getattr(feedback, 'execution_phase', 'processing')
+            }
+        }
+        
+        emit('step_feedback', detailed_feedback, room=user_session)
+        
+        # Also emit to a general monitoring room for admin oversight
+        emit('pipeline_monitoring', {
+            'workflow_type': workflow_type,
+            'user_session': user_session,
+            'feedback': detailed_feedback
+        }, room='monitoring')
+    
+    controller = InteractiveWorkflowController(
+        workflow, feedback_callback,
+        checkpoint_store=checkpoint_store,
+        execution_id=execution_id,
+        checkpoint_metadata={"query": query, "workflow_type": workflow_type, "user_session": user_session}
+    )
+    execution_id = controller.execution_id
+    
+    # Store controller for later control operations
+    active_controllers[execution_id] = {
+        'controller': controller,
+        'user_session': user_session,
+        'query': query,
+        'workflow_type': workflow_type,
+        'started_at': datetime.now().isoformat()
+    }
+    
+    # Start execution in background
+    async def run_workflow():
+        try:
+            result = await controller.run_with_control(query)
+            
+            # Send completion notification
+            emit('workflow_completed', {
+                'execution_id': execution_id,
+                'result': str(result)[:1000] + "..." if len(str(result)) > 1000 else str(result),
+                'summary': controller.get_execution_summary()
+            }, room=user_session)
+            
+            control_logger.info(f"✅ Interactive workflow {execution_id} completed successfully")
+            
+        except Exception as e:
+            # Send error notification
+            emit('workflow_error', {
+                'execution_id': execution_id,
+                'error': str(e),
+                'summary': controller.get_execution_summary()
+            }, room=user_session)
+            
+            control_logger.error(f"❌ Interactive workflow {execution_id} failed: {str(e)}")
+        
+        finally:
+            # Clean up
+            if execution_id in active_controllers:
+                del active_controllers[execution_id]
+    
+    # Schedule the workflow execution
+    asyncio.create_task(run_workflow())
+    
+    return controller
+
+
 @workflow_control_bp.route('/api/workflows/start', methods=['POST'])
 def start_interactive_workflow():
     """Start a new interactive workflow with real-time control"""
@@ -74,99 +196,10 @@ def start_interactive_workflow():
         
         control_logger.info(f"🚀 Starting interactive {workflow_type} workflow for query: '{query[:50]}...'")
         
-        # Create workflow context (you'll need to adapt this to your specific setup)
-        context = create_research_context(
-            # Add your model, tokenizer, etc. here based on your setup
-            # model=your_model,
-            # tokenizer=your_tokenizer,
-            # proto_ai=your_proto_ai,
-        )
-        
-        # Build the requested workflow
-        if workflow_type in WORKFLOW_REGISTRY:
-            workflow = WORKFLOW_REGISTRY[workflow_type](context)
-        else:
-            workflow = build_research_workflow(context)
-        
-        # Create interactive controller with enhanced real-time feedback
-        def feedback_callback(feedback):
-            """Send comprehensive real-time feedback via WebSocket"""
-            detailed_feedback = {
-                'execution_id': feedback.step_id.split('_')[0] if '_' in feedback.step_id else feedback.step_id,
-                'step_feedback': {
-                    'step_id': feedback.step_id,
-                    'step_label': feedback.step_label,
-                    'status': feedback.status.value,
-                    'progress_percent': feedback.progress_percent,
-                    'current_action': feedback.current_action,
-                    'actions_completed': feedback.actions_completed,
-                    'data_summary': feedback.data_summary,
-                    'performance_metrics': feedback.performance_metrics,
-                    'timestamp': feedback.timestamp,
-                    'duration': feedback.duration,
-                    'can_modify': feedback.can_modify,
-                    'modification_suggestions': feedback.modification_suggestions or [],
-                    # Enhanced tracking information
-                    'input_summary': getattr(feedback, 'input_summary', None),
-                    'output_summary': getattr(feedback, 'output_summary', None),
-                    'error_details': getattr(feedback, 'error_details', None),
-                    'execution_phase': getattr(feedback, 'execution_phase', 'processing')
-                }
-            }
-            
-            emit('step_feedback', detailed_feedback, room=user_session)
-            
-            # Also emit to a general monitoring room for admin oversight
-            emit('pipeline_monitoring', {
-                'workflow_type': workflow_type,
-                'user_session': user_session,
-                'feedback': detailed_feedback
-            }, room='monitoring')
-        
-        controller = InteractiveWorkflowController(workflow, feedback_callback)
+        controller = _launch_interactive_workflow(query, workflow_type, user_session)
+        workflow = controller.workflow
         execution_id = controller.execution_id
         
-        # Store controller for later control operations
-        active_controllers[execution_id] = {
-            'controller': controller,
-            'user_session': user_session,
-            'query': query,
-            'workflow_type': workflow_type,
-            'started_at': datetime.now().isoformat()
-        }
-        
-        # Start execution in background
-        async def run_workflow():
-            try:
-                result = await controller.run_with_control(query)
-                
-                # Send completion notification
-                emit('workflow_completed', {
-                    'execution_id': execution_id,
-                    'result': str(result)[:1000] + "..." if len(str(result)) > 1000 else str(result),
-                    'summary': controller.get_execution_summary()
-                }, room=user_session)
-                
-                control_logger.info(f"✅ Interactive workflow {execution_id} completed successfully")
-                
-            except Exception as e:
-                # Send error notification
-                emit('workflow_error', {
-                    'execution_id': execution_id,
-                    'error': str(e),
-                    'summary': controller.get_execution_summary()
-                }, room=user_session)
-                
-                control_logger.error(f"❌ Interactive workflow {execution_id} failed: {str(e)}")
-            
-            finally:
-                # Clean up
-                if execution_id in active_controllers:
-                    del active_controllers[execution_id]
-        
-        # Schedule the workflow execution
-        asyncio.create_task(run_workflow())
-        
         return jsonify({
             "success": True,
             "execution_id": execution_id,
@@ -408,23 +441,29 @@ def get_pipeline_log(execution_id):
 
 @workflow_control_bp.route('/api/workflows/active')
 def get_active_workflows():
-    """Get list of currently active workflows"""
+    """Get running, paused and interrupted workflows from the checkpoint store"""
     try:
         active_list = []
         
-        for execution_id, controller_data in active_controllers.items():
-            controller = controller_data['controller']
-            summary = controller.get_execution_summary()
+        for execution in checkpoint_store.list_executions(ACTIVE_STATUSES):
+            execution_id = execution['execution_id']
+            metadata = execution['metadata']
+            query = metadata.get('query', '')
+            # Live controllers know their exact position and pause state
+            controller_data = active_controllers.get(execution_id)
+            controller = controller_data['controller'] if controller_data else None
             
             active_list.append({
                 "execution_id": execution_id,
-                "query": controller_data['query'][:100] + "..." if len(controller_data['query']) > 100 else controller_data['query'],
-                "workflow_type": controller_data['workflow_type'],
-                "started_at": controller_data['started_at'],
-                "current_step": controller.current_step_index,
-                "total_steps": summary['total_steps'],
-                "is_paused": controller.is_paused,
-                "completed_steps": summary['completed_steps']
+                "query": query[:100] + "..." if len(query) > 100 else query,
+                "workflow_type": metadata.get('workflow_type'),
+                "started_at": datetime.fromtimestamp(execution['started_at']).isoformat(),
+                "status": execution['status'],
+                "current_step": controller.current_step_index if controller else execution['current_step'],
+                "total_steps": execution['total_steps'],
+                "is_paused": controller.is_paused if controller else execution['status'] == 'paused',
+                "completed_steps": execution['completed_steps'],
+                "resumable": controller is None
             })
         
         return jsonify({
@@ -438,6 +477,45 @@ def get_active_workflows():
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+@workflow_control_bp.route('/api/workflows/<execution_id>/resume', methods=['POST'])
+def resume_interrupted_workflow(execution_id):
+    """Resume an interrupted or failed workflow from its last completed step"""
+    try:
+        if execution_id in active_controllers:
+            return jsonify({"success": False, "error": "Workflow is already running"}), 409
+        
+        execution = checkpoint_store.get_execution(execution_id)
+        if execution is None:
+            return jsonify({"success": False, "error": "Workflow not found"}), 404
+        if execution['status'] not in ('interrupted', 'failed', 'paused'):
+            return jsonify({
+                "success": False,
+                "error": f"Workflow is {execution['status']} and cannot be resumed"
+            }), 400
+        
+        metadata = execution['metadata']
+        user_session = (request.get_json(silent=True) or {}).get('session_id') or metadata.get('user_session', 'anonymous')
+        
+        control_logger.info(
+            f"♻️ Resuming workflow {execution_id} after step {execution['completed_steps']}/{execution['total_steps']}"
+        )
+        controller = _launch_interactive_workflow(
+            metadata.get('query', ''), metadata.get('workflow_type', 'comprehensive'), user_session, execution_id
+        )
+        
+        return jsonify({
+            "success": True,
+            "execution_id": execution_id,
+            "completed_steps": execution['completed_steps'],
+            "total_steps": len(controller.workflow.steps),
+            "step_labels": [step.label for step in controller.workflow.steps]
+        })
+        
+    except Exception as e:
+        control_logger.error(f"Failed to resume workflow {execution_id}: {str(e)}")
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
 # WebSocket Events for Real-time Control
 
 def register_socketio_events(socketio):
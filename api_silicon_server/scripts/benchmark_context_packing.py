@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Research Context Packing Benchmark
+Compares prompt tokens, sources reaching the model and prefill time (time
+to first token) for the summarization prompt built from N search results,
+the way it was built before packing (every result concatenated, then cut
+at 4000 characters) versus packed into the token budget.
+
+The old cut kept prompts near 1k tokens whatever the result count; the
+default 3072-token budget makes them larger, in exchange for ranked,
+de-duplicated sources instead of whichever came first.
+
+Without MLX-LM only token counts and packing time are reported.
+
+Usage:
+    python scripts/benchmark_context_packing.py --model mlx-community/Llama-3.2-1B-Instruct-4bit --counts 5,10,20,40
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Server modules live one directory up
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# The workflow engine logs to logs/ relative to the working directory
+Path("logs").mkdir(exist_ok=True)
+
+QUERY = "effects of sleep on memory consolidation"
+
+VOCABULARY = (
+    "sleep memory consolidation hippocampus cortex replay slow wave REM spindle synaptic "
+    "plasticity learning recall participants study trial evidence effect significant cohort "
+    "rodent human adolescents deprivation nap performance task retention encoding"
+).split()
+
+
+# Prompt builders cut the content here before context packing
+LEGACY_CONTENT_CHARS = 4000
+
+
+def make_results(count, seed=7):
+    """Synthetic search results with realistic snippet lengths and some mirrored duplicates"""
+    rng = random.Random(seed)
+    results = []
+    for i in range(count):
+        if i and i % 7 == 0:
+            results.append(dict(results[i - 1], url=f"https://mirror{i}.example.org/paper"))
+            continue
+        words = rng.randint(80, 220)
+        results.append({
+            "title": f"Study {i}: {' '.join(rng.sample(VOCABULARY, 4))}",
+            "snippet": " ".join(rng.choice(VOCABULARY) for _ in range(words)) + ".",
+            "url": f"https://journal{i}.example.edu/article/{i}"
+        })
+    return results
+
+
+def legacy_content(results):
+    """Search results as the summarize step joined them before packing, with the prompt's character cut"""
+    combined_text = ""
+    for i, result in enumerate(results):
+        if result.get("title"):
+            combined_text += f"\n\n=== Source {i+1}: {result['title']} ===\n"
+        content = next((result[field] for field in ("snippet", "abstract", "body", "content", "text")
+                        if result.get(field)), "")
+        if content:
+            combined_text += content + "\n"
+        if result.get("url"):
+            combined_text += f"Source: {result['url']}\n"
+    return combined_text.strip()[:LEGACY_CONTENT_CHARS]
+
+
+def prefill_seconds(model, tokenizer, prompt):
+    """Time until the first generated token, which is dominated by prompt prefill"""
+    from mlx_lm import stream_generate
+
+    start_time = time.time()
+    for _ in stream_generate(model, tokenizer, prompt, max_tokens=1):
+        break
+    return time.time() - start_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark prompt prefill for packed vs truncated research context")
+    parser.add_argument("--model", default="mlx-community/Llama-3.2-1B-Instruct-4bit")
+    parser.add_argument("--counts", default="5,10,20,40,80", help="Comma-separated search result counts")
+    parser.add_argument("--budget", type=int, default=3072, help="Context token budget")
+    parser.add_argument("--no-model", action="store_true", help="Only count tokens (no prefill timing)")
+    args = parser.parse_args()
+
+    from workflows.tools.context_packer import pack_results, make_token_counter
+    from workflows.tools.summarize import _create_summarization_prompt
+
+    model = tokenizer = None
+    if not args.no_model:
+        try:
+            from mlx_lm import load
+            print(f"🔄 Loading {args.model}...")
+            model, tokenizer = load(args.model)
+        except ImportError as e:
+            print(f"⚠️ MLX-LM not available ({e}) - reporting token counts only")
+
+    count_tokens = make_token_counter(tokenizer)
+    context = {"original_request": QUERY, "context_token_budget": args.budget, "tokenizer": tokenizer}
+
+    if model is not None:
+        # Warm up kernels so the first measured prompt is not penalised
+        prefill_seconds(model, tokenizer, "Warm up.")
+
+    print()
+    header = f"{'results':>8}{'old tok':>9}{'old src':>9}{'packed tok':>12}{'packed src':>12}{'pack ms':>9}"
+    if model is not None:
+        header += f"{'old prefill':>13}{'packed prefill':>16}{'ratio':>8}"
+    print(header)
+
+    for count in [int(c) for c in args.counts.split(",") if c.strip()]:
+        results = make_results(count)
+
+        old_content = legacy_content(results)
+        old_prompt = _create_summarization_prompt(old_content, context)
+        old_sources = old_content.count("=== Source ")
+
+        packed_content, stats, _ = pack_results(results, context)
+        packed_prompt = _create_summarization_prompt(packed_content, context)
+
+        row = (f"{count:>8}{count_tokens(old_prompt):>9}{old_sources:>9}"
+               f"{count_tokens(packed_prompt):>12}{stats['sources_packed']:>12}{stats['pack_ms']:>9.1f}")
+        if model is not None:
+            old_time = prefill_seconds(model, tokenizer, old_prompt)
+            packed_time = prefill_seconds(model, tokenizer, packed_prompt)
+            row += f"{old_time:>12.2f}s{packed_time:>15.2f}s{packed_time / old_time if old_time else 0.0:>7.1f}x"
+        print(row)
+
+    print(f"\n📊 Budget {args.budget} tokens (old prompts cut content at {LEGACY_CONTENT_CHARS} chars) | "
+          f"token counter: {'model tokenizer' if tokenizer else 'estimate'} | ratio = packed/old prefill")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Cognitive Distortion Detection Benchmark
+Times CBT distortion detection plus the research complexity check over a
+corpus of prompts: the per-pattern regex battery (as ProtoConsciousness
+used to run it) versus the compiled DistortionDetector, uncached, cached
+and through the batch API. Also checks both give the same results.
+
+Usage:
+    python scripts/benchmark_distortion_detection.py --repeat 200
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+# Server modules live one directory up
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# The workflow engine (imported with the workflows package) logs to logs/
+Path("logs").mkdir(exist_ok=True)
+
+PROMPTS = [
+    "How does sleep affect memory consolidation in adolescents?",
+    "Write a comprehensive review of transformer architectures for speech recognition.",
+    "Everyone says remote work is obviously better, this proves that offices are a disaster.",
+    "I feel like the data is wrong so it must be a measurement problem.",
+    "What is the meaning of consciousness in philosophical and theoretical terms?",
+    "Urgent: I need to summarize the statistical methodology of this trial by the deadline.",
+    "We should always use the most complete dataset, but the only issue is memory.",
+    "It's my fault the experiment failed, I should have checked the calibration.",
+    "Explain the algorithm behind gradient boosting and its experimental design trade-offs.",
+    "Give me everything about the history of the Silk Road and all aspects of its trade.",
+    "Why does the moon look larger near the horizon?",
+    "Research the mental health effects of social media on teenagers, including trauma.",
+    "Compare Raspberry Pi and Jetson boards for on-device inference.",
+    "The results are clearly significant, there is no need to consider alternative explanations.",
+    "Summarize the political debate around nuclear energy policy in Europe.",
+]
+
+
+def run_baseline(distortions, term_groups, texts):
+    """The original per-pattern battery and per-term substring checks"""
+    for text in texts:
+        text_lower = text.lower()
+        for distortion in distortions:
+            matches = re.findall(distortion.pattern, text_lower, re.IGNORECASE)
+            if matches:
+                len(matches)
+        {group: any(term in text_lower for term in terms) for group, terms in term_groups.items()}
+
+
+def run_detector(detector, texts):
+    for text in texts:
+        detector.analyze(text)
+
+
+def timed(label, func, count):
+    start_time = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start_time
+    print(f"{label:<28}{elapsed * 1000:>10.1f}{elapsed / count * 1e6:>12.1f}")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CBT distortion detection")
+    parser.add_argument("--repeat", type=int, default=200, help="Times the prompt corpus is scanned")
+    args = parser.parse_args()
+
+    import logging
+    logging.disable(logging.WARNING)
+
+    from workflows.proto_consciousness import (
+        DEFAULT_DISTORTIONS, RESEARCH_COMPLEXITY_TERMS, DistortionDetector
+    )
+
+    # Distinct texts so the uncached runs really scan every prompt
+    texts = [f"{prompt} (variant {i})" for i in range(args.repeat) for prompt in PROMPTS]
+    uncached = DistortionDetector(DEFAULT_DISTORTIONS, RESEARCH_COMPLEXITY_TERMS, cache_size=0)
+    cached = DistortionDetector(DEFAULT_DISTORTIONS, RESEARCH_COMPLEXITY_TERMS, cache_size=len(PROMPTS))
+
+    # Same answers as the per-pattern battery
+    for text in PROMPTS:
+        expected = [d.name for d in DEFAULT_DISTORTIONS if re.findall(d.pattern, text.lower(), re.IGNORECASE)]
+        assert [hit["distortion_type"] for hit in uncached.detect(text)] == expected, text
+
+    print(f"🧪 {len(texts)} prompts, {len(DEFAULT_DISTORTIONS)} distortions, "
+          f"{sum(len(terms) for terms in RESEARCH_COMPLEXITY_TERMS.values())} complexity terms\n")
+    print(f"{'mode':<28}{'total ms':>10}{'us/prompt':>12}")
+
+    baseline = timed("per-pattern battery", lambda: run_baseline(DEFAULT_DISTORTIONS, RESEARCH_COMPLEXITY_TERMS, texts),
+                     len(texts))
+    compiled = timed("compiled detector", lambda: run_detector(uncached, texts), len(texts))
+    timed("compiled, batch scoring", lambda: uncached.score_batch(texts), len(texts))
+
+    # A request scans the same prompt up to four times (complexity, clarify, respond x2)
+    repeated = [prompt for prompt in PROMPTS for _ in range(4)] * max(1, args.repeat // 4)
+    timed("cached, 4 scans per request", lambda: run_detector(cached, repeated), len(repeated))
+
+    print(f"\n📊 Compiled detector speedup: {baseline / compiled if compiled else 0.0:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+MLX-LM Batching Benchmark
+Compares tokens/sec for N concurrent prompts decoded one at a time versus
+through MLXBatchScheduler on the same model.
+
+Usage:
+    python scripts/benchmark_mlx_batching.py --model mlx-community/Llama-3.2-1B-Instruct-4bit --concurrency 8
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Server modules live one directory up
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+PROMPTS = [
+    "Explain how a rainbow forms in two sentences.",
+    "Write a haiku about a rover exploring a quiet garden.",
+    "List three uses for a Raspberry Pi in a classroom.",
+    "Summarize the idea of cognitive behavioural therapy briefly.",
+    "Describe the smell of rain to someone who has never experienced it.",
+    "Give one tip for writing clear Python functions.",
+    "What is the difference between weather and climate?",
+    "Suggest a name for a friendly robot and explain why."
+]
+
+
+def run_sequential(model, tokenizer, prompts, max_tokens):
+    """Decode each prompt on its own, one after another"""
+    from mlx_lm import stream_generate
+
+    tokens = 0
+    start_time = time.time()
+    for prompt in prompts:
+        for _ in stream_generate(model, tokenizer, prompt, max_tokens=max_tokens):
+            tokens += 1
+    return tokens, time.time() - start_time
+
+
+async def run_batched(entry, prompts, max_tokens, window_ms, max_batch_size):
+    """Submit every prompt concurrently through the batch scheduler"""
+    from faculty_executors import FacultyExecutor
+    from mlx_batching import MLXBatchScheduler
+
+    executor = FacultyExecutor("llm", max_workers=1, max_queue_depth=len(prompts))
+    scheduler = MLXBatchScheduler(executor, window_ms=window_ms, max_batch_size=max_batch_size,
+                                  max_pending=len(prompts))
+
+    start_time = time.time()
+    await asyncio.gather(*(scheduler.generate(entry, prompt, max_tokens=max_tokens, temperature=0.0)
+                           for prompt in prompts))
+    elapsed = time.time() - start_time
+    executor.shutdown()
+    return scheduler.stats["tokens_generated"], elapsed, scheduler.stats["peak_batch_size"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sequential vs batched MLX-LM decoding")
+    parser.add_argument("--model", default="mlx-community/Llama-3.2-1B-Instruct-4bit")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--max-tokens", type=int, default=128)
+    parser.add_argument("--window-ms", type=int, default=20)
+    parser.add_argument("--max-batch-size", type=int, default=8)
+    args = parser.parse_args()
+
+    try:
+        from mlx_lm import load
+        from mlx_batching import MLX_BATCHING_AVAILABLE
+        from mlx_model_residency import ResidentModel
+    except ImportError as e:
+        print(f"❌ MLX-LM not available: {e}")
+        return 1
+
+    if not MLX_BATCHING_AVAILABLE:
+        print("❌ This mlx_lm release has no BatchGenerator - upgrade mlx-lm to benchmark batching")
+        return 1
+
+    prompts = [PROMPTS[i % len(PROMPTS)] for i in range(args.concurrency)]
+
+    print(f"🔄 Loading {args.model}...")
+    model, tokenizer = load(args.model)
+    entry = ResidentModel(args.model, model, tokenizer, 0, 0.0)
+
+    # Warm up kernels so the first measured run is not penalised
+    run_sequential(model, tokenizer, prompts[:1], 8)
+
+    print(f"🧪 Sequential: {len(prompts)} prompts x {args.max_tokens} tokens")
+    seq_tokens, seq_time = run_sequential(model, tokenizer, prompts, args.max_tokens)
+    seq_rate = seq_tokens / seq_time if seq_time else 0.0
+
+    print(f"🧪 Batched: {len(prompts)} concurrent prompts")
+    batch_tokens, batch_time, peak = asyncio.run(
+        run_batched(entry, prompts, args.max_tokens, args.window_ms, args.max_batch_size)
+    )
+    batch_rate = batch_tokens / batch_time if batch_time else 0.0
+
+    print()
+    print(f"{'mode':<12}{'tokens':>8}{'seconds':>10}{'tok/s':>10}")
+    print(f"{'sequential':<12}{seq_tokens:>8}{seq_time:>10.2f}{seq_rate:>10.1f}")
+    print(f"{'batched':<12}{batch_tokens:>8}{batch_time:>10.2f}{batch_rate:>10.1f}")
+    print(f"\n📊 Peak batch size: {peak} | Speedup: {batch_rate / seq_rate if seq_rate else 0.0:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
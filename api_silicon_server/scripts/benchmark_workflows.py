@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Research Workflow Engine Benchmark
+Runs the registered research workflows (build_workflow_by_name) end to end
+against a deterministic fake generate_with_fallback and offline search
+providers with configurable latency, and reports per-step wall time, engine
+overhead (wall time not spent waiting on the model or search), concurrency
+achieved and memory growth across runs.
+
+A run whose steps fail or log an error (a stage falling back to its
+template output) is flagged and makes the script exit non-zero, so a broken
+path is never reported as normal timing.
+
+Runs offline on CPU-only machines - no MLX, Ollama or network needed - so
+regressions in AgentWorkflow.run and section expansion scheduling show up
+on their own instead of being hidden by model latency.
+
+Usage:
+    python scripts/benchmark_workflows.py --runs 20 --latency 0.05
+    python scripts/benchmark_workflows.py --workflows quick,technical --latency 0 --json results.json
+"""
+
+import argparse
+import asyncio
+import gc
+import hashlib
+import json
+import logging
+import math
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Server modules live one directory up
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# The workflow engine logs to logs/ relative to the working directory
+Path("logs").mkdir(exist_ok=True)
+
+DEFAULT_WORKFLOWS = "comprehensive,quick,academic,creative,technical"
+QUERY = "How does sleep affect memory consolidation in adolescents?"
+
+WORDS = (
+    "evidence suggests consolidation depends on slow wave sleep while replay in the hippocampus "
+    "strengthens cortical traces and studies report consistent effects across cohorts"
+).split()
+
+
+class StageFailureLog(logging.Handler):
+    """Collects ERROR records from workflow loggers (failed stages and their fallbacks)"""
+
+    def __init__(self):
+        super().__init__(level=logging.ERROR)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def summarize_times(values):
+    """Mean and nearest-rank p95 of a list of durations"""
+    ordered = sorted(values)
+    return {"mean": statistics.mean(ordered), "p95": ordered[math.ceil(0.95 * len(ordered)) - 1]}
+
+
+class Timeline:
+    """Intervals during which the fake model or a search provider was busy"""
+
+    def __init__(self):
+        self.intervals = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    def enter(self) -> float:
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        return time.perf_counter()
+
+    def leave(self, started: float):
+        self.in_flight -= 1
+        self.intervals.append((started, time.perf_counter()))
+
+    def busy_seconds(self) -> float:
+        """Length of the union of the busy intervals (overlapping calls counted once)"""
+        busy, current_start, current_end = 0.0, None, None
+        for start, end in sorted(self.intervals):
+            if current_end is None or start > current_end:
+                if current_end is not None:
+                    busy += current_end - current_start
+                current_start, current_end = start, end
+            else:
+                current_end = max(current_end, end)
+        if current_end is not None:
+            busy += current_end - current_start
+        return busy
+
+    def reset(self):
+        self.intervals.clear()
+        self.in_flight = self.peak_in_flight = 0
+
+
+class FakeModel:
+    """
+    Deterministic stand-in for generate_with_fallback.
+
+    Structure prompts get a markdown outline (so section expansion has real
+    jobs to schedule); everything else gets text derived from the prompt
+    hash. Latency is a fixed cost plus a per-1k-prompt-character cost.
+    """
+
+    def __init__(self, timeline: Timeline, latency: float, per_1k_chars: float, sections: int, words: int):
+        self.timeline = timeline
+        self.latency = latency
+        self.per_1k_chars = per_1k_chars
+        self.sections = sections
+        self.words = words
+        self.calls = 0
+
+    async def __call__(self, prompt: str, *args, **kwargs) -> str:
+        self.calls += 1
+        started = self.timeline.enter()
+        try:
+            delay = self.latency + self.per_1k_chars * len(prompt) / 1000
+            if delay:
+                await asyncio.sleep(delay)
+            return self._respond(prompt)
+        finally:
+            self.timeline.leave(started)
+
+    def _respond(self, prompt: str) -> str:
+        if "create a logical document structure" in prompt:
+            lines = []
+            for i in range(1, self.sections + 1):
+                lines.append(f"# Section {i}: Aspect {i} of the research")
+                for j in range(1, 3):
+                    lines.append(f"## Subsection {i}.{j}: Detail {i}.{j}")
+                    lines.append(f"- Key point {i}.{j}.1")
+                    lines.append(f"- Key point {i}.{j}.2")
+            return "\n".join(lines)
+
+        seed = int(hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:8], 16)
+        return " ".join(WORDS[(seed + i * 7) % len(WORDS)] for i in range(self.words)) + "."
+
+
+def make_search_providers(timeline: Timeline, delay: float):
+    """Offline web and academic providers that record their busy time"""
+    from workflows.tools.search import OfflineSearchProvider
+
+    class TimedOfflineProvider(OfflineSearchProvider):
+        async def _search(self, query, max_results, options):
+            started = timeline.enter()
+            try:
+                return await super()._search(query, max_results, options)
+            finally:
+                timeline.leave(started)
+
+    return [TimedOfflineProvider("web", delay=delay), TimedOfflineProvider("academic", delay=delay)]
+
+
+async def run_once(workflow_name: str, args, timeline: Timeline, failure_log: StageFailureLog):
+    """Build and run one workflow; returns (metrics, per-step durations)"""
+    from workflows.research_workflow import build_workflow_by_name, create_research_context
+    from workflows.tools.search import search_result_cache
+
+    # Every run pays for its searches instead of hitting the previous run's cache
+    search_result_cache.clear()
+    timeline.reset()
+    failure_log.messages.clear()
+    model = FakeModel(timeline, args.latency, args.per_1k_chars, args.sections, args.words)
+
+    context = create_research_context(
+        generate_with_fallback=model,
+        original_request=QUERY,
+        search_providers=make_search_providers(timeline, args.search_latency),
+        section_expansion_concurrency=args.section_concurrency
+    )
+    workflow = build_workflow_by_name(workflow_name, context)
+
+    started = time.perf_counter()
+    await workflow.run(QUERY)
+    wall = time.perf_counter() - started
+
+    busy = timeline.busy_seconds()
+    expansion = context.get("section_expansion_metrics", {})
+    steps = {record["step_label"]: record["duration"] for record in context.get("workflow_steps", [])}
+    failures = [f"step failed: {record['step_label']}" for record in context.get("workflow_steps", [])
+                if record.get("status") == "failed"] + failure_log.messages
+
+    return {
+        "wall": wall,
+        "busy": busy,
+        "overhead": max(0.0, wall - busy),
+        "model_calls": model.calls,
+        "peak_in_flight": timeline.peak_in_flight,
+        "section_jobs": expansion.get("jobs", 0),
+        "section_parallelism": (expansion["sequential_time"] / expansion["total_time"]
+                                if expansion.get("total_time") else 0.0),
+        "failures": failures
+    }, steps
+
+
+async def benchmark_workflow(workflow_name: str, args, failure_log: StageFailureLog):
+    timeline = Timeline()
+    failures = []
+
+    for _ in range(args.warmup):
+        metrics, _ = await run_once(workflow_name, args, timeline, failure_log)
+        failures += metrics["failures"]
+
+    gc.collect()
+    tracemalloc.start()
+    memory_start = tracemalloc.get_traced_memory()[0]
+
+    runs, step_times = [], {}
+    for _ in range(args.runs):
+        metrics, steps = await run_once(workflow_name, args, timeline, failure_log)
+        runs.append(metrics)
+        failures += metrics["failures"]
+        for label, duration in steps.items():
+            step_times.setdefault(label, []).append(duration)
+
+    gc.collect()
+    memory_end, memory_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    def mean(key):
+        return statistics.mean(run[key] for run in runs)
+
+    wall = summarize_times([run["wall"] for run in runs])
+    return {
+        "workflow": workflow_name,
+        "runs": len(runs),
+        "failed_runs": sum(1 for run in runs if run["failures"]),
+        "failures": sorted(set(failures)),
+        "wall_mean": wall["mean"],
+        "wall_p95": wall["p95"],
+        "overhead_mean": mean("overhead"),
+        "overhead_share": mean("overhead") / mean("wall") if mean("wall") else 0.0,
+        "model_calls": mean("model_calls"),
+        "peak_in_flight": max(run["peak_in_flight"] for run in runs),
+        "section_jobs": mean("section_jobs"),
+        "section_parallelism": mean("section_parallelism"),
+        "memory_growth_kb": (memory_end - memory_start) / 1024,
+        "memory_growth_per_run_kb": (memory_end - memory_start) / 1024 / len(runs),
+        "memory_peak_kb": memory_peak / 1024,
+        "steps": {label: statistics.mean(durations) for label, durations in step_times.items()}
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark research workflow engine overhead with a fake model")
+    parser.add_argument("--workflows", default=DEFAULT_WORKFLOWS, help="Comma-separated workflow names")
+    parser.add_argument("--runs", type=int, default=10, help="Measured runs per workflow")
+    parser.add_argument("--warmup", type=int, default=1, help="Unmeasured runs per workflow")
+    parser.add_argument("--latency", type=float, default=0.02, help="Fake model seconds per call")
+    parser.add_argument("--per-1k-chars", type=float, default=0.0, help="Extra fake model seconds per 1k prompt chars")
+    parser.add_argument("--search-latency", type=float, default=0.01, help="Offline search provider delay")
+    parser.add_argument("--section-concurrency", type=int, default=4)
+    parser.add_argument("--sections", type=int, default=5, help="Sections in the fake outline")
+    parser.add_argument("--words", type=int, default=120, help="Words per fake generation")
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+    parser.add_argument("--verbose", action="store_true", help="Show workflow INFO logging")
+    parser.add_argument("--allow-failures", action="store_true", help="Exit 0 even when runs hit failed stages")
+    args = parser.parse_args()
+
+    if args.verbose:
+        logging.basicConfig(level=logging.INFO)
+    else:
+        # Module loggers set their own INFO level; keep the console to step errors
+        logging.disable(logging.WARNING)
+    failure_log = StageFailureLog()
+    logging.getLogger().addHandler(failure_log)
+
+    results = []
+    for workflow_name in [name.strip() for name in args.workflows.split(",") if name.strip()]:
+        print(f"🧪 {workflow_name}: {args.warmup} warm-up + {args.runs} runs "
+              f"(model {args.latency * 1000:.0f}ms, search {args.search_latency * 1000:.0f}ms)")
+        results.append(asyncio.run(benchmark_workflow(workflow_name, args, failure_log)))
+
+    print()
+    print(f"{'workflow':<15}{'wall ms':>9}{'p95 ms':>9}{'engine ms':>11}{'engine %':>10}"
+          f"{'calls':>7}{'peak':>6}{'sect x':>8}{'mem KB/run':>12}")
+    for result in results:
+        print(f"{result['workflow']:<15}{result['wall_mean'] * 1000:>9.1f}{result['wall_p95'] * 1000:>9.1f}"
+              f"{result['overhead_mean'] * 1000:>11.1f}{result['overhead_share'] * 100:>9.1f}%"
+              f"{result['model_calls']:>7.0f}{result['peak_in_flight']:>6}{result['section_parallelism']:>8.2f}"
+              f"{result['memory_growth_per_run_kb']:>12.1f}{'  ⚠️ failed' if result['failures'] else ''}")
+
+    for result in results:
+        print(f"\n⏱️ {result['workflow']} per-step wall time (mean ms)")
+        for label, duration in result["steps"].items():
+            print(f"   {label:<40}{duration * 1000:>9.1f}")
+
+    max_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"\n📊 engine = wall time not spent waiting on the model or search | "
+          f"peak = most model/search calls in flight | sect x = section expansion parallelism | "
+          f"max RSS {max_rss_mb:.0f} MB")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"config": vars(args), "results": results}, f, indent=2)
+        print(f"💾 Results written to {args.json}")
+
+    failed = [result for result in results if result["failures"]]
+    for result in failed:
+        print(f"\n❌ {result['workflow']}: {result['failed_runs']}/{result['runs']} measured runs hit failed stages "
+              f"(timings above include fallback paths)")
+        for message in result["failures"]:
+            print(f"   {message}")
+    return 1 if failed and not args.allow_failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+Upstream HTTP Clients for API Silicon Server
+
+One long-lived async HTTP client per upstream service (Ollama, Hugging Face)
+instead of a module-level requests.get/post per call. Connections are kept
+alive and reused, HTTP/2 is negotiated where the upstream and the optional
+h2 package support it, and nothing blocks the event loop.
+
+Each upstream has its own connection limit, timeouts and a concurrency cap
+with a bounded wait queue. When the queue is full new calls are rejected with
+UpstreamBusyError (a FacultyBusyError, so routes answer 503 + Retry-After).
+Request counts, latency, in-flight calls and opened-vs-reused connections are
+reported per upstream in /status.
+
+When httpx is not installed a shared requests.Session is used on a worker
+thread, which still keeps connections alive but cannot report connection
+reuse.
+"""
+
+import asyncio
+import importlib.util
+import time
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+from faculty_executors import FacultyBusyError
+
+# Async HTTP client (optional, falls back to a requests.Session on a thread)
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# HTTP/2 support for httpx (optional) - httpx imports h2 itself when http2=True
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger("SiliconServer.Upstreams")
+
+# Defaults per upstream; config.UPSTREAM_CLIENTS overrides any of these
+DEFAULT_UPSTREAM_SETTINGS = {
+    "ollama": {
+        "max_concurrency": 8,
+        "max_queue": 32,
+        "max_keepalive": 8,
+        "timeout": 120.0,
+        "connect_timeout": 5.0,
+        "http2": False  # Ollama speaks HTTP/1.1 only
+    },
+    "huggingface": {
+        "max_concurrency": 4,
+        "max_queue": 16,
+        "max_keepalive": 4,
+        "timeout": 30.0,
+        "connect_timeout": 10.0,
+        "http2": True
+    }
+}
+
+
+class UpstreamBusyError(FacultyBusyError):
+    """Raised when an upstream's concurrency slots and wait queue are all occupied"""
+
+
+class UpstreamClient:
+    """
+    A pooled, keep-alive HTTP client for one upstream service.
+
+    Args:
+        name: Upstream name used in logs, errors and /status
+        base_url: Prefix for relative request paths (absolute URLs are passed through)
+        max_concurrency: Requests in flight at once (also the connection limit)
+        max_queue: Requests allowed to wait for a slot before UpstreamBusyError
+        max_keepalive: Idle connections kept open for reuse
+        timeout: Default read/write timeout in seconds
+        connect_timeout: TCP/TLS connect timeout in seconds
+        http2: Negotiate HTTP/2 when the h2 package is installed
+        perf_log: Callable(operation, duration, success, details)
+    """
+
+    def __init__(self, name: str, base_url: str = "", max_concurrency: int = 8, max_queue: int = 32,
+                 max_keepalive: int = 8, timeout: float = 60.0, connect_timeout: float = 5.0,
+                 http2: bool = False, perf_log: Optional[Callable] = None):
+        self.name = name
+        self.base_url = base_url.rstrip("/")
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_queue = max(0, max_queue)
+        self.max_keepalive = max(0, max_keepalive)
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.http2 = http2 and HTTPX_AVAILABLE and HTTP2_AVAILABLE
+        self.perf_log = perf_log
+
+        self._client = None
+        self._session: Optional[requests.Session] = None
+        # Created on first use so they bind to the server's running loop
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._waiting = 0
+        self._in_flight = 0
+
+        self.stats = {
+            "requests": 0,
+            "failed": 0,
+            "rejected": 0,
+            "connections_opened": 0,
+            "peak_in_flight": 0,
+            "total_latency": 0.0,
+            "total_wait_time": 0.0
+        }
+
+    # -------- CLIENT -------- #
+
+    def _get_client(self):
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_keepalive
+                ),
+                timeout=httpx.Timeout(self.timeout, connect=self.connect_timeout)
+            )
+            logger.info(f"🔌 Upstream client '{self.name}' -> {self.base_url or '(absolute URLs)'} "
+                        f"| HTTP/2: {self.http2} | Connections: {self.max_concurrency}")
+        return self._client
+
+    def _get_session(self) -> requests.Session:
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_concurrency)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
+        return self._session
+
+    def _url(self, path: str) -> str:
+        if path.startswith(("http://", "https://")):
+            return path
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def _timeout(self, timeout: Optional[float]):
+        read = self.timeout if timeout is None else timeout
+        if HTTPX_AVAILABLE:
+            return httpx.Timeout(read, connect=min(self.connect_timeout, read))
+        return (min(self.connect_timeout, read), read)
+
+    async def _trace(self, event_name: str, info: Dict[str, Any]):
+        """httpcore trace hook: counts new TCP connections (everything else reused one)"""
+        if event_name == "connection.connect_tcp.complete":
+            self.stats["connections_opened"] += 1
+
+    # -------- ADMISSION -------- #
+
+    @asynccontextmanager
+    async def _slot(self):
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+
+        if self._in_flight >= self.max_concurrency and self._waiting >= self.max_queue:
+            self.stats["rejected"] += 1
+            raise UpstreamBusyError(self.name)
+
+        wait_start = time.time()
+        self._waiting += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self._waiting -= 1
+        self.stats["total_wait_time"] += time.time() - wait_start
+
+        self._in_flight += 1
+        self.stats["peak_in_flight"] = max(self.stats["peak_in_flight"], self._in_flight)
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            self._slots.release()
+
+    def _record(self, method: str, path: str, start_time: float, success: bool, details: str = ""):
+        duration = time.time() - start_time
+        self.stats["requests"] += 1
+        self.stats["total_latency"] += duration
+        if not success:
+            self.stats["failed"] += 1
+        if self.perf_log and not success:
+            self.perf_log(f"UPSTREAM_{self.name.upper()}", duration, False, f"{method} {path} | {details}")
+
+    # -------- REQUESTS -------- #
+
+    async def request(self, method: str, path: str, timeout: Optional[float] = None, **kwargs):
+        """
+        Send a request and read the whole body.
+
+        Returns an httpx.Response (or requests.Response on the fallback path);
+        both offer status_code, json(), content and raise_for_status().
+        """
+        async with self._slot():
+            start_time = time.time()
+            try:
+                if HTTPX_AVAILABLE:
+                    response = await self._get_client().request(
+                        method, self._url(path), timeout=self._timeout(timeout),
+                        extensions={"trace": self._trace}, **kwargs
+                    )
+                else:
+                    response = await asyncio.to_thread(
+                        self._get_session().request, method, self._url(path),
+                        timeout=self._timeout(timeout), **kwargs
+                    )
+            except Exception as e:
+                self._record(method, path, start_time, False, str(e))
+                raise
+            self._record(method, path, start_time, response.status_code < 500, f"HTTP {response.status_code}")
+            return response
+
+    async def get(self, path: str, **kwargs):
+        return await self.request("GET", path, **kwargs)
+
+    async def post(self, path: str, **kwargs):
+        return await self.request("POST", path, **kwargs)
+
+    async def stream_lines(self, method: str, path: str, timeout: Optional[float] = None,
+                           **kwargs) -> AsyncIterator[str]:
+        """Yield non-empty response lines as they arrive (NDJSON streams); holds a slot until exhausted"""
+        async with self._slot():
+            start_time = time.time()
+            success = False
+            try:
+                if HTTPX_AVAILABLE:
+                    async with self._get_client().stream(
+                        method, self._url(path), timeout=self._timeout(timeout),
+                        extensions={"trace": self._trace}, **kwargs
+                    ) as response:
+                        response.raise_for_status()
+                        async for line in response.aiter_lines():
+                            if line.strip():
+                                yield line
+                else:
+                    response = await asyncio.to_thread(
+                        self._get_session().request, method, self._url(path),
+                        stream=True, timeout=self._timeout(timeout), **kwargs
+                    )
+                    try:
+                        response.raise_for_status()
+                        lines = response.iter_lines(decode_unicode=True)
+                        while True:
+                            line = await asyncio.to_thread(next, lines, None)
+                            if line is None:
+                                break
+                            if line.strip():
+                                yield line
+                    finally:
+                        response.close()
+                success = True
+            finally:
+                self._record(method, path, start_time, success, "" if success else "Stream failed or interrupted")
+
+    async def download(self, url: str, destination, timeout: Optional[float] = None, chunk_size: int = 65536) -> int:
+        """Stream a GET response body to a file; returns the number of bytes written"""
+        written = 0
+        async with self._slot():
+            start_time = time.time()
+            success = False
+            try:
+                with open(destination, "wb") as f:
+                    if HTTPX_AVAILABLE:
+                        async with self._get_client().stream(
+                            "GET", self._url(url), timeout=self._timeout(timeout),
+                            follow_redirects=True, extensions={"trace": self._trace}
+                        ) as response:
+                            response.raise_for_status()
+                            async for chunk in response.aiter_bytes(chunk_size):
+                                f.write(chunk)
+                                written += len(chunk)
+                    else:
+                        response = await asyncio.to_thread(
+                            self._get_session().get, self._url(url), stream=True, timeout=self._timeout(timeout)
+                        )
+                        try:
+                            response.raise_for_status()
+                            chunks = response.iter_content(chunk_size=chunk_size)
+                            while True:
+                                chunk = await asyncio.to_thread(next, chunks, None)
+                                if chunk is None:
+                                    break
+                                f.write(chunk)
+                                written += len(chunk)
+                        finally:
+                            response.close()
+                success = True
+            finally:
+                self._record("GET", url, start_time, success, f"{written} bytes")
+        return written
+
+    # -------- LIFECYCLE -------- #
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def get_status(self) -> Dict[str, Any]:
+        requests_made = self.stats["requests"]
+        opened = self.stats["connections_opened"]
+        return {
+            "base_url": self.base_url,
+            "backend": "httpx" if HTTPX_AVAILABLE else "requests",
+            "http2": self.http2,
+            "connected": self._client is not None or self._session is not None,
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "in_flight": self._in_flight,
+            "waiting": self._waiting,
+            # Reuse is only measurable through the httpx trace hook
+            "connections_reused": max(0, requests_made - opened) if HTTPX_AVAILABLE else None,
+            "avg_latency": round(self.stats["total_latency"] / requests_made, 3) if requests_made else 0.0,
+            **self.stats
+        }
+
+
+class UpstreamClients:
+    """
+    Registry of pooled clients, one per upstream service.
+
+    Args:
+        base_urls: Upstream name -> base URL
+        settings: Upstream name -> UpstreamClient keyword overrides
+        perf_log: Callable(operation, duration, success, details)
+    """
+
+    def __init__(self, base_urls: Dict[str, str], settings: Optional[Dict[str, Dict[str, Any]]] = None,
+                 perf_log: Optional[Callable] = None):
+        settings = settings or {}
+        self.clients: Dict[str, UpstreamClient] = {}
+        for name, base_url in base_urls.items():
+            options = {**DEFAULT_UPSTREAM_SETTINGS.get(name, {}), **settings.get(name, {})}
+            self.clients[name] = UpstreamClient(name, base_url, perf_log=perf_log, **options)
+
+    def __getitem__(self, name: str) -> UpstreamClient:
+        return self.clients[name]
+
+    async def aclose(self):
+        for client in self.clients.values():
+            await client.aclose()
+        logger.info("🔌 Upstream clients closed")
+
+    def get_status(self) -> Dict[str, Any]:
+        return {name: client.get_status() for name, client in self.clients.items()}
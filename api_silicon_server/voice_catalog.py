@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Voice Catalog for API Silicon Server
+
+In-memory index of installed Piper voices: voice id -> model (.onnx), config
+(.onnx.json) and metadata parsed from the file name. Every voice lookup,
+/api/voices listing and TTS diagnostic is served from the index instead of
+globbing the voices directories on each request.
+
+The index covers each search directory and its immediate subdirectories (the
+same layout the old globbing searched). It refreshes incrementally: at most
+once per refresh_interval the directory mtimes are checked and only
+directories whose mtime changed are rescanned.
+"""
+
+import os
+import threading
+import time
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger("SiliconServer.VoiceCatalog")
+
+
+class VoiceEntry:
+    """An installed Piper voice"""
+
+    def __init__(self, voice_id: str, model_path: str, config_path: Optional[str], category: Optional[str], size: int):
+        self.voice_id = voice_id
+        self.model_path = model_path
+        self.config_path = config_path
+        self.category = category  # subdirectory name, None for the root
+        self.size = size
+
+        # Piper names are language-speaker-quality (e.g. en_US-amy-medium)
+        parts = voice_id.split("-")
+        self.language = parts[0] if len(parts) >= 2 else "unknown"
+        self.speaker = parts[1] if len(parts) >= 2 else "unknown"
+        self.quality = parts[2] if len(parts) >= 3 else "unknown"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.voice_id,
+            "language": self.language,
+            "speaker": self.speaker,
+            "quality": self.quality,
+            "model_path": self.model_path,
+            "config_path": self.config_path,
+            "config_available": self.config_path is not None,
+            "category": self.category,
+            "file_size": self.size
+        }
+
+
+def _scan_directory(path: str, category: Optional[str]) -> Tuple[Dict[str, VoiceEntry], Dict[str, str]]:
+    """Index the voices directly inside one directory"""
+    models, configs = {}, {}
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith(".") or not entry.is_file():
+                    continue
+                if name.endswith(".onnx.json"):
+                    configs[name[:-len(".onnx.json")]] = entry.path
+                elif name.endswith(".onnx"):
+                    models[name[:-len(".onnx")]] = (entry.path, entry.stat().st_size)
+    except OSError as e:
+        logger.warning(f"⚠️ Could not scan voices directory {path}: {e}")
+
+    voices = {
+        voice_id: VoiceEntry(voice_id, model_path, configs.get(voice_id), category, size)
+        for voice_id, (model_path, size) in models.items()
+    }
+    return voices, configs
+
+
+class VoiceCatalog:
+    """
+    Indexed lookup of Piper voices across one or more voice directories.
+
+    Args:
+        search_dirs: Voice directories in priority order
+        refresh_interval: Minimum seconds between mtime checks
+    """
+
+    def __init__(self, search_dirs: List[str], refresh_interval: float = 2.0):
+        self.search_dirs = [str(d) for d in search_dirs]
+        self.refresh_interval = refresh_interval
+
+        self._lock = threading.Lock()
+        self._last_check = 0.0
+        # directory -> (mtime, category, voices, configs)
+        self._directories: Dict[str, Tuple[float, Optional[str], Dict[str, VoiceEntry], Dict[str, str]]] = {}
+        self._root_mtimes: Dict[str, float] = {}
+        self._order: List[str] = []
+
+        self._voices: Dict[str, VoiceEntry] = {}
+        self._aliases: Dict[str, VoiceEntry] = {}
+        self._configs: Dict[str, str] = {}
+
+        self.stats = {"lookups": 0, "misses": 0, "rescans": 0, "full_rebuilds": 0}
+
+    # -------- LOOKUP -------- #
+
+    def find(self, voice_id: str) -> Optional[VoiceEntry]:
+        """Return the voice for an exact id, or the first voice named <voice_id>-*"""
+        self.refresh()
+        self.stats["lookups"] += 1
+        entry = self._voices.get(voice_id) or self._aliases.get(voice_id)
+        if entry is None:
+            self.stats["misses"] += 1
+        return entry
+
+    def find_model(self, voice_id: str) -> Optional[str]:
+        entry = self.find(voice_id)
+        return entry.model_path if entry else None
+
+    def find_config(self, voice_id: str) -> Optional[str]:
+        entry = self.find(voice_id)
+        if entry and entry.config_path:
+            return entry.config_path
+        # A config stored apart from its model
+        return self._configs.get(entry.voice_id if entry else voice_id)
+
+    def list_voices(self) -> List[VoiceEntry]:
+        """All indexed voices in search-directory priority order"""
+        self.refresh()
+        return list(self._voices.values())
+
+    def __len__(self) -> int:
+        self.refresh()
+        return len(self._voices)
+
+    # -------- REFRESH -------- #
+
+    def invalidate(self):
+        """Force a check on the next lookup (e.g. after a download or delete)"""
+        with self._lock:
+            self._last_check = 0.0
+
+    def refresh(self, force: bool = False):
+        """Rescan directories whose mtime changed since the last check"""
+        now = time.monotonic()
+        if not force and now - self._last_check < self.refresh_interval:
+            return
+
+        with self._lock:
+            if not force and now - self._last_check < self.refresh_interval:
+                return
+            self._last_check = now
+
+            changed = False
+            order = []
+            for root in self.search_dirs:
+                try:
+                    root_mtime = os.stat(root).st_mtime
+                except OSError:
+                    continue
+
+                # Root mtime changes when subdirectories are added or removed
+                if self._root_mtimes.get(root) != root_mtime or root not in self._directories:
+                    self._root_mtimes[root] = root_mtime
+                    subdirs = self._list_subdirectories(root)
+                    self._directories[root] = (-1.0, None, {}, {})
+                else:
+                    subdirs = [d for d in self._order if os.path.dirname(d) == root and d != root]
+
+                order.append(root)
+                order.extend(subdirs)
+
+            for directory in order:
+                changed |= self._rescan_if_modified(directory)
+
+            # Directories that disappeared
+            for directory in list(self._directories):
+                if directory not in order:
+                    del self._directories[directory]
+                    changed = True
+
+            if changed or order != self._order:
+                self._order = order
+                self._rebuild()
+
+    def _list_subdirectories(self, root: str) -> List[str]:
+        try:
+            with os.scandir(root) as entries:
+                return sorted(e.path for e in entries if e.is_dir() and not e.name.startswith("."))
+        except OSError:
+            return []
+
+    def _rescan_if_modified(self, directory: str) -> bool:
+        try:
+            mtime = os.stat(directory).st_mtime
+        except OSError:
+            return directory in self._directories
+
+        cached = self._directories.get(directory)
+        if cached and cached[0] == mtime:
+            return False
+
+        category = None if directory in self.search_dirs else os.path.basename(directory)
+        voices, configs = _scan_directory(directory, category)
+        self._directories[directory] = (mtime, category, voices, configs)
+        self.stats["rescans"] += 1
+        return True
+
+    def _rebuild(self):
+        """Merge per-directory indexes; earlier directories win on duplicate ids (caller holds the lock)"""
+        voices, aliases, configs = {}, {}, {}
+        for directory in self._order:
+            _, _, dir_voices, dir_configs = self._directories.get(directory, (0, None, {}, {}))
+            for voice_id in sorted(dir_voices):
+                voices.setdefault(voice_id, dir_voices[voice_id])
+            for voice_id, config_path in dir_configs.items():
+                configs.setdefault(voice_id, config_path)
+
+        # "en_US-amy" resolves to the first en_US-amy-* voice
+        for voice_id, entry in voices.items():
+            parts = voice_id.split("-")
+            for i in range(1, len(parts)):
+                aliases.setdefault("-".join(parts[:i]), entry)
+
+        self._voices, self._aliases, self._configs = voices, aliases, configs
+        self.stats["full_rebuilds"] += 1
+        logger.info(f"🗂️ Voice catalog indexed {len(voices)} voices in {len(self._order)} directories")
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "voices": len(self._voices),
+            "directories": len(self._order),
+            "refresh_interval": self.refresh_interval,
+            **self.stats
+        }
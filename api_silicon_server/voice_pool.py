@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Piper Voice Pool for API Silicon Server
+
+Keeps loaded Piper voices resident between requests so the ONNX session is
+built once per voice instead of once per utterance. Voices are keyed by voice
+id, bounded by count and by an approximate memory budget, and evicted in
+least-recently-used order.
+
+When the piper-tts Python module is unavailable the pool keeps resident
+Piper binary processes instead (one per voice, driven through --output_dir),
+so the binary fallback no longer forks a new process for every call.
+"""
+
+import os
+import select
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+import logging
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+# Piper Python module (optional)
+try:
+    import piper
+    PIPER_MODULE_AVAILABLE = True
+except ImportError:
+    PIPER_MODULE_AVAILABLE = False
+
+
+logger = logging.getLogger("SiliconServer.VoicePool")
+
+
+class ResidentPiperProcess:
+    """
+    A long-lived Piper binary process bound to a single voice.
+
+    Piper reads one utterance per stdin line and, in --output_dir mode, writes
+    a WAV file per line and prints its path on stdout.
+    """
+
+    def __init__(self, piper_binary: str, model_path: str, config_path: str):
+        self.model_path = model_path
+        self.config_path = config_path
+        self.output_dir = tempfile.mkdtemp(prefix="piper_pool_")
+        self.lock = threading.Lock()
+        self.retired = False
+        self.process = subprocess.Popen(
+            [piper_binary,
+             "--model", model_path,
+             "--config", config_path,
+             "--output_dir", self.output_dir],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1
+        )
+
+    def is_alive(self) -> bool:
+        return self.process.poll() is None
+
+    def synthesize(self, text: str, timeout: float = 15.0) -> bytes:
+        """Synthesize one utterance and return the WAV file bytes"""
+        # Piper treats each line as a separate utterance
+        line = " ".join(text.split())
+        if not line:
+            raise ValueError("No text to synthesize")
+
+        try:
+            with self.lock:
+                if self.retired or not self.is_alive():
+                    raise RuntimeError("Resident Piper process has exited")
+
+                self.process.stdin.write(line + "\n")
+                self.process.stdin.flush()
+
+                ready, _, _ = select.select([self.process.stdout], [], [], timeout)
+                if not ready:
+                    self.close()
+                    raise TimeoutError(f"Piper TTS timed out after {timeout:.0f} seconds")
+
+                wav_path = self.process.stdout.readline().strip()
+                if not wav_path or not os.path.exists(wav_path):
+                    raise RuntimeError("Resident Piper process did not produce audio")
+
+                try:
+                    with open(wav_path, "rb") as f:
+                        return f.read()
+                finally:
+                    os.remove(wav_path)
+        finally:
+            # Evicted while this utterance was in flight - close now that it is done
+            if self.retired:
+                self.retire()
+
+    def retire(self):
+        """
+        Close the process now if it is idle, otherwise as soon as the
+        utterance in flight finishes (whoever releases the lock closes it)
+        """
+        self.retired = True
+        if self.lock.acquire(blocking=False):
+            try:
+                self.close()
+            finally:
+                self.lock.release()
+
+    def close(self):
+        """Stop the process and remove its output directory"""
+        try:
+            if self.is_alive():
+                self.process.stdin.close()
+                self.process.terminate()
+                self.process.wait(timeout=2)
+        except Exception:
+            self.process.kill()
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+
+
+class _PooledVoice:
+    """Pool entry tracking a resident voice and its usage"""
+
+    def __init__(self, voice_id: str, model_path: str, engine: Any, kind: str,
+                 estimated_bytes: int, load_time: float):
+        self.voice_id = voice_id
+        self.model_path = model_path
+        self.engine = engine
+        self.kind = kind  # "python" or "binary"
+        self.estimated_bytes = estimated_bytes
+        self.load_time = load_time
+        self.loaded_at = time.time()
+        self.last_used = self.loaded_at
+        self.hits = 0
+
+    def close(self):
+        if self.kind == "binary":
+            # Never kill a process mid-utterance
+            self.engine.retire()
+
+
+class PiperVoicePool:
+    """
+    LRU pool of resident Piper voices.
+
+    Args:
+        max_voices: Maximum number of voices kept loaded at once
+        memory_budget_mb: Approximate memory budget for all resident voices.
+            A voice's footprint is estimated from its .onnx file size.
+        piper_binary: Piper binary used when the Python module is unavailable
+    """
+
+    def __init__(self, max_voices: int = 4, memory_budget_mb: int = 512, piper_binary: Optional[str] = None):
+        self.max_voices = max(1, max_voices)
+        self.memory_budget_bytes = memory_budget_mb * 1024 * 1024
+        self.piper_binary = piper_binary
+
+        self._voices: "OrderedDict[str, _PooledVoice]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._load_locks: Dict[str, threading.Lock] = {}
+
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "loads": 0,
+            "load_failures": 0,
+            "total_load_time": 0.0
+        }
+
+    # -------- LOOKUP -------- #
+
+    def get_voice(self, voice_id: str, model_path: str, config_path: str):
+        """
+        Return a loaded PiperVoice for voice_id, loading it on first use.
+
+        Raises ImportError if the piper Python module is not installed.
+        """
+        if not PIPER_MODULE_AVAILABLE:
+            raise ImportError("piper-tts Python module not available")
+
+        entry = self._acquire(voice_id, model_path, config_path, "python")
+        return entry.engine
+
+    def synthesize_with_binary(self, voice_id: str, model_path: str, config_path: str,
+                               text: str, timeout: float = 15.0) -> bytes:
+        """Synthesize text with a resident Piper binary process and return WAV bytes"""
+        if not self.piper_binary:
+            raise FileNotFoundError("Piper binary not configured")
+
+        entry = self._acquire(voice_id, model_path, config_path, "binary")
+        if entry.engine.retired:
+            # Evicted between lookup and use - load it again
+            entry = self._acquire(voice_id, model_path, config_path, "binary")
+        try:
+            return entry.engine.synthesize(text, timeout=timeout)
+        except Exception:
+            # A broken process must not stay resident
+            with self._lock:
+                if self._voices.get(f"binary:{voice_id}") is entry:
+                    self._remove(f"binary:{voice_id}")
+            raise
+
+    def prewarm(self, voice_id: str, model_path: str, config_path: str) -> bool:
+        """Load a voice ahead of the first request"""
+        kind = "python" if PIPER_MODULE_AVAILABLE else "binary"
+        if kind == "binary" and not self.piper_binary:
+            return False
+
+        try:
+            self._acquire(voice_id, model_path, config_path, kind)
+            logger.info(f"🔥 Pre-warmed voice: {voice_id} ({kind})")
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to pre-warm voice {voice_id}: {e}")
+            return False
+
+    # -------- RESIDENCY -------- #
+
+    def _acquire(self, voice_id: str, model_path: str, config_path: str, kind: str) -> _PooledVoice:
+        key = f"{kind}:{voice_id}"
+
+        with self._lock:
+            entry = self._lookup(key, model_path)
+            if entry:
+                return entry
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        # Load outside the pool lock so other voices stay available;
+        # the per-voice lock stops concurrent requests loading the same voice twice.
+        with load_lock:
+            with self._lock:
+                entry = self._lookup(key, model_path)
+                if entry:
+                    return entry
+                self.stats["misses"] += 1
+
+            start_time = time.time()
+            try:
+                if kind == "python":
+                    engine = piper.PiperVoice.load(model_path, config_path=config_path)
+                else:
+                    engine = ResidentPiperProcess(self.piper_binary, model_path, config_path)
+            except Exception:
+                with self._lock:
+                    self.stats["load_failures"] += 1
+                raise
+            load_time = time.time() - start_time
+
+            estimated_bytes = os.path.getsize(model_path) if os.path.exists(model_path) else 0
+            entry = _PooledVoice(voice_id, model_path, engine, kind, estimated_bytes, load_time)
+
+            with self._lock:
+                self._voices[key] = entry
+                self._voices.move_to_end(key)
+                self.stats["loads"] += 1
+                self.stats["total_load_time"] += load_time
+                self._evict_over_budget(keep=key)
+
+            logger.info(f"🗣️ Loaded voice into pool: {voice_id} ({kind}) in {load_time:.3f}s")
+            return entry
+
+    def _lookup(self, key: str, model_path: str) -> Optional[_PooledVoice]:
+        """Return a live pool entry and mark it most recently used (caller holds the lock)"""
+        entry = self._voices.get(key)
+        if entry is None:
+            return None
+
+        # A re-downloaded voice at a new path, or a dead binary process, is reloaded
+        if entry.model_path != model_path or (entry.kind == "binary" and not entry.engine.is_alive()):
+            self._remove(key)
+            return None
+
+        self._voices.move_to_end(key)
+        entry.last_used = time.time()
+        entry.hits += 1
+        self.stats["hits"] += 1
+        return entry
+
+    def _evict_over_budget(self, keep: str):
+        """Evict least-recently-used voices until count and memory fit (caller holds the lock)"""
+        while len(self._voices) > 1 and (
+            len(self._voices) > self.max_voices or self.resident_bytes > self.memory_budget_bytes
+        ):
+            oldest_key = next(iter(self._voices))
+            if oldest_key == keep:
+                break
+            self._remove(oldest_key)
+            self.stats["evictions"] += 1
+            logger.info(f"♻️ Evicted voice from pool: {oldest_key}")
+
+    def _remove(self, key: str):
+        # A binary process that is mid-utterance closes when that utterance finishes
+        entry = self._voices.pop(key, None)
+        if entry:
+            entry.close()
+
+    def evict(self, voice_id: str) -> bool:
+        """Drop a voice from the pool (both python and binary engines)"""
+        removed = False
+        with self._lock:
+            for kind in ("python", "binary"):
+                key = f"{kind}:{voice_id}"
+                if key in self._voices:
+                    self._remove(key)
+                    removed = True
+        return removed
+
+    def clear(self):
+        """Unload all resident voices"""
+        with self._lock:
+            for key in list(self._voices.keys()):
+                self._remove(key)
+
+    # -------- STATUS -------- #
+
+    @property
+    def resident_bytes(self) -> int:
+        return sum(entry.estimated_bytes for entry in self._voices.values())
+
+    def get_status(self) -> Dict[str, Any]:
+        """Pool occupancy and hit/miss counters for /status"""
+        with self._lock:
+            lookups = self.stats["hits"] + self.stats["misses"]
+            return {
+                "resident_voices": [
+                    {
+                        "voice": entry.voice_id,
+                        "engine": entry.kind,
+                        "estimated_mb": round(entry.estimated_bytes / (1024 * 1024), 1),
+                        "load_time": round(entry.load_time, 3),
+                        "hits": entry.hits,
+                        "idle_seconds": round(time.time() - entry.last_used, 1)
+                    }
+                    for entry in reversed(self._voices.values())
+                ],
+                "max_voices": self.max_voices,
+                "memory_budget_mb": round(self.memory_budget_bytes / (1024 * 1024), 1),
+                "resident_mb": round(self.resident_bytes / (1024 * 1024), 1),
+                "hit_rate": round(self.stats["hits"] / lookups, 3) if lookups else 0.0,
+                **self.stats
+            }
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Whisper Model Registry for API Silicon Server
+
+Process-wide cache for OpenAI Whisper models used by the fallback
+transcription path. Each requested size is loaded once and reused by /stt,
+/chat and /v1/audio/transcriptions. A size can be pinned (for example the
+configured default at startup) so it is never evicted; unpinned sizes are
+evicted least-recently-used once max_models is exceeded.
+"""
+
+import threading
+import time
+import logging
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+# OpenAI Whisper Python module (optional)
+try:
+    import whisper
+    WHISPER_MODULE_AVAILABLE = True
+except ImportError:
+    WHISPER_MODULE_AVAILABLE = False
+
+
+logger = logging.getLogger("SiliconServer.WhisperRegistry")
+
+
+class WhisperModelRegistry:
+    """
+    Load-once cache of OpenAI Whisper models keyed by size.
+
+    Args:
+        max_models: Maximum number of unpinned plus pinned sizes kept loaded
+        perf_log: Optional callable(operation, duration, success, details)
+            used to report load and transcribe timings
+    """
+
+    def __init__(self, max_models: int = 2, perf_log: Optional[Callable] = None):
+        self.max_models = max(1, max_models)
+        self.perf_log = perf_log
+
+        self._models: "OrderedDict[str, Any]" = OrderedDict()
+        self._pinned = set()
+        self._lock = threading.Lock()
+        self._load_locks: Dict[str, threading.Lock] = {}
+        self.stats = {"hits": 0, "loads": 0, "evictions": 0, "transcriptions": 0, "total_load_time": 0.0}
+
+    def _report(self, operation: str, duration: float, success: bool, details: str):
+        if self.perf_log:
+            self.perf_log(operation, duration, success, details)
+
+    def get_model(self, size: str):
+        """Return the loaded Whisper model for size, loading it on first use"""
+        if not WHISPER_MODULE_AVAILABLE:
+            raise ImportError("openai-whisper Python module not available")
+
+        with self._lock:
+            if size in self._models:
+                self._models.move_to_end(size)
+                self.stats["hits"] += 1
+                return self._models[size]
+            load_lock = self._load_locks.setdefault(size, threading.Lock())
+
+        with load_lock:
+            with self._lock:
+                if size in self._models:
+                    self._models.move_to_end(size)
+                    self.stats["hits"] += 1
+                    return self._models[size]
+
+            start_time = time.time()
+            try:
+                model = whisper.load_model(size)
+            except Exception as e:
+                self._report("WHISPER_MODEL_LOAD", time.time() - start_time, False, f"Model: {size} | Error: {e}")
+                raise
+            load_time = time.time() - start_time
+            self._report("WHISPER_MODEL_LOAD", load_time, True, f"Model: {size}")
+
+            with self._lock:
+                self._models[size] = model
+                self.stats["loads"] += 1
+                self.stats["total_load_time"] += load_time
+                self._evict_unpinned()
+            return model
+
+    def _evict_unpinned(self):
+        """Drop least-recently-used unpinned sizes over max_models (caller holds the lock)"""
+        for size in list(self._models.keys()):
+            if len(self._models) <= self.max_models:
+                break
+            if size in self._pinned:
+                continue
+            del self._models[size]
+            self.stats["evictions"] += 1
+            logger.info(f"♻️ Evicted Whisper model: {size}")
+
+    def pin(self, size: str) -> bool:
+        """Load size now and keep it resident until unpinned"""
+        try:
+            self.get_model(size)
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to pin Whisper model {size}: {e}")
+            return False
+        with self._lock:
+            self._pinned.add(size)
+        logger.info(f"📌 Pinned Whisper model: {size}")
+        return True
+
+    def unpin(self, size: str):
+        with self._lock:
+            self._pinned.discard(size)
+            self._evict_unpinned()
+
+    def transcribe(self, size: str, audio_path: str) -> str:
+        """Transcribe audio_path with the cached model for size"""
+        model = self.get_model(size)
+
+        start_time = time.time()
+        try:
+            result = model.transcribe(audio_path)
+        except Exception as e:
+            self._report("WHISPER_TRANSCRIBE", time.time() - start_time, False, f"Model: {size} | Error: {e}")
+            raise
+        transcript = result["text"] if isinstance(result, dict) else result
+
+        with self._lock:
+            self.stats["transcriptions"] += 1
+        self._report("WHISPER_TRANSCRIBE", time.time() - start_time, True,
+                     f"Model: {size} | Text length: {len(transcript)}")
+        return transcript
+
+    def clear(self, include_pinned: bool = False):
+        with self._lock:
+            for size in list(self._models.keys()):
+                if include_pinned or size not in self._pinned:
+                    del self._models[size]
+            if include_pinned:
+                self._pinned.clear()
+
+    def get_status(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "module_available": WHISPER_MODULE_AVAILABLE,
+                "loaded_models": list(reversed(self._models.keys())),
+                "pinned_models": sorted(self._pinned),
+                "max_models": self.max_models,
+                **self.stats
+            }
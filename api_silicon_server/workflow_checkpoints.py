@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Workflow Checkpoint Store for API Silicon Server
+
+Durable record of workflow executions in SQLite. After every completed step
+the step's result and a snapshot of the workflow context are written as a
+checkpoint, so a run interrupted by a restart or crash resumes from its last
+completed step instead of starting the whole research job again.
+
+Only JSON-serializable context values are snapshotted; runtime objects
+(models, tokenizers, callbacks, the server instance) are re-supplied by
+whoever resumes the run. Executions still marked running when the server
+starts are flagged as interrupted and can be resumed by id. Finished
+executions are pruned after a retention period.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger("SiliconServer.WorkflowCheckpoints")
+
+ACTIVE_STATUSES = ("running", "paused", "interrupted")
+
+# Context keys owned by the live run; never restored from a snapshot
+NON_RESTORED_KEYS = {
+    "llm_cache_stats", "current_execution_id", "execution_start_time", "running_steps",
+    "checkpoint_store", "checkpoint_execution_id", "progress_sink", "interactive_controller"
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS executions (
+    execution_id TEXT PRIMARY KEY,
+    workflow_name TEXT NOT NULL,
+    status TEXT NOT NULL,
+    input TEXT,
+    step_labels TEXT NOT NULL,
+    current_step INTEGER DEFAULT 0,
+    completed_steps INTEGER DEFAULT 0,
+    metadata TEXT NOT NULL,
+    error TEXT,
+    result TEXT,
+    started_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_executions_status ON executions (status, updated_at DESC);
+CREATE TABLE IF NOT EXISTS step_checkpoints (
+    execution_id TEXT NOT NULL,
+    step_index INTEGER NOT NULL,
+    step_label TEXT NOT NULL,
+    status TEXT NOT NULL,
+    result TEXT,
+    context TEXT,
+    duration REAL DEFAULT 0,
+    sequence INTEGER NOT NULL,
+    completed_at REAL NOT NULL,
+    PRIMARY KEY (execution_id, step_index)
+);
+"""
+
+
+def snapshot_context(context: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON-safe copy of a workflow context (objects and callables are left out)"""
+    snapshot = {}
+    for key, value in context.items():
+        if key in NON_RESTORED_KEYS or callable(value):
+            continue
+        try:
+            json.dumps(value)
+        except (TypeError, ValueError):
+            continue
+        snapshot[key] = value
+    return snapshot
+
+
+class WorkflowCheckpointStore:
+    """
+    SQLite-backed execution and step checkpoint store.
+
+    Args:
+        db_path: SQLite database file (created with its directory if missing)
+        retention_days: Finished executions older than this are pruned
+    """
+
+    def __init__(self, db_path: str, retention_days: float = 7.0):
+        self.db_path = Path(db_path)
+        self.retention_days = retention_days
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+        self.stats = {"checkpoints_written": 0, "steps_restored": 0, "resumed_executions": 0, "write_time": 0.0}
+
+    # -------- EXECUTIONS -------- #
+
+    def begin(self, execution_id: str, workflow_name: str, step_labels: List[str], input_data: Any = None,
+              metadata: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Register an execution as running.
+
+        Returns True when the execution already existed (a resume); its
+        input and metadata are kept and only the status changes.
+        """
+        now = time.time()
+        with self._lock:
+            existing = self._conn.execute(
+                "SELECT execution_id FROM executions WHERE execution_id = ?", (execution_id,)
+            ).fetchone()
+            if existing:
+                self._conn.execute(
+                    "UPDATE executions SET status = 'running', error = NULL, updated_at = ?, finished_at = NULL "
+                    "WHERE execution_id = ?",
+                    (now, execution_id)
+                )
+            else:
+                self._conn.execute(
+                    """INSERT INTO executions
+                       (execution_id, workflow_name, status, input, step_labels, metadata, started_at, updated_at)
+                       VALUES (?, ?, 'running', ?, ?, ?, ?, ?)""",
+                    (execution_id, workflow_name, json.dumps(input_data, default=str), json.dumps(step_labels),
+                     json.dumps(metadata or {}, default=str), now, now)
+                )
+            self._conn.commit()
+
+        if existing:
+            self.stats["resumed_executions"] += 1
+        return existing is not None
+
+    def set_status(self, execution_id: str, status: str, current_step: Optional[int] = None):
+        with self._lock:
+            if current_step is None:
+                self._conn.execute(
+                    "UPDATE executions SET status = ?, updated_at = ? WHERE execution_id = ?",
+                    (status, time.time(), execution_id)
+                )
+            else:
+                self._conn.execute(
+                    "UPDATE executions SET status = ?, current_step = ?, updated_at = ? WHERE execution_id = ?",
+                    (status, current_step, time.time(), execution_id)
+                )
+            self._conn.commit()
+
+    def finish(self, execution_id: str, success: bool, result: Any = None, error: Optional[str] = None):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE executions SET status = ?, result = ?, error = ?, updated_at = ?, finished_at = ? "
+                "WHERE execution_id = ?",
+                ("completed" if success else "failed",
+                 json.dumps(result, default=str) if result is not None else None,
+                 error, now, now, execution_id)
+            )
+            self._conn.commit()
+
+    def mark_interrupted(self) -> int:
+        """Flag executions left running by a previous process; returns how many"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE executions SET status = 'interrupted', updated_at = ? WHERE status IN ('running', 'paused')",
+                (time.time(),)
+            )
+            self._conn.commit()
+        if cursor.rowcount:
+            logger.info(f"💾 {cursor.rowcount} workflow executions were interrupted and can be resumed")
+        return cursor.rowcount
+
+    # -------- CHECKPOINTS -------- #
+
+    def save_step(self, execution_id: str, step_index: int, step_label: str, result: Any,
+                  context: Optional[Dict[str, Any]] = None, duration: float = 0.0, status: str = "completed"):
+        """Persist one completed (or skipped) step and the context as it stood afterwards"""
+        start_time = time.time()
+        result_json = json.dumps(result, default=str)
+        context_json = json.dumps(snapshot_context(context), default=str) if context is not None else None
+
+        with self._lock:
+            sequence = self._conn.execute(
+                "SELECT COALESCE(MAX(sequence), 0) + 1 FROM step_checkpoints WHERE execution_id = ?", (execution_id,)
+            ).fetchone()[0]
+            self._conn.execute(
+                """INSERT OR REPLACE INTO step_checkpoints
+                   (execution_id, step_index, step_label, status, result, context, duration, sequence, completed_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (execution_id, step_index, step_label, status, result_json, context_json, duration,
+                 sequence, time.time())
+            )
+            self._conn.execute(
+                """UPDATE executions SET current_step = ?, updated_at = ?,
+                   completed_steps = (SELECT COUNT(*) FROM step_checkpoints WHERE execution_id = ?)
+                   WHERE execution_id = ?""",
+                (step_index + 1, time.time(), execution_id, execution_id)
+            )
+            self._conn.commit()
+
+        self.stats["checkpoints_written"] += 1
+        self.stats["write_time"] += time.time() - start_time
+
+    def load(self, execution_id: str, step_labels: Optional[List[str]] = None
+             ) -> Tuple[Dict[int, Any], Optional[Dict[str, Any]]]:
+        """
+        Completed step results and the latest context snapshot of an execution.
+
+        With step_labels, checkpoints whose label no longer matches the
+        step at that index (the workflow definition changed) are ignored.
+        Returns ({step_index: result}, context snapshot or None).
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT step_index, step_label, result, context FROM step_checkpoints "
+                "WHERE execution_id = ? ORDER BY sequence",
+                (execution_id,)
+            ).fetchall()
+
+        results, snapshot = {}, None
+        for row in rows:
+            index = row["step_index"]
+            if step_labels is not None and (index >= len(step_labels) or step_labels[index] != row["step_label"]):
+                continue
+            results[index] = json.loads(row["result"]) if row["result"] is not None else None
+            if row["context"]:
+                snapshot = json.loads(row["context"])
+
+        self.stats["steps_restored"] += len(results)
+        return results, snapshot
+
+    def restore_context(self, context: Dict[str, Any], snapshot: Optional[Dict[str, Any]]):
+        """Apply a snapshot to a live context without touching its runtime-owned keys"""
+        if not snapshot:
+            return
+        for key, value in snapshot.items():
+            if key not in NON_RESTORED_KEYS:
+                context[key] = value
+
+    # -------- QUERIES -------- #
+
+    def get_execution(self, execution_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM executions WHERE execution_id = ?", (execution_id,)).fetchone()
+        return self._row_to_execution(row) if row else None
+
+    def list_executions(self, statuses: Tuple[str, ...] = ACTIVE_STATUSES, limit: int = 100) -> List[Dict[str, Any]]:
+        placeholders = ", ".join("?" for _ in statuses)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT * FROM executions WHERE status IN ({placeholders}) ORDER BY updated_at DESC LIMIT ?",
+                (*statuses, limit)
+            ).fetchall()
+        return [self._row_to_execution(row) for row in rows]
+
+    def _row_to_execution(self, row: sqlite3.Row) -> Dict[str, Any]:
+        step_labels = json.loads(row["step_labels"])
+        return {
+            "execution_id": row["execution_id"],
+            "workflow_name": row["workflow_name"],
+            "status": row["status"],
+            "input": json.loads(row["input"]) if row["input"] else None,
+            "step_labels": step_labels,
+            "total_steps": len(step_labels),
+            "current_step": row["current_step"],
+            "completed_steps": row["completed_steps"],
+            "metadata": json.loads(row["metadata"]),
+            "error": row["error"],
+            "has_result": row["result"] is not None,
+            "started_at": row["started_at"],
+            "updated_at": row["updated_at"],
+            "finished_at": row["finished_at"]
+        }
+
+    def get_result(self, execution_id: str) -> Any:
+        with self._lock:
+            row = self._conn.execute("SELECT result FROM executions WHERE execution_id = ?", (execution_id,)).fetchone()
+        return json.loads(row["result"]) if row and row["result"] is not None else None
+
+    # -------- MAINTENANCE -------- #
+
+    def prune(self) -> int:
+        """Delete finished executions (and their checkpoints) past the retention period"""
+        cutoff = time.time() - self.retention_days * 86400
+        with self._lock:
+            expired = [row[0] for row in self._conn.execute(
+                "SELECT execution_id FROM executions WHERE status IN ('completed', 'failed') AND finished_at < ?",
+                (cutoff,)
+            )]
+            for execution_id in expired:
+                self._conn.execute("DELETE FROM step_checkpoints WHERE execution_id = ?", (execution_id,))
+                self._conn.execute("DELETE FROM executions WHERE execution_id = ?", (execution_id,))
+            self._conn.commit()
+        return len(expired)
+
+    def get_status(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = dict(self._conn.execute("SELECT status, COUNT(*) FROM executions GROUP BY status").fetchall())
+        written = self.stats["checkpoints_written"]
+        return {
+            "db_path": str(self.db_path),
+            "executions": counts,
+            "avg_checkpoint_ms": round(self.stats["write_time"] / written * 1000, 2) if written else 0.0,
+            **self.stats
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
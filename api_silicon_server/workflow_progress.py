@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Workflow Progress Hub for API Silicon Server
+
+Live progress for research workflows, keyed by execution id. The workflow's
+PipelineTracker (and the section writer) publish step starts, progress,
+completions and finished section text into the hub as they happen; clients
+follow them over Server-Sent Events instead of waiting on the request that
+runs the whole workflow.
+
+Every execution keeps an ordered event log, so a client that connects late
+(or reconnects with Last-Event-ID) replays what it missed before receiving
+live events. Idle streams send comment heartbeats so proxies (n8n, nginx)
+do not time the connection out. Finished executions, with their final
+result, are kept for a retention period and then dropped.
+"""
+
+import asyncio
+import json
+import threading
+import time
+import logging
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger("SiliconServer.WorkflowProgress")
+
+TERMINAL_EVENTS = ("workflow_complete", "workflow_failed")
+
+
+class WorkflowExecution:
+    """Event log, subscribers and outcome of one workflow run"""
+
+    def __init__(self, execution_id: str, metadata: Dict[str, Any], max_events: int):
+        self.execution_id = execution_id
+        self.metadata = metadata
+        self.max_events = max_events
+        self.status = "running"
+        self.result: Optional[Dict[str, Any]] = None
+        self.started_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.events: List[Dict[str, Any]] = []
+        self.next_id = 1
+        self.dropped = 0
+        self.task: Optional[asyncio.Task] = None
+        self.subscribers: List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = []
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "execution_id": self.execution_id,
+            "status": self.status,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "elapsed": round((self.finished_at or time.time()) - self.started_at, 2),
+            "events": self.next_id - 1,
+            "subscribers": len(self.subscribers),
+            **self.metadata
+        }
+
+
+class WorkflowProgressHub:
+    """
+    Registry of running and recently finished workflow executions.
+
+    Args:
+        retention_seconds: How long finished executions (and results) stay available
+        heartbeat_seconds: Idle interval after which streams send a keep-alive comment
+        max_events: Events kept per execution for replay (oldest dropped first)
+    """
+
+    def __init__(self, retention_seconds: float = 3600.0, heartbeat_seconds: float = 15.0, max_events: int = 2000):
+        self.retention_seconds = retention_seconds
+        self.heartbeat_seconds = heartbeat_seconds
+        self.max_events = max_events
+
+        self._lock = threading.Lock()
+        self._executions: Dict[str, WorkflowExecution] = {}
+
+        self.stats = {"started": 0, "completed": 0, "failed": 0, "cancelled": 0, "events": 0, "streams_opened": 0}
+
+    # -------- LIFECYCLE -------- #
+
+    def start(self, execution_id: str, **metadata) -> WorkflowExecution:
+        self._prune()
+        execution = WorkflowExecution(execution_id, metadata, self.max_events)
+        with self._lock:
+            # A resumed run continues its predecessor's ids, so Last-Event-ID reconnects skip nothing
+            previous = self._executions.get(execution_id)
+            if previous is not None:
+                execution.next_id = previous.next_id
+            self._executions[execution_id] = execution
+        self.stats["started"] += 1
+        self.publish(execution_id, "workflow_start", metadata)
+        return execution
+
+    def finish(self, execution_id: str, result: Dict[str, Any], success: bool = True, cancelled: bool = False):
+        """Record the outcome and publish the terminal event (a cancelled run ends as workflow_failed)"""
+        execution = self.get(execution_id)
+        if execution is None:
+            return
+        execution.result = result
+        execution.status = "cancelled" if cancelled else ("completed" if success else "failed")
+        self.stats[execution.status] += 1
+
+        # The terminal event carries a summary; the full document is fetched from the result endpoint
+        summary = {key: value for key, value in result.items() if key != "research_content"}
+        self.publish(execution_id, "workflow_complete" if success and not cancelled else "workflow_failed", summary)
+        # Set once the terminal event is in the log, so a finished run always has one to replay
+        execution.finished_at = time.time()
+
+    def sink(self, execution_id: str) -> Callable[[str, Dict[str, Any]], None]:
+        """Callable(event_type, payload) bound to one execution (context["progress_sink"])"""
+        def publish_event(event_type: str, payload: Dict[str, Any]):
+            self.publish(execution_id, event_type, payload)
+        return publish_event
+
+    def get(self, execution_id: str) -> Optional[WorkflowExecution]:
+        with self._lock:
+            return self._executions.get(execution_id)
+
+    def _prune(self):
+        cutoff = time.time() - self.retention_seconds
+        with self._lock:
+            expired = [
+                execution_id for execution_id, execution in self._executions.items()
+                if execution.finished_at and execution.finished_at < cutoff
+            ]
+            for execution_id in expired:
+                del self._executions[execution_id]
+
+    # -------- EVENTS -------- #
+
+    def publish(self, execution_id: str, event_type: str, payload: Dict[str, Any]):
+        """Append an event and wake subscribers (safe to call from worker threads)"""
+        execution = self.get(execution_id)
+        if execution is None:
+            return
+
+        with self._lock:
+            event = {
+                "id": execution.next_id,
+                "type": event_type,
+                "execution_id": execution_id,
+                "timestamp": time.time(),
+                "data": payload
+            }
+            execution.next_id += 1
+            execution.events.append(event)
+            if len(execution.events) > execution.max_events:
+                execution.events.pop(0)
+                execution.dropped += 1
+            subscribers = list(execution.subscribers)
+        self.stats["events"] += 1
+
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, event)
+            except RuntimeError:
+                pass  # Subscriber's loop already closed
+
+    async def subscribe(self, execution_id: str, last_event_id: int = 0) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """
+        Replay events after last_event_id, then yield live ones until the run ends.
+
+        Yields None when heartbeat_seconds pass without an event.
+        """
+        execution = self.get(execution_id)
+        if execution is None:
+            return
+
+        queue: asyncio.Queue = asyncio.Queue()
+        subscriber = (asyncio.get_running_loop(), queue)
+        with self._lock:
+            backlog = [event for event in execution.events if event["id"] > last_event_id]
+            # Reconnect after the terminal event (EventSource sends its id): nothing more will come
+            seen_terminal = any(
+                event["type"] in TERMINAL_EVENTS and event["id"] <= last_event_id for event in execution.events
+            )
+            if seen_terminal or (execution.finished_at and not backlog):
+                return
+            execution.subscribers.append(subscriber)
+        self.stats["streams_opened"] += 1
+
+        try:
+            last_sent = last_event_id
+            for event in backlog:
+                last_sent = event["id"]
+                yield event
+                if event["type"] in TERMINAL_EVENTS:
+                    return
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), self.heartbeat_seconds)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                if event["id"] <= last_sent:
+                    continue  # Already replayed from the backlog
+                last_sent = event["id"]
+                yield event
+                if event["type"] in TERMINAL_EVENTS:
+                    return
+        finally:
+            with self._lock:
+                if subscriber in execution.subscribers:
+                    execution.subscribers.remove(subscriber)
+
+    # -------- STATUS -------- #
+
+    def list_executions(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            executions = list(self._executions.values())
+        return [execution.summary() for execution in executions]
+
+    def get_status(self) -> Dict[str, Any]:
+        with self._lock:
+            running = sum(1 for e in self._executions.values() if e.status == "running")
+            tracked = len(self._executions)
+        return {
+            "running": running,
+            "tracked": tracked,
+            "retention_seconds": self.retention_seconds,
+            "heartbeat_seconds": self.heartbeat_seconds,
+            **self.stats
+        }
+
+
+def sse_progress_frame(event: Optional[Dict[str, Any]]) -> str:
+    """Encode a progress event as an SSE frame with its id (None -> heartbeat comment)"""
+    if event is None:
+        return ": keep-alive\n\n"
+    return f"id: {event['id']}\ndata: {json.dumps(event, ensure_ascii=False, default=str)}\n\n"
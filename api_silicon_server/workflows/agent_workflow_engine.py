@@ -4,6 +4,10 @@ Agent Workflow Engine - Core Cognitive Processing Chain
 A psychologically-aware workflow system that models how human cognition
 processes complex tasks through sequential steps with shared context.
 Each step represents a cognitive faculty (perception, analysis, synthesis).
+
+Steps may declare which earlier steps they depend on; independent steps
+(e.g. parallel searches) then run concurrently under a concurrency cap,
+like attending to several sources at once before integrating them.
 """
 
 import time
@@ -13,7 +17,7 @@ import inspect
 import json
 import traceback
 from datetime import datetime
-from typing import Dict, List, Callable, Any, Optional
+from typing import Dict, List, Callable, Any, Optional, Tuple
 import logging
 
 # Set up workflow logger
@@ -29,12 +33,16 @@ workflow_logger.addHandler(handler)
 
 class PipelineTracker:
     """
-    Comprehensive pipeline execution tracker with detailed step monitoring
+    Comprehensive pipeline execution tracker with detailed step monitoring.
+    
+    An optional event_sink(event_type, payload) receives every pipeline and
+    step event as it happens (used to stream live progress to clients).
     """
     
-    def __init__(self, workflow_id: str, workflow_name: str):
+    def __init__(self, workflow_id: str, workflow_name: str, event_sink: Optional[Callable[[str, Dict], None]] = None):
         self.workflow_id = workflow_id
         self.workflow_name = workflow_name
+        self.event_sink = event_sink
         self.pipeline_start_time = None
         self.pipeline_end_time = None
         self.total_steps = 0
@@ -42,8 +50,18 @@ class PipelineTracker:
         self.failed_steps = 0
         self.skipped_steps = 0
         self.step_execution_log = []
+        self._step_logs = {}  # step_index -> entry in step_execution_log (steps may start out of order)
         self.performance_metrics = {}
         self.execution_phases = []
+    
+    def _emit(self, event_type: str, payload: Dict[str, Any]):
+        """Forward an event to the sink; a failing listener never breaks the pipeline"""
+        if self.event_sink is None:
+            return
+        try:
+            self.event_sink(event_type, {"workflow": self.workflow_name, **payload})
+        except Exception as e:
+            workflow_logger.warning(f"⚠️ Pipeline event sink failed for {event_type}: {str(e)}")
         
     def start_pipeline(self, total_steps: int):
         """Initialize pipeline tracking"""
@@ -56,6 +74,7 @@ class PipelineTracker:
         })
         
         workflow_logger.info(f"🚀 PIPELINE START: {self.workflow_name} (ID: {self.workflow_id}) - {total_steps} steps")
+        self._emit("pipeline_start", {"total_steps": total_steps})
         
     def log_step_start(self, step_index: int, step_label: str, step_description: str):
         """Log the start of a pipeline step"""
@@ -73,14 +92,21 @@ class PipelineTracker:
         }
         
         self.step_execution_log.append(step_log)
+        self._step_logs[step_index] = step_log
         
         workflow_logger.info(f"📋 STEP {step_index + 1}/{self.total_steps} STARTING: {step_label}")
         workflow_logger.info(f"   📝 Description: {step_description}")
+        self._emit("step_start", {
+            "step_index": step_index,
+            "step_label": step_label,
+            "step_description": step_description,
+            "total_steps": self.total_steps
+        })
         
     def log_step_progress(self, step_index: int, progress_details: str, progress_percent: float = None):
         """Log progress during step execution"""
-        if step_index < len(self.step_execution_log):
-            step_log = self.step_execution_log[step_index]
+        step_log = self._step_logs.get(step_index)
+        if step_log:
             step_log['details'].append({
                 'timestamp': datetime.now().isoformat(),
                 'progress': progress_details,
@@ -89,12 +115,18 @@ class PipelineTracker:
             
             progress_str = f" ({progress_percent:.1f}%)" if progress_percent else ""
             workflow_logger.info(f"   ⚡ PROGRESS{progress_str}: {progress_details}")
+            self._emit("step_progress", {
+                "step_index": step_index,
+                "step_label": step_log['step_label'],
+                "progress": progress_details,
+                "progress_percent": progress_percent
+            })
     
     def log_step_completion(self, step_index: int, execution_time: float, result_summary: str, 
                            input_summary: str = None, output_summary: str = None):
         """Log successful step completion"""
-        if step_index < len(self.step_execution_log):
-            step_log = self.step_execution_log[step_index]
+        step_log = self._step_logs.get(step_index)
+        if step_log:
             step_log['end_time'] = datetime.now()
             step_log['execution_time'] = execution_time
             step_log['status'] = 'completed'
@@ -111,11 +143,19 @@ class PipelineTracker:
                 workflow_logger.info(f"   📥 Input: {input_summary}")
             if output_summary:
                 workflow_logger.info(f"   📤 Output: {output_summary}")
+            self._emit("step_completion", {
+                "step_index": step_index,
+                "step_label": step_log['step_label'],
+                "execution_time": execution_time,
+                "result_summary": result_summary,
+                "completed_steps": self.completed_steps,
+                "total_steps": self.total_steps
+            })
     
     def log_step_failure(self, step_index: int, error: Exception, execution_time: float):
         """Log step failure with detailed error information"""
-        if step_index < len(self.step_execution_log):
-            step_log = self.step_execution_log[step_index]
+        step_log = self._step_logs.get(step_index)
+        if step_log:
             step_log['end_time'] = datetime.now()
             step_log['execution_time'] = execution_time
             step_log['status'] = 'failed'
@@ -129,11 +169,28 @@ class PipelineTracker:
             workflow_logger.error(f"   ⏱️ Duration: {execution_time:.2f}s")
             workflow_logger.error(f"   🚨 Error: {str(error)}")
             workflow_logger.error(f"   🔍 Error Type: {type(error).__name__}")
+            self._emit("step_failure", {
+                "step_index": step_index,
+                "step_label": step_log['step_label'],
+                "execution_time": execution_time,
+                "error": str(error),
+                "error_type": type(error).__name__
+            })
     
-    def log_step_skip(self, step_index: int, skip_reason: str):
+    def log_step_skip(self, step_index: int, skip_reason: str, step_label: str = None):
         """Log step being skipped"""
-        if step_index < len(self.step_execution_log):
-            step_log = self.step_execution_log[step_index]
+        step_log = self._step_logs.get(step_index)
+        if step_log is None and step_label:
+            # Skipped steps never start, so they get their log entry here
+            step_log = {
+                'step_index': step_index,
+                'step_label': step_label,
+                'start_time': datetime.now(),
+                'details': []
+            }
+            self.step_execution_log.append(step_log)
+            self._step_logs[step_index] = step_log
+        if step_log:
             step_log['status'] = 'skipped'
             step_log['skip_reason'] = skip_reason
             
@@ -141,6 +198,11 @@ class PipelineTracker:
             
             workflow_logger.info(f"⏭️ STEP {step_index + 1}/{self.total_steps} SKIPPED: {step_log['step_label']}")
             workflow_logger.info(f"   📝 Reason: {skip_reason}")
+            self._emit("step_skip", {
+                "step_index": step_index,
+                "step_label": step_log['step_label'],
+                "skip_reason": skip_reason
+            })
     
     def complete_pipeline(self):
         """Complete pipeline tracking and generate summary"""
@@ -175,6 +237,7 @@ class PipelineTracker:
             'details': f'Pipeline completed with {self.performance_metrics["success_rate"]:.1%} success rate',
             'metrics': self.performance_metrics
         })
+        self._emit("pipeline_complete", {"metrics": self.performance_metrics})
         
         return self.performance_metrics
     
@@ -209,7 +272,8 @@ class WorkflowStep:
         retry_attempts: int = 3,
         timeout: Optional[float] = None,
         description: str = "",
-        configuration: Dict[str, Any] = None
+        configuration: Dict[str, Any] = None,
+        depends_on: Optional[List[str]] = None
     ):
         self.label = label
         self.func = func
@@ -220,9 +284,17 @@ class WorkflowStep:
         self.configuration = configuration or {}
         self.execution_history = []
         self.skip_conditions = []  # Conditions that would cause this step to be skipped
+        # Labels of the steps whose results this step needs; None means "the previous step"
+        self.depends_on = list(depends_on) if depends_on is not None else None
     
-    async def execute(self, input_data: Any, context: Dict, step_index: int = None, pipeline_tracker: PipelineTracker = None) -> Any:
-        """Execute this workflow step with enhanced error handling and detailed logging"""
+    async def execute(self, input_data: Any, context: Dict, step_index: int = None, pipeline_tracker: PipelineTracker = None,
+                      run_sync_in_thread: bool = False) -> Any:
+        """
+        Execute this workflow step with enhanced error handling and detailed logging.
+        
+        With run_sync_in_thread, synchronous step functions (blocking searches)
+        run on a worker thread so concurrently scheduled steps overlap.
+        """
         start_time = time.time()
         step_id = str(uuid.uuid4())[:8]
         
@@ -271,7 +343,10 @@ class WorkflowStep:
                     result = await self.func(input_data, context)
                 else:
                     # Call the function and check if it returns a coroutine
-                    result = self.func(input_data, context)
+                    if run_sync_in_thread:
+                        result = await asyncio.to_thread(self.func, input_data, context)
+                    else:
+                        result = self.func(input_data, context)
                     
                     # If the result is a coroutine, await it
                     if inspect.iscoroutine(result):
@@ -390,8 +465,8 @@ class WorkflowStep:
                 if attempt == self.retry_attempts - 1:
                     raise
                 
-                # Wait briefly before retry
-                time.sleep(0.5)
+                # Wait briefly before retry (without blocking concurrently running steps)
+                await asyncio.sleep(0.5)
         
         # This should never be reached, but just in case
         raise Exception(f"Step {self.label} failed after {self.retry_attempts} attempts")
@@ -458,8 +533,12 @@ class AgentWorkflow:
     cognitive behavioral therapy and information processing theory.
     """
     
-    def __init__(self, name: str, context: Dict = None):
+    # Per-step progress keys that concurrent steps must not share
+    STEP_LOCAL_CONTEXT_KEYS = ("current_step_details", "step_output_details")
+    
+    def __init__(self, name: str, context: Dict = None, max_concurrency: int = 4):
         self.name = name
+        self.max_concurrency = max(1, max_concurrency)
         self.steps: List[WorkflowStep] = []
         self.context = context or {}
         self.history = []
@@ -490,7 +569,8 @@ class AgentWorkflow:
         retry_attempts: int = 3,
         timeout: Optional[float] = None,
         description: str = "",
-        configuration: Dict[str, Any] = None
+        configuration: Dict[str, Any] = None,
+        depends_on: Optional[List[str]] = None
     ):
         """
         Add a cognitive step to the workflow.
@@ -503,10 +583,15 @@ class AgentWorkflow:
             timeout: Maximum time to allow for step execution
             description: Detailed description of the step's purpose
             configuration: Step-specific configuration options
+            depends_on: Labels of the steps whose results this step needs. Omitted
+                means the previous step (a plain chain); [] means only the workflow
+                input. With several dependencies the step receives their results as
+                a list in depends_on order, and list results are concatenated so
+                parallel searches fan in as one result list.
         """
         step = WorkflowStep(
             label, func, auto, retry_attempts, timeout, 
-            description, configuration
+            description, configuration, depends_on
         )
         self.steps.append(step)
         
@@ -546,10 +631,11 @@ class AgentWorkflow:
         label: str, 
         func: Callable, 
         auto: bool = False,
-        retry_attempts: int = 3
+        retry_attempts: int = 3,
+        depends_on: Optional[List[str]] = None
     ):
-        """Insert a step at a specific position"""
-        step = WorkflowStep(label, func, auto, retry_attempts)
+        """Insert a step at a specific position (depends_on as in add_step)"""
+        step = WorkflowStep(label, func, auto, retry_attempts, depends_on=depends_on)
         self.steps.insert(index, step)
         
         workflow_logger.info(f"📌 Inserted step '{label}' at position {index} in workflow '{self.name}'")
@@ -560,7 +646,9 @@ class AgentWorkflow:
         Execute the complete workflow with the given input data.
         
         This represents the full cognitive processing cycle from initial
-        input through all transformation steps to final output.
+        input through all transformation steps to final output. When any
+        step declares depends_on, steps run as a dependency graph and
+        independent steps execute concurrently (up to max_concurrency).
         """
         if not self.steps:
             workflow_logger.warning(f"⚠️ Workflow '{self.name}' has no steps defined")
@@ -581,92 +669,57 @@ class AgentWorkflow:
         data = input_data
         successful_steps = 0
         
+        # Resume from durable checkpoints when a store is supplied and this execution ran before
+        checkpoint_id = self.context.get("checkpoint_execution_id") or execution_id
+        restored = self._begin_checkpointing(checkpoint_id, input_data)
+        
         try:
             # Initialize detailed workflow steps tracking
             if "workflow_steps" not in self.context:
                 self.context["workflow_steps"] = []
             
             # Initialize pipeline tracker with proper startup
-            pipeline_tracker = PipelineTracker(self.workflow_id, self.name)
+            pipeline_tracker = PipelineTracker(self.workflow_id, self.name, self.context.get("progress_sink"))
             pipeline_tracker.start_pipeline(len(self.steps))
             
-            # Execute each step in sequence
-            for i, step in enumerate(self.steps):
-                step_start = time.time()
-                
-                # Update context with current step info
-                self.context["current_step"] = step.label
-                self.context["current_step_index"] = i
-                self.context["total_steps"] = len(self.steps)
-                
-                # Check if step should be skipped
-                should_skip, skip_reason = step.should_skip(self.context)
-                
-                if should_skip:
-                    # Log skip in pipeline tracker
-                    pipeline_tracker.log_step_skip(i, skip_reason)
+            if self.has_dependencies():
+                data, successful_steps = await self._run_dag(input_data, execution_id, pipeline_tracker,
+                                                             restored, checkpoint_id)
+            else:
+                # Execute each step in sequence
+                for i, step in enumerate(self.steps):
+                    step_start = time.time()
                     
-                    # Record skipped step
-                    step_record = {
-                        "execution_id": execution_id,
-                        "step_index": i,
-                        "step_label": step.label,
-                        "step_description": step.description,
-                        "timestamp": datetime.now().isoformat(),
-                        "duration": 0,
-                        "status": "skipped",
-                        "skip_reason": skip_reason,
-                        "configuration": step.configuration.copy()
-                    }
+                    if i in restored:
+                        pipeline_tracker.log_step_skip(i, "Restored from checkpoint", step.label)
+                        data = restored[i]
+                        successful_steps += 1
+                        continue
                     
-                    self.history.append(step_record)
-                    self.context["workflow_steps"].append(step_record)
+                    # Update context with current step info
+                    self.context["current_step"] = step.label
+                    self.context["current_step_index"] = i
+                    self.context["total_steps"] = len(self.steps)
                     
-                    workflow_logger.info(
-                        f"⏭️ Step {i+1}/{len(self.steps)} [{step.label}] skipped: {skip_reason}"
-                    )
-                    continue
-                
-                # Clear any previous step output details
-                self.context.pop("step_output_details", None)
-                
-                # Execute the step (now with async support)
-                result = await step.execute(data, self.context, i, pipeline_tracker)
-                
-                step_duration = time.time() - step_start
-                
-                # Get detailed step information from context
-                step_details = self.context.get("current_step_details", {})
-                
-                # Record step in workflow history with enhanced details
-                step_record = {
-                    "execution_id": execution_id,
-                    "step_index": i,
-                    "step_label": step.label,
-                    "step_description": step.description,
-                    "timestamp": datetime.now().isoformat(),
-                    "duration": step_duration,
-                    "status": "success",
-                    "input_summary": step_details.get("input_summary", str(data)[:200] + "..." if len(str(data)) > 200 else str(data)),
-                    "output_summary": step_details.get("output_summary", str(result)[:200] + "..." if len(str(result)) > 200 else str(result)),
-                    "details": step_details.get("details", f"Completed {step.label}"),
-                    "actions_performed": step_details.get("actions_performed", []),
-                    "data_processed": step_details.get("data_processed", {}),
-                    "quality_metrics": step_details.get("quality_metrics", {}),
-                    "configuration": step.configuration.copy()
-                }
-                
-                self.history.append(step_record)
-                self.context["workflow_steps"].append(step_record)
-                
-                # Pass result to next step
-                data = result
-                successful_steps += 1
-                
-                workflow_logger.info(
-                    f"📈 Step {i+1}/{len(self.steps)} [{step.label}] completed "
-                    f"(Duration: {step_duration:.2f}s)"
-                )
+                    # Check if step should be skipped
+                    should_skip, skip_reason = step.should_skip(self.context)
+                    
+                    if should_skip:
+                        self._record_skipped_step(execution_id, i, step, skip_reason, pipeline_tracker)
+                        continue
+                    
+                    # Clear any previous step output details
+                    self.context.pop("step_output_details", None)
+                    
+                    # Execute the step (now with async support)
+                    result = await step.execute(data, self.context, i, pipeline_tracker)
+                    
+                    self._record_completed_step(execution_id, i, step, data, result, time.time() - step_start)
+                    self._checkpoint_step(checkpoint_id, i, step, result, time.time() - step_start)
+                    
+                    # Pass result to next step
+                    data = result
+                    successful_steps += 1
             
             # Complete pipeline tracking
             pipeline_metrics = pipeline_tracker.complete_pipeline()
@@ -699,6 +752,7 @@ class AgentWorkflow:
                 f"(ID: {execution_id}, Duration: {total_duration:.2f}s, Steps: {successful_steps}/{len(self.steps)})"
             )
             
+            self._finish_checkpointing(checkpoint_id, True, result=data)
             return data
             
         except Exception as e:
@@ -711,11 +765,17 @@ class AgentWorkflow:
             self.execution_metadata["total_executions"] += 1
             self.execution_metadata["failed_executions"] += 1
             
+            successful_steps = len([
+                h for h in self.history
+                if h.get("execution_id") == execution_id and h.get("status") == "success"
+            ])
+            failed_index = self.context.get("current_step_index", successful_steps)
+            
             # Record failure in history
             self.history.append({
                 "execution_id": execution_id,
-                "step_index": successful_steps,
-                "step_label": self.steps[successful_steps].label if successful_steps < len(self.steps) else "unknown",
+                "step_index": failed_index,
+                "step_label": self.steps[failed_index].label if failed_index < len(self.steps) else "unknown",
                 "timestamp": datetime.now().isoformat(),
                 "duration": total_duration,
                 "status": "failed",
@@ -742,8 +802,289 @@ class AgentWorkflow:
                 f"Completed: {successful_steps}/{len(self.steps)}, Error: {str(e)})"
             )
             
+            self._finish_checkpointing(checkpoint_id, False, error=str(e))
             raise
     
+    # -------- CHECKPOINTS -------- #
+    
+    def _begin_checkpointing(self, checkpoint_id: str, input_data: Any) -> Dict[int, Any]:
+        """
+        Register the run with context["checkpoint_store"] (if any).
+        
+        When the execution already has checkpoints (a resume), the context
+        is restored from the latest snapshot and the completed steps'
+        results are returned by step index so they are not run again.
+        """
+        store = self.context.get("checkpoint_store")
+        if store is None:
+            return {}
+        
+        labels = [step.label for step in self.steps]
+        try:
+            if not store.begin(checkpoint_id, self.name, labels, input_data, self.context.get("checkpoint_metadata")):
+                return {}
+            restored, snapshot = store.load(checkpoint_id, labels)
+        except Exception as e:
+            workflow_logger.warning(f"⚠️ Checkpoint store unavailable for '{self.name}': {str(e)} - running without resume")
+            return {}
+        
+        store.restore_context(self.context, snapshot)
+        if restored:
+            workflow_logger.info(
+                f"♻️ Resuming '{self.name}' (checkpoint {checkpoint_id}): "
+                f"{len(restored)}/{len(self.steps)} steps restored from checkpoints"
+            )
+        return restored
+    
+    def _checkpoint_step(self, checkpoint_id: str, i: int, step: WorkflowStep, result: Any, duration: float):
+        """Persist a completed step and the context after it; failures only cost resumability"""
+        store = self.context.get("checkpoint_store")
+        if store is None:
+            return
+        try:
+            store.save_step(checkpoint_id, i, step.label, result, self.context, duration)
+        except Exception as e:
+            workflow_logger.warning(f"⚠️ Could not checkpoint step [{step.label}]: {str(e)}")
+    
+    def _finish_checkpointing(self, checkpoint_id: str, success: bool, result: Any = None, error: str = None):
+        store = self.context.get("checkpoint_store")
+        if store is None:
+            return
+        try:
+            store.finish(checkpoint_id, success, result=result, error=error)
+        except Exception as e:
+            workflow_logger.warning(f"⚠️ Could not record checkpoint outcome: {str(e)}")
+    
+    def _record_skipped_step(self, execution_id: str, i: int, step: WorkflowStep, skip_reason: str,
+                             pipeline_tracker: PipelineTracker):
+        """Log a skipped step in the pipeline tracker and workflow history"""
+        pipeline_tracker.log_step_skip(i, skip_reason, step.label)
+        
+        step_record = {
+            "execution_id": execution_id,
+            "step_index": i,
+            "step_label": step.label,
+            "step_description": step.description,
+            "timestamp": datetime.now().isoformat(),
+            "duration": 0,
+            "status": "skipped",
+            "skip_reason": skip_reason,
+            "configuration": step.configuration.copy()
+        }
+        
+        self.history.append(step_record)
+        self.context["workflow_steps"].append(step_record)
+        
+        workflow_logger.info(
+            f"⏭️ Step {i+1}/{len(self.steps)} [{step.label}] skipped: {skip_reason}"
+        )
+    
+    def _record_completed_step(self, execution_id: str, i: int, step: WorkflowStep, data: Any, result: Any,
+                               step_duration: float, step_details: Dict = None):
+        """Record a successful step in workflow history with enhanced details"""
+        # Get detailed step information from context
+        if step_details is None:
+            step_details = self.context.get("current_step_details", {})
+        
+        step_record = {
+            "execution_id": execution_id,
+            "step_index": i,
+            "step_label": step.label,
+            "step_description": step.description,
+            "timestamp": datetime.now().isoformat(),
+            "duration": step_duration,
+            "status": "success",
+            "input_summary": step_details.get("input_summary", str(data)[:200] + "..." if len(str(data)) > 200 else str(data)),
+            "output_summary": step_details.get("output_summary", str(result)[:200] + "..." if len(str(result)) > 200 else str(result)),
+            "details": step_details.get("details", f"Completed {step.label}"),
+            "actions_performed": step_details.get("actions_performed", []),
+            "data_processed": step_details.get("data_processed", {}),
+            "quality_metrics": step_details.get("quality_metrics", {}),
+            "configuration": step.configuration.copy()
+        }
+        
+        self.history.append(step_record)
+        self.context["workflow_steps"].append(step_record)
+        
+        workflow_logger.info(
+            f"📈 Step {i+1}/{len(self.steps)} [{step.label}] completed "
+            f"(Duration: {step_duration:.2f}s)"
+        )
+    
+    # -------- DEPENDENCY GRAPH EXECUTION -------- #
+    
+    def has_dependencies(self) -> bool:
+        """Whether any step declares depends_on (and the workflow runs as a graph)"""
+        return any(step.depends_on is not None for step in self.steps)
+    
+    def resolve_dependencies(self) -> List[List[int]]:
+        """
+        Map each step to the indices of the steps it depends on.
+        
+        Raises ValueError for unknown labels, duplicate labels referenced as
+        dependencies, or dependency cycles.
+        """
+        indices = {}
+        duplicates = set()
+        for i, step in enumerate(self.steps):
+            if step.label in indices:
+                duplicates.add(step.label)
+            indices.setdefault(step.label, i)
+        
+        dependencies = []
+        for i, step in enumerate(self.steps):
+            if step.depends_on is None:
+                dependencies.append([i - 1] if i > 0 else [])
+                continue
+            step_dependencies = []
+            for label in step.depends_on:
+                if label not in indices:
+                    raise ValueError(f"Step '{step.label}' depends on unknown step '{label}'")
+                if label in duplicates:
+                    raise ValueError(f"Step '{step.label}' depends on ambiguous label '{label}'")
+                if indices[label] == i:
+                    raise ValueError(f"Step '{step.label}' cannot depend on itself")
+                step_dependencies.append(indices[label])
+            dependencies.append(step_dependencies)
+        
+        # Kahn's algorithm: every step must become ready eventually
+        remaining = {i: set(deps) for i, deps in enumerate(dependencies)}
+        ready = [i for i, deps in remaining.items() if not deps]
+        visited = 0
+        while ready:
+            done = ready.pop()
+            visited += 1
+            for i, deps in remaining.items():
+                if done in deps:
+                    deps.discard(done)
+                    if not deps:
+                        ready.append(i)
+        if visited < len(self.steps):
+            cyclic = [self.steps[i].label for i, deps in remaining.items() if deps]
+            raise ValueError(f"Workflow '{self.name}' has a dependency cycle between: {cyclic}")
+        
+        return dependencies
+    
+    def _dependency_input(self, dependencies: List[int], results: Dict[int, Any], input_data: Any) -> Any:
+        """Input for a step: the workflow input, one dependency's result, or the fan-in of several"""
+        if not dependencies:
+            return input_data
+        if len(dependencies) == 1:
+            return results[dependencies[0]]
+        
+        values = [results[d] for d in dependencies]
+        if all(isinstance(value, list) for value in values):
+            return [item for value in values for item in value]
+        return values
+    
+    async def _run_dag_step(self, i: int, step: WorkflowStep, data: Any,
+                            pipeline_tracker: PipelineTracker) -> Tuple[Any, Dict, float]:
+        """
+        Run one step against a private copy of the context.
+        
+        The step's context changes are merged back when it finishes, so
+        concurrently running steps do not overwrite each other's progress
+        details mid-flight. Returns (result, step_details, duration).
+        """
+        step_start = time.time()
+        snapshot = dict(self.context)
+        step_context = dict(snapshot)
+        step_context.pop("step_output_details", None)
+        
+        result = await step.execute(data, step_context, i, pipeline_tracker, run_sync_in_thread=True)
+        
+        step_details = step_context.get("current_step_details", {})
+        for key, value in step_context.items():
+            if key not in snapshot or snapshot[key] is not value:
+                self.context[key] = value
+        for key in snapshot:
+            if key not in step_context and key not in self.STEP_LOCAL_CONTEXT_KEYS:
+                self.context.pop(key, None)
+        
+        return result, step_details, time.time() - step_start
+    
+    async def _run_dag(self, input_data: Any, execution_id: str, pipeline_tracker: PipelineTracker,
+                       restored: Optional[Dict[int, Any]] = None, checkpoint_id: Optional[str] = None) -> Tuple[Any, int]:
+        """
+        Execute steps in dependency order, running ready steps concurrently.
+        
+        Skipped steps pass their input through unchanged, as in sequential
+        runs. Steps restored from checkpoints count as done with their saved
+        results. The workflow result is the result of the last declared step.
+        Returns (result, successful_steps).
+        """
+        dependencies = self.resolve_dependencies()
+        restored = restored or {}
+        results: Dict[int, Any] = dict(restored)
+        pending = [i for i in range(len(self.steps)) if i not in restored]
+        running: Dict[asyncio.Task, int] = {}
+        successful_steps = len(restored)
+        
+        for i in sorted(restored):
+            pipeline_tracker.log_step_skip(i, "Restored from checkpoint", self.steps[i].label)
+        
+        self.context["total_steps"] = len(self.steps)
+        
+        try:
+            while pending or running:
+                # Launch (or skip) every ready step while there is capacity
+                launched = True
+                while launched:
+                    launched = False
+                    for i in list(pending):
+                        if len(running) >= self.max_concurrency:
+                            break
+                        if not all(d in results for d in dependencies[i]):
+                            continue
+                        
+                        step = self.steps[i]
+                        pending.remove(i)
+                        data = self._dependency_input(dependencies[i], results, input_data)
+                        
+                        self.context["current_step"] = step.label
+                        self.context["current_step_index"] = i
+                        
+                        should_skip, skip_reason = step.should_skip(self.context)
+                        if should_skip:
+                            self._record_skipped_step(execution_id, i, step, skip_reason, pipeline_tracker)
+                            results[i] = data
+                            launched = True  # its dependents may be ready now
+                            continue
+                        
+                        task = asyncio.create_task(self._run_dag_step(i, step, data, pipeline_tracker))
+                        running[task] = i
+                        launched = True
+                
+                self.context["running_steps"] = [self.steps[i].label for i in running.values()]
+                if not running:
+                    continue
+                
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    i = running.pop(task)
+                    step = self.steps[i]
+                    try:
+                        result, step_details, step_duration = task.result()
+                    except Exception:
+                        self.context["current_step"] = step.label
+                        self.context["current_step_index"] = i
+                        raise
+                    
+                    data = self._dependency_input(dependencies[i], results, input_data)
+                    self._record_completed_step(execution_id, i, step, data, result, step_duration, step_details)
+                    self._checkpoint_step(checkpoint_id or execution_id, i, step, result, step_duration)
+                    results[i] = result
+                    successful_steps += 1
+        finally:
+            # A failed step stops the run; cancel its still-running siblings
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+            self.context["running_steps"] = []
+        
+        return results[len(self.steps) - 1], successful_steps
+    
     def get_step_history(self, step_label: str = None) -> List[Dict]:
         """Get execution history for a specific step or all steps"""
         if step_label:
@@ -766,7 +1107,9 @@ class AgentWorkflow:
             "workflow_metadata": self.execution_metadata,
             "step_metrics": step_metrics,
             "total_steps": len(self.steps),
-            "workflow_age": (datetime.now() - self.created_at).total_seconds()
+            "workflow_age": (datetime.now() - self.created_at).total_seconds(),
+            # Response cache hits/misses for this workflow's generations (set when generation is cached)
+            "llm_cache": dict(self.context.get("llm_cache_stats", {"hits": 0, "misses": 0, "bypassed": 0}))
         }
     
     def reset(self):
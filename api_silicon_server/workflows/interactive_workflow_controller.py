@@ -73,14 +73,23 @@ class InteractiveWorkflowController:
     - Skip or retry steps
     - Adjust parameters on-the-fly
     - Monitor performance and quality metrics
+    
+    With a checkpoint_store, every completed step's result and the context
+    after it are persisted; running again with the same execution_id
+    resumes after the last completed step.
     """
     
-    def __init__(self, workflow: AgentWorkflow, feedback_callback: Callable = None):
+    def __init__(self, workflow: AgentWorkflow, feedback_callback: Callable = None,
+                 checkpoint_store: Any = None, execution_id: Optional[str] = None,
+                 checkpoint_metadata: Optional[Dict[str, Any]] = None):
         self.workflow = workflow
         self.feedback_callback = feedback_callback or self._default_feedback_handler
         self.step_feedbacks: Dict[str, StepFeedback] = {}
         self.step_modifications: Dict[str, StepModification] = {}
-        self.execution_id = str(uuid.uuid4())[:8]
+        self.execution_id = execution_id or str(uuid.uuid4())[:8]
+        self.checkpoint_store = checkpoint_store
+        self.checkpoint_metadata = checkpoint_metadata or {}
+        self.restored_steps: Dict[int, Any] = {}
         self.is_paused = False
         self.current_step_index = 0
         self.user_interactions = []
@@ -107,6 +116,9 @@ class InteractiveWorkflowController:
         Run workflow with interactive control and real-time feedback.
         
         Provides step-by-step execution with pause/modify/continue capabilities.
+        Steps run one at a time; each receives the results of the steps it
+        depends_on (as in AgentWorkflow.run), or the previous step's result
+        when it declares none. The result is that of the last declared step.
         """
         controller_logger.info(f"🚀 Starting interactive execution (ID: {self.execution_id})")
         
@@ -114,7 +126,8 @@ class InteractiveWorkflowController:
             controller_logger.warning("⚠️ No steps in workflow")
             return input_data
         
-        data = input_data
+        dependencies = self.workflow.resolve_dependencies()
+        results: Dict[int, Any] = {}
         execution_start = time.time()
         
         # Update workflow context with interactive capabilities
@@ -124,20 +137,37 @@ class InteractiveWorkflowController:
             "feedback_enabled": True
         })
         
+        self.restored_steps = self._restore_checkpoints(input_data)
+        
         try:
-            for i, step in enumerate(self.workflow.steps):
+            for i in self._execution_order(dependencies):
+                step = self.workflow.steps[i]
                 self.current_step_index = i
                 
+                # Completed before an interruption: reuse the saved result
+                if i in self.restored_steps:
+                    results[i] = self.restored_steps[i]
+                    await self._send_restored_feedback(step, i)
+                    continue
+                
+                data = self.workflow._dependency_input(dependencies[i], results, input_data)
+                
                 # Check for modifications before execution
                 await self._handle_step_modifications(step, i)
                 
-                # Check if step should be skipped
+                # Check if step should be skipped (its input passes through to dependents)
                 if self._should_skip_step(step.label):
                     await self._skip_step(step, i)
+                    results[i] = data
                     continue
                 
                 # Execute step with real-time feedback
-                data = await self._execute_step_with_feedback(step, i, data)
+                step_start = time.time()
+                result = await self._execute_step_with_feedback(step, i, data)
+                results[i] = result
+                self._checkpoint(lambda store: store.save_step(
+                    self.execution_id, i, step.label, result, self.workflow.context, time.time() - step_start
+                ))
                 
                 # Handle pause state
                 while self.is_paused:
@@ -147,12 +177,76 @@ class InteractiveWorkflowController:
             total_duration = time.time() - execution_start
             controller_logger.info(f"🎉 Interactive execution completed in {total_duration:.2f}s")
             
+            data = results[len(self.workflow.steps) - 1]
+            self._checkpoint(lambda store: store.finish(self.execution_id, True, result=data))
             return data
             
         except Exception as e:
             controller_logger.error(f"❌ Interactive execution failed: {str(e)}")
+            self._checkpoint(lambda store: store.finish(self.execution_id, False, error=str(e)))
             raise
     
+    def _execution_order(self, dependencies: List[List[int]]) -> List[int]:
+        """Declared step order, except that a step never runs before the steps it depends on"""
+        order, done = [], set()
+        pending = list(range(len(self.workflow.steps)))
+        while pending:
+            i = next(i for i in pending if all(d in done for d in dependencies[i]))
+            pending.remove(i)
+            order.append(i)
+            done.add(i)
+        return order
+    
+    # Durable Checkpoints
+    
+    def _checkpoint(self, write: Callable):
+        """Run a checkpoint store write; a failing store only costs resumability"""
+        if self.checkpoint_store is None:
+            return
+        try:
+            write(self.checkpoint_store)
+        except Exception as e:
+            controller_logger.warning(f"⚠️ Checkpoint write failed for {self.execution_id}: {str(e)}")
+    
+    def _restore_checkpoints(self, input_data: Any) -> Dict[int, Any]:
+        """Register the execution and, when resuming, restore context and completed step results"""
+        if self.checkpoint_store is None:
+            return {}
+        
+        labels = [step.label for step in self.workflow.steps]
+        try:
+            if not self.checkpoint_store.begin(self.execution_id, self.workflow.name, labels, input_data,
+                                               self.checkpoint_metadata):
+                return {}
+            restored, snapshot = self.checkpoint_store.load(self.execution_id, labels)
+        except Exception as e:
+            controller_logger.warning(f"⚠️ Could not load checkpoints for {self.execution_id}: {str(e)}")
+            return {}
+        
+        self.checkpoint_store.restore_context(self.workflow.context, snapshot)
+        if restored:
+            controller_logger.info(
+                f"♻️ Resuming {self.execution_id}: {len(restored)}/{len(labels)} steps restored from checkpoints"
+            )
+        return restored
+    
+    async def _send_restored_feedback(self, step: WorkflowStep, step_index: int):
+        """Report a step whose result came from a checkpoint"""
+        feedback = StepFeedback(
+            step_id=f"{self.execution_id}_{step_index}",
+            step_label=step.label,
+            status=StepStatus.COMPLETED,
+            progress_percent=100.0,
+            current_action="Restored from checkpoint",
+            actions_completed=["Step result restored from checkpoint"],
+            data_summary=self._create_data_summary(self.restored_steps[step_index]),
+            performance_metrics={"restored": True},
+            timestamp=datetime.now().isoformat(),
+            duration=0.0,
+            can_modify=False
+        )
+        await self._send_feedback(feedback)
+    
     async def _execute_step_with_feedback(self, step: WorkflowStep, step_index: int, input_data: Any) -> Any:
         """Execute a step with comprehensive real-time feedback"""
         step_id = f"{self.execution_id}_{step_index}"
@@ -397,13 +491,16 @@ class InteractiveWorkflowController:
     async def _send_feedback(self, feedback: StepFeedback):
         """Send feedback to the registered callback"""
         self.step_feedbacks[feedback.step_id] = feedback
-        await asyncio.create_task(asyncio.coroutine(self.feedback_callback)(feedback))
+        result = self.feedback_callback(feedback)
+        if asyncio.iscoroutine(result):
+            await result
     
     # Interactive Control Methods
     
     def pause_execution(self, reason: str = "User requested pause"):
         """Pause workflow execution"""
         self.is_paused = True
+        self._checkpoint(lambda store: store.set_status(self.execution_id, "paused", self.current_step_index))
         self.user_interactions.append({
             "action": "pause",
             "reason": reason,
@@ -415,6 +512,7 @@ class InteractiveWorkflowController:
     def resume_execution(self):
         """Resume paused workflow execution"""
         self.is_paused = False
+        self._checkpoint(lambda store: store.set_status(self.execution_id, "running", self.current_step_index))
         self.user_interactions.append({
             "action": "resume", 
             "timestamp": datetime.now().isoformat(),
@@ -534,14 +632,21 @@ class InteractiveWorkflowController:
 async def run_workflow_with_control(
     workflow: AgentWorkflow,
     input_data: Any,
-    feedback_callback: Callable = None
+    feedback_callback: Callable = None,
+    checkpoint_store: Any = None,
+    execution_id: Optional[str] = None,
+    checkpoint_metadata: Optional[Dict[str, Any]] = None
 ) -> tuple[Any, InteractiveWorkflowController]:
     """
     Convenience function to run a workflow with interactive control.
     
+    Pass a checkpoint_store (and the execution_id of an interrupted run to
+    resume it) to make the execution durable; checkpoint_metadata is stored
+    with the execution for whoever resumes it.
     Returns both the result and the controller for further analysis.
     """
-    controller = InteractiveWorkflowController(workflow, feedback_callback)
+    controller = InteractiveWorkflowController(workflow, feedback_callback, checkpoint_store, execution_id,
+                                               checkpoint_metadata)
     result = await controller.run_with_control(input_data)
     return result, controller
 
@@ -7,12 +7,20 @@ processing. This module helps clarify intentions and reduce systematic errors
 in reasoning before they propagate through the workflow.
 
 Inspired by CBT, metacognitive therapy, and the bicameral mind concept.
+
+Distortion patterns (and the research complexity terms used by the clarify
+tools) are compiled once at import into a DistortionDetector. One scan of
+the text for the patterns' literal anchors decides which distortions can
+match at all; only those run their full pattern. Results per text are
+cached, so the complexity check, clarification and response for one
+request share a single scan.
 """
 
 import time
 import uuid
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Any, FrozenSet, Tuple
 import logging
 import re
 
@@ -20,11 +28,15 @@ import re
 class CognitiveDistortion:
     """Represents a specific type of cognitive distortion that can be detected"""
     
-    def __init__(self, name: str, description: str, pattern: str, correction_strategy: str):
+    def __init__(self, name: str, description: str, pattern: str, correction_strategy: str,
+                 anchors: Optional[Iterable[str]] = None):
         self.name = name
         self.description = description
         self.pattern = pattern  # Regex or keyword pattern to detect
         self.correction_strategy = correction_strategy
+        # Lowercase substrings at least one of which occurs in every match (None: always run the pattern)
+        self.anchors = tuple(anchors) if anchors else None
+        self.compiled = re.compile(pattern, re.IGNORECASE)
 
 
 class EmotionalState:
@@ -52,6 +64,210 @@ class CognitiveFrame:
         self.assumptions_made = []
 
 
+# -------- DISTORTION DETECTION -------- #
+
+# Common cognitive distortion patterns based on CBT literature
+DEFAULT_DISTORTIONS = [
+    CognitiveDistortion(
+        "All-or-Nothing Thinking",
+        "Seeing things in black and white categories",
+        r'\b(always|never|all|none|everything|nothing|completely|totally)\b',
+        "Look for middle ground and gradations",
+        anchors=("always", "never", "all", "none", "everything", "nothing", "completely", "totally")
+    ),
+    CognitiveDistortion(
+        "Overgeneralization",
+        "Drawing broad conclusions from single events",
+        r'\b(all .+ are|everyone .+ is|this proves that|this means that)\b',
+        "Consider specific context and multiple examples",
+        anchors=("all", "everyone", "this proves that", "this means that")
+    ),
+    CognitiveDistortion(
+        "Mental Filter",
+        "Focusing only on negative aspects while ignoring positives",
+        r'\b(only|just|but|however|except)\b.*\b(problem|issue|wrong|bad|negative)\b',
+        "Actively seek balanced evidence and positive aspects",
+        anchors=("only", "just", "but", "however", "except")
+    ),
+    CognitiveDistortion(
+        "Jumping to Conclusions",
+        "Making assumptions without evidence",
+        r'\b(obviously|clearly|must be|definitely|certainly) (?!.*evidence|.*proof|.*data)\b',
+        "Seek evidence and consider alternative explanations",
+        anchors=("obviously", "clearly", "must be", "definitely", "certainly")
+    ),
+    CognitiveDistortion(
+        "Catastrophizing",
+        "Expecting the worst possible outcome",
+        r'\b(disaster|catastrophe|terrible|awful|worst|ruin|destroy|devastating)\b',
+        "Consider more likely and moderate outcomes",
+        anchors=("disaster", "catastrophe", "terrible", "awful", "worst", "ruin", "destroy", "devastating")
+    ),
+    CognitiveDistortion(
+        "Emotional Reasoning",
+        "Believing that feelings reflect facts",
+        r'\bi feel.* so it must be|because .* feel|my feelings tell me\b',
+        "Distinguish between emotions and objective evidence",
+        anchors=("feel",)
+    ),
+    CognitiveDistortion(
+        "Should Statements",
+        "Using rigid rules about how things should be",
+        r'\b(should|must|ought to|have to|need to) (?!.*consider|.*explore)\b',
+        "Replace with preferences and flexible thinking",
+        anchors=("should", "must", "ought to", "have to", "need to")
+    ),
+    CognitiveDistortion(
+        "Personalization",
+        "Taking responsibility for things outside your control",
+        r'\bit\'s my fault|i caused|because of me|i should have\b',
+        "Consider external factors and shared responsibility",
+        anchors=("it's my fault", "i caused", "because of me", "i should have")
+    )
+]
+
+# Research request terms the clarify tools use to pick a CBT approach (substring matches)
+RESEARCH_COMPLEXITY_TERMS = {
+    "high_sensitivity": [
+        "trauma", "abuse", "violence", "suicide", "mental health", "therapy",
+        "controversial", "political", "religious", "ethical dilemma"
+    ],
+    "high_technical": [
+        "algorithm", "statistical", "mathematical", "technical", "scientific method",
+        "methodology", "experimental design", "data analysis"
+    ],
+    "high_ambiguity": [
+        "meaning of", "purpose of", "why does", "philosophical", "abstract",
+        "conceptual", "theoretical", "meaning"
+    ],
+    "urgent_context": [
+        "urgent", "immediate", "asap", "deadline", "emergency", "crisis"
+    ],
+    "broad_scope": [
+        "comprehensive", "complete", "everything about", "all aspects",
+        "thorough", "exhaustive", "holistic"
+    ]
+}
+
+
+class DistortionDetector:
+    """
+    Compiled detector for a fixed set of distortions and term groups.
+    
+    All anchors and terms are combined into one scanner regex (longest
+    literal first), so a text is lowercased and scanned once. Distortions
+    none of whose anchors occur are skipped; the rest run their
+    precompiled pattern exactly as before, so results match a per-pattern
+    findall. Scans are cached per text.
+    
+    Args:
+        distortions: Distortion definitions (anchors narrow which patterns run)
+        term_groups: Named lists of substrings reported by term_groups()
+        cache_size: Texts whose scan results are kept
+    """
+    
+    def __init__(self, distortions: List[CognitiveDistortion],
+                 term_groups: Optional[Dict[str, List[str]]] = None, cache_size: int = 256):
+        self.distortions = list(distortions)
+        self.term_groups = {group: list(terms) for group, terms in (term_groups or {}).items()}
+        
+        # Literal -> keys it proves present (distortion index or term group name)
+        literal_keys: Dict[str, set] = {}
+        self._unanchored = frozenset(i for i, d in enumerate(self.distortions) if not d.anchors)
+        for i, distortion in enumerate(self.distortions):
+            for anchor in distortion.anchors or ():
+                literal_keys.setdefault(anchor.lower(), set()).add(i)
+        for group, terms in self.term_groups.items():
+            for term in terms:
+                literal_keys.setdefault(term.lower(), set()).add(group)
+        
+        # The scanner reports only the longest literal at each position, so it
+        # also carries the keys of every literal that is a prefix of it
+        self._literal_keys = {
+            literal: frozenset().union(*(keys for other, keys in literal_keys.items() if literal.startswith(other)))
+            for literal in literal_keys
+        }
+        alternatives = "|".join(re.escape(literal) for literal in sorted(literal_keys, key=len, reverse=True))
+        self._scanner = re.compile(alternatives) if alternatives else None
+        
+        self._detect_cached = lru_cache(maxsize=cache_size)(self._detect_uncached)
+    
+    def scan(self, text: str) -> FrozenSet[Any]:
+        """Keys (distortion indexes, term group names) whose literals occur in text"""
+        return self._detect_cached(text)[1]
+    
+    def _detect_uncached(self, text: str) -> Tuple[Tuple[Tuple[int, List[Any]], ...], FrozenSet[Any]]:
+        text_lower = text.lower()
+        keys = set(self._unanchored)
+        if self._scanner is not None:
+            literals = set()
+            for match in self._scanner.finditer(text_lower):
+                literals.add(match.group())
+                # Matches do not overlap; literals starting inside this one are checked in place
+                for position in range(match.start() + 1, match.end()):
+                    inner = self._scanner.match(text_lower, position)
+                    if inner:
+                        literals.add(inner.group())
+            for literal in literals:
+                keys |= self._literal_keys[literal]
+        
+        hits = []
+        for i, distortion in enumerate(self.distortions):
+            if i in keys:
+                matches = distortion.compiled.findall(text_lower)
+                if matches:
+                    hits.append((i, matches))
+        return tuple(hits), frozenset(keys)
+    
+    def detect(self, text: str) -> List[Dict[str, Any]]:
+        """Distortions found in text, in definition order"""
+        hits, _ = self._detect_cached(text)
+        return self._describe(hits)
+    
+    def _describe(self, hits: Tuple[Tuple[int, List[Any]], ...]) -> List[Dict[str, Any]]:
+        return [
+            {
+                "distortion_type": self.distortions[i].name,
+                "description": self.distortions[i].description,
+                "matches": list(matches),
+                "correction_strategy": self.distortions[i].correction_strategy,
+                "confidence": len(matches) * 0.2  # Simple confidence scoring
+            }
+            for i, matches in hits
+        ]
+    
+    def analyze(self, text: str) -> Dict[str, Any]:
+        """Distortions and term groups for one text from a single scan"""
+        hits, keys = self._detect_cached(text)
+        return {
+            "distortions": self._describe(hits),
+            "term_groups": {group: group in keys for group in self.term_groups}
+        }
+    
+    def detect_batch(self, texts: Iterable[str]) -> List[List[Dict[str, Any]]]:
+        """detect() for many texts"""
+        return [self.detect(text) for text in texts]
+    
+    def score_batch(self, texts: Iterable[str]) -> List[Dict[str, float]]:
+        """Confidence per detected distortion name for many texts (empty dict: none found)"""
+        scores = []
+        for text in texts:
+            hits, _ = self._detect_cached(text)
+            scores.append({self.distortions[i].name: len(matches) * 0.2 for i, matches in hits})
+        return scores
+    
+    def term_groups_present(self, text: str) -> Dict[str, bool]:
+        """For each term group, whether any of its terms occurs in text"""
+        keys = self.scan(text)
+        return {group: group in keys for group in self.term_groups}
+    
+    def cache_info(self):
+        return self._detect_cached.cache_info()
+
+
+DISTORTION_DETECTOR = DistortionDetector(DEFAULT_DISTORTIONS, RESEARCH_COMPLEXITY_TERMS)
+
+
 class ProtoConsciousness:
     """
     CBT-Informed Cognitive Awareness System
@@ -66,6 +282,7 @@ class ProtoConsciousness:
         self.created_at = datetime.now(timezone.utc)
         self.emotional_state = EmotionalState()
         self.cognitive_frame = CognitiveFrame()
+        self.detector = DISTORTION_DETECTOR
         self.consciousness_history = []
         self.sub_contexts = {}  # Named contexts for different topics
         self.cognitive_distortions = self._initialize_distortion_patterns()
@@ -88,57 +305,8 @@ class ProtoConsciousness:
         self.logger.info(f"🧘 ProtoConsciousness initialized (Session: {self.session_id[:8]})")
     
     def _initialize_distortion_patterns(self) -> List[CognitiveDistortion]:
-        """Initialize common cognitive distortion patterns based on CBT literature"""
-        return [
-            CognitiveDistortion(
-                "All-or-Nothing Thinking",
-                "Seeing things in black and white categories",
-                r'\b(always|never|all|none|everything|nothing|completely|totally)\b',
-                "Look for middle ground and gradations"
-            ),
-            CognitiveDistortion(
-                "Overgeneralization",
-                "Drawing broad conclusions from single events",
-                r'\b(all .+ are|everyone .+ is|this proves that|this means that)\b',
-                "Consider specific context and multiple examples"
-            ),
-            CognitiveDistortion(
-                "Mental Filter",
-                "Focusing only on negative aspects while ignoring positives",
-                r'\b(only|just|but|however|except)\b.*\b(problem|issue|wrong|bad|negative)\b',
-                "Actively seek balanced evidence and positive aspects"
-            ),
-            CognitiveDistortion(
-                "Jumping to Conclusions",
-                "Making assumptions without evidence",
-                r'\b(obviously|clearly|must be|definitely|certainly) (?!.*evidence|.*proof|.*data)\b',
-                "Seek evidence and consider alternative explanations"
-            ),
-            CognitiveDistortion(
-                "Catastrophizing",
-                "Expecting the worst possible outcome",
-                r'\b(disaster|catastrophe|terrible|awful|worst|ruin|destroy|devastating)\b',
-                "Consider more likely and moderate outcomes"
-            ),
-            CognitiveDistortion(
-                "Emotional Reasoning",
-                "Believing that feelings reflect facts",
-                r'\bi feel.* so it must be|because .* feel|my feelings tell me\b',
-                "Distinguish between emotions and objective evidence"
-            ),
-            CognitiveDistortion(
-                "Should Statements",
-                "Using rigid rules about how things should be",
-                r'\b(should|must|ought to|have to|need to) (?!.*consider|.*explore)\b',
-                "Replace with preferences and flexible thinking"
-            ),
-            CognitiveDistortion(
-                "Personalization",
-                "Taking responsibility for things outside your control",
-                r'\bit\'s my fault|i caused|because of me|i should have\b',
-                "Consider external factors and shared responsibility"
-            )
-        ]
+        """Common cognitive distortion patterns based on CBT literature (compiled at import)"""
+        return list(DEFAULT_DISTORTIONS)
     
     def update_sub_context(self, context_name: str, context_data: Any):
         """Update a specific sub-context (e.g., 'Research Topic', 'User Intent')"""
@@ -286,27 +454,16 @@ class ProtoConsciousness:
         """
         self.logger.info("🔍 Scanning for cognitive distortions...")
         
-        detected_distortions = []
-        input_lower = input_text.lower()
+        detected_distortions = self.detector.detect(input_text)
         
-        for distortion in self.cognitive_distortions:
-            pattern_matches = re.findall(distortion.pattern, input_lower, re.IGNORECASE)
-            
-            if pattern_matches:
-                detected_distortions.append({
-                    "distortion_type": distortion.name,
-                    "description": distortion.description,
-                    "matches": pattern_matches,
-                    "correction_strategy": distortion.correction_strategy,
-                    "confidence": len(pattern_matches) * 0.2  # Simple confidence scoring
-                })
-                
-                # Update thought record
-                self.thought_record["cognitive_distortions"].append({
-                    "type": distortion.name,
-                    "evidence": pattern_matches,
-                    "timestamp": datetime.now(timezone.utc).isoformat()
-                })
+        # Update thought record
+        timestamp = datetime.now(timezone.utc).isoformat()
+        for distortion in detected_distortions:
+            self.thought_record["cognitive_distortions"].append({
+                "type": distortion["distortion_type"],
+                "evidence": distortion["matches"],
+                "timestamp": timestamp
+            })
         
         if detected_distortions:
             self.logger.info(f"⚠️ Detected {len(detected_distortions)} potential cognitive distortions")
@@ -16,7 +16,7 @@ import logging
 from typing import Dict, Any
 from .agent_workflow_engine import AgentWorkflow
 from .tools.clarify import clarify_request, auto_clarify_research_request
-from .tools.search import search_web_info, search_academic
+from .tools.search import search_web_info, search_arxiv, search_academic
 from .tools.summarize import summarize_content, synthesize_findings
 from .tools.sections import identify_sections, write_sections, finalize_document
 
@@ -65,12 +65,13 @@ def build_research_workflow(context: Dict[str, Any]) -> AgentWorkflow:
         }
     )
     
-    # Step 2: Information Gathering
+    # Step 2: Information Gathering (web and ArXiv searches run side by side)
     workflow.add_step(
         "Gather Information",
         search_web_info,
         auto=True,
         retry_attempts=3,
+        depends_on=["Clarify Research Intent"],
         description="Search the web for relevant information using DuckDuckGo with relevance scoring",
         configuration={
             "max_results": 10,
@@ -86,12 +87,28 @@ def build_research_workflow(context: Dict[str, Any]) -> AgentWorkflow:
         }
     )
     
-    # Step 3: Content Synthesis
+    workflow.add_step(
+        "Search Academic Papers",
+        search_arxiv,
+        auto=True,
+        retry_attempts=3,
+        depends_on=["Clarify Research Intent"],
+        description="Search ArXiv for scholarly papers in parallel with the web search",
+        configuration={
+            "arxiv_max_results": 5,
+            "schema": {
+                "arxiv_max_results": {"type": "integer", "min": 1, "max": 20, "description": "Maximum number of ArXiv papers"}
+            }
+        }
+    )
+    
+    # Step 3: Content Synthesis (web results followed by ArXiv papers)
     workflow.add_step(
         "Synthesize Findings",
         synthesize_findings,
         auto=True,
         retry_attempts=2,
+        depends_on=["Gather Information", "Search Academic Papers"],
         description="Analyze and synthesize research findings using MLX-powered language models",
         configuration={
             "synthesis_depth": "comprehensive",
@@ -164,7 +181,7 @@ def build_research_workflow(context: Dict[str, Any]) -> AgentWorkflow:
         }
     )
     
-    workflow_logger.info("✅ Research workflow built with 6 cognitive processing steps")
+    workflow_logger.info("✅ Research workflow built with 7 cognitive processing steps (parallel information gathering)")
     return workflow
 
 
@@ -450,6 +467,7 @@ def create_research_context(
         "arxiv_max_results": 5,
         "search_region": "en-us",
         "search_safesearch": "moderate",
+        "search_deadline": 20.0,  # Providers still running after this are merged without
         
         # Academic parameters
         "academic_focus": True,
@@ -461,6 +479,12 @@ def create_research_context(
         "advanced_expansion": False,
         "technical_focus": False,
         "precision_mode": False,
+        "section_expansion_concurrency": 4,   # Section generations in flight at once
+        "section_expansion_timeout": 120.0,   # Seconds before a section falls back to template text
+        "context_token_budget": 3072,         # Prompt tokens for packed sources in summarize/synthesize
+        "context_packing_mode": "auto",       # "fill" drops low-ranked sources; "auto"/"map_reduce" condenses them
+        "context_map_max_batches": 4,         # Source batches condensed at most when over budget
+        "context_map_reduce_threshold": 0.5,  # "auto" condenses only when more than this share of source tokens is dropped
         
         # Workflow tracking
         "workflow_steps": [],
@@ -9,7 +9,7 @@ the true intent behind research requests.
 import logging
 import time
 from typing import Any, Dict
-from ..proto_consciousness import ProtoConsciousness
+from ..proto_consciousness import ProtoConsciousness, DISTORTION_DETECTOR
 
 # Set up logger
 clarify_logger = logging.getLogger("WorkflowTools.Clarify")
@@ -216,29 +216,8 @@ def detect_research_complexity(input_data: Any, context: Dict) -> Dict[str, Any]
     clarify_logger.info("🔍 Analyzing research complexity...")
     
     request_text = str(input_data) if not isinstance(input_data, str) else input_data
-    request_lower = request_text.lower()
-    
-    complexity_indicators = {
-        "high_sensitivity": any(term in request_lower for term in [
-            "trauma", "abuse", "violence", "suicide", "mental health", "therapy",
-            "controversial", "political", "religious", "ethical dilemma"
-        ]),
-        "high_technical": any(term in request_lower for term in [
-            "algorithm", "statistical", "mathematical", "technical", "scientific method",
-            "methodology", "experimental design", "data analysis"
-        ]),
-        "high_ambiguity": any(term in request_lower for term in [
-            "meaning of", "purpose of", "why does", "philosophical", "abstract",
-            "conceptual", "theoretical", "meaning"
-        ]),
-        "urgent_context": any(term in request_lower for term in [
-            "urgent", "immediate", "asap", "deadline", "emergency", "crisis"
-        ]),
-        "broad_scope": any(term in request_lower for term in [
-            "comprehensive", "complete", "everything about", "all aspects",
-            "thorough", "exhaustive", "holistic"
-        ])
-    }
+    # Same cached scan the distortion detector runs during clarification
+    complexity_indicators = DISTORTION_DETECTOR.term_groups_present(request_text)
     
     # Calculate complexity score
     complexity_score = sum(complexity_indicators.values())
@@ -0,0 +1,240 @@
+"""
+Context Packer - Token-Budgeted Prompt Context
+
+Fits search results into the prompt context of summarization and synthesis
+steps. Results are formatted as numbered source chunks, near-identical
+snippets (the same abstract mirrored on several sites) are dropped, chunks
+are ranked by query relevance and the best ones are packed until the token
+budget is reached. Tokens are counted with the resident model's tokenizer
+when the workflow context has one, otherwise estimated from characters.
+
+When the ranked sources do not fit, pack_results reports the overflow as
+budget-sized batches so the caller can map-reduce them (summarize each
+batch, then work from the batch notes) instead of dropping sources.
+"""
+
+import logging
+import re
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .search import _calculate_relevance_score
+
+# Set up logger
+packer_logger = logging.getLogger("WorkflowTools.ContextPacker")
+packer_logger.setLevel(logging.INFO)
+
+DEFAULT_TOKEN_BUDGET = 3072
+CHARS_PER_TOKEN = 4            # Estimate when no tokenizer is loaded
+DUPLICATE_SIMILARITY = 0.85    # Shingle overlap at which two snippets count as the same text
+MIN_CHUNK_TOKENS = 48          # Floor for the per-source cap on very small budgets
+
+CONTENT_FIELDS = ["snippet", "abstract", "body", "content", "text"]
+
+
+# -------- TOKENS -------- #
+
+def make_token_counter(tokenizer: Any = None) -> Callable[[str], int]:
+    """Token counter for the resident model's tokenizer (character estimate without one)"""
+    encode = getattr(tokenizer, "encode", None)
+    if encode is not None:
+        def count_tokens(text: str) -> int:
+            try:
+                return len(encode(text))
+            except Exception:
+                return _estimate_tokens(text)
+        return count_tokens
+    return _estimate_tokens
+
+
+def _estimate_tokens(text: str) -> int:
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def truncate_to_tokens(text: str, max_tokens: int, tokenizer: Any = None) -> str:
+    """Cut text to at most max_tokens, on a word boundary where possible"""
+    if max_tokens <= 0:
+        return ""
+    encode, decode = getattr(tokenizer, "encode", None), getattr(tokenizer, "decode", None)
+    if encode is not None and decode is not None:
+        try:
+            ids = encode(text)
+            if len(ids) <= max_tokens:
+                return text
+            cut = decode(ids[:max_tokens])
+        except Exception:
+            cut = text[:max_tokens * CHARS_PER_TOKEN]
+    else:
+        if len(text) <= max_tokens * CHARS_PER_TOKEN:
+            return text
+        cut = text[:max_tokens * CHARS_PER_TOKEN]
+
+    space = cut.rfind(" ")
+    if space > len(cut) * 0.8:
+        cut = cut[:space]
+    return cut.rstrip() + " ..."
+
+
+# -------- CHUNKS -------- #
+
+def result_content(result: Dict) -> str:
+    """Main text of a search result (first non-empty content field)"""
+    for field in CONTENT_FIELDS:
+        if result.get(field):
+            return str(result[field])
+    return ""
+
+
+def format_source(result: Dict, number: int, content: Optional[str] = None) -> str:
+    """One search result as a numbered source block"""
+    text = ""
+    title = result.get("title", "")
+    if title:
+        text += f"=== Source {number}: {title} ===\n"
+
+    content = result_content(result) if content is None else content
+    if content:
+        text += content + "\n"
+
+    url = result.get("url", "")
+    if url:
+        text += f"Source: {url}\n"
+    return text
+
+
+def _shingles(text: str) -> set:
+    words = re.findall(r"\w+", text.lower())
+    if len(words) < 3:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + 3]) for i in range(len(words) - 2)}
+
+
+def dedupe_results(results: List[Dict]) -> Tuple[List[Dict], int]:
+    """
+    Drop repeated URLs and near-identical snippets (first occurrence wins).
+
+    Returns (kept results, number removed).
+    """
+    kept, kept_shingles, seen_urls = [], [], set()
+    for result in results:
+        if not isinstance(result, dict):
+            continue
+        url = result.get("url", "").rstrip("/").lower()
+        if url and url in seen_urls:
+            continue
+
+        shingles = _shingles(result.get("title", "") + " " + result_content(result))
+        duplicate = False
+        if shingles:
+            for other in kept_shingles:
+                overlap = len(shingles & other) / min(len(shingles), len(other)) if other else 0.0
+                if overlap >= DUPLICATE_SIMILARITY:
+                    duplicate = True
+                    break
+        if duplicate:
+            continue
+
+        if url:
+            seen_urls.add(url)
+        kept.append(result)
+        kept_shingles.append(shingles)
+    return kept, len(results) - len(kept)
+
+
+def rank_results(results: List[Dict], query: str) -> List[Dict]:
+    """Order results by relevance to the query (search-time scores are reused when present)"""
+    if not query.strip():
+        return list(results)
+
+    def score(result: Dict) -> float:
+        if "relevance_score" in result:
+            return result["relevance_score"]
+        scoring_view = {**result, "snippet": result_content(result)}
+        return _calculate_relevance_score(scoring_view, query)
+
+    return sorted(results, key=score, reverse=True)
+
+
+# -------- PACKING -------- #
+
+def pack_results(results: List[Dict], context: Dict, budget_tokens: Optional[int] = None
+                 ) -> Tuple[str, Dict[str, Any], List[List[str]]]:
+    """
+    Pack the most relevant, de-duplicated results into a token budget.
+
+    Budget and query come from context["context_token_budget"] and
+    context["original_request"]. Returns (packed text, packing stats,
+    overflow batches); the batches hold every ranked source chunk split
+    into budget-sized groups and are empty when all sources fit.
+    """
+    pack_start = time.time()
+    budget = int(budget_tokens or context.get("context_token_budget") or DEFAULT_TOKEN_BUDGET)
+    tokenizer = context.get("tokenizer")
+    count_tokens = make_token_counter(tokenizer)
+
+    unique, duplicates = dedupe_results(results)
+    ranked = rank_results(unique, context.get("original_request", ""))
+
+    # One source may not take the whole budget on its own
+    chunk_cap = max(MIN_CHUNK_TOKENS, budget // 2)
+    chunks = []
+    for number, result in enumerate(ranked, 1):
+        chunk = format_source(result, number)
+        tokens = count_tokens(chunk)
+        if tokens > chunk_cap:
+            content = result_content(result)
+            overhead = tokens - count_tokens(content)
+            chunk = format_source(result, number, truncate_to_tokens(content, chunk_cap - overhead, tokenizer))
+            tokens = count_tokens(chunk)
+        chunks.append((chunk, tokens))
+
+    # Greedy in rank order; a source that does not fit is skipped so shorter ones can still fill the gap
+    packed, used = [], 0
+    for chunk, tokens in chunks:
+        if used + tokens <= budget:
+            packed.append(chunk)
+            used += tokens
+
+    total_tokens = sum(tokens for _, tokens in chunks)
+    overflow = []
+    if len(packed) < len(chunks):
+        batch, batch_tokens = [], 0
+        for chunk, tokens in chunks:
+            if batch and batch_tokens + tokens > budget:
+                overflow.append(batch)
+                batch, batch_tokens = [], 0
+            batch.append(chunk)
+            batch_tokens += tokens
+        if batch:
+            overflow.append(batch)
+
+    stats = {
+        "sources_in": len(results),
+        "duplicates_removed": duplicates,
+        "sources_packed": len(packed),
+        "sources_dropped": len(chunks) - len(packed),
+        "tokens_packed": used,
+        "tokens_available": total_tokens,
+        "token_budget": budget,
+        "token_counter": "model" if getattr(tokenizer, "encode", None) is not None else "estimate",
+        "pack_ms": round((time.time() - pack_start) * 1000, 2)
+    }
+    packer_logger.info(
+        f"📦 Packed {stats['sources_packed']}/{len(chunks)} sources into {used}/{budget} tokens "
+        f"({duplicates} duplicates removed, {total_tokens} tokens available)"
+    )
+    return "\n\n".join(chunk.strip() for chunk in packed), stats, overflow
+
+
+def pack_text(text: str, context: Dict, budget_tokens: Optional[int] = None) -> Tuple[str, Dict[str, Any]]:
+    """Fit already-combined text into the token budget"""
+    budget = int(budget_tokens or context.get("context_token_budget") or DEFAULT_TOKEN_BUDGET)
+    tokenizer = context.get("tokenizer")
+    tokens = make_token_counter(tokenizer)(text)
+    packed = text if tokens <= budget else truncate_to_tokens(text, budget, tokenizer)
+    return packed, {
+        "tokens_available": tokens,
+        "tokens_packed": min(tokens, budget),
+        "token_budget": budget,
+        "truncated": tokens > budget
+    }
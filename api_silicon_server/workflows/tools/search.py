@@ -7,21 +7,403 @@ Provides comprehensive search capabilities for research workflows:
 - ArXiv research paper search
 - Intelligent query generation and result filtering
 
+Searches go through async providers (DuckDuckGo, ArXiv, or an offline
+provider for tests and air-gapped runs). Blocking client libraries run on a
+worker thread so the workflow's event loop keeps moving, providers are
+queried concurrently under a deadline and whatever returned in time is
+merged and ranked together. Results are cached per provider and normalized
+query for a TTL, so the same query across workflows hits the network once.
+
 Integrates with the workflow context to maintain search history and
 apply cognitive filters for relevance.
 """
 
+import asyncio
 import logging
+import re
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 
 # Set up logger
 search_logger = logging.getLogger("WorkflowTools.Search")
 search_logger.setLevel(logging.INFO)
 
+DEFAULT_SEARCH_DEADLINE = 20.0  # Seconds to wait for providers before merging what returned
+
+
+class SearchProvider:
+    """
+    Async search backend.
+
+    Subclasses implement _search(query, max_results, options) returning
+    result dicts with at least title, url and snippet (or abstract).
+    kind is "web" or "academic"; each search tool queries the providers
+    of its kind.
+    """
+
+    name = "Search"
+    kind = "web"
+
+    def available(self) -> bool:
+        return True
+
+    def cache_key(self, options: Dict[str, Any]) -> Tuple:
+        """Options that change this provider's results (part of the cache key)"""
+        return tuple(sorted(options.items()))
+
+    async def search(self, query: str, max_results: int, options: Dict[str, Any]) -> List[Dict[str, Any]]:
+        results = await self._search(query, max_results, options)
+        for result in results:
+            result.setdefault("source", self.name)
+        return results
+
+    async def _search(self, query: str, max_results: int, options: Dict[str, Any]) -> List[Dict[str, Any]]:
+        raise NotImplementedError
+
+
+class DuckDuckGoProvider(SearchProvider):
+    """DuckDuckGo text search (the DDGS client is blocking, so it runs on a worker thread)"""
+
+    name = "DuckDuckGo"
+    kind = "web"
+
+    def __init__(self):
+        self._ddgs_class = None
+        self._checked = False
+
+    def _load(self):
+        if not self._checked:
+            self._checked = True
+            try:
+                from ddgs import DDGS
+                self._ddgs_class = DDGS
+            except ImportError:
+                try:
+                    # Fallback to old package name if new one not available
+                    from duckduckgo_search import DDGS
+                    self._ddgs_class = DDGS
+                    search_logger.warning("⚠️ Using deprecated duckduckgo_search package. Please upgrade to 'ddgs'")
+                except ImportError:
+                    search_logger.warning("⚠️ DuckDuckGo search not available, using mock results")
+        return self._ddgs_class
+
+    def available(self) -> bool:
+        return self._load() is not None
+
+    def cache_key(self, options: Dict[str, Any]) -> Tuple:
+        return (options.get("region", "en-us"), options.get("safesearch", "moderate"))
+
+    async def _search(self, query: str, max_results: int, options: Dict[str, Any]) -> List[Dict[str, Any]]:
+        DDGS = self._load()
+
+        def run():
+            with DDGS() as ddgs:
+                return list(ddgs.text(
+                    keywords=query,
+                    region=options.get("region", "en-us"),
+                    safesearch=options.get("safesearch", "moderate"),
+                    max_results=max_results
+                ) or [])
+
+        raw_results = await asyncio.to_thread(run)
+        return [
+            {"title": r.get("title", ""), "url": r.get("href", ""), "snippet": r.get("body", "")}
+            for r in raw_results
+        ]
+
+
+class ArxivProvider(SearchProvider):
+    """ArXiv paper search (the arxiv client pages results synchronously, so it runs on a worker thread)"""
+
+    name = "ArXiv"
+    kind = "academic"
+
+    def __init__(self):
+        self._arxiv = None
+        self._checked = False
+
+    def _load(self):
+        if not self._checked:
+            self._checked = True
+            try:
+                import arxiv
+                self._arxiv = arxiv
+            except ImportError:
+                search_logger.warning("⚠️ ArXiv library not available, using mock results")
+        return self._arxiv
+
+    def available(self) -> bool:
+        return self._load() is not None
+
+    def cache_key(self, options: Dict[str, Any]) -> Tuple:
+        return ()
+
+    async def _search(self, query: str, max_results: int, options: Dict[str, Any]) -> List[Dict[str, Any]]:
+        arxiv = self._load()
+
+        def run():
+            arxiv_search = arxiv.Search(
+                query=query,
+                max_results=max_results,
+                sort_by=arxiv.SortCriterion.Relevance
+            )
+            return [
+                {
+                    "title": paper.title,
+                    "authors": [author.name for author in paper.authors],
+                    "abstract": paper.summary,
+                    "url": paper.entry_id,
+                    "pdf_url": paper.pdf_url,
+                    "published": paper.published.isoformat() if paper.published else "",
+                    "categories": paper.categories,
+                    "academic_relevance": _calculate_academic_relevance(paper, query)
+                }
+                for paper in arxiv_search.results()
+            ]
+
+        return await asyncio.to_thread(run)
+
+
+class OfflineSearchProvider(SearchProvider):
+    """
+    Local search for tests and offline runs.
+
+    With a corpus (list of dicts with title, url and snippet or abstract)
+    it returns the documents sharing the most words with the query;
+    without one it returns the same generated results as the mock
+    fallback. Never touches the network.
+    """
+
+    def __init__(self, kind: str = "web", corpus: Optional[List[Dict[str, Any]]] = None, name: str = None,
+                 delay: float = 0.0):
+        self.kind = kind
+        self.name = name or ("Offline ArXiv" if kind == "academic" else "Offline")
+        self.corpus = corpus
+        self.delay = delay  # Simulated latency, for exercising deadlines
+
+    async def _search(self, query: str, max_results: int, options: Dict[str, Any]) -> List[Dict[str, Any]]:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+
+        if self.corpus is None:
+            if self.kind == "academic":
+                return _generate_mock_arxiv_results(query, max_results)
+            return _generate_mock_search_results(query, max_results)
+
+        terms = set(query.lower().split())
+        scored = []
+        for position, document in enumerate(self.corpus):
+            text = f"{document.get('title', '')} {document.get('snippet', document.get('abstract', ''))}".lower()
+            overlap = len(terms & set(re.findall(r"\w+", text)))
+            if overlap:
+                scored.append((-overlap, position, document))
+        scored.sort(key=lambda item: item[:2])
+        return [dict(document) for _, _, document in scored[:max_results]]
+
+
+class SearchResultCache:
+    """
+    In-memory cache of provider results keyed by provider, normalized query and options.
+
+    Args:
+        ttl_seconds: Age after which a cached result set is refetched
+        max_entries: Least recently used entries beyond this are dropped
+    """
+
+    def __init__(self, ttl_seconds: float = 3600.0, max_entries: int = 256):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "expired": 0, "evictions": 0}
+
+    def get(self, key: Tuple) -> Optional[List[Dict[str, Any]]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            stored_at, results = entry
+            if time.time() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self.stats["expired"] += 1
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return [dict(result) for result in results]
+
+    def put(self, key: Tuple, results: List[Dict[str, Any]]):
+        with self._lock:
+            self._entries[key] = (time.time(), [dict(result) for result in results])
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_status(self) -> Dict[str, Any]:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            "entries": len(self._entries),
+            "ttl_seconds": self.ttl_seconds,
+            "hit_rate": round(self.stats["hits"] / lookups, 3) if lookups else 0.0,
+            **self.stats
+        }
+
+
+# Shared across workflows so identical queries hit the network once per TTL
+search_result_cache = SearchResultCache()
+DEFAULT_PROVIDERS: List[SearchProvider] = [DuckDuckGoProvider(), ArxivProvider()]
+
+
+def normalize_query(query: str) -> str:
+    """Cache form of a query: lowercase, single-spaced, without trailing punctuation"""
+    return " ".join(query.lower().split()).strip(" ?!.,;:")
 
-def search_web_info(input_data: Any, context: Dict) -> List[Dict[str, Any]]:
+
+def _get_providers(context: Dict, kind: str) -> List[SearchProvider]:
+    """
+    Providers of one kind for this run.
+
+    context["search_providers"] replaces the defaults (e.g. with
+    OfflineSearchProvider instances in tests); context["search_offline"]
+    uses the built-in offline providers.
+    """
+    if context.get("search_providers") is not None:
+        providers = context["search_providers"]
+    elif context.get("search_offline"):
+        providers = [OfflineSearchProvider("web"), OfflineSearchProvider("academic")]
+    else:
+        providers = DEFAULT_PROVIDERS
+    return [provider for provider in providers if provider.kind == kind]
+
+
+async def run_search(query: str, providers: List[SearchProvider], context: Dict, max_results: int,
+                     options: Optional[Dict[str, Any]] = None) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Query providers concurrently and merge what returns before the deadline.
+
+    Cached result sets are used without a network call (unless
+    context["search_cache_bypass"]). Providers still running at
+    context["search_deadline"] are cancelled; failures are logged and
+    skipped. The merged results are de-duplicated by URL and ranked with
+    _calculate_relevance_score across all providers.
+
+    Returns:
+        (ranked results, report) where report holds per-provider status,
+        result counts and latency plus the overall duration
+    """
+    options = options or {}
+    deadline = context.get("search_deadline", DEFAULT_SEARCH_DEADLINE)
+    bypass_cache = context.get("search_cache_bypass", False)
+    normalized = normalize_query(query)
+
+    search_start = time.time()
+    provider_report: Dict[str, Dict[str, Any]] = {}
+    collected: List[Dict[str, Any]] = []
+    tasks: Dict[asyncio.Task, Tuple[SearchProvider, Tuple]] = {}
+
+    for provider in providers:
+        if not provider.available():
+            provider_report[provider.name] = {"status": "unavailable", "results": 0}
+            continue
+
+        key = (provider.name, normalized, max_results, provider.cache_key(options))
+        cached = None if bypass_cache else search_result_cache.get(key)
+        if cached is not None:
+            provider_report[provider.name] = {"status": "cached", "results": len(cached), "latency": 0.0}
+            collected.extend(cached)
+            continue
+
+        task = asyncio.ensure_future(_timed_search(provider, query, max_results, options))
+        tasks[task] = (provider, key)
+
+    if tasks:
+        done, pending = await asyncio.wait(tasks, timeout=deadline)
+
+        for task in pending:
+            task.cancel()
+            provider, _ = tasks[task]
+            provider_report[provider.name] = {"status": "timeout", "results": 0, "latency": round(deadline, 2)}
+            search_logger.warning(f"⏱️ {provider.name} search missed the {deadline}s deadline - merging without it")
+
+        for task in done:
+            provider, key = tasks[task]
+            try:
+                results, latency = task.result()
+            except Exception as e:
+                provider_report[provider.name] = {"status": "error", "results": 0, "error": str(e)}
+                search_logger.error(f"❌ {provider.name} search failed: {str(e)}")
+                continue
+            search_result_cache.put(key, results)
+            provider_report[provider.name] = {"status": "ok", "results": len(results), "latency": round(latency, 2)}
+            collected.extend(results)
+
+    ranked = _rank_results(collected, query)
+    report = {
+        "providers": provider_report,
+        "duration": round(time.time() - search_start, 2),
+        "deadline": deadline,
+        "cache": search_result_cache.get_status()
+    }
+    return ranked, report
+
+
+async def _timed_search(provider: SearchProvider, query: str, max_results: int,
+                        options: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], float]:
+    start_time = time.time()
+    results = await provider.search(query, max_results, options)
+    return results, time.time() - start_time
+
+
+def _rank_results(results: List[Dict[str, Any]], query: str) -> List[Dict[str, Any]]:
+    """De-duplicate merged results by URL and order them by relevance to the query"""
+
+    seen_urls = set()
+    unique_results = []
+    for result in results:
+        url = result.get("url", "").rstrip("/").lower()
+        if url and url in seen_urls:
+            continue
+        seen_urls.add(url)
+        unique_results.append(result)
+
+    has_terms = bool(query.split())
+    timestamp = datetime.now().isoformat()
+    for result in unique_results:
+        # Papers carry an abstract rather than a snippet
+        scoring_view = {
+            "title": result.get("title", ""),
+            "snippet": result.get("snippet") or result.get("abstract", ""),
+            "url": result.get("url", "")
+        }
+        result["relevance_score"] = _calculate_relevance_score(scoring_view, query) if has_terms else 0.0
+        result["search_query"] = query
+        result["timestamp"] = timestamp
+
+    # Stable sort keeps each provider's own order among equal scores
+    unique_results.sort(key=lambda r: r["relevance_score"], reverse=True)
+    for i, result in enumerate(unique_results):
+        result["rank"] = i + 1
+    return unique_results
+
+
+def get_search_status() -> Dict[str, Any]:
+    """Provider availability and cache counters (for status endpoints)"""
+    return {
+        "providers": {provider.name: provider.available() for provider in DEFAULT_PROVIDERS},
+        "cache": search_result_cache.get_status()
+    }
+
+
+async def search_web_info(input_data: Any, context: Dict) -> List[Dict[str, Any]]:
     """
     Search for web information using DuckDuckGo search engine.
     
@@ -38,20 +420,6 @@ def search_web_info(input_data: Any, context: Dict) -> List[Dict[str, Any]]:
     search_logger.info("🌐 Starting DuckDuckGo web search...")
     
     try:
-        # Import DuckDuckGo search (with fallback if not available)
-        try:
-            from ddgs import DDGS
-            ddgs_available = True
-        except ImportError:
-            try:
-                # Fallback to old package name if new one not available
-                from duckduckgo_search import DDGS
-                ddgs_available = True
-                search_logger.warning("⚠️ Using deprecated duckduckgo_search package. Please upgrade to 'ddgs'")
-            except ImportError:
-                search_logger.warning("⚠️ DuckDuckGo search not available, using mock results")
-                ddgs_available = False
-        
         # Extract search query from input
         if isinstance(input_data, str):
             search_query = input_data
@@ -67,46 +435,22 @@ def search_web_info(input_data: Any, context: Dict) -> List[Dict[str, Any]]:
         search_region = context.get("search_region", "en-us")
         search_safesearch = context.get("search_safesearch", "moderate")
         
-        results = []
-        
-        if ddgs_available:
-            try:
-                # Perform DuckDuckGo search
-                with DDGS() as ddgs:
-                    search_start = time.time()
-                    
-                    ddg_results = ddgs.text(
-                        keywords=optimized_query,
-                        region=search_region,
-                        safesearch=search_safesearch,
-                        max_results=max_results
-                    )
-                    
-                    search_duration = time.time() - search_start
-                    
-                    # Process results
-                    for i, result in enumerate(ddg_results):
-                        processed_result = {
-                            "title": result.get("title", ""),
-                            "url": result.get("href", ""),
-                            "snippet": result.get("body", ""),
-                            "source": "DuckDuckGo",
-                            "rank": i + 1,
-                            "relevance_score": _calculate_relevance_score(result, optimized_query),
-                            "search_query": optimized_query,
-                            "timestamp": datetime.now().isoformat()
-                        }
-                        results.append(processed_result)
-                    
-                    search_logger.info(f"✅ DuckDuckGo search completed: {len(results)} results in {search_duration:.2f}s")
-                    
-            except Exception as e:
-                search_logger.error(f"❌ DuckDuckGo search failed: {str(e)}")
-                # Fall back to mock results
-                results = _generate_mock_search_results(optimized_query, max_results)
+        providers = _get_providers(context, "web")
+        results, report = await run_search(
+            optimized_query, providers, context, max_results,
+            {"region": search_region, "safesearch": search_safesearch}
+        )
+        search_duration = report["duration"]
+        
+        if results:
+            search_logger.info(f"✅ Web search completed: {len(results)} results in {search_duration:.2f}s")
+            search_source = ", ".join(
+                name for name, info in report["providers"].items() if info["status"] in ("ok", "cached")
+            )
         else:
-            # Use mock results if DuckDuckGo not available
+            # No provider available or none returned in time
             results = _generate_mock_search_results(optimized_query, max_results)
+            search_source = "Mock"
         
         # Calculate quality metrics
         quality_metrics = {
@@ -123,29 +467,32 @@ def search_web_info(input_data: Any, context: Dict) -> List[Dict[str, Any]]:
             "original_query": search_query,
             "results_count": len(results),
             "search_results_processed": len(results),  # Add this for workflow metrics
-            "search_source": "DuckDuckGo" if ddgs_available and results and results[0].get("source") != "Mock" else "Mock",
+            "search_source": search_source,
             "search_timestamp": datetime.now().isoformat(),
-            "search_results": results  # Store actual results for other tools to use
+            "search_results": results,  # Store actual results for other tools to use
+            "search_report": report
         }
         
         context.update(search_metadata)
         
         # Provide detailed step output information
+        cached_providers = [name for name, info in report["providers"].items() if info["status"] == "cached"]
         context["step_output_details"] = {
             "summary": f"Found {len(results)} web sources using optimized query '{optimized_query}'",
             "actions": [
                 f"Optimized search query from '{search_query}' to '{optimized_query}'",
-                f"Searched {search_metadata['search_source']} with safety={search_safesearch}",
-                f"Retrieved {len(results)} results" + (f" in {search_duration:.2f}s" if 'search_duration' in locals() else ""),
+                f"Searched {search_source} with safety={search_safesearch}",
+                f"Retrieved {len(results)} results in {search_duration:.2f}s"
+                + (f" (cached: {', '.join(cached_providers)})" if cached_providers else ""),
                 f"Calculated relevance scores (avg: {quality_metrics['avg_relevance']:.2f})"
             ],
             "data_processed": {
                 "input_query_length": len(search_query),
                 "optimized_query_length": len(optimized_query),
                 "total_content_retrieved": sum(len(r.get("snippet", "")) for r in results),
-                "unique_domains": len(set(r.get("url", "").split("/")[2] for r in results if r.get("url")))
+                "unique_domains": len(set(r.get("url", "").split("/")[2] for r in results if r.get("url", "").count("/") >= 2))
             },
-            "metrics": quality_metrics
+            "metrics": {**quality_metrics, "providers": report["providers"]}
         }
         
         # Add to search history
@@ -162,14 +509,14 @@ def search_web_info(input_data: Any, context: Dict) -> List[Dict[str, Any]]:
         search_logger.info(f"📊 Search metrics: {quality_metrics['search_effectiveness']} effectiveness, avg relevance: {quality_metrics['avg_relevance']:.2f}")
         
         return results
-        
+    
     except Exception as e:
         search_logger.error(f"❌ Web search failed: {str(e)}")
         # Return empty results on total failure
         return []
 
 
-def search_arxiv(input_data: Any, context: Dict) -> List[Dict[str, Any]]:
+async def search_arxiv(input_data: Any, context: Dict) -> List[Dict[str, Any]]:
     """
     Search ArXiv for academic papers related to the research query.
     
@@ -186,14 +533,6 @@ def search_arxiv(input_data: Any, context: Dict) -> List[Dict[str, Any]]:
     search_logger.info("📚 Starting ArXiv academic search...")
     
     try:
-        # Import ArXiv library (with fallback if not available)
-        try:
-            import arxiv
-            arxiv_available = True
-        except ImportError:
-            search_logger.warning("⚠️ ArXiv library not available, using mock results")
-            arxiv_available = False
-        
         # Extract and optimize query
         if isinstance(input_data, str):
             search_query = input_data
@@ -204,67 +543,39 @@ def search_arxiv(input_data: Any, context: Dict) -> List[Dict[str, Any]]:
         academic_query = _create_academic_query(search_query, context)
         search_logger.info(f"🔬 Academic query: '{academic_query}'")
         
-        results = []
         max_results = context.get("arxiv_max_results", 5)
         
-        if arxiv_available:
-            try:
-                # Search ArXiv
-                search_start = time.time()
-                
-                arxiv_search = arxiv.Search(
-                    query=academic_query,
-                    max_results=max_results,
-                    sort_by=arxiv.SortCriterion.Relevance
-                )
-                
-                for i, paper in enumerate(arxiv_search.results()):
-                    result = {
-                        "title": paper.title,
-                        "authors": [author.name for author in paper.authors],
-                        "abstract": paper.summary,
-                        "url": paper.entry_id,
-                        "pdf_url": paper.pdf_url,
-                        "published": paper.published.isoformat() if paper.published else "",
-                        "categories": paper.categories,
-                        "source": "ArXiv",
-                        "rank": i + 1,
-                        "relevance_score": _calculate_academic_relevance(paper, academic_query),
-                        "search_query": academic_query,
-                        "timestamp": datetime.now().isoformat()
-                    }
-                    results.append(result)
-                
-                search_duration = time.time() - search_start
-                search_logger.info(f"✅ ArXiv search completed: {len(results)} papers in {search_duration:.2f}s")
-                
-            except Exception as e:
-                search_logger.error(f"❌ ArXiv search failed: {str(e)}")
-                results = _generate_mock_arxiv_results(academic_query, max_results)
+        providers = _get_providers(context, "academic")
+        results, report = await run_search(academic_query, providers, context, max_results)
+        
+        if results:
+            search_logger.info(f"✅ ArXiv search completed: {len(results)} papers in {report['duration']:.2f}s")
         else:
-            # Mock results if ArXiv not available
+            # Mock results if ArXiv not available or returned nothing in time
             results = _generate_mock_arxiv_results(academic_query, max_results)
         
         # Update context
         context.update({
             "arxiv_search_performed": True,
             "arxiv_query": academic_query,
-            "arxiv_results_count": len(results)
+            "arxiv_results_count": len(results),
+            "arxiv_search_report": report
         })
         
         return results
-        
+    
     except Exception as e:
         search_logger.error(f"❌ ArXiv search failed: {str(e)}")
         return []
 
 
-def search_academic(input_data: Any, context: Dict) -> List[Dict[str, Any]]:
+async def search_academic(input_data: Any, context: Dict) -> List[Dict[str, Any]]:
     """
     Comprehensive academic search combining multiple scholarly sources.
     
     This searches multiple academic databases and repositories to provide
-    comprehensive scholarly information.
+    comprehensive scholarly information. ArXiv and the academic-focused web
+    search run concurrently.
     
     Args:
         input_data: Research query
@@ -278,14 +589,14 @@ def search_academic(input_data: Any, context: Dict) -> List[Dict[str, Any]]:
     all_results = []
     
     try:
-        # Search ArXiv for papers
-        arxiv_results = search_arxiv(input_data, context)
-        all_results.extend(arxiv_results)
-        
-        # Search DuckDuckGo with academic focus
+        # Search ArXiv for papers and DuckDuckGo with academic focus side by side
         academic_context = context.copy()
         academic_context["search_academic_focus"] = True
-        web_results = search_web_info(input_data, academic_context)
+        arxiv_results, web_results = await asyncio.gather(
+            search_arxiv(input_data, context),
+            search_web_info(input_data, academic_context)
+        )
+        all_results.extend(arxiv_results)
         
         # Filter web results for academic sources
         academic_web_results = _filter_academic_sources(web_results)
@@ -308,7 +619,7 @@ def search_academic(input_data: Any, context: Dict) -> List[Dict[str, Any]]:
         })
         
         return all_results
-        
+    
     except Exception as e:
         search_logger.error(f"❌ Academic search failed: {str(e)}")
         return []
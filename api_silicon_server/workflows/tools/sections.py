@@ -8,9 +8,10 @@ Handles the structuring, expansion, and finalization of research content:
 - Maintains academic formatting and quality standards
 """
 
+import asyncio
 import logging
 import time
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 import re
 
@@ -19,8 +20,9 @@ sections_logger = logging.getLogger("WorkflowTools.Sections")
 sections_logger.setLevel(logging.INFO)
 
 # Helper function for pipeline logging format
-def log_pipeline_stage(stage_num: int, stage_desc: str, input_data: Any, output_data: Any = None, logger=sections_logger):
-    """Log pipeline stages in the requested format with INPUT/OUTPUT"""
+def log_pipeline_stage(stage_num: int, stage_desc: str, input_data: Any, output_data: Any = None, logger=sections_logger,
+                       metrics: Dict[str, Any] = None):
+    """Log pipeline stages in the requested format with INPUT/OUTPUT (and optional stage metrics)"""
     
     # Format input data for logging
     input_str = str(input_data) if input_data is not None else "None"
@@ -49,6 +51,17 @@ def log_pipeline_stage(stage_num: int, stage_desc: str, input_data: Any, output_
         logger.info(f"     Preview: {output_preview}")
         logger.info(f"     Success: True")
     
+    # Log stage metrics (e.g. per-section latency) if provided
+    if metrics:
+        logger.info(f"📊 PIPELINE {stage_num} ({stage_desc}) -METRICS:")
+        for name, value in metrics.items():
+            if isinstance(value, dict):
+                logger.info(f"     {name}:")
+                for key, item in value.items():
+                    logger.info(f"       {key}: {item}")
+            else:
+                logger.info(f"     {name}: {value}")
+    
     logger.info(f"🔄 PIPELINE {stage_num} ({stage_desc}) - Stage completed at {datetime.now().strftime('%H:%M:%S')}")
 
 
@@ -227,8 +240,13 @@ async def write_sections(input_data: Any, context: Dict) -> str:
             sections_logger.warning("⚠️ Section expansion produced minimal content - applying enhancements")
             expanded_document = _enhance_minimal_content(expanded_document, structure, context)
         
-        context["step_output_details"]["actions"].append("Sections expanded with content")
+        expansion_metrics = context.get("section_expansion_metrics", {})
+        context["step_output_details"]["actions"].append(
+            f"Sections expanded with content ({expansion_metrics.get('jobs', 0)} generations, "
+            f"{expansion_metrics.get('concurrency', 1)} at a time, {expansion_metrics.get('fallbacks', 0)} fallbacks)"
+        )
         context["step_output_details"]["data_processed"]["expanded_length"] = len(expanded_document)
+        context["step_output_details"]["data_processed"]["section_latencies"] = expansion_metrics.get("section_latencies", {})
         
         # Format the final document
         sections_logger.info(f"📐 Formatting document ({len(expanded_document)} chars)")
@@ -632,81 +650,146 @@ def _enhance_structure(structure: Dict, content: str, context: Dict) -> Dict[str
 
 
 async def _expand_sections(structure: Dict, context: Dict) -> str:
-    """Expand each section with detailed content and enhanced logging"""
+    """
+    Expand each section with detailed content and enhanced logging.
+    
+    Every section/subsection that needs generated text becomes one job; jobs
+    run concurrently (context["section_expansion_concurrency"], default 4)
+    and are stitched back together in outline order. A job that exceeds
+    context["section_expansion_timeout"] seconds gets fallback content.
+    """
     
     sections_logger.info(f"📝 Beginning detailed section expansion")
     
-    expanded_content = ""
     research_context = str(context.get("search_results", ""))[:2000]
     expansion_start = time.time()
     
+    # Document pieces in output order: literal text or the index of a generation job
+    pieces: List[Any] = []
+    jobs: List[Dict[str, Any]] = []
+    
     # Add document header
     research_topic = context.get("original_request", "Research Topic")
-    expanded_content += f"# {research_topic}\n\n"
+    pieces.append(f"# {research_topic}\n\n")
     
     if context.get("clarification_applied"):
-        expanded_content += "*Research conducted with cognitive bias awareness and CBT-informed analysis.*\n\n"
+        pieces.append("*Research conducted with cognitive bias awareness and CBT-informed analysis.*\n\n")
     
     total_sections = len(structure.get("sections", []))
     sections_logger.info(f"📚 Expanding {total_sections} sections with research context")
     
-    # Expand each section
+    # Plan the expansion of each section
     for i, section in enumerate(structure.get("sections", [])):
-        section_start = time.time()
-        sections_logger.info(f"📝 Expanding section {i+1}/{total_sections}: {section['title']}")
-        
-        expanded_content += f"\n## {section['title']}\n\n"
+        pieces.append(f"\n## {section['title']}\n\n")
         
         # Expand subsections if they exist
         if section.get("subsections"):
             for j, subsection in enumerate(section["subsections"]):
-                sections_logger.info(f"   📋 Expanding subsection {j+1}: {subsection['title']}")
-                expanded_content += f"\n### {subsection['title']}\n\n"
+                pieces.append(f"\n### {subsection['title']}\n\n")
                 
                 # Generate content for this subsection
                 section_points = subsection.get("points", [])
                 if section_points:
-                    expansion_prompt = _create_section_expansion_prompt(
-                        subsection["title"], section_points, research_context, context
-                    )
-                    expanded_text = await _generate_with_model(expansion_prompt, context)
-                    
-                    if expanded_text and len(expanded_text.strip()) > 20:
-                        expanded_content += expanded_text + "\n\n"
-                    else:
-                        # Fallback content for subsection
-                        fallback_content = _create_subsection_fallback(subsection["title"], section_points, context)
-                        expanded_content += fallback_content + "\n\n"
+                    jobs.append({
+                        "label": f"{i+1}.{j+1} {subsection['title']}",
+                        "prompt": _create_section_expansion_prompt(
+                            subsection["title"], section_points, research_context, context
+                        ),
+                        "fallback": lambda s=subsection, p=section_points: _create_subsection_fallback(s["title"], p, context)
+                    })
+                    pieces.append(len(jobs) - 1)
                 
                 # Add existing content if any
                 if subsection.get("content"):
-                    expanded_content += subsection["content"] + "\n\n"
+                    pieces.append(subsection["content"] + "\n\n")
         
         # Add section-level content if no subsections
         elif section.get("content"):
-            expanded_content += section["content"] + "\n\n"
+            pieces.append(section["content"] + "\n\n")
         
         # Generate content if section is empty
         else:
-            section_prompt = f"Write a comprehensive section about '{section['title']}' in the context of {research_topic}. Provide 2-3 well-developed paragraphs with academic depth."
-            section_content = await _generate_with_model(section_prompt, context)
-            
-            if section_content and len(section_content.strip()) > 20:
-                expanded_content += section_content + "\n\n"
-            else:
-                # Fallback content for empty section
-                fallback_content = _create_section_fallback(section["title"], research_topic)
-                expanded_content += fallback_content + "\n\n"
-        
-        section_time = time.time() - section_start
-        sections_logger.info(f"   ✅ Section {i+1} completed in {section_time:.2f}s")
+            jobs.append({
+                "label": f"{i+1} {section['title']}",
+                "prompt": f"Write a comprehensive section about '{section['title']}' in the context of {research_topic}. Provide 2-3 well-developed paragraphs with academic depth.",
+                "fallback": lambda s=section: _create_section_fallback(s["title"], research_topic)
+            })
+            pieces.append(len(jobs) - 1)
+    
+    concurrency = max(1, int(context.get("section_expansion_concurrency", 4)))
+    timeout = context.get("section_expansion_timeout", 120.0)
+    sections_logger.info(f"⚡ Generating {len(jobs)} section texts (concurrency: {concurrency}, timeout: {timeout}s)")
+    
+    outputs = await _run_expansion_jobs(jobs, context, concurrency, timeout)
+    
+    expanded_content = "".join(
+        piece if isinstance(piece, str) else outputs[piece] + "\n\n" for piece in pieces
+    )
     
     expansion_time = time.time() - expansion_start
+    latencies = {job["label"]: round(job["latency"], 2) for job in jobs}
+    expansion_metrics = {
+        "jobs": len(jobs),
+        "concurrency": concurrency,
+        "fallbacks": sum(1 for job in jobs if job["status"] != "generated"),
+        "timeouts": sum(1 for job in jobs if job["status"] == "timeout"),
+        "total_time": round(expansion_time, 2),
+        "sequential_time": round(sum(job["latency"] for job in jobs), 2),
+        "section_latencies": latencies
+    }
+    context["section_expansion_metrics"] = expansion_metrics
+    
+    log_pipeline_stage(2, "SECTION EXPANSION", structure, expanded_content, sections_logger, metrics=expansion_metrics)
     sections_logger.info(f"✅ All sections expanded in {expansion_time:.2f}s (total: {len(expanded_content)} chars)")
     
     return expanded_content
 
 
+async def _run_expansion_jobs(jobs: List[Dict[str, Any]], context: Dict, concurrency: int,
+                              timeout: Optional[float]) -> List[str]:
+    """Generate every job's text with at most `concurrency` model calls in flight; results keep job order"""
+    
+    semaphore = asyncio.Semaphore(concurrency)
+    progress_sink = context.get("progress_sink")
+    
+    async def expand(job: Dict[str, Any]) -> str:
+        async with semaphore:
+            job_start = time.time()
+            sections_logger.info(f"📝 Expanding section {job['label']}")
+            try:
+                text = await asyncio.wait_for(_generate_with_model(job["prompt"], context), timeout)
+                job["status"] = "generated" if text and len(text.strip()) > 20 else "fallback"
+            except asyncio.TimeoutError:
+                sections_logger.warning(f"⏱️ Section {job['label']} timed out after {timeout}s - using fallback content")
+                text = None
+                job["status"] = "timeout"
+            except Exception as e:
+                sections_logger.error(f"❌ Section {job['label']} expansion failed: {str(e)} - using fallback content")
+                text = None
+                job["status"] = "error"
+            
+            if job["status"] != "generated":
+                text = job["fallback"]()
+            
+            job["latency"] = time.time() - job_start
+            sections_logger.info(f"   ✅ Section {job['label']} completed in {job['latency']:.2f}s ({job['status']})")
+            
+            # Stream the finished section to live progress listeners
+            if progress_sink:
+                try:
+                    progress_sink("section_text", {
+                        "section": job["label"],
+                        "status": job["status"],
+                        "latency": round(job["latency"], 2),
+                        "text": text
+                    })
+                except Exception as e:
+                    sections_logger.warning(f"⚠️ Progress sink failed for section {job['label']}: {str(e)}")
+            return text
+    
+    return await asyncio.gather(*(expand(job) for job in jobs))
+
+
 def _format_research_document(content: str, context: Dict) -> str:
     """Format the document with proper academic structure"""
     
@@ -922,6 +1005,10 @@ def _add_final_formatting(document: str, context: Dict) -> str:
     
     formatted = document
     
+    # Step records are dicts from the workflow engine; the default is a plain label list
+    pipeline_steps = context.get('workflow_steps') or ['CBT Clarification', 'Web Search', 'Content Analysis', 'Structured Writing']
+    pipeline = ' → '.join(step.get('step_label', '') if isinstance(step, dict) else str(step) for step in pipeline_steps)
+    
     # Add document metadata footer
     metadata_footer = f"""
 
@@ -931,7 +1018,7 @@ def _add_final_formatting(document: str, context: Dict) -> str:
 - Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}
 - Word Count: ~{len(formatted.split())} words
 - Research Topic: {context.get('original_request', 'Unknown')}
-- Processing Pipeline: {' → '.join(context.get('workflow_steps', ['CBT Clarification', 'Web Search', 'Content Analysis', 'Structured Writing']))}
+- Processing Pipeline: {pipeline}
 """
     
     # Add cognitive processing notes if applicable
@@ -4,13 +4,21 @@ Summarization Tools - MLX-Powered Content Synthesis
 Uses MLX-accelerated language models to synthesize and summarize information
 gathered during research workflows. Provides intelligent content condensation
 while preserving key insights and maintaining academic rigor.
+
+Search results are packed into the prompt by the context packer: ranked,
+de-duplicated and fitted to context["context_token_budget"]. When they do
+not fit, the sources are map-reduced (each budget-sized batch is condensed
+to notes first) so low-ranked sources are summarized rather than dropped.
 """
 
+import asyncio
 import logging
 import time
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 from datetime import datetime
 
+from .context_packer import pack_results, pack_text, DEFAULT_TOKEN_BUDGET
+
 # Set up logger
 summarize_logger = logging.getLogger("WorkflowTools.Summarize")
 summarize_logger.setLevel(logging.INFO)
@@ -33,15 +41,10 @@ async def summarize_content(input_data: Any, context: Dict) -> str:
     summarize_logger.info("🧠 Starting MLX-powered content summarization...")
     
     try:
-        # Extract content text from various input formats
+        # Fit content from various input formats into the prompt token budget
+        content_text, _ = await _prepare_content(input_data, context)
         if isinstance(input_data, list):
-            # Handle search results
-            content_text = _extract_text_from_results(input_data)
-            summarize_logger.info(f"📄 Extracted text from {len(input_data)} search results")
-        elif isinstance(input_data, str):
-            content_text = input_data
-        else:
-            content_text = str(input_data)
+            summarize_logger.info(f"📄 Packed text from {len(input_data)} search results")
         
         # Check if we have sufficient content
         if len(content_text.strip()) < 50:
@@ -94,13 +97,8 @@ async def synthesize_findings(input_data: Any, context: Dict) -> str:
     summarize_logger.info("🔬 Starting research findings synthesis...")
     
     try:
-        # Process input data
-        if isinstance(input_data, list):
-            content_text = _extract_text_from_results(input_data)
-            source_count = len(input_data)
-        else:
-            content_text = str(input_data)
-            source_count = 1
+        # Process input data (packed into the prompt token budget)
+        content_text, source_count = await _prepare_content(input_data, context)
         
         # Create synthesis prompt with analytical focus
         synthesis_prompt = _create_synthesis_prompt(content_text, context, source_count)
@@ -143,7 +141,8 @@ async def synthesize_findings(input_data: Any, context: Dict) -> str:
                 "output_synthesis_length": len(enhanced_synthesis),
                 "processing_time": time.time() - time.time() if 'start_time' in locals() else 0
             },
-            "metrics": quality_metrics
+            "metrics": quality_metrics,
+            "context_packing": context.get("context_packing", {})
         }
         
         summarize_logger.info(f"✅ Synthesis completed: {source_count} sources → {len(enhanced_synthesis)} chars "
@@ -156,35 +155,79 @@ async def synthesize_findings(input_data: Any, context: Dict) -> str:
         return _create_fallback_synthesis(input_data)
 
 
-def _extract_text_from_results(results: List[Dict]) -> str:
-    """Extract and combine text content from search results"""
+async def _prepare_content(input_data: Any, context: Dict) -> Tuple[str, int]:
+    """
+    Prompt content for summarization/synthesis within the token budget.
+    
+    Search results are ranked, de-duplicated and packed; when they exceed
+    the budget and context["context_packing_mode"] allows it, every source
+    is condensed batch by batch instead of dropping the lowest ranked.
+    "map_reduce" always condenses an overflow; "auto" only does so with a
+    model available and when the dropped share of source tokens exceeds
+    context["context_map_reduce_threshold"], since condensing costs extra
+    generations. Packing stats are kept in context["context_packing"].
+    Returns (content, source count).
+    """
     
-    combined_text = ""
+    if not isinstance(input_data, list):
+        content_text, stats = pack_text(input_data if isinstance(input_data, str) else str(input_data), context)
+        context["context_packing"] = {"mode": "text", **stats}
+        return content_text, 1
+    
+    content_text, stats, overflow = pack_results(input_data, context)
+    mode = context.get("context_packing_mode", "auto")
+    can_generate = callable(context.get("generate_with_fallback")) or hasattr(context.get("model"), "generate")
+    available = stats["tokens_available"]
+    stats["dropped_share"] = round(1 - stats["tokens_packed"] / available, 3) if available else 0.0
+    worth_condensing = stats["dropped_share"] > context.get("context_map_reduce_threshold", 0.5)
+    
+    if overflow and (mode == "map_reduce" or (mode == "auto" and can_generate and worth_condensing)):
+        content_text, map_stats = await _map_reduce_sources(overflow, context)
+        stats.update(map_stats)
+        stats["mode"] = "map_reduce"
+    else:
+        stats["mode"] = "fill"
     
-    for i, result in enumerate(results):
-        # Extract title
-        title = result.get("title", "")
-        if title:
-            combined_text += f"\n\n=== Source {i+1}: {title} ===\n"
-        
-        # Extract main content
-        content_fields = ["snippet", "abstract", "body", "content", "text"]
-        content = ""
-        
-        for field in content_fields:
-            if field in result and result[field]:
-                content = result[field]
-                break
-        
-        if content:
-            combined_text += content + "\n"
-        
-        # Add URL for reference
-        url = result.get("url", "")
-        if url:
-            combined_text += f"Source: {url}\n"
+    context["context_packing"] = stats
+    return content_text, stats["sources_in"] - stats["duplicates_removed"]
+
+
+async def _map_reduce_sources(batches: List[List[str]], context: Dict) -> Tuple[str, Dict[str, Any]]:
+    """Condense each batch of source chunks to notes, then pack the notes into the budget"""
     
-    return combined_text.strip()
+    map_start = time.time()
+    max_batches = context.get("context_map_max_batches", 4)
+    dropped_batches = max(0, len(batches) - max_batches)
+    batches = batches[:max_batches]
+    research_topic = context.get("original_request", "the research topic")
+    semaphore = asyncio.Semaphore(context.get("context_map_concurrency", 2))
+    
+    async def condense(index: int, batch: List[str]) -> str:
+        sources = "\n\n".join(chunk.strip() for chunk in batch)
+        prompt = f"""
+Extract the key findings about {research_topic} from the sources below as concise bullet notes.
+Keep figures, named methods and disagreements between sources, and end each note with its source title.
+
+{sources}
+"""
+        async with semaphore:
+            notes = await _generate_with_mlx_model(prompt, context)
+        if not notes or len(notes.strip()) < 20:
+            # Generation unavailable for this batch - keep the leading sources verbatim
+            notes, _ = pack_text(sources, context, context.get("context_token_budget", DEFAULT_TOKEN_BUDGET) // len(batches))
+        return f"=== Notes from source batch {index + 1} ===\n{notes.strip()}"
+    
+    notes = await asyncio.gather(*(condense(i, batch) for i, batch in enumerate(batches)))
+    content_text, text_stats = pack_text("\n\n".join(notes), context)
+    
+    summarize_logger.info(f"🗂️ Map-reduced {sum(len(b) for b in batches)} sources in {len(batches)} batches "
+                          f"({time.time() - map_start:.2f}s, {dropped_batches} batches over the limit dropped)")
+    return content_text, {
+        "map_batches": len(batches),
+        "map_batches_dropped": dropped_batches,
+        "map_time": round(time.time() - map_start, 2),
+        "tokens_packed": text_stats["tokens_packed"]
+    }
 
 
 def _create_summarization_prompt(content: str, context: Dict) -> str:
@@ -199,7 +242,7 @@ def _create_summarization_prompt(content: str, context: Dict) -> str:
 Please provide a comprehensive summary of the following research content about {research_topic}.
 
 Content to summarize:
-{content[:4000]}
+{content}
 
 Requirements:
 - Create a {target_length} summary that captures the essential information
@@ -224,7 +267,7 @@ def _create_synthesis_prompt(content: str, context: Dict, source_count: int) ->
 Please provide an analytical synthesis of research findings about {research_topic} from {source_count} sources.
 
 Research content to synthesize:
-{content[:4000]}
+{content}
 
 Requirements for synthesis:
 1. CONVERGENT FINDINGS: Identify areas where sources agree
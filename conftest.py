@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Shared fixtures for the root-level tests.
+"""
+
+import pytest
+
+
+@pytest.fixture
+def workflow_cwd(tmp_path, monkeypatch):
+    """
+    Run the test from a temporary directory with a logs/ folder.
+
+    The workflow engine (and the benchmark scripts) open log files under
+    ./logs/ relative to the working directory when first imported, so
+    workflow modules are imported inside tests that use this fixture.
+    """
+    (tmp_path / "logs").mkdir()
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
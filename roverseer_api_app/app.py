@@ -135,6 +135,14 @@ async def initialize_application():
         print("⚠️  Continuing without hardware...")
         hardware_success = False
     
+    try:
+        # Keep the Ollama model catalog warm so chat turns never wait on /api/tags
+        from cognition.model_catalog import get_model_catalog
+        get_model_catalog().start_background_refresh()
+        print("✅ Model catalog background refresh started")
+    except Exception as e:
+        print(f"⚠️  Model catalog refresh failed to start: {e}")
+    
     try:
         # Initialize model management (now personalities are available)
         model_success = initialize_model_list()
@@ -233,6 +241,12 @@ def cleanup_application():
     except Exception as e:
         print(f"⚠️  Discovery cleanup error: {e}")
     
+    try:
+        from cognition.model_catalog import get_model_catalog
+        get_model_catalog().stop_background_refresh()
+    except Exception as e:
+        print(f"⚠️  Model catalog cleanup error: {e}")
+    
     try:
         # Turn off all LEDs and clear display
         from embodiment.rainbow_interface import get_rainbow_driver
@@ -268,6 +282,12 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """FastAPI shutdown event"""
+    try:
+        # Close pooled Ollama connections
+        from cognition.llm_client import close_http_client
+        await close_http_client()
+    except Exception as e:
+        print(f"⚠️  LLM client cleanup error: {e}")
     cleanup_application()
 
 # Register cleanup function for non-FastAPI shutdown
@@ -1,103 +1,204 @@
+import asyncio
 import time
 import random
 
-from config import (LOGICAL_MODEL, CREATIVE_MODEL, LOGICAL_MESSAGE, CREATIVE_MESSAGE, 
-                   CONVERGENCE_MESSAGE, DEFAULT_VOICE)
-from cognition.llm_interface import run_chat_completion
+from config import (LOGICAL_MODEL, CREATIVE_MODEL, LOGICAL_MESSAGE, CREATIVE_MESSAGE,
+                   CONVERGENCE_MESSAGE, DEFAULT_VOICE, BICAMERAL_HEMISPHERE_TIMEOUT,
+                   LOGICAL_OLLAMA_URL, CREATIVE_OLLAMA_URL)
+from cognition.llm_interface import run_chat_completion_async
+from cognition.llm_client import ollama_chat, ollama_chat_stream, run_blocking
 from memory.usage_logger import log_penphin_mind_usage
 from expression.sound_orchestration import play_sound_async, play_bicameral_connection_tune
 
 
-# Global state for convergence model selection
+# Most recent convergence model selection (reported by get_convergence_model;
+# each request uses the model returned by _consult_hemispheres)
 convergence_model = None
 
 
-def bicameral_chat_direct(prompt, system="", voice=DEFAULT_VOICE):
+# -------- HEMISPHERES -------- #
+
+async def _consult_hemisphere(model, system_message, prompt, base_url, timeout):
+    """One hemisphere's perspective: (response or None, seconds, error or None)"""
+    start_time = time.time()
+    messages = [
+        {"role": "system", "content": system_message},
+        {"role": "user", "content": prompt}
+    ]
+    try:
+        response = await asyncio.wait_for(ollama_chat(model, messages, base_url=base_url), timeout)
+        return response, time.time() - start_time, None
+    except asyncio.TimeoutError:
+        print(f"⏱️ {model} hemisphere timed out after {timeout}s")
+        return None, time.time() - start_time, f"timed out after {timeout}s"
+    except Exception as e:
+        print(f"⚠️ {model} hemisphere failed: {e}")
+        return None, time.time() - start_time, str(e)
+
+
+async def _consult_hemispheres(prompt, hemisphere_timeout=None):
     """
-    Direct bicameral processing without HTTP overhead.
-    Returns the final synthesis text.
+    Run both hemispheres at the same time.
+    Returns (first, second, convergence model, convergence server URL) - the
+    second hemisphere is the convergence model's own perspective, and
+    convergence runs on the same Ollama server that hemisphere used. Concurrent requests each keep their own
+    convergence model; the global only records the latest choice.
     """
     global convergence_model
-    
+    timeout = hemisphere_timeout or BICAMERAL_HEMISPHERE_TIMEOUT
+
+    # Randomly decide which model will handle convergence
+    converger = random.choice([LOGICAL_MODEL, CREATIVE_MODEL])
+    convergence_model = converger
+    first_model = LOGICAL_MODEL if converger == CREATIVE_MODEL else CREATIVE_MODEL
+
+    # Same model for both sides keeps the logical/creative split by system message
+    first_is_logical = converger == CREATIVE_MODEL if LOGICAL_MODEL != CREATIVE_MODEL else random.random() < 0.5
+    hemispheres = [
+        {"model": first_model, "logical": first_is_logical},
+        {"model": converger, "logical": not first_is_logical}
+    ]
+    for hemisphere in hemispheres:
+        hemisphere["base_url"] = LOGICAL_OLLAMA_URL if hemisphere["logical"] else CREATIVE_OLLAMA_URL
+
+    results = await asyncio.gather(*(
+        _consult_hemisphere(
+            hemisphere["model"],
+            LOGICAL_MESSAGE if hemisphere["logical"] else CREATIVE_MESSAGE,
+            prompt,
+            hemisphere["base_url"],
+            timeout
+        )
+        for hemisphere in hemispheres
+    ))
+    for hemisphere, (response, elapsed, error) in zip(hemispheres, results):
+        hemisphere.update(response=response, time=elapsed, error=error)
+
+    first, second = hemispheres
+    if first["response"] is None and second["response"] is None:
+        raise Exception(f"Both hemispheres failed: {first['error']}; {second['error']}")
+    return first, second, converger, second["base_url"]
+
+
+def _build_convergence_messages(prompt, system, first, second):
+    """Convergence prompt over whichever perspectives arrived"""
+    perspectives = ""
+    if first["response"] is not None:
+        perspectives += f"""
+
+        First Mind Perspective:
+        {first['response']}"""
+    if second["response"] is not None:
+        perspectives += f"""
+
+        Second Mind Perspective:
+        {second['response']}"""
+
+    # Build convergence prompt base
+    convergence_prompt_base = f"""
+        [Prompt:
+        {prompt}{perspectives}]"""
+
+    # If system message provided, prepend it
+    if system:
+        convergence_prompt = system + ". " + convergence_prompt_base
+    else:
+        convergence_prompt = convergence_prompt_base
+
+    return [{"role": "user", "content": convergence_prompt}]
+
+
+def _log_bicameral_usage(prompt, first, second, converger, final_response, convergence_time, voice):
+    bicameral_system_message = f"Bicameral processing for: {prompt[:50]}..."
+    log_penphin_mind_usage(
+        first["model"], second["model"], converger,
+        bicameral_system_message, prompt,
+        first["response"] if first["response"] is not None else f"[no response: {first['error']}]", first["time"],
+        second["response"] if second["response"] is not None else f"[no response: {second['error']}]", second["time"],
+        final_response, convergence_time,
+        voice_id=voice
+    )
+
+
+def _bicameral_error(e):
+    error_msg = str(e)
+    if "Connection refused" in error_msg:
+        return Exception("Failed to connect to Ollama service. Please ensure Ollama is running.")
+    elif "model not found" in error_msg.lower():
+        return Exception(f"Model not found: {error_msg}")
+    else:
+        return Exception(f"Bicameral processing failed: {error_msg}")
+
+
+# -------- BICAMERAL PROCESSING -------- #
+
+async def bicameral_chat_async(prompt, system="", voice=DEFAULT_VOICE, hemisphere_timeout=None):
+    """
+    Bicameral processing with both hemispheres running concurrently.
+    If one hemisphere fails or times out, convergence works from the other.
+    Returns the final synthesis text.
+    """
     if not prompt.strip():
         raise ValueError("No prompt provided")
 
     try:
         # Play the unique bicameral connection tune
         play_sound_async(play_bicameral_connection_tune)
-        
-        # Randomly decide which model will handle convergence
-        convergence_model = random.choice([LOGICAL_MODEL, CREATIVE_MODEL])
-        first_model = LOGICAL_MODEL if convergence_model == CREATIVE_MODEL else CREATIVE_MODEL
-        
-        # 1. Send to First Mind
-        first_start_time = time.time()
-        first_messages = [{"role": "user", "content": prompt}]
-        first_system = LOGICAL_MESSAGE if first_model == LOGICAL_MODEL else CREATIVE_MESSAGE
-        
-        first_response = run_chat_completion(first_model, first_messages, first_system, skip_logging=True)
-        first_time = time.time() - first_start_time
-        
-        # Keep LLM LED state, don't stop
-        time.sleep(0.5)  # Brief pause between minds
-        
-        # 2. Send to Second Mind (which will also handle convergence)
-        second_start_time = time.time()
-        second_messages = [{"role": "user", "content": prompt}]
-        second_system = LOGICAL_MESSAGE if convergence_model == LOGICAL_MODEL else CREATIVE_MESSAGE
-        
-        second_response = run_chat_completion(convergence_model, second_messages, second_system, skip_logging=True)
-        second_time = time.time() - second_start_time
-        
-        # Keep LLM LED state, don't stop
-        time.sleep(0.5)  # Brief pause before convergence
-        
-        # 3. Send all to Convergence Mind (using the same model as second mind)
-        convergence_start_time = time.time()
-        
-        # Build convergence prompt base
-        convergence_prompt_base = f"""
-        [Prompt:
-        {prompt}
 
-        First Mind Perspective:
-        {first_response}
+        # 1. Both minds at once
+        first, second, converger, converger_url = await _consult_hemispheres(prompt, hemisphere_timeout)
 
-        Second Mind Perspective:
-        {second_response}]"""
-        
-        # If system message provided, prepend it
-        if system:
-            convergence_prompt = system + ". " + convergence_prompt_base
-        else:
-            convergence_prompt = convergence_prompt_base
-        
-        convergence_messages = [{"role": "user", "content": convergence_prompt}]
-
-        final_response = run_chat_completion(convergence_model, convergence_messages, CONVERGENCE_MESSAGE, skip_logging=True)
+        # 2. Converge (using the same model as second mind)
+        convergence_start_time = time.time()
+        convergence_messages = _build_convergence_messages(prompt, system, first, second)
+        final_response = await run_chat_completion_async(converger, convergence_messages, CONVERGENCE_MESSAGE, skip_logging=True,
+                                                   base_url=converger_url)
         convergence_time = time.time() - convergence_start_time
-        
+
         # Log PenphinMind usage
-        bicameral_system_message = f"Bicameral processing for: {prompt[:50]}..."
-        log_penphin_mind_usage(
-            first_model, convergence_model, convergence_model,
-            bicameral_system_message, prompt,
-            first_response, first_time,
-            second_response, second_time,
-            final_response, convergence_time,
-            voice_id=voice
-        )
-        
+        _log_bicameral_usage(prompt, first, second, converger, final_response, convergence_time, voice)
+
         return final_response
-        
+
+    except asyncio.CancelledError:
+        raise
     except Exception as e:
-        error_msg = str(e)
-        if "Connection refused" in error_msg:
-            raise Exception("Failed to connect to Ollama service. Please ensure Ollama is running.")
-        elif "model not found" in error_msg.lower():
-            raise Exception(f"Model not found: {error_msg}")
-        else:
-            raise Exception(f"Bicameral processing failed: {error_msg}")
+        raise _bicameral_error(e)
+
+
+async def bicameral_chat_stream_async(prompt, system="", voice=DEFAULT_VOICE, hemisphere_timeout=None):
+    """Like bicameral_chat_async, but yields the convergence response as it is generated"""
+    if not prompt.strip():
+        raise ValueError("No prompt provided")
+
+    play_sound_async(play_bicameral_connection_tune)
+    try:
+        first, second, converger, converger_url = await _consult_hemispheres(prompt, hemisphere_timeout)
+    except Exception as e:
+        raise _bicameral_error(e)
+
+    convergence_start_time = time.time()
+    messages = [{"role": "system", "content": CONVERGENCE_MESSAGE}] + _build_convergence_messages(prompt, system, first, second)
+    final_response = ""
+    chunks = ollama_chat_stream(converger, messages, base_url=converger_url)
+    try:
+        async for chunk in chunks:
+            final_response += chunk
+            yield chunk
+    except Exception as e:
+        raise _bicameral_error(e)
+    finally:
+        await chunks.aclose()
+
+    _log_bicameral_usage(prompt, first, second, converger, final_response, time.time() - convergence_start_time, voice)
+
+
+def bicameral_chat_direct(prompt, system="", voice=DEFAULT_VOICE):
+    """
+    Direct bicameral processing without HTTP overhead (blocking wrapper).
+    Returns the final synthesis text.
+    """
+    return run_blocking(bicameral_chat_async(prompt, system, voice))
 
 
 def get_convergence_model():
@@ -108,4 +209,4 @@ def get_convergence_model():
 def reset_convergence_model():
     """Reset convergence model selection"""
     global convergence_model
-    convergence_model = None 
\ No newline at end of file
+    convergence_model = None
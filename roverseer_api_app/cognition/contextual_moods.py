@@ -16,6 +16,7 @@ import datetime
 import platform
 from typing import Dict, List, Optional, Any
 from config import DebugLog
+from cognition.mood_tag_engine import detect_context_triggers, extract_tags
 
 
 def has_probability_chance(x: int) -> bool:
@@ -220,101 +221,11 @@ class ContextualMoods:
         Returns:
             List of trigger strings
         """
-        triggers = []
-        
         try:
-            # Weather triggers (environmental)
-            weather = context.get('weather', '').lower()
-            if 'sunny' in weather or 'clear' in weather:
-                triggers.append('sunny')
-            if 'hot' in weather or 'warm' in weather:
-                triggers.append('hot')
-            if 'cold' in weather or 'cool' in weather or 'chilly' in weather:
-                triggers.append('cold')
-            if 'rain' in weather:
-                triggers.append('rainy')
-            if 'snow' in weather:
-                triggers.append('snow')
-            
-            # Time triggers (environmental)
-            time_of_day = context.get('time_of_day', '').lower()
-            if time_of_day in ['morning', 'evening', 'night', 'afternoon']:
-                triggers.append(time_of_day)
-            
-            # Activity triggers (environmental)
-            current_task = context.get('current_task', '').lower()
-            if 'cod' in current_task or 'program' in current_task:
-                triggers.append('coding')
-            if 'music' in current_task:
-                triggers.append('music')
-            
-            # Interaction triggers (environmental)
-            interaction_type = context.get('interaction_type', '').lower()
-            if 'compliment' in interaction_type:
-                triggers.append('compliment')
-            if 'error' in interaction_type:
-                triggers.append('error')
-            
-            # USER INPUT ANALYSIS - NEW FEATURE!
-            # Analyze what the user actually said for trigger words
-            user_message = context.get('user_message', '').lower()
-            if user_message:
-                # Emotional state triggers
-                if any(word in user_message for word in ['sad', 'depressed', 'down', 'upset', 'crying']):
-                    triggers.append('user_sad')
-                if any(word in user_message for word in ['happy', 'excited', 'great', 'awesome', 'wonderful', 'amazing']):
-                    triggers.append('user_happy')
-                if any(word in user_message for word in ['angry', 'mad', 'frustrated', 'annoyed', 'pissed']):
-                    triggers.append('user_angry')
-                if any(word in user_message for word in ['scared', 'afraid', 'worried', 'nervous', 'anxious']):
-                    triggers.append('user_afraid')
-                
-                # Activity triggers from user input
-                if any(word in user_message for word in ['code', 'coding', 'programming', 'debug', 'function', 'algorithm']):
-                    triggers.append('coding')
-                if any(word in user_message for word in ['music', 'song', 'singing', 'melody', 'rhythm', 'beat']):
-                    triggers.append('music')
-                
-                # Compliments and criticism from user
-                if any(word in user_message for word in ['thank you', 'thanks', 'good job', 'well done', 'excellent', 'perfect']):
-                    triggers.append('compliment')
-                if any(word in user_message for word in ['wrong', 'bad', 'terrible', 'awful', 'stupid', 'useless']):
-                    triggers.append('criticism')
-                
-                # Problem/error triggers from user
-                if any(word in user_message for word in ['error', 'bug', 'problem', 'issue', 'broken', 'not working']):
-                    triggers.append('error')
-                if any(word in user_message for word in ['help', 'stuck', "don't understand", 'confused', 'lost']):
-                    triggers.append('help_needed')
-                
-                # Creative/learning triggers
-                if any(word in user_message for word in ['create', 'make', 'build', 'design', 'art', 'creative']):
-                    triggers.append('creative')
-                if any(word in user_message for word in ['learn', 'teach', 'explain', 'understand', 'how does']):
-                    triggers.append('learning')
-                
-                # Weather mentioned by user
-                if any(word in user_message for word in ['sunny', 'sun', 'bright', 'clear']):
-                    triggers.append('sunny')
-                if any(word in user_message for word in ['hot', 'warm', 'heat', 'sweat']):
-                    triggers.append('hot')
-                if any(word in user_message for word in ['cold', 'freezing', 'chilly', 'freeze']):
-                    triggers.append('cold')
-                if any(word in user_message for word in ['rain', 'raining', 'wet', 'storm']):
-                    triggers.append('rainy')
-                if any(word in user_message for word in ['snow', 'snowing', 'blizzard', 'winter']):
-                    triggers.append('snow')
-                
-                # Philosophy/deep topics
-                if any(word in user_message for word in ['consciousness', 'meaning', 'purpose', 'existence', 'philosophy']):
-                    triggers.append('philosophical')
-                if any(word in user_message for word in ['dream', 'dreams', 'imagination', 'fantasy']):
-                    triggers.append('dreamy')
-            
+            return detect_context_triggers(context)
         except Exception as e:
             print(f"⚠️  Error detecting context triggers: {e}")
-        
-        return triggers
+            return []
     
     def _weighted_choice(self, influences: List[Dict]) -> Optional[Dict]:
         """
@@ -823,41 +734,15 @@ def extract_tags_from_response(response: str) -> Dict[str, str]:
     Returns:
         Dict with extracted tag contents (personality, mood, clean_response)
     """
-    import re
-    
-    extracted = {
-        "personality": None,
-        "mood": None,
-        "clean_response": response
-    }
-    
     try:
-        # Extract personality tag
-        personality_match = re.search(r'<personality>(.*?)</personality>', response)
-        if personality_match:
-            extracted["personality"] = personality_match.group(1)
-            # Remove from clean response
-            extracted["clean_response"] = re.sub(r'<personality>.*?</personality>', '', extracted["clean_response"])
-        
-        # Extract mood tag
-        mood_match = re.search(r'<mood>(.*?)</mood>', response)
-        if mood_match:
-            extracted["mood"] = mood_match.group(1)
-            try:
-                # Try to parse mood JSON
-                extracted["mood"] = json.loads(extracted["mood"])
-            except:
-                pass  # Keep as string if not valid JSON
-            # Remove from clean response
-            extracted["clean_response"] = re.sub(r'<mood>.*?</mood>', '', extracted["clean_response"])
-        
-        # Clean up any extra whitespace
-        extracted["clean_response"] = extracted["clean_response"].strip()
-        
+        return extract_tags(response)
     except Exception as e:
         print(f"⚠️  Error extracting tags from response: {e}")
-    
-    return extracted
+        return {
+            "personality": None,
+            "mood": None,
+            "clean_response": response
+        }
 
 
 def enhance_system_message(base_message: str, context: Optional[Dict] = None, personality: Optional[any] = None) -> str:
@@ -0,0 +1,178 @@
+import asyncio
+import json
+import threading
+import weakref
+
+import httpx
+
+from config import LLM_REQUEST_TIMEOUT, LLM_STREAMING_TIMEOUT, get_config_value
+
+
+# -------- ASYNC OLLAMA CLIENT -------- #
+# Non-blocking chat requests for the FastAPI routes. Each event loop gets one
+# pooled httpx.AsyncClient (keep-alive connections to Ollama are reused across
+# requests); sync callers such as the Rainbow HAT button handlers go through
+# run_blocking(), which runs the coroutine on a dedicated client loop thread.
+
+LLM_CONNECT_TIMEOUT = get_config_value("llm_connect_timeout", 10)
+LLM_MAX_CONNECTIONS = get_config_value("llm_max_connections", 8)
+
+_clients = weakref.WeakKeyDictionary()  # event loop -> httpx.AsyncClient
+_clients_lock = threading.Lock()
+
+_blocking_loop = None
+_blocking_loop_lock = threading.Lock()
+
+
+class ClientDisconnected(Exception):
+    """The HTTP client went away before the LLM finished"""
+
+
+def get_http_client():
+    """Pooled AsyncClient for the running event loop"""
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        client = _clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                timeout=httpx.Timeout(LLM_REQUEST_TIMEOUT, connect=LLM_CONNECT_TIMEOUT),
+                limits=httpx.Limits(max_connections=LLM_MAX_CONNECTIONS,
+                                    max_keepalive_connections=LLM_MAX_CONNECTIONS)
+            )
+            _clients[loop] = client
+    return client
+
+
+async def close_http_client():
+    """Close the running loop's client (application shutdown)"""
+    with _clients_lock:
+        client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+async def _ollama_url():
+    # Probing the remote server is a blocking request - keep it off the event loop
+    import config
+    ollama_url, is_remote = await asyncio.to_thread(config.get_ollama_base_url)
+    return ollama_url
+
+
+def _chat_request(model, messages, stream, temperature=None):
+    request_data = {
+        "model": model,
+        "messages": messages,
+        "stream": stream
+    }
+
+    # Add temperature if specified
+    if temperature is not None:
+        request_data["options"] = {"temperature": temperature}
+    return request_data
+
+
+# -------- REQUESTS -------- #
+
+async def ollama_chat(model, messages, temperature=None, timeout=None, base_url=None):
+    """Single chat completion; returns the assistant message content"""
+    client = get_http_client()
+    response = await client.post(
+        f"{base_url or await _ollama_url()}/api/chat",
+        json=_chat_request(model, messages, False, temperature),
+        timeout=httpx.Timeout(timeout or LLM_REQUEST_TIMEOUT, connect=LLM_CONNECT_TIMEOUT)
+    )
+    response.raise_for_status()
+
+    # Debug: Check what we actually got from Ollama
+    if not response.text.strip():
+        raise Exception(f"Ollama returned empty response for model {model}")
+
+    try:
+        response_data = response.json()
+    except json.JSONDecodeError:
+        raise Exception(f"Invalid JSON response from Ollama for model {model}. Response: {response.text[:200]}...")
+
+    # Check if response has expected structure
+    if "message" not in response_data:
+        raise Exception(f"Unexpected response structure from Ollama for model {model}. Got: {response_data}")
+
+    if "content" not in response_data["message"]:
+        raise Exception(f"Missing content in Ollama response for model {model}. Message: {response_data['message']}")
+
+    return response_data["message"]["content"]
+
+
+async def ollama_chat_stream(model, messages, temperature=None, timeout=None, base_url=None):
+    """Streaming chat completion; yields content chunks as Ollama produces them"""
+    client = get_http_client()
+    async with client.stream(
+        "POST",
+        f"{base_url or await _ollama_url()}/api/chat",
+        json=_chat_request(model, messages, True, temperature),
+        timeout=httpx.Timeout(timeout or LLM_STREAMING_TIMEOUT, connect=LLM_CONNECT_TIMEOUT)
+    ) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if not line:
+                continue
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError as e:
+                print(f"Error processing streaming chunk: {e}")
+                continue
+
+            # Debug log the streaming chunk
+            if get_config_value("debug_logging", False):
+                print(f"Streaming chunk: {data}")
+
+            chunk = data.get("message", {}).get("content")
+            if chunk:
+                yield chunk
+            if data.get("done"):
+                break
+
+
+# -------- CALLER HELPERS -------- #
+
+async def cancel_on_disconnect(request, awaitable, poll_interval=0.5):
+    """
+    Await an LLM call, cancelling it if the HTTP client disconnects first.
+    Cancelling closes the Ollama connection, which stops generation there too.
+    """
+    task = asyncio.ensure_future(awaitable)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=poll_interval)
+            if done:
+                return task.result()
+            if await request.is_disconnected():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+                print("🔌 Client disconnected - cancelled LLM request")
+                raise ClientDisconnected("Client disconnected before the response was ready")
+    finally:
+        if not task.done():
+            task.cancel()
+
+
+def run_blocking(coroutine, timeout=None):
+    """Run an LLM coroutine to completion from synchronous code (any thread)"""
+    future = asyncio.run_coroutine_threadsafe(coroutine, _get_blocking_loop())
+    try:
+        return future.result(timeout)
+    except BaseException:
+        future.cancel()
+        raise
+
+
+def _get_blocking_loop():
+    global _blocking_loop
+    with _blocking_loop_lock:
+        if _blocking_loop is None:
+            _blocking_loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=_blocking_loop.run_forever, name="llm-client-loop", daemon=True)
+            thread.start()
+    return _blocking_loop
@@ -1,22 +1,35 @@
 import requests
-import json
+import asyncio
 import time
 import threading
 import re
 
+import httpx
+
 from config import DEFAULT_MODEL, get_config_value, set_config_value
 from memory.usage_logger import log_llm_usage, update_model_runtime
-from expression.sound_orchestration import play_sound_async, play_ollama_tune, play_ollama_complete_tune, tune_playing
+from expression.sound_orchestration import play_sound_async, play_ollama_tune, play_ollama_complete_tune, play_tts_tune, tune_playing
 from embodiment.display_manager import scroll_text_on_display, display_timer, blink_number, clear_display
 from embodiment.rainbow_interface import get_rainbow_driver
-from expression.text_to_speech import generate_tts_audio, speak_text
+from expression.text_to_speech import generate_tts_audio
+from expression.speech_pipeline import SpeechPipeline
+from cognition.llm_client import ollama_chat, ollama_chat_stream, run_blocking
 
 # LLM Request timeout configuration
 LLM_REQUEST_TIMEOUT = get_config_value("llm_request_timeout", 120)  # 2 minutes default
 LLM_STREAMING_TIMEOUT = get_config_value("llm_streaming_timeout", 300)  # 5 minutes for streaming
 
-def run_chat_completion(model, messages, system_message=None, skip_logging=False, voice_id=None, temperature=None):
-    """Run a chat completion request against Ollama with display and sound feedback"""
+def run_chat_completion(model, messages, system_message=None, skip_logging=False, voice_id=None, temperature=None, base_url=None):
+    """Run a chat completion request against Ollama with display and sound feedback (blocking wrapper)"""
+    return run_blocking(run_chat_completion_async(model, messages, system_message, skip_logging, voice_id, temperature, base_url))
+
+
+async def run_chat_completion_async(model, messages, system_message=None, skip_logging=False, voice_id=None, temperature=None,
+                                    base_url=None):
+    """
+    Run a chat completion request against Ollama with display and sound feedback, without blocking the event loop.
+    base_url targets a specific Ollama server (e.g. a bicameral hemisphere's); None uses the configured one.
+    """
     
     # Check if streaming TTS is enabled
     streaming_tts_enabled = get_config_value("streaming_tts_enabled", False)
@@ -124,48 +137,12 @@ def run_chat_completion(model, messages, system_message=None, skip_logging=False
         
         # If streaming TTS is enabled and voice_id is provided, use streaming mode
         if streaming_tts_enabled and voice_id:
-            return _run_streaming_chat_completion(model, messages, stop_timer, start_time, voice_id, 
-                                                  skip_logging, system_message, user_prompt, current_personality, temperature)
+            return await _run_streaming_chat_completion(model, messages, stop_timer, start_time, voice_id, 
+                                                  skip_logging, system_message, user_prompt, current_personality, temperature,
+                                                  base_url)
         else:
-            # Get the appropriate Ollama server URL
-            ollama_url, is_remote = config.get_ollama_base_url()
-            
-            # Use regular non-streaming mode
-            request_data = {
-                "model": model, 
-                "messages": messages,
-                "stream": False
-            }
-            
-            # Add temperature if specified
-            if temperature is not None:
-                request_data["options"] = {"temperature": temperature}
-            
-            response = requests.post(
-                f"{ollama_url}/api/chat",
-                headers={"Content-Type": "application/json"},
-                json=request_data,
-                timeout=LLM_REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            
-            # Debug: Check what we actually got from Ollama
-            if not response.text.strip():
-                raise Exception(f"Ollama returned empty response for model {model}")
-            
-            try:
-                response_data = response.json()
-            except json.JSONDecodeError as e:
-                raise Exception(f"Invalid JSON response from Ollama for model {model}. Response: {response.text[:200]}...")
-            
-            # Check if response has expected structure
-            if "message" not in response_data:
-                raise Exception(f"Unexpected response structure from Ollama for model {model}. Got: {response_data}")
-            
-            if "content" not in response_data["message"]:
-                raise Exception(f"Missing content in Ollama response for model {model}. Message: {response_data['message']}")
-                
-            result = response_data["message"]["content"]
+            # Use regular non-streaming mode over the pooled async client
+            result = await ollama_chat(model, messages, temperature=temperature, timeout=LLM_REQUEST_TIMEOUT, base_url=base_url)
             
             # Stop timer and calculate elapsed time
             stop_timer.set()
@@ -215,7 +192,15 @@ def run_chat_completion(model, messages, system_message=None, skip_logging=False
             # Return the original result (without tags) for normal operation
             return result
             
-    except requests.exceptions.Timeout as e:
+    except asyncio.CancelledError:
+        # Caller went away (client disconnected) - the Ollama request is closed with the task
+        stop_timer.set()
+        clear_display()
+        import config
+        config.active_model = None
+        print(f"🛑 LLM request for model {model} cancelled")
+        raise
+    except httpx.TimeoutException as e:
         stop_timer.set()
         clear_display()
         # Clear active model on error
@@ -223,7 +208,7 @@ def run_chat_completion(model, messages, system_message=None, skip_logging=False
         config.active_model = None
         print(f"[ERROR] LLM request timed out after {LLM_REQUEST_TIMEOUT} seconds for model {model}")
         raise Exception(f"LLM request timed out. The model '{model}' took longer than {LLM_REQUEST_TIMEOUT} seconds to respond. Try using a smaller/faster model or increase the timeout in settings.")
-    except requests.exceptions.ConnectionError as e:
+    except httpx.ConnectError as e:
         stop_timer.set()
         clear_display()
         # Clear active model on error
@@ -241,162 +226,81 @@ def run_chat_completion(model, messages, system_message=None, skip_logging=False
         raise e
 
 
-def _run_streaming_chat_completion(model, messages, stop_timer, start_time, voice_id, 
-                                 skip_logging, system_message, user_prompt, current_personality, temperature=None):
+async def _run_streaming_chat_completion(model, messages, stop_timer, start_time, voice_id, 
+                                 skip_logging, system_message, user_prompt, current_personality, temperature=None,
+                                 base_url=None):
     """Streaming version of chat completion with sentence-by-sentence TTS"""
     
-    # Prepare TTS thread control
-    tts_queue = []
-    tts_queue_lock = threading.Lock()
-    tts_thread_active = threading.Event()
-    tts_thread_active.set()
-    stop_tts = threading.Event()
-    
-    # Snippet counter - psychology term: "episodic_fragments_expressed"
-    episodic_fragments_expressed = 0
-    fragment_lock = threading.Lock()
-    
-    # Start TTS processing thread
-    def tts_processor():
-        nonlocal episodic_fragments_expressed
-        while tts_thread_active.is_set() and not stop_tts.is_set():
-            current_sentence = None
-            with tts_queue_lock:
-                if tts_queue:
-                    current_sentence = tts_queue.pop(0)
-            
-            if current_sentence:
-                try:
-                    # Increment fragment counter
-                    with fragment_lock:
-                        episodic_fragments_expressed += 1
-                        current_fragment = episodic_fragments_expressed
-                    
-                    # Play streaming snippet tone before speaking (except for the first one)
-                    if current_fragment > 1:
-                        from expression.sound_orchestration import play_streaming_snippet_tone
-                        play_streaming_snippet_tone()
-                        time.sleep(0.1)  # Brief pause after tone
-                    
-                    # Display snippet count using blink pattern
-                    from embodiment.display_manager import blink_number
-                    
-                    # Blink the fragment number briefly and asynchronously
-                    def blink_fragment_count():
-                        blink_number(current_fragment, duration=1, blink_speed=0.2)
-                    
-                    # Run blink in background thread
-                    import threading
-                    blink_thread = threading.Thread(target=blink_fragment_count)
-                    blink_thread.daemon = True
-                    blink_thread.start()
-                    
-                    # Speak the sentence
-                    speak_text(current_sentence, voice_id)
-                    
-                    print(f"📢 Episodic fragment {current_fragment} expressed: {current_sentence[:50]}{'...' if len(current_sentence) > 50 else ''}")
-                    
-                except Exception as e:
-                    print(f"Error in TTS processing: {e}")
-            
-            # Small sleep to prevent CPU hogging
-            time.sleep(0.1)
-    
-    tts_thread = threading.Thread(target=tts_processor)
-    tts_thread.daemon = True
-    tts_thread.start()
+    # Synthesis renders up to `lookahead` sentences ahead while the current one plays
+    lookahead = get_config_value("streaming_tts_lookahead", 2)
     
-    try:
-        # Get the appropriate Ollama server URL
-        import config
-        ollama_url, is_remote = config.get_ollama_base_url()
+    # Tone, blink and TTS tune per episodic fragment (sentence) as it is expressed
+    def express_fragment(current_fragment, sentence):
+        # Play streaming snippet tone before speaking (except for the first one)
+        if current_fragment > 1:
+            from expression.sound_orchestration import play_streaming_snippet_tone
+            play_streaming_snippet_tone()
+            time.sleep(0.1)  # Brief pause after tone
         
-        # Start streaming request
-        request_data = {
-            "model": model, 
-            "messages": messages,
-            "stream": True
-        }
+        # Blink the fragment number briefly and asynchronously
+        def blink_fragment_count():
+            blink_number(current_fragment, duration=1, blink_speed=0.2)
         
-        # Add temperature if specified
-        if temperature is not None:
-            request_data["options"] = {"temperature": temperature}
-            
-        response = requests.post(
-            f"{ollama_url}/api/chat",
-            headers={"Content-Type": "application/json"},
-            json=request_data,
-            stream=True,
-            timeout=LLM_STREAMING_TIMEOUT
-        )
-        response.raise_for_status()
+        blink_thread = threading.Thread(target=blink_fragment_count)
+        blink_thread.daemon = True
+        blink_thread.start()
         
+        # Tune to indicate speech start (rendering stays silent while the previous sentence plays)
+        play_sound_async(play_tts_tune)
+    
+    speech_pipeline = SpeechPipeline(voice_id, lookahead=lookahead, on_fragment=express_fragment).start()
+    
+    try:
         # Process streaming response
         full_response = ""
         current_sentence_buffer = ""
         sentence_pattern = re.compile(r'([.!?])\s+')
         
-        for line in response.iter_lines():
-            if line:
-                try:
-                    data = json.loads(line.decode('utf-8'))
+        async for chunk in ollama_chat_stream(model, messages, temperature=temperature, timeout=LLM_STREAMING_TIMEOUT,
+                                              base_url=base_url):
+            try:
+                # Only add to full_response once
+                full_response += chunk
+                current_sentence_buffer += chunk
+                
+                # Check if we have a complete sentence
+                if sentence_pattern.search(current_sentence_buffer):
+                    # Split into sentences
+                    sentences = sentence_pattern.split(current_sentence_buffer)
+                    # Reorganize into proper sentences with punctuation
+                    complete_sentences = []
+                    for i in range(0, len(sentences) - 1, 2):
+                        if i + 1 < len(sentences):
+                            complete_sentences.append(sentences[i] + sentences[i + 1])
                     
-                    # Debug log the streaming chunk
-                    if get_config_value("debug_logging", False):
-                        print(f"Streaming chunk: {data}")
+                    # Keep the last incomplete part
+                    if len(sentences) % 2 == 1:
+                        current_sentence_buffer = sentences[-1]
+                    else:
+                        current_sentence_buffer = ""
                     
-                    if 'message' in data and 'content' in data['message']:
-                        chunk = data['message']['content']
-                        
-                        # Only add to full_response once
-                        full_response += chunk
-                        current_sentence_buffer += chunk
-                        
-                        # Check if we have a complete sentence
-                        if sentence_pattern.search(current_sentence_buffer):
-                            # Split into sentences
-                            sentences = sentence_pattern.split(current_sentence_buffer)
-                            # Reorganize into proper sentences with punctuation
-                            complete_sentences = []
-                            for i in range(0, len(sentences) - 1, 2):
-                                if i + 1 < len(sentences):
-                                    complete_sentences.append(sentences[i] + sentences[i + 1])
-                            
-                            # Keep the last incomplete part
-                            if len(sentences) % 2 == 1:
-                                current_sentence_buffer = sentences[-1]
-                            else:
-                                current_sentence_buffer = ""
-                            
-                            # Add complete sentences to TTS queue
-                            with tts_queue_lock:
-                                for sentence in complete_sentences:
-                                    if sentence.strip():
-                                        tts_queue.append(sentence.strip())
-                
-                except Exception as e:
-                    print(f"Error processing streaming chunk: {e}")
+                    # Hand complete sentences to the synthesis stage
+                    for sentence in complete_sentences:
+                        speech_pipeline.put(sentence.strip())
+            
+            except Exception as e:
+                print(f"Error processing streaming chunk: {e}")
         
         # Process any remaining text
-        if current_sentence_buffer.strip():
-            with tts_queue_lock:
-                tts_queue.append(current_sentence_buffer.strip())
-        
-        # Wait for TTS queue to finish
-        while True:
-            with tts_queue_lock:
-                if not tts_queue:
-                    break
-            time.sleep(0.1)
-        
-        # Stop TTS thread
-        tts_thread_active.clear()
+        speech_pipeline.put(current_sentence_buffer.strip())
         
-        # Log final fragment count
-        with fragment_lock:
-            final_fragment_count = episodic_fragments_expressed
+        # Wait until every sentence has been spoken
+        speech_summary = await asyncio.to_thread(speech_pipeline.finish)
+        final_fragment_count = speech_summary["fragments"]
         
-        print(f"🎯 Streaming synthesis complete. Total episodic fragments expressed: {final_fragment_count}")
+        print(f"🎯 Streaming synthesis complete. Total episodic fragments expressed: {final_fragment_count} "
+              f"(mean gap {speech_summary['mean_gap']:.2f}s, max {speech_summary['max_gap']:.2f}s, "
+              f"lookahead {speech_summary['lookahead']})")
         
         # Stop timer and calculate elapsed time
         stop_timer.set()
@@ -449,10 +353,19 @@ def _run_streaming_chat_completion(model, messages, stop_timer, start_time, voic
         # IMPORTANT: Return the full response so the UI gets the text
         return full_response
         
-    except requests.exceptions.Timeout as e:
-        # Stop TTS thread
-        stop_tts.set()
-        tts_thread_active.clear()
+    except asyncio.CancelledError:
+        # Caller went away - stop speaking what is still queued
+        speech_pipeline.stop()
+        
+        stop_timer.set()
+        clear_display()
+        import config
+        config.active_model = None
+        print(f"🛑 Streaming LLM request for model {model} cancelled")
+        raise
+    except httpx.TimeoutException as e:
+        # Drop sentences not yet spoken
+        speech_pipeline.stop()
         
         stop_timer.set()
         clear_display()
@@ -461,10 +374,9 @@ def _run_streaming_chat_completion(model, messages, stop_timer, start_time, voic
         config.active_model = None
         print(f"[ERROR] Streaming LLM request timed out after {LLM_STREAMING_TIMEOUT} seconds for model {model}")
         raise Exception(f"Streaming LLM request timed out. The model '{model}' took longer than {LLM_STREAMING_TIMEOUT} seconds to respond. Try using a smaller/faster model or increase the timeout in settings.")
-    except requests.exceptions.ConnectionError as e:
-        # Stop TTS thread
-        stop_tts.set()
-        tts_thread_active.clear()
+    except httpx.ConnectError as e:
+        # Drop sentences not yet spoken
+        speech_pipeline.stop()
         
         stop_timer.set()
         clear_display()
@@ -474,9 +386,8 @@ def _run_streaming_chat_completion(model, messages, stop_timer, start_time, voic
         print(f"[ERROR] Cannot connect to Ollama server: {e}")
         raise Exception("Cannot connect to Ollama server. Please ensure Ollama is running and accessible.")
     except Exception as e:
-        # Stop TTS thread
-        stop_tts.set()
-        tts_thread_active.clear()
+        # Drop sentences not yet spoken
+        speech_pipeline.stop()
         
         stop_timer.set()
         # Clear display on error
@@ -487,6 +398,37 @@ def _run_streaming_chat_completion(model, messages, stop_timer, start_time, voic
         raise e
 
 
+async def stream_chat_completion_async(model, messages, system_message=None, temperature=None):
+    """Yield response chunks as Ollama produces them (for streaming HTTP responses, no device speech)"""
+    if system_message and not any(msg.get("role") == "system" for msg in messages):
+        messages = [{"role": "system", "content": system_message}] + messages
+    
+    user_prompt = ""
+    if messages and messages[-1].get("role") == "user":
+        user_prompt = messages[-1].get("content", "")
+    
+    import config
+    config.active_model = model
+    play_sound_async(play_ollama_tune, model)
+    
+    start_time = time.time()
+    full_response = ""
+    chunks = ollama_chat_stream(model, messages, temperature=temperature, timeout=LLM_STREAMING_TIMEOUT)
+    try:
+        async for chunk in chunks:
+            full_response += chunk
+            yield chunk
+    finally:
+        # Also runs when the client disconnects and the generator is closed
+        await chunks.aclose()
+        config.active_model = None
+    
+    elapsed_time = time.time() - start_time
+    log_llm_usage(model, system_message or "Default system message", user_prompt, full_response, elapsed_time)
+    update_model_runtime(model, elapsed_time)
+    play_sound_async(play_ollama_complete_tune)
+
+
 def toggle_streaming_tts():
     """Toggle the streaming TTS feature"""
     current_value = get_config_value("streaming_tts_enabled", False)
@@ -529,37 +471,15 @@ def test_ollama_connection():
 
 
 def get_available_models():
-    """Get list of available models from Ollama (tries remote first, then local)"""
-    import config
-    
-    # Try to get models from the available server (remote first, then local)
-    ollama_url, is_remote = config.get_ollama_base_url()
-    
-    try:
-        response = requests.get(f"{ollama_url}/api/tags")
-        if response.ok:
-            tags_data = response.json()
-            models = [model.get("name") for model in tags_data.get("models", []) if model.get("name")]
-            server_type = "remote" if is_remote else "local"
-            print(f"📋 Fetched {len(models)} models from {server_type} Ollama server")
-            return sorted(models)
-    except Exception as e:
-        print(f"Error fetching models from {'remote' if is_remote else 'local'} server: {e}")
-        
-        # If remote failed, try local as fallback
-        if is_remote:
-            try:
-                local_url = f"http://{config.LOCAL_OLLAMA_HOST}:{config.LOCAL_OLLAMA_PORT}"
-                response = requests.get(f"{local_url}/api/tags")
-                if response.ok:
-                    tags_data = response.json()
-                    models = [model.get("name") for model in tags_data.get("models", []) if model.get("name")]
-                    print(f"📋 Fallback: Fetched {len(models)} models from local Ollama server")
-                    return sorted(models)
-            except Exception as e2:
-                print(f"Error fetching models from local server: {e2}")
-    
-    return []
+    """Get list of available models from Ollama (cached catalog, refreshed in the background)"""
+    from cognition.model_catalog import get_model_catalog
+    return get_model_catalog().get_models()
+
+
+def get_sorted_models():
+    """Available models ordered by parameter size (sorted once per catalog refresh)"""
+    from cognition.model_catalog import get_model_catalog
+    return get_model_catalog().get_sorted_models()
 
 
 def sort_models_by_size(models, models_info=None):
@@ -0,0 +1,254 @@
+import threading
+import time
+
+import requests
+
+from config import get_config_value
+
+
+# -------- MODEL CATALOG -------- #
+# Cached view of the Ollama model list. /api/tags is fetched once per refresh
+# (with a timeout) and per-model details come from /api/show, fetched only for
+# models that are new or whose digest changed. Readers never wait on Ollama
+# once the catalog is warm: a stale catalog is served as-is while a background
+# refresh runs (stale-while-revalidate). sort_models_by_size runs once per
+# refresh, not on every read.
+
+MODEL_CATALOG_REFRESH_INTERVAL = get_config_value("model_catalog_refresh_interval", 300)  # Background refresh (seconds)
+MODEL_CATALOG_MAX_AGE = get_config_value("model_catalog_max_age", 60)  # Older than this is stale (seconds)
+MODEL_CATALOG_TIMEOUT = get_config_value("model_catalog_timeout", 5)  # Per Ollama request (seconds)
+RETRY_DELAY = 5  # After a failed refresh, reads start another at most this often (Ollama unreachable)
+
+
+class ModelCatalog:
+    """Cached Ollama tag list and per-model details with background refresh"""
+
+    def __init__(self, refresh_interval=MODEL_CATALOG_REFRESH_INTERVAL, max_age=MODEL_CATALOG_MAX_AGE,
+                 timeout=MODEL_CATALOG_TIMEOUT):
+        self.refresh_interval = refresh_interval
+        self.max_age = max_age
+        self.timeout = timeout
+
+        self._models = []          # Names, alphabetical (what get_available_models always returned)
+        self._sorted_models = []   # Names, by parameter size
+        self._details = {}         # Name -> details dict
+        self._fetched_at = 0.0
+        self._failed_at = 0.0
+        self._invalidated_at = 0.0
+        self._stale = True
+        self._server = None
+
+        self._lock = threading.Lock()          # Guards the cached lists
+        self._refresh_lock = threading.Lock()  # One refresh at a time
+        self._stop = threading.Event()
+        self._thread = None
+
+        self.stats = {"refreshes": 0, "failures": 0, "show_requests": 0, "last_refresh_ms": 0.0}
+
+    # -------- READS -------- #
+
+    def get_models(self):
+        """Model names, alphabetical"""
+        self._ensure_fresh()
+        with self._lock:
+            return list(self._models)
+
+    def get_sorted_models(self):
+        """Model names ordered by parameter size (computed once per refresh)"""
+        self._ensure_fresh()
+        with self._lock:
+            return list(self._sorted_models)
+
+    def get_details(self, model_name):
+        """Details for one model (size, family, quantization, ...) or None"""
+        self._ensure_fresh()
+        with self._lock:
+            details = self._details.get(model_name)
+            return dict(details) if details else None
+
+    def get_models_info(self):
+        """Details for every model, in size order"""
+        self._ensure_fresh()
+        with self._lock:
+            return [dict(self._details[name]) for name in self._sorted_models if name in self._details]
+
+    def status(self):
+        with self._lock:
+            return {
+                "models": len(self._models),
+                "server": self._server,
+                "age_seconds": round(time.time() - self._fetched_at, 1) if self._fetched_at else None,
+                "stale": self._is_stale(),
+                "background_refresh": bool(self._thread and self._thread.is_alive()),
+                **self.stats
+            }
+
+    def _is_stale(self):
+        return self._stale or time.time() - self._fetched_at > self.max_age
+
+    def _ensure_fresh(self):
+        if time.time() - self._failed_at <= RETRY_DELAY:
+            return  # Ollama just failed to answer - serve what is cached without another attempt
+        if not self._fetched_at:
+            # Cold catalog - nothing to serve yet, so this caller waits for the first fetch
+            self.refresh(if_older_than=time.time())
+        elif self._is_stale():
+            self.refresh_async()
+
+    # -------- REFRESH -------- #
+
+    def invalidate(self):
+        """Mark the catalog stale (after a pull or delete) and refresh in the background"""
+        with self._lock:
+            self._stale = True
+            self._invalidated_at = time.time()
+        self.refresh_async()
+
+    def refresh_async(self):
+        """Start a background refresh unless one is already running"""
+        if self._refresh_lock.locked():
+            return
+        thread = threading.Thread(target=self.refresh, name="model-catalog-refresh", daemon=True)
+        thread.start()
+
+    def refresh(self, if_older_than=None):
+        """
+        Fetch the tag list (and details for new models) now; returns True on success.
+        With if_older_than, a refresh that finished after that time while this
+        caller waited for the lock is reused instead of fetching again.
+        """
+        with self._refresh_lock:
+            if if_older_than is not None and self._fetched_at > if_older_than:
+                return True
+            
+            refresh_start = time.time()
+            try:
+                tags, server = self._fetch_tags()
+            except Exception as e:
+                self._failed_at = time.time()
+                self.stats["failures"] += 1
+                print(f"Error refreshing model catalog: {e}")
+                return False
+
+            with self._lock:
+                previous = dict(self._details)
+
+            details = {}
+            for tag in tags:
+                name = tag.get("name")
+                if not name:
+                    continue
+                known = previous.get(name)
+                if known and known.get("digest") == tag.get("digest") and known.get("shown"):
+                    details[name] = known
+                else:
+                    details[name] = self._build_details(tag, server)
+
+            from cognition.llm_interface import sort_models_by_size
+            models = sorted(details)
+            sorted_models = sort_models_by_size(models, list(details.values()))
+
+            with self._lock:
+                self._models = models
+                self._sorted_models = sorted_models
+                self._details = details
+                self._server = server
+                self._fetched_at = time.time()
+                # Invalidated while this refresh was fetching - the next read refreshes again
+                self._stale = self._invalidated_at >= refresh_start
+
+            self.stats["refreshes"] += 1
+            self.stats["last_refresh_ms"] = round((time.time() - refresh_start) * 1000, 1)
+            print(f"📋 Model catalog refreshed: {len(models)} models from {server} Ollama server")
+            return True
+
+    def _fetch_tags(self):
+        """GET /api/tags from the configured server (remote first, then local)"""
+        import config
+        ollama_url, is_remote = config.get_ollama_base_url()
+
+        try:
+            response = requests.get(f"{ollama_url}/api/tags", timeout=self.timeout)
+            response.raise_for_status()
+            return response.json().get("models", []), ollama_url
+        except Exception as e:
+            # If remote failed, try local as fallback
+            if not is_remote:
+                raise
+            print(f"Error fetching models from remote server: {e}")
+            local_url = f"http://{config.LOCAL_OLLAMA_HOST}:{config.LOCAL_OLLAMA_PORT}"
+            response = requests.get(f"{local_url}/api/tags", timeout=self.timeout)
+            response.raise_for_status()
+            return response.json().get("models", []), local_url
+
+    def _build_details(self, tag, server):
+        """Details for one tag entry, completed from /api/show"""
+        tag_details = tag.get("details", {})
+        details = {
+            "name": tag["name"],
+            "digest": tag.get("digest"),
+            "size": tag_details.get("parameter_size", "unknown"),  # Key sort_models_by_size reads
+            "size_bytes": tag.get("size", 0),
+            "family": tag_details.get("family", ""),
+            "quantization": tag_details.get("quantization_level", "unknown"),
+            "format": tag_details.get("format", ""),
+            "modified_at": tag.get("modified_at", ""),
+            "context_length": None,
+            "shown": False
+        }
+
+        try:
+            self.stats["show_requests"] += 1
+            response = requests.post(f"{server}/api/show", json={"model": tag["name"]}, timeout=self.timeout)
+            response.raise_for_status()
+            show = response.json()
+        except Exception as e:
+            # Tag details are enough to sort by; /api/show is retried next refresh
+            print(f"Could not fetch details for {tag['name']}: {e}")
+            return details
+
+        show_details = show.get("details", {})
+        details["size"] = show_details.get("parameter_size") or details["size"]
+        details["family"] = show_details.get("family") or details["family"]
+        details["quantization"] = show_details.get("quantization_level") or details["quantization"]
+        for key, value in show.get("model_info", {}).items():
+            if key.endswith(".context_length"):
+                details["context_length"] = value
+                break
+        details["shown"] = True
+        return details
+
+    # -------- BACKGROUND -------- #
+
+    def start_background_refresh(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._refresh_loop, name="model-catalog", daemon=True)
+        self._thread.start()
+
+    def stop_background_refresh(self):
+        self._stop.set()
+
+    def _refresh_loop(self):
+        while not self._stop.is_set():
+            self.refresh()
+            self._stop.wait(self.refresh_interval)
+
+
+_model_catalog = None
+_model_catalog_lock = threading.Lock()
+
+
+def get_model_catalog():
+    """Shared model catalog"""
+    global _model_catalog
+    with _model_catalog_lock:
+        if _model_catalog is None:
+            _model_catalog = ModelCatalog()
+    return _model_catalog
+
+
+def invalidate_model_catalog():
+    """Hook for anything that changes the installed models (pulls, deletes, server switch)"""
+    get_model_catalog().invalidate()
@@ -1,12 +1,17 @@
 from config import available_models, DEFAULT_MODEL
-from cognition.llm_interface import get_available_models, sort_models_by_size
+import time
+
+from cognition.model_catalog import get_model_catalog
 
 
 def refresh_available_models():
     """Refresh the available models list from Ollama"""
     global available_models
-    models = get_available_models()
-    if models:  # Only update if we got models
+    catalog = get_model_catalog()
+    # Reuse a refresh that completes while we wait (e.g. the background one at startup)
+    catalog.refresh(if_older_than=time.time())
+    sorted_models = catalog.get_sorted_models()  # Already sorted by size
+    if sorted_models:  # Only update if we got models
         # Get personalities from personality manager
         from cognition.personality import get_personality_manager
         personality_manager = get_personality_manager()
@@ -20,7 +25,6 @@ def refresh_available_models():
             new_list.append(f"PERSONALITY:{personality.name}")
         
         # Then add all models
-        sorted_models = sort_models_by_size(models)
         new_list.extend(sorted_models)
         
         available_models[:] = new_list  # Update in-place
@@ -42,7 +46,6 @@ def initialize_model_list():
             break
         else:
             print(f"Attempt {attempt + 1}/{max_retries} failed, waiting {retry_delay}s...")
-            import time
             time.sleep(retry_delay)
     
     # If still no models, use default
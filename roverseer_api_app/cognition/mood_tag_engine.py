@@ -0,0 +1,255 @@
+import json
+import re
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+
+# -------- MOOD TAG ENGINE -------- #
+# Patterns for contextual moods, compiled once at import. Personality/mood
+# tags are pulled out of logged responses with precompiled regexes (skipped
+# outright for untagged responses), and mood context triggers are found with
+# one keyword scanner per context field instead of one substring test per
+# keyword. The batch functions serve log views that parse a whole day at once.
+
+
+# -------- TAG EXTRACTION -------- #
+
+PERSONALITY_TAG = re.compile(r'<personality>(.*?)</personality>')
+MOOD_TAG = re.compile(r'<mood>(.*?)</mood>')
+
+
+def _find_tag(text, open_tag, close_tag, pattern):
+    """
+    (content, text without the tag) like pattern.search/pattern.sub.
+    A tag that appears once - the format add_contextual_tags_to_response
+    writes - is sliced out with str.find; anything else goes to the regex.
+    """
+    start = text.find(open_tag)
+    if start == -1:
+        return None, text
+    if text.find(open_tag, start + 1) == -1:
+        content_start = start + len(open_tag)
+        end = text.find(close_tag, content_start)
+        if end == -1:
+            return None, text
+        content = text[content_start:end]
+        if "\n" not in content:
+            return content, text[:start] + text[end + len(close_tag):]
+    match = pattern.search(text)
+    if not match:
+        return None, text
+    return match.group(1), pattern.sub('', text)
+
+
+def extract_tags(response: str) -> Dict[str, Any]:
+    """
+    Extract personality and mood tags from a response
+
+    Args:
+        response: Response text potentially containing tags
+
+    Returns:
+        Dict with extracted tag contents (personality, mood, clean_response)
+    """
+    extracted = {
+        "personality": None,
+        "mood": None,
+        "clean_response": response
+    }
+
+    # Most untagged responses never reach the regex engine
+    has_personality = "<personality>" in response
+    has_mood = "<mood>" in response
+    if not has_personality and not has_mood:
+        extracted["clean_response"] = response.strip()
+        return extracted
+
+    if has_personality:
+        personality, clean_response = _find_tag(response, "<personality>", "</personality>", PERSONALITY_TAG)
+        if personality is not None:
+            extracted["personality"] = personality
+            extracted["clean_response"] = clean_response
+
+    if has_mood:
+        # Mood comes from the original response; removal applies to what personality removal left
+        mood, without_mood = _find_tag(response, "<mood>", "</mood>", MOOD_TAG)
+        if mood is not None:
+            extracted["mood"] = mood
+            try:
+                # Try to parse mood JSON
+                extracted["mood"] = json.loads(mood)
+            except ValueError:
+                pass  # Keep as string if not valid JSON
+            if extracted["clean_response"] is response:
+                extracted["clean_response"] = without_mood
+            else:
+                _, extracted["clean_response"] = _find_tag(extracted["clean_response"], "<mood>", "</mood>", MOOD_TAG)
+
+    # Clean up any extra whitespace
+    extracted["clean_response"] = extracted["clean_response"].strip()
+    return extracted
+
+
+def extract_tags_batch(responses: Iterable[str]) -> List[Dict[str, Any]]:
+    """Extract tags from many responses (e.g. every line of a daily log)"""
+    return [extract_tags(response) for response in responses]
+
+
+# -------- TRIGGER SCANNING -------- #
+
+def _trie_pattern(keywords):
+    """Regex for a keyword set as a prefix tree; optional tails are greedy so the longest keyword wins"""
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+class TriggerScanner:
+    """
+    Finds which triggers' keywords occur in a text, in one pass.
+
+    Matches are substring matches, exactly like `keyword in text`. The
+    keywords are compiled into one prefix-tree regex inside a lookahead, so
+    every position is tested once against all keywords and overlapping hits
+    are all reported. Each hit is the longest keyword at its position;
+    keywords that are prefixes of it ("sun" in "sunny") are credited too.
+    """
+
+    def __init__(self, rules: Sequence[Tuple[str, Sequence[str]]]):
+        self.rules = [(trigger, [keyword.lower() for keyword in keywords]) for trigger, keywords in rules]
+        self.trigger_order = []
+        triggers_by_keyword: Dict[str, set] = {}
+        for trigger, keywords in self.rules:
+            if trigger not in self.trigger_order:
+                self.trigger_order.append(trigger)
+            for keyword in keywords:
+                triggers_by_keyword.setdefault(keyword, set()).add(trigger)
+
+        keywords = [keyword for keyword in triggers_by_keyword if keyword]
+        self.pattern = re.compile(f"(?=({_trie_pattern(keywords)}))") if keywords else None
+
+        # A hit on "sunny" is also a hit on "sun"
+        self.triggers_for_hit = {}
+        for keyword in keywords:
+            triggers = set()
+            for other, other_triggers in triggers_by_keyword.items():
+                if keyword.startswith(other):
+                    triggers |= other_triggers
+            self.triggers_for_hit[keyword] = triggers
+
+    def scan(self, text: str) -> set:
+        """Triggers whose keywords occur in the (already lowercased) text"""
+        found = set()
+        if not text or self.pattern is None:
+            return found
+        for hit in set(self.pattern.findall(text)):
+            found |= self.triggers_for_hit[hit]
+        return found
+
+    def detect(self, text: str) -> List[str]:
+        """Triggers found in the text, in rule order"""
+        found = self.scan(text)
+        return [trigger for trigger in self.trigger_order if trigger in found]
+
+
+# -------- CONTEXT TRIGGERS -------- #
+
+WEATHER_TRIGGERS = [
+    ('sunny', ['sunny', 'clear']),
+    ('hot', ['hot', 'warm']),
+    ('cold', ['cold', 'cool', 'chilly']),
+    ('rainy', ['rain']),
+    ('snow', ['snow']),
+]
+
+TIMES_OF_DAY = ['morning', 'evening', 'night', 'afternoon']
+
+TASK_TRIGGERS = [
+    ('coding', ['cod', 'program']),
+    ('music', ['music']),
+]
+
+INTERACTION_TRIGGERS = [
+    ('compliment', ['compliment']),
+    ('error', ['error']),
+]
+
+# Analyze what the user actually said for trigger words
+USER_MESSAGE_TRIGGERS = [
+    # Emotional state triggers
+    ('user_sad', ['sad', 'depressed', 'down', 'upset', 'crying']),
+    ('user_happy', ['happy', 'excited', 'great', 'awesome', 'wonderful', 'amazing']),
+    ('user_angry', ['angry', 'mad', 'frustrated', 'annoyed', 'pissed']),
+    ('user_afraid', ['scared', 'afraid', 'worried', 'nervous', 'anxious']),
+    # Activity triggers from user input
+    ('coding', ['code', 'coding', 'programming', 'debug', 'function', 'algorithm']),
+    ('music', ['music', 'song', 'singing', 'melody', 'rhythm', 'beat']),
+    # Compliments and criticism from user
+    ('compliment', ['thank you', 'thanks', 'good job', 'well done', 'excellent', 'perfect']),
+    ('criticism', ['wrong', 'bad', 'terrible', 'awful', 'stupid', 'useless']),
+    # Problem/error triggers from user
+    ('error', ['error', 'bug', 'problem', 'issue', 'broken', 'not working']),
+    ('help_needed', ['help', 'stuck', "don't understand", 'confused', 'lost']),
+    # Creative/learning triggers
+    ('creative', ['create', 'make', 'build', 'design', 'art', 'creative']),
+    ('learning', ['learn', 'teach', 'explain', 'understand', 'how does']),
+    # Weather mentioned by user
+    ('sunny', ['sunny', 'sun', 'bright', 'clear']),
+    ('hot', ['hot', 'warm', 'heat', 'sweat']),
+    ('cold', ['cold', 'freezing', 'chilly', 'freeze']),
+    ('rainy', ['rain', 'raining', 'wet', 'storm']),
+    ('snow', ['snow', 'snowing', 'blizzard', 'winter']),
+    # Philosophy/deep topics
+    ('philosophical', ['consciousness', 'meaning', 'purpose', 'existence', 'philosophy']),
+    ('dreamy', ['dream', 'dreams', 'imagination', 'fantasy']),
+]
+
+WEATHER_SCANNER = TriggerScanner(WEATHER_TRIGGERS)
+TASK_SCANNER = TriggerScanner(TASK_TRIGGERS)
+INTERACTION_SCANNER = TriggerScanner(INTERACTION_TRIGGERS)
+USER_MESSAGE_SCANNER = TriggerScanner(USER_MESSAGE_TRIGGERS)
+
+
+def detect_context_triggers(context: Dict[str, Any]) -> List[str]:
+    """
+    Detect context triggers that can activate moods
+
+    Args:
+        context: Context dictionary (weather, time_of_day, current_task,
+            interaction_type, user_message)
+
+    Returns:
+        List of trigger strings, in the order the moods system has always listed them
+    """
+    triggers = WEATHER_SCANNER.detect(context.get('weather', '').lower())
+
+    # Time triggers (environmental)
+    time_of_day = context.get('time_of_day', '').lower()
+    if time_of_day in TIMES_OF_DAY:
+        triggers.append(time_of_day)
+
+    triggers += TASK_SCANNER.detect(context.get('current_task', '').lower())
+    triggers += INTERACTION_SCANNER.detect(context.get('interaction_type', '').lower())
+    triggers += USER_MESSAGE_SCANNER.detect(context.get('user_message', '').lower())
+    return triggers
+
+
+def detect_context_triggers_batch(contexts: Iterable[Dict[str, Any]]) -> List[List[str]]:
+    """Detect context triggers for many contexts"""
+    return [detect_context_triggers(context) for context in contexts]
+
+
+def user_message_triggers(messages: Iterable[str]) -> List[List[str]]:
+    """Triggers in each user message (batch scoring of logged prompts)"""
+    return [USER_MESSAGE_SCANNER.detect(message.lower()) if message else [] for message in messages]
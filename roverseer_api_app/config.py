@@ -169,6 +169,11 @@ DEFAULT_MODEL = "tinydolphin:1.1b"
 LOGICAL_MODEL = "DolphinSeek-R1:latest"
 CREATIVE_MODEL = "DolphinSeek-R1:latest"
 
+# Hemispheres run concurrently; each gets its own timeout and optionally its own Ollama server
+BICAMERAL_HEMISPHERE_TIMEOUT = get_config_value("bicameral_hemisphere_timeout", 90)  # seconds
+LOGICAL_OLLAMA_URL = get_config_value("bicameral_logical_ollama_url", None)  # None = configured server
+CREATIVE_OLLAMA_URL = get_config_value("bicameral_creative_ollama_url", None)
+
 # -------- OLLAMA SERVER CONFIGURATION -------- #
 # Remote Ollama server configuration
 REMOTE_OLLAMA_ENABLED = get_config_value("remote_ollama_enabled", True)  # Enable by default
@@ -0,0 +1,217 @@
+import os
+import queue
+import subprocess
+import threading
+import time
+
+
+# -------- SPEECH PIPELINE -------- #
+# Two-stage sentence speech for streaming chat. A synthesis worker renders
+# sentences with Piper as soon as they arrive, staying up to `lookahead`
+# sentences ahead; a playback worker plays the rendered files in order with
+# aplay. Sentence N+1 is synthesized while sentence N plays, so the silence
+# between sentences is no longer the Piper render time. Both stages block on
+# queues instead of polling. Rendering has no audible side effects (no tune,
+# no active voice); the voice is active while its sentence plays. A sentence
+# that fails to render or play is skipped and counted in errors; an
+# interrupted playback stops the pipeline.
+
+_DONE = object()  # Sentinel closing a stage's input queue
+
+
+def play_wav(path, voice_id=None):
+    """
+    Play a rendered file on the device, registered with the orchestrator for cleanup.
+    Returns False when playback was killed (an interruption), True otherwise.
+    """
+    import config
+    from config import AUDIO_DEVICE
+    from embodiment.pipeline_orchestrator import get_pipeline_orchestrator
+
+    config.active_voice = voice_id
+    try:
+        audio_process = subprocess.Popen(
+            ["aplay", "-D", AUDIO_DEVICE, path],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+        get_pipeline_orchestrator().register_audio_process(audio_process)
+        audio_process.wait()
+    finally:
+        config.active_voice = None
+    if audio_process.returncode > 0:
+        print(f"aplay exited with code {audio_process.returncode}")
+    return audio_process.returncode >= 0
+
+
+def render_wav(text, voice_id):
+    """Synthesize one sentence to a temporary wav (returns path, seconds spent) while another plays"""
+    from expression.text_to_speech import render_tts_audio
+    return render_tts_audio(text, voice_id)
+
+
+class SpeechPipeline:
+    """Sentence queue -> synthesis worker -> rendered queue -> playback worker"""
+
+    def __init__(self, voice_id, lookahead=2, on_fragment=None, synthesize=render_wav, play=play_wav):
+        self.voice_id = voice_id
+        self.lookahead = max(1, int(lookahead))
+        self.on_fragment = on_fragment  # Called as on_fragment(number, text) just before playback
+        self._synthesize = synthesize
+        self._play = play
+
+        self._sentences = queue.Queue()
+        self._rendered = queue.Queue(maxsize=self.lookahead)
+        self._stop = threading.Event()
+        self._threads = []
+
+        self.stats = {
+            "fragments": 0,
+            "synthesis_time": 0.0,
+            "playback_time": 0.0,
+            "gaps": [],            # Silence between the end of one sentence and the start of the next
+            "starved_gaps": 0,     # Gaps where playback waited for a render (LLM or Piper behind)
+            "errors": 0
+        }
+
+    # -------- CONTROL -------- #
+
+    def start(self):
+        for target, name in ((self._synthesis_worker, "tts-synthesis"), (self._playback_worker, "tts-playback")):
+            thread = threading.Thread(target=target, name=name, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def put(self, sentence):
+        """Queue a sentence for speech (ignored once stopped)"""
+        if sentence and not self._stop.is_set():
+            self._sentences.put(sentence)
+
+    def finish(self, timeout=None):
+        """Close the input and wait until every queued sentence has been spoken"""
+        self._sentences.put(_DONE)
+        deadline = time.time() + timeout if timeout else None
+        for thread in self._threads:
+            thread.join(None if deadline is None else max(0.0, deadline - time.time()))
+        return self.summary()
+
+    def stop(self):
+        """Abandon queued sentences (playback of the current one is left to the orchestrator)"""
+        self._stop.set()
+        self._sentences.put(_DONE)
+        # Unblock a synthesis worker waiting for room in the rendered queue
+        self._discard_rendered()
+
+    # -------- WORKERS -------- #
+
+    def _synthesis_worker(self):
+        while True:
+            sentence = self._sentences.get()
+            if sentence is _DONE or self._stop.is_set():
+                break
+            try:
+                path, synthesis_time = self._synthesize(sentence, self.voice_id)
+                self.stats["synthesis_time"] += synthesis_time
+            except Exception as e:
+                print(f"Error synthesizing streamed sentence: {e}")
+                self.stats["errors"] += 1
+                continue
+
+            # Blocks while `lookahead` sentences are already waiting to be played
+            while not self._stop.is_set():
+                try:
+                    self._rendered.put((sentence, path), timeout=0.5)
+                    break
+                except queue.Full:
+                    continue
+            else:
+                _remove(path)
+                break
+        self._put_done()
+
+    def _playback_worker(self):
+        last_end = None
+        while True:
+            wait_start = time.time()
+            item = self._rendered.get()
+            waited = time.time() - wait_start
+            if item is _DONE or self._stop.is_set():
+                if item is not _DONE:
+                    _remove(item[1])
+                break
+            sentence, path = item
+
+            self.stats["fragments"] += 1
+            number = self.stats["fragments"]
+            try:
+                if self.on_fragment:
+                    self.on_fragment(number, sentence)
+
+                play_start = time.time()
+                if last_end is not None:
+                    self.stats["gaps"].append(play_start - last_end)
+                    if waited > 0.05:
+                        self.stats["starved_gaps"] += 1
+
+                completed = self._play(path, self.voice_id)
+                last_end = time.time()
+                self.stats["playback_time"] += last_end - play_start
+                print(f"📢 Episodic fragment {number} expressed: {sentence[:50]}{'...' if len(sentence) > 50 else ''}")
+                
+                if completed is False:
+                    print("🛑 Streamed speech interrupted - dropping queued sentences")
+                    self.stop()
+            except Exception as e:
+                print(f"Error playing streamed sentence: {e}")
+                self.stats["errors"] += 1
+            finally:
+                _remove(path)
+
+    # -------- HELPERS -------- #
+
+    def _put_done(self):
+        while True:
+            try:
+                self._rendered.put(_DONE, timeout=0.5)
+                return
+            except queue.Full:
+                if self._stop.is_set():
+                    self._discard_rendered()
+
+    def _discard_rendered(self):
+        while True:
+            try:
+                item = self._rendered.get_nowait()
+            except queue.Empty:
+                return
+            if item is not _DONE:
+                _remove(item[1])
+            else:
+                # Keep the sentinel for the playback worker
+                try:
+                    self._rendered.put_nowait(_DONE)
+                except queue.Full:
+                    pass
+                return
+
+    def summary(self):
+        gaps = self.stats["gaps"]
+        return {
+            "fragments": self.stats["fragments"],
+            "lookahead": self.lookahead,
+            "synthesis_time": round(self.stats["synthesis_time"], 3),
+            "playback_time": round(self.stats["playback_time"], 3),
+            "mean_gap": round(sum(gaps) / len(gaps), 3) if gaps else 0.0,
+            "max_gap": round(max(gaps), 3) if gaps else 0.0,
+            "starved_gaps": self.stats["starved_gaps"],
+            "errors": self.stats["errors"]
+        }
+
+
+def _remove(path):
+    try:
+        if path and os.path.exists(path):
+            os.remove(path)
+    except OSError:
+        pass
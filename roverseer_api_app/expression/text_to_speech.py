@@ -6,6 +6,7 @@ from pathlib import Path
 from config import VOICES_DIR, DEFAULT_VOICE, INTROS_DIR, AUDIO_DEVICE
 from memory.usage_logger import log_tts_usage, log_error
 from expression.sound_orchestration import play_sound_async, play_tts_tune
+from expression.voice_catalog import get_voice_catalog
 from helpers.text_processing_helper import TextProcessingHelper
 from helpers.logging_helper import LoggingHelper
 
@@ -27,117 +28,17 @@ def list_voice_ids():
 
 def get_categorized_voices():
     """Get voices organized by categories (subdirectories) with fallback to flat list"""
-    flat_voices = set()
-    categorized_voices = {}
-    uncategorized_voices = set()
-    
-    # First, scan the root voices directory for uncategorized voices
-    try:
-        for fname in filter_hidden_files(os.listdir(VOICES_DIR)):
-            if fname.endswith(".onnx") and not fname.endswith(".onnx.json"):
-                base = fname.rsplit("-", 1)[0]
-                uncategorized_voices.add(base)
-    except Exception as e:
-        print(f"Error scanning voices directory: {e}")
-    
-    # Then scan subdirectories for categorized voices
-    try:
-        for item in filter_hidden_files(os.listdir(VOICES_DIR)):
-            item_path = os.path.join(VOICES_DIR, item)
-            if os.path.isdir(item_path):
-                category_name = item
-                category_voices = set()
-                
-                # Scan this category directory
-                try:
-                    for fname in filter_hidden_files(os.listdir(item_path)):
-                        if fname.endswith(".onnx") and not fname.endswith(".onnx.json"):
-                            base = fname.rsplit("-", 1)[0]
-                            category_voices.add(base)
-                            flat_voices.add(base)  # Also add to flat list
-                except Exception as e:
-                    print(f"Error scanning category {category_name}: {e}")
-                
-                if category_voices:
-                    categorized_voices[category_name] = sorted(category_voices)
-    except Exception as e:
-        print(f"Error scanning for voice categories: {e}")
-    
-    # Add uncategorized voices to flat list
-    flat_voices.update(uncategorized_voices)
-    
-    # Add uncategorized voices to categorized structure if any exist
-    if uncategorized_voices:
-        categorized_voices['uncategorized'] = sorted(uncategorized_voices)
-    
-    return {
-        'flat_list': sorted(flat_voices),
-        'categorized': categorized_voices
-    }
+    return get_voice_catalog(VOICES_DIR).categorized()
 
 
 def find_voice_files(base_voice_id):
-    """Find the model and config files for a voice ID (searches root and subdirectories)"""
-    pattern_prefix = f"{base_voice_id}"
-    model_file = None
-    config_file = None
-    
-    # Debug logging
-    print(f"Looking for voice files with prefix: {pattern_prefix}")
-    print(f"In directory: {VOICES_DIR}")
-    
-    # Search in root directory first
-    try:
-        files_in_dir = filter_hidden_files(os.listdir(VOICES_DIR))
-        matching_files = [f for f in files_in_dir if f.startswith(pattern_prefix)]
-        print(f"Root files starting with {pattern_prefix}: {matching_files}")
-        
-        for fname in files_in_dir:
-            if fname.startswith(pattern_prefix):
-                if fname.endswith(".onnx") and not fname.endswith(".onnx.json"):
-                    model_file = os.path.join(VOICES_DIR, fname)
-                elif fname.endswith(".onnx.json"):
-                    config_file = os.path.join(VOICES_DIR, fname)
-            if model_file and config_file:
-                break
-    except Exception as e:
-        print(f"Error listing root directory: {e}")
-    
-    # If not found in root, search subdirectories
-    if not (model_file and config_file):
-        try:
-            for item in filter_hidden_files(os.listdir(VOICES_DIR)):
-                item_path = os.path.join(VOICES_DIR, item)
-                if os.path.isdir(item_path):
-                    try:
-                        subdir_files = filter_hidden_files(os.listdir(item_path))
-                        matching_subfiles = [f for f in subdir_files if f.startswith(pattern_prefix)]
-                        print(f"Subdir {item} files starting with {pattern_prefix}: {matching_subfiles}")
-                        
-                        for fname in subdir_files:
-                            if fname.startswith(pattern_prefix):
-                                if fname.endswith(".onnx") and not fname.endswith(".onnx.json"):
-                                    model_file = os.path.join(item_path, fname)
-                                elif fname.endswith(".onnx.json"):
-                                    config_file = os.path.join(item_path, fname)
-                            if model_file and config_file:
-                                break
-                    except Exception as e:
-                        print(f"Error scanning subdirectory {item}: {e}")
-                
-                if model_file and config_file:
-                    break
-        except Exception as e:
-            print(f"Error scanning subdirectories: {e}")
+    """Find the model and config files for a voice ID (root first, then subdirectories)"""
+    model_file, config_file = get_voice_catalog(VOICES_DIR).find(base_voice_id)
     
     if not model_file or not config_file:
-        # More detailed error message
-        print(f"Missing files for voice {base_voice_id}:")
-        print(f"  Model file (.onnx): {model_file}")
-        print(f"  Config file (.onnx.json): {config_file}")
+        print(f"Missing files for voice {base_voice_id} in {VOICES_DIR}")
         raise FileNotFoundError(f"Missing model or config for voice: {base_voice_id}")
     
-    print(f"Found voice files: {model_file}, {config_file}")
     return model_file, config_file
 
 
@@ -155,6 +56,21 @@ def generate_tts_audio(text, voice_id=DEFAULT_VOICE, output_file=None):
     # Play tune to indicate start
     play_sound_async(play_tts_tune)
     
+    try:
+        return render_tts_audio(text, voice_id, output_file)
+    finally:
+        # Clear active voice when done
+        config.active_voice = None
+
+
+def render_tts_audio(text, voice_id=DEFAULT_VOICE, output_file=None):
+    """
+    Render TTS audio with Piper without the start tune or active voice
+    (for callers that play other audio meanwhile, like the streaming speech pipeline)
+    """
+    if not voice_id:
+        voice_id = DEFAULT_VOICE
+    
     # Sanitize text for speech (this preserves think tags in logs but removes them from speech)
     clean_text = TextProcessingHelper.sanitize_for_speech(text)
     
@@ -187,7 +103,6 @@ def generate_tts_audio(text, voice_id=DEFAULT_VOICE, output_file=None):
                 model_path, config_path = find_voice_files(available[0])
                 voice_id = available[0]
             else:
-                config.active_voice = None
                 raise Exception("No voices available")
     
     # Generate output filename if not provided
@@ -217,16 +132,11 @@ def generate_tts_audio(text, voice_id=DEFAULT_VOICE, output_file=None):
             "model_path": model_path,
             "config_path": config_path
         })
-        # Clear active voice on error
-        config.active_voice = None
         raise Exception(f"Piper TTS failed: {error_msg}")
     
     # Log TTS usage with ORIGINAL text (preserving think tags in logs)
     log_tts_usage(voice_id, text, output_file, tts_processing_time)
     
-    # Clear active voice when done
-    config.active_voice = None
-    
     return output_file, tts_processing_time
 
 
@@ -0,0 +1,165 @@
+import os
+import threading
+import time
+
+
+# -------- VOICE CATALOG -------- #
+# In-memory index of the Piper voices under VOICES_DIR (root plus one level of
+# category subdirectories). Lookups are dictionary hits; the index refreshes
+# incrementally by checking directory mtimes at most once per refresh interval,
+# so a newly downloaded voice shows up without rescanning on every TTS call.
+
+def _is_visible(name):
+    """Skip macOS and system hidden files (same rules as filter_hidden_files)"""
+    return not name.startswith('.') and not name.startswith('_') and name != 'Thumbs.db'
+
+
+def _voice_keys(stem):
+    """Ids a voice file answers to: its full name and each dash-separated prefix"""
+    parts = stem.split('-')
+    return ['-'.join(parts[:i]) for i in range(len(parts), 0, -1)]
+
+
+class VoiceCatalog:
+    """Indexed lookup of voice id -> (model, config) for one voices directory"""
+
+    def __init__(self, voices_dir, refresh_interval=2.0):
+        self.voices_dir = voices_dir
+        self.refresh_interval = refresh_interval
+        self._lock = threading.Lock()
+        self._last_check = 0.0
+        self._dir_state = {}  # path -> (mtime, {stem: (model_path, config_path)})
+        self._order = []      # root first, then subdirectories
+        self._files = {}      # voice key -> (model_path, config_path)
+        self._categorized = {}
+        self._flat = []
+
+    # -------- SCANNING -------- #
+
+    def _scan(self, path):
+        models, configs = {}, {}
+        try:
+            for fname in os.listdir(path):
+                if not _is_visible(fname):
+                    continue
+                if fname.endswith('.onnx.json'):
+                    configs[fname[:-len('.onnx.json')]] = os.path.join(path, fname)
+                elif fname.endswith('.onnx'):
+                    models[fname[:-len('.onnx')]] = os.path.join(path, fname)
+        except Exception as e:
+            print(f"Error scanning voices directory {path}: {e}")
+        return {stem: (model_path, configs.get(stem)) for stem, model_path in models.items()}
+
+    def _subdirectories(self):
+        try:
+            return [os.path.join(self.voices_dir, item) for item in os.listdir(self.voices_dir)
+                    if _is_visible(item) and os.path.isdir(os.path.join(self.voices_dir, item))]
+        except Exception as e:
+            print(f"Error scanning for voice categories: {e}")
+            return []
+
+    def invalidate(self):
+        """Force a directory check on the next lookup"""
+        self._last_check = 0.0
+
+    def refresh(self, force=False):
+        """Rescan only the directories whose mtime changed"""
+        now = time.monotonic()
+        if not force and now - self._last_check < self.refresh_interval:
+            return
+
+        with self._lock:
+            if not force and now - self._last_check < self.refresh_interval:
+                return
+            self._last_check = now
+
+            try:
+                root_mtime = os.stat(self.voices_dir).st_mtime
+            except OSError:
+                self._dir_state, self._order = {}, []
+                self._rebuild()
+                return
+
+            root_state = self._dir_state.get(self.voices_dir)
+            if root_state is None or root_state[0] != root_mtime:
+                # Root changed: files or categories were added or removed
+                self._order = [self.voices_dir] + self._subdirectories()
+
+            changed = False
+            for path in self._order:
+                try:
+                    mtime = os.stat(path).st_mtime
+                except OSError:
+                    continue
+                state = self._dir_state.get(path)
+                if state is None or state[0] != mtime:
+                    self._dir_state[path] = (mtime, self._scan(path))
+                    changed = True
+
+            for path in list(self._dir_state):
+                if path not in self._order:
+                    del self._dir_state[path]
+                    changed = True
+
+            if changed:
+                self._rebuild()
+
+    def _rebuild(self):
+        files, categorized, flat = {}, {}, set()
+        uncategorized = set()
+
+        for path in self._order:
+            _, voices = self._dir_state.get(path, (0, {}))
+            is_root = path == self.voices_dir
+            category = set()
+            for stem in sorted(voices):
+                model_path, config_path = voices[stem]
+                # Root voices take precedence over category voices with the same id
+                for key in _voice_keys(stem):
+                    files.setdefault(key, (model_path, config_path))
+                base = stem.rsplit('-', 1)[0]
+                (uncategorized if is_root else category).add(base)
+            if not is_root and category:
+                categorized[os.path.basename(path)] = sorted(category)
+                flat.update(category)
+
+        flat.update(uncategorized)
+        if uncategorized:
+            categorized['uncategorized'] = sorted(uncategorized)
+
+        self._files = files
+        self._categorized = categorized
+        self._flat = sorted(flat)
+
+    # -------- LOOKUP -------- #
+
+    def find(self, voice_id):
+        """Return (model_path, config_path) for a voice id, or (None, None)"""
+        self.refresh()
+        model_path, config_path = self._files.get(voice_id, (None, None))
+        if model_path and config_path:
+            return model_path, config_path
+
+        # Unusual ids (partial names) fall back to a prefix match over the index
+        for path in self._order:
+            _, voices = self._dir_state.get(path, (0, {}))
+            for stem in sorted(voices):
+                model_path, config_path = voices[stem]
+                if stem.startswith(voice_id) and config_path:
+                    return model_path, config_path
+        return None, None
+
+    def categorized(self):
+        self.refresh()
+        return {'flat_list': list(self._flat), 'categorized': dict(self._categorized)}
+
+
+_catalogs = {}
+
+
+def get_voice_catalog(voices_dir):
+    """Shared catalog per voices directory"""
+    catalog = _catalogs.get(voices_dir)
+    if catalog is None:
+        catalog = _catalogs.setdefault(voices_dir, VoiceCatalog(voices_dir))
+    return catalog
@@ -105,6 +105,11 @@ def parse_log_file(log_type, date=None):
     if not log_file.exists():
         return []
     
+    try:
+        from cognition.contextual_moods import extract_tags_from_response
+    except ImportError:
+        extract_tags_from_response = None
+    
     entries = []
     try:
         with open(log_file, 'r') as f:
@@ -118,7 +123,6 @@ def parse_log_file(log_type, date=None):
                         extracted_tags = {}
                         
                         try:
-                            from cognition.contextual_moods import extract_tags_from_response
                             extracted_tags = extract_tags_from_response(response_text)
                         except:
                             extracted_tags = {"clean_response": response_text}
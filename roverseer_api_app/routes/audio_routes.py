@@ -429,9 +429,9 @@ async def transcribe_chat_voice(
         
         if not llm_success or not llm_result:
             # Fallback to local LLM
-            from ..cognition.llm_interface import run_chat_completion
+            from ..cognition.llm_interface import run_chat_completion_async
             messages = [{"role": "user", "content": transcript}]
-            reply = run_chat_completion(model, messages, "You are a helpful AI assistant.", voice_id=voice)
+            reply = await run_chat_completion_async(model, messages, "You are a helpful AI assistant.", voice_id=voice)
             llm_info = {"source": "local_fallback", "acceleration": "cpu"}
         else:
             # Extract reply from satellite response
@@ -8,8 +8,10 @@ import asyncio
 
 import config
 from config import DEFAULT_MODEL, DEFAULT_VOICE, current_audio_process
-from cognition.llm_interface import run_chat_completion
-from cognition.bicameral_mind import bicameral_chat_direct
+from fastapi.responses import StreamingResponse
+from cognition.llm_interface import run_chat_completion_async, stream_chat_completion_async
+from cognition.llm_client import cancel_on_disconnect
+from cognition.bicameral_mind import bicameral_chat_async, bicameral_chat_stream_async
 from expression.text_to_speech import generate_tts_audio, speak_text
 from memory.usage_logger import log_penphin_mind_usage
 from embodiment.rainbow_interface import start_system_processing, stop_system_processing
@@ -122,7 +124,7 @@ async def chat_unified(request: Request):
     try:
         # Start LLM processing LED - this is always text input since it's a web request
         start_system_processing('B', is_text_input=True, has_voice_output=(output_type in ["audio_file", "speak"]))
-        reply = run_chat_completion(model, messages, system_message, voice_id=voice)
+        reply = await cancel_on_disconnect(request, run_chat_completion_async(model, messages, system_message, voice_id=voice))
         
         # For text-only response, stop LEDs
         if output_type == "text":
@@ -255,7 +257,7 @@ async def insight(request: Request):
     messages = [{"role": "user", "content": prompt}]
 
     try:
-        reply = run_chat_completion(model, messages, system_message)
+        reply = await cancel_on_disconnect(request, run_chat_completion_async(model, messages, system_message))
         return JSONResponse({"response": reply})
     except Exception as e:
         return JSONResponse({"status": "error", "message": str(e)}), 500
@@ -292,6 +294,10 @@ async def bicameral_chat(request: Request):
               type: boolean
               example: true
               description: If true, speaks on device; if false, returns audio file
+            stream:
+              type: boolean
+              example: false
+              description: If true, streams the convergence text as it is generated (no audio)
           required:
             - prompt
     responses:
@@ -323,12 +329,16 @@ async def bicameral_chat(request: Request):
     if not prompt:
         return JSONResponse({"status": "error", "message": "No prompt provided"}), 400
 
+    # Stream the convergence text instead of speaking it
+    if data.get("stream"):
+        return StreamingResponse(_bicameral_text_stream(prompt, system, voice), media_type="text/plain")
+
     try:
         # Start LLM processing indicator - this is text input with voice output
         start_system_processing('B', is_text_input=True, has_voice_output=True)
         
-        # Use bicameral_chat_direct function
-        final_response = bicameral_chat_direct(prompt, system, voice)
+        # Both hemispheres run concurrently; cancelled if the client disconnects
+        final_response = await cancel_on_disconnect(request, bicameral_chat_async(prompt, system, voice))
         
         # Generate TTS for final response
         tmp_wav = f"/tmp/{uuid.uuid4().hex}.wav"
@@ -532,7 +542,14 @@ async def openai_compatible_chat(request: Request):
         if not any(stage for stage in pipeline_stages.values() if stage):
             start_system_processing('B')
         
-        reply = run_chat_completion(model, filtered_messages, system_message, voice_id=voice)
+        # OpenAI-style streaming: server-sent chat.completion.chunk events, text only
+        if data.get("stream"):
+            return StreamingResponse(
+                _openai_stream(model, filtered_messages, system_message, data.get("temperature")),
+                media_type="text/event-stream"
+            )
+        
+        reply = await cancel_on_disconnect(request, run_chat_completion_async(model, filtered_messages, system_message, voice_id=voice))
         
         # Stop LED processing if we started it
         if pipeline_stages.get('llm_active'):
@@ -570,6 +587,53 @@ async def openai_compatible_chat(request: Request):
         }), 500
 
 
+async def _bicameral_text_stream(prompt, system, voice):
+    """Convergence text as it is generated, for streamed bicameral chat"""
+    chunks = bicameral_chat_stream_async(prompt, system, voice)
+    start_system_processing('B', is_text_input=True, has_voice_output=False)
+    try:
+        async for chunk in chunks:
+            yield chunk
+    except Exception as e:
+        # bicameral_chat_stream_async already raises with a descriptive message
+        yield f"\n[{e}]"
+    finally:
+        await chunks.aclose()
+        stop_system_processing()
+
+
+async def _openai_stream(model, messages, system_message, temperature=None):
+    """Server-sent events in the OpenAI chat.completion.chunk format"""
+    completion_id = f"chatcmpl-{uuid.uuid4().hex[:8]}"
+    created = int(time.time())
+    
+    def event(delta, finish_reason=None):
+        payload = {
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": created,
+            "model": model,
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]
+        }
+        return f"data: {json.dumps(payload)}\n\n"
+    
+    chunks = stream_chat_completion_async(model, messages, system_message, temperature)
+    try:
+        yield event({"role": "assistant"})
+        # Starlette closes this generator when the client disconnects, which closes the Ollama stream
+        async for chunk in chunks:
+            yield event({"content": chunk})
+        yield event({}, "stop")
+    except Exception as e:
+        yield f"data: {json.dumps({'error': {'message': str(e), 'type': 'internal_server_error'}})}\n\n"
+    finally:
+        await chunks.aclose()
+        from config import pipeline_stages
+        if pipeline_stages.get('llm_active'):
+            stop_system_processing()
+    yield "data: [DONE]\n\n"
+
+
 @router.post('/chat_ajax')
 async def chat_ajax(request: Request):
     """AJAX endpoint for chat requests that returns JSON"""
@@ -692,9 +756,9 @@ async def chat_ajax(request: Request):
         
         # Check if PenphinMind is selected
         if model.lower() == "penphinmind":
-            # Use bicameral_chat_direct function
+            # Both hemispheres run concurrently; cancelled if the client disconnects
             try:
-                reply = bicameral_chat_direct(user_input, system, voice)
+                reply = await cancel_on_disconnect(request, bicameral_chat_async(user_input, system, voice))
             except Exception as e:
                 reply = f"Bicameral processing error: {e}"
             
@@ -744,7 +808,7 @@ async def chat_ajax(request: Request):
                     print(f"Using {'provided' if system else 'default'} system message")
                 
                 # Run LLM
-                reply = run_chat_completion(model, messages, system_message, voice_id=voice)
+                reply = await cancel_on_disconnect(request, run_chat_completion_async(model, messages, system_message, voice_id=voice))
                 
                 # Log response for analytics with voice model context
                 from helpers.logging_helper import LoggingHelper
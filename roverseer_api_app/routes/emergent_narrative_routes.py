@@ -47,9 +47,8 @@ os.makedirs(CHARACTER_IMAGES_DIR, exist_ok=True)
 def get_available_models() -> List[str]:
     """Get available AI models from main app configuration"""
     try:
-        from cognition.llm_interface import get_available_models, sort_models_by_size
-        models = get_available_models()
-        return sort_models_by_size(models)
+        from cognition.llm_interface import get_sorted_models
+        return get_sorted_models()
     except Exception as e:
         logger.error(f"Failed to get models: {e}")
         return []
@@ -57,10 +56,9 @@ def get_available_models() -> List[str]:
 def get_categorized_models():
     """Get categorized models for organized dropdowns"""
     try:
-        from cognition.llm_interface import get_available_models, sort_models_by_size
+        from cognition.llm_interface import get_sorted_models
         
-        models = get_available_models()
-        models = sort_models_by_size(models)
+        models = get_sorted_models()
         
         # Process models to include short names for display
         models_with_display_names = []
@@ -1189,14 +1187,14 @@ def get_character_conversation_summary(narrative: EmergentNarrative, character:
 async def generate_character_response(character: Character, context: str) -> str:
     """Generate AI response for character with enhanced tagging and think tag filtering"""
     try:
-        from cognition.llm_interface import run_chat_completion
+        from cognition.llm_interface import run_chat_completion_async
         
         messages = [
             {"role": "system", "content": character.system_message},
             {"role": "user", "content": context}
         ]
         
-        response = run_chat_completion(
+        response = await run_chat_completion_async(
             model=character.model,
             messages=messages,
             system_message=character.system_message,
@@ -1715,7 +1713,8 @@ async def ai_generate_narrative(request: Request):
             logger.info("Sending generation request to AI model...")
             
             # Generate the narrative structure using AI with quality retry mechanism
-            from cognition.llm_interface import run_chat_completion
+            from cognition.llm_interface import run_chat_completion_async
+            from cognition.llm_client import cancel_on_disconnect, ClientDisconnected
             
             max_attempts = 3
             best_narrative = None
@@ -1725,12 +1724,12 @@ async def ai_generate_narrative(request: Request):
                 try:
                     logger.info(f"Generation attempt {attempt + 1}/{max_attempts}")
                     
-                    response = run_chat_completion(
+                    response = await cancel_on_disconnect(request, run_chat_completion_async(
                         model=generation_model,
                         messages=[{"role": "user", "content": generation_prompt}],
                         system_message="You are an expert narrative designer and AI consciousness architect. Generate detailed, creative narrative structures with rich character development and compelling themes.",
                         temperature=0.8 + (attempt * 0.1)  # Slightly increase creativity on retries
-                    )
+                    ))
                     
                     logger.info(f"Received AI response (length: {len(response)})")
                     
@@ -1751,6 +1750,9 @@ async def ai_generate_narrative(request: Request):
                         narrative_data = current_narrative
                         break
                         
+                except ClientDisconnected:
+                    # Nobody is waiting for the result - do not retry
+                    raise
                 except Exception as e:
                     logger.warning(f"Generation attempt {attempt + 1} failed: {e}")
                     continue
@@ -2535,7 +2537,8 @@ async def ai_generate_character(request: Request):
             raise HTTPException(status_code=400, detail=f"Selected model '{selected_model}' is not available")
         
         # Use LLM to generate character
-        from cognition.llm_interface import run_chat_completion
+        from cognition.llm_interface import run_chat_completion_async
+        from cognition.llm_client import cancel_on_disconnect
         
         generation_prompt = f"""Create a detailed character based on this description: "{prompt}"
 
@@ -2563,18 +2566,18 @@ Please provide a JSON response with the following structure:
 
 Make the character interesting and well-developed with realistic personality traits."""
         
-        # Use run_chat_completion which is the correct function in the LLM interface
+        # Use run_chat_completion_async which is the correct function in the LLM interface
         # Use the selected model for character generation
         logger.info(f"Using model '{selected_model}' for character generation")
         
-        response = run_chat_completion(
+        response = await cancel_on_disconnect(request, run_chat_completion_async(
             model=selected_model,
             messages=[{"role": "user", "content": generation_prompt}],
             system_message=None,
             skip_logging=False,
             voice_id=None,
             temperature=0.8  # Some creativity for character generation
-        )
+        ))
         
         # Parse AI response
         try:
@@ -2994,8 +2997,8 @@ async def generate_narrative_with_selected_characters(
     # Generate title and description
     title_prompt = f"Create a compelling title for a narrative about: {story_concept}. Respond with just the title, no quotes or extra text."
     
-    from cognition.llm_interface import run_chat_completion
-    title_response = run_chat_completion(
+    from cognition.llm_interface import run_chat_completion_async
+    title_response = await run_chat_completion_async(
         model=generation_model,
         messages=[{"role": "user", "content": title_prompt}],
         system_message="You are a creative writer. Generate compelling, concise titles.",
@@ -3124,8 +3127,8 @@ Use this enhanced character generation approach with multiple scenes per act and
 
 {build_generation_prompt(story_concept, chars_to_generate, num_acts, narrative_tone, scene_length, additional_notes)}"""
         
-        from cognition.llm_interface import run_chat_completion
-        response = run_chat_completion(
+        from cognition.llm_interface import run_chat_completion_async
+        response = await run_chat_completion_async(
             model=generation_model,
             messages=[{"role": "user", "content": generation_prompt}],
             system_message="You are an expert narrative designer. Generate creative characters that complement existing ones.",
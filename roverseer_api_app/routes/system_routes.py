@@ -14,7 +14,7 @@ import asyncio
 from config import history, MAX_HISTORY, DEFAULT_MODEL, DEFAULT_VOICE
 from config import DebugLog  # Add DebugLog import
 from embodiment.sensors import get_sensor_data, check_tcp_ports, get_ai_pipeline_status
-from cognition.llm_interface import get_available_models, sort_models_by_size
+from cognition.llm_interface import get_available_models, get_sorted_models, sort_models_by_size
 from cognition.bicameral_mind import bicameral_chat_direct
 from cognition.llm_interface import run_chat_completion
 from expression.text_to_speech import list_voice_ids, get_categorized_voices
@@ -85,8 +85,7 @@ async def serve_temp_static(filename: str):
 async def home(request: Request, action: Optional[str] = Form(None)):
     """Main home page with system status and chat interface"""
     statuses = check_tcp_ports()
-    models = get_available_models()
-    models = sort_models_by_size(models)
+    models = get_sorted_models()
     voices = list_voice_ids()  # Keep for compatibility but won't use directly
     categorized_voices = get_categorized_voices()  # Get categorized voice data for web interface
     model_stats = get_model_stats()
@@ -1094,6 +1093,10 @@ async def download_ollama_model(request: Request):
                 subprocess.run(['ollama', 'pull', full_model_name], 
                              capture_output=True, text=True, check=True)
                 print(f"✅ Model {full_model_name} downloaded successfully")
+                
+                # New model - refresh the cached catalog
+                from cognition.model_catalog import invalidate_model_catalog
+                invalidate_model_catalog()
             except subprocess.CalledProcessError as e:
                 print(f"❌ Failed to download {full_model_name}: {e.stderr}")
         
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Mood Tag Benchmark
+Times personality/mood tag extraction and context trigger detection over a
+synthetic llm_usage log corpus, comparing the previous per-call
+implementations (regex compiled per call, one substring test per keyword)
+against cognition.mood_tag_engine. Both are checked to give identical
+results before anything is timed. Finally parse_log_file is timed on the
+same corpus written to a temporary log directory.
+
+Usage:
+    python scripts/benchmark_mood_tags.py
+    python scripts/benchmark_mood_tags.py --entries 5000 --tagged 0.3 --repeat 5
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# App modules live one directory up
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+PERSONALITIES = ["GlaDOS", "Penphin", "Rover", "Sage", "Jester"]
+MOODS = ["curious", "grumpy", "playful", "melancholy", "focused"]
+WEATHER = ["sunny", "clear skies", "hot and humid", "cool breeze", "light rain", "snow flurries", "overcast", ""]
+TIMES_OF_DAY = ["morning", "afternoon", "evening", "night", "midday", ""]
+TASKS = ["coding", "programming the rover", "music practice", "reading", "chatting", ""]
+INTERACTIONS = ["compliment", "error report", "question", "conversation", ""]
+
+SENTENCES = [
+    "Sure, I can help with that.",
+    "The rover's left wheel is drawing more current than the right one.",
+    "Here is a short function that reads the sensor and averages the last ten samples.",
+    "I don't understand why the build keeps failing, it worked yesterday.",
+    "Thanks, that was a great explanation of the algorithm!",
+    "It's raining again, so maybe we should stay inside and write a song.",
+    "Consciousness is a strange thing to think about at this time of night.",
+    "That answer was wrong and honestly a bit useless.",
+    "Let me explain how does the scheduler decide what runs next.",
+    "I had a dream about a rover exploring a frozen blizzard planet.",
+    "The temperature sensor says it's freezing outside.",
+    "Could you design a little melody for the startup chime?",
+    "Everything looks fine from here, nothing to report.",
+]
+
+
+# -------- CORPUS -------- #
+
+def make_response(rng, tagged):
+    text = " ".join(rng.choice(SENTENCES) for _ in range(rng.randint(2, 8)))
+    if not tagged:
+        return text
+    mood = {"mood": rng.choice(MOODS), "trigger": rng.choice(["sunny", "coding", "user_sad"]), "intensity": rng.random()}
+    return f"<personality>{rng.choice(PERSONALITIES)}</personality><mood>{json.dumps(mood)}</mood>{text}"
+
+
+def make_context(rng):
+    return {
+        "weather": rng.choice(WEATHER),
+        "time_of_day": rng.choice(TIMES_OF_DAY),
+        "current_task": rng.choice(TASKS),
+        "interaction_type": rng.choice(INTERACTIONS),
+        "user_message": " ".join(rng.choice(SENTENCES) for _ in range(rng.randint(1, 3)))
+    }
+
+
+def make_corpus(count, tagged_ratio, seed):
+    rng = random.Random(seed)
+    responses = [make_response(rng, rng.random() < tagged_ratio) for _ in range(count)]
+    contexts = [make_context(rng) for _ in range(count)]
+    return responses, contexts
+
+
+def write_log(directory, responses, contexts, date):
+    """An llm_usage log in the format log_llm_usage writes"""
+    with open(Path(directory) / f"llm_usage_{date}.log", "w") as f:
+        for i, (response, context) in enumerate(zip(responses, contexts)):
+            f.write(json.dumps({
+                "timestamp": f"{date}T12:{i // 60 % 60:02d}:{i % 60:02d}.{i:06d}",
+                "model": "llama3.2:3b",
+                "system_message": "You are a helpful rover assistant.",
+                "user_prompt": context["user_message"],
+                "llm_reply": response,
+                "runtime": 1.5,
+                "personality": "GlaDOS",
+                "voice_id": "en_US-GlaDOS-medium"
+            }) + "\n")
+
+
+# -------- PREVIOUS IMPLEMENTATION -------- #
+
+def previous_extract_tags(response):
+    extracted = {"personality": None, "mood": None, "clean_response": response}
+    personality_match = re.search(r'<personality>(.*?)</personality>', response)
+    if personality_match:
+        extracted["personality"] = personality_match.group(1)
+        extracted["clean_response"] = re.sub(r'<personality>.*?</personality>', '', extracted["clean_response"])
+    mood_match = re.search(r'<mood>(.*?)</mood>', response)
+    if mood_match:
+        extracted["mood"] = mood_match.group(1)
+        try:
+            extracted["mood"] = json.loads(extracted["mood"])
+        except ValueError:
+            pass
+        extracted["clean_response"] = re.sub(r'<mood>.*?</mood>', '', extracted["clean_response"])
+    extracted["clean_response"] = extracted["clean_response"].strip()
+    return extracted
+
+
+def previous_detect_triggers(context):
+    from cognition.mood_tag_engine import (WEATHER_TRIGGERS, TASK_TRIGGERS, INTERACTION_TRIGGERS,
+                                           USER_MESSAGE_TRIGGERS, TIMES_OF_DAY as DAY_PARTS)
+    triggers = []
+    for field, rules in (("weather", WEATHER_TRIGGERS), ("time_of_day", None),
+                         ("current_task", TASK_TRIGGERS), ("interaction_type", INTERACTION_TRIGGERS),
+                         ("user_message", USER_MESSAGE_TRIGGERS)):
+        value = context.get(field, '').lower()
+        if rules is None:
+            if value in DAY_PARTS:
+                triggers.append(value)
+            continue
+        for trigger, keywords in rules:
+            if any(word in value for word in keywords):
+                triggers.append(trigger)
+    return triggers
+
+
+# -------- TIMING -------- #
+
+def best_of(repeat, function, *args):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def report(label, before, after, count):
+    print(f"{label:<22}{before / count * 1e6:>12.2f}{after / count * 1e6:>12.2f}{before / after:>9.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark mood tag extraction and trigger detection")
+    parser.add_argument("--entries", type=int, default=2000, help="Log entries in the corpus")
+    parser.add_argument("--tagged", type=float, default=0.5, help="Fraction of responses carrying tags")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (best is reported)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    from cognition.mood_tag_engine import detect_context_triggers_batch, extract_tags_batch
+
+    responses, contexts = make_corpus(args.entries, args.tagged, args.seed)
+
+    # Same answers first
+    mismatches = sum(previous_extract_tags(r) != e for r, e in zip(responses, extract_tags_batch(responses)))
+    mismatches += sum(previous_detect_triggers(c) != t for c, t in zip(contexts, detect_context_triggers_batch(contexts)))
+    if mismatches:
+        print(f"❌ {mismatches} results differ from the previous implementation")
+        return 1
+
+    print(f"🏷️  {args.entries} log entries, {args.tagged:.0%} tagged, best of {args.repeat}\n")
+    print(f"{'stage':<22}{'before µs':>12}{'after µs':>12}{'speedup':>10}")
+
+    report("tag extraction",
+           best_of(args.repeat, lambda: [previous_extract_tags(r) for r in responses]),
+           best_of(args.repeat, extract_tags_batch, responses), args.entries)
+    report("context triggers",
+           best_of(args.repeat, lambda: [previous_detect_triggers(c) for c in contexts]),
+           best_of(args.repeat, detect_context_triggers_batch, contexts), args.entries)
+
+    import memory.usage_logger as usage_logger
+    date = "2000-01-01"
+    with tempfile.TemporaryDirectory() as directory:
+        write_log(directory, responses, contexts, date)
+        usage_logger.LOG_DIR = Path(directory)
+        parse_time = best_of(args.repeat, usage_logger.parse_log_file, "llm_usage", date)
+        parsed = len(usage_logger.parse_log_file("llm_usage", date))
+    print(f"\n📊 parse_log_file: {parsed} entries in {parse_time * 1000:.1f}ms "
+          f"({parse_time / max(parsed, 1) * 1e6:.1f}µs per entry)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
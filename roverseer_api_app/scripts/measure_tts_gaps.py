@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Streaming TTS Gap Measurement
+Measures the silence between spoken sentences for the old serial streaming
+TTS loop (poll every 0.1s, synthesize with Piper, then play with aplay) and
+for the SpeechPipeline at several look-ahead depths.
+
+--simulate replaces Piper and aplay with sleeps so the script runs on any
+machine; without it the configured voice is synthesized and played for real.
+
+Usage:
+    python scripts/measure_tts_gaps.py --simulate --synth 0.6 --play 2.0
+    python scripts/measure_tts_gaps.py --voice en_US-GlaDOS-medium --lookahead 1,2,3
+"""
+
+import argparse
+import sys
+import threading
+import time
+from pathlib import Path
+
+# App modules live one directory up
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+SENTENCES = [
+    "Hello there, I have been thinking about your question.",
+    "The short answer is that it depends on the weather.",
+    "Rovers do not like mud, and neither do their wheels.",
+    "If the sky stays clear, we can head out after lunch.",
+    "Bring a spare battery, just in case.",
+    "Otherwise, I will be waiting here, watching the sensors.",
+]
+
+
+def simulated_stages(synth_seconds, play_seconds):
+    """Piper and aplay stand-ins: synthesis scales with sentence length, playback too"""
+    def synthesize(text, voice_id):
+        seconds = synth_seconds * len(text) / 50
+        time.sleep(seconds)
+        return None, seconds
+
+    def play(path, voice_id):
+        time.sleep(play_seconds)
+        return True
+
+    return synthesize, play
+
+
+def arrival_times(count, interval):
+    """When each sentence leaves the LLM stream (0 = all at once)"""
+    return [i * interval for i in range(count)]
+
+
+def _remove(path):
+    from expression.speech_pipeline import _remove as remove_rendered
+    remove_rendered(path)
+
+
+def run_serial(sentences, arrivals, synthesize, play, voice_id):
+    """The previous tts_processor: a list polled every 0.1s, synthesize then play per sentence"""
+    pending, lock, gaps = [], threading.Lock(), []
+    done = threading.Event()
+
+    def processor():
+        last_end = None
+        spoken = 0
+        while spoken < len(sentences):
+            sentence = None
+            with lock:
+                if pending:
+                    sentence = pending.pop(0)
+            if sentence:
+                path, _ = synthesize(sentence, voice_id)
+                play_start = time.time()
+                if last_end is not None:
+                    gaps.append(play_start - last_end)
+                play(path, voice_id)
+                last_end = time.time()
+                _remove(path)
+                spoken += 1
+            time.sleep(0.1)
+        done.set()
+
+    threading.Thread(target=processor, daemon=True).start()
+    feed(sentences, arrivals, lambda sentence: _append(pending, lock, sentence))
+    done.wait()
+    return gaps
+
+
+def _append(pending, lock, sentence):
+    with lock:
+        pending.append(sentence)
+
+
+def run_pipeline(sentences, arrivals, synthesize, play, voice_id, lookahead):
+    from expression.speech_pipeline import SpeechPipeline
+
+    pipeline = SpeechPipeline(voice_id, lookahead=lookahead, synthesize=synthesize, play=play).start()
+    feed(sentences, arrivals, pipeline.put)
+    summary = pipeline.finish()
+    return pipeline.stats["gaps"], summary
+
+
+def feed(sentences, arrivals, put):
+    start = time.time()
+    for sentence, arrival in zip(sentences, arrivals):
+        delay = start + arrival - time.time()
+        if delay > 0:
+            time.sleep(delay)
+        put(sentence)
+
+
+def report(label, gaps, starved=None):
+    mean_gap = sum(gaps) / len(gaps) if gaps else 0.0
+    max_gap = max(gaps) if gaps else 0.0
+    row = f"{label:<22}{mean_gap * 1000:>10.0f}{max_gap * 1000:>10.0f}{sum(gaps):>10.2f}"
+    if starved is not None:
+        row += f"{starved:>9}"
+    print(row)
+    return mean_gap
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure silence between streamed TTS sentences")
+    parser.add_argument("--voice", default=None, help="Voice id (default: configured default voice)")
+    parser.add_argument("--lookahead", default="1,2,3", help="Comma-separated look-ahead depths to try")
+    parser.add_argument("--interval", type=float, default=0.3, help="Seconds between sentences arriving from the LLM")
+    parser.add_argument("--simulate", action="store_true", help="Replace Piper and aplay with sleeps")
+    parser.add_argument("--synth", type=float, default=0.6, help="Simulated synthesis seconds per 50 characters")
+    parser.add_argument("--play", type=float, default=2.0, help="Simulated playback seconds per sentence")
+    args = parser.parse_args()
+
+    if args.simulate:
+        synthesize, play = simulated_stages(args.synth, args.play)
+        voice_id = args.voice or "simulated"
+    else:
+        from config import DEFAULT_VOICE
+        from expression.speech_pipeline import play_wav, render_wav
+        synthesize, play = render_wav, play_wav
+        voice_id = args.voice or DEFAULT_VOICE
+
+    arrivals = arrival_times(len(SENTENCES), args.interval)
+    print(f"🔊 {len(SENTENCES)} sentences, one every {args.interval:.1f}s from the LLM "
+          f"({'simulated' if args.simulate else voice_id})\n")
+    print(f"{'mode':<22}{'mean ms':>10}{'max ms':>10}{'total s':>10}{'starved':>9}")
+
+    serial_gap = report("serial (before)", run_serial(SENTENCES, arrivals, synthesize, play, voice_id))
+
+    best_gap = None
+    for lookahead in [int(depth) for depth in args.lookahead.split(",") if depth.strip()]:
+        gaps, summary = run_pipeline(SENTENCES, arrivals, synthesize, play, voice_id, lookahead)
+        mean_gap = report(f"pipeline lookahead={lookahead}", gaps, summary["starved_gaps"])
+        best_gap = mean_gap if best_gap is None else min(best_gap, mean_gap)
+
+    if best_gap is not None:
+        print(f"\n📊 Mean inter-sentence silence {serial_gap * 1000:.0f}ms -> {best_gap * 1000:.0f}ms "
+              f"| starved = gaps where playback waited on the next render")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Workflow Benchmark Summary Tests
+
+Checks the mean and nearest-rank p95 the workflow benchmark reports, and
+that ERROR records from failed stages are collected so a fallback run is
+flagged instead of being timed as normal.
+
+Run with: python -m pytest test_benchmark_workflows.py
+"""
+
+import importlib.util
+import logging
+import os
+import sys
+
+import pytest
+
+BENCHMARK_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'api_silicon_server', 'scripts', 'benchmark_workflows.py'
+)
+
+
+@pytest.fixture
+def benchmark_workflows(workflow_cwd):
+    """The benchmark script as a module (it creates ./logs/ at import, see conftest.py)"""
+    module = sys.modules.get("benchmark_workflows")
+    if module is None:
+        spec = importlib.util.spec_from_file_location("benchmark_workflows", BENCHMARK_PATH)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        sys.modules["benchmark_workflows"] = module
+    return module
+
+
+@pytest.mark.parametrize("values, mean, p95", [
+    ([0.5], 0.5, 0.5),
+    ([0.3, 0.1, 0.2], 0.2, 0.3),
+    ([float(i) for i in range(1, 21)], 10.5, 19.0),
+    ([float(i) for i in range(1, 101)], 50.5, 95.0),
+])
+def test_mean_and_nearest_rank_p95(benchmark_workflows, values, mean, p95):
+    summary = benchmark_workflows.summarize_times(values)
+
+    assert summary["mean"] == pytest.approx(mean)
+    assert summary["p95"] == p95
+
+
+def test_p95_is_an_observed_value_at_or_above_the_95th_percentile(benchmark_workflows):
+    values = [float(i) for i in range(1, 11)]
+
+    # 10 runs: the 95th percentile rank is 9.5, so the slowest run is reported
+    assert benchmark_workflows.summarize_times(values)["p95"] == 10.0
+
+
+def test_stage_failure_log_collects_errors_only(benchmark_workflows):
+    failure_log = benchmark_workflows.StageFailureLog()
+    logger = logging.getLogger("benchmark_test")
+    logger.addHandler(failure_log)
+    try:
+        logger.warning("slow search provider")
+        logger.error("❌ PIPELINE 3 FAILED: Document finalization failed")
+    finally:
+        logger.removeHandler(failure_log)
+
+    assert failure_log.messages == ["❌ PIPELINE 3 FAILED: Document finalization failed"]
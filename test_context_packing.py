@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Research Context Packing Tests
+
+Checks when the summarize/synthesize steps condense overflowing sources
+(map-reduce) instead of packing the best ones into the token budget: "auto"
+only pays for the extra generations when a large share of the sources would
+otherwise be dropped.
+
+Run with: python -m pytest test_context_packing.py
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+# Add the api_silicon_server directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'api_silicon_server'))
+
+# The workflow engine logs to ./logs/ relative to the working directory (see conftest.py)
+pytestmark = pytest.mark.usefixtures("workflow_cwd")
+
+BUDGET = 600
+
+
+def make_results(count):
+    """Sources of roughly 140 estimated tokens each, all distinct"""
+    return [
+        {
+            "title": f"Sleep study {i}",
+            "snippet": " ".join(f"finding{i}x{word}" for word in range(40)),
+            "url": f"https://journal{i}.example.edu/article/{i}"
+        }
+        for i in range(count)
+    ]
+
+
+def run_prepare(results, **overrides):
+    from workflows.tools.summarize import _prepare_content
+    calls = []
+
+    async def generate(prompt):
+        calls.append(prompt)
+        return "- condensed note about the sources in this batch"
+
+    context = {
+        "original_request": "sleep and memory",
+        "context_token_budget": BUDGET,
+        "context_packing_mode": "auto",
+        "generate_with_fallback": generate,
+        **overrides
+    }
+    asyncio.run(_prepare_content(results, context))
+    return context["context_packing"], calls
+
+
+def test_one_source_overflow_does_not_map_reduce():
+    stats, calls = run_prepare(make_results(5))
+
+    assert stats["sources_dropped"] == 1
+    assert stats["mode"] == "fill"
+    assert calls == []
+
+
+def test_large_overflow_map_reduces_in_auto_mode():
+    stats, calls = run_prepare(make_results(20))
+
+    assert stats["dropped_share"] > 0.5
+    assert stats["mode"] == "map_reduce"
+    assert calls
+
+
+def test_threshold_is_configurable():
+    stats, calls = run_prepare(make_results(5), context_map_reduce_threshold=0.0)
+
+    assert stats["mode"] == "map_reduce"
+    assert calls
+
+
+def test_fill_mode_never_map_reduces():
+    stats, calls = run_prepare(make_results(20), context_packing_mode="fill")
+
+    assert stats["mode"] == "fill"
+    assert calls == []
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Interactive Workflow Controller Tests
+
+Checks that run_with_control feeds each step the results of the steps it
+depends_on (a two-branch DAG like the research workflow's web/ArXiv fan-out),
+keeps plain chains working, passes skipped steps' input through, and resumes
+from checkpointed step results by step index, storing the run's checkpoint
+metadata with the execution.
+
+Run with: python -m pytest test_interactive_workflow_controller.py
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+# Add the api_silicon_server directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'api_silicon_server'))
+
+# The workflow engine logs to ./logs/ relative to the working directory (see conftest.py)
+pytestmark = pytest.mark.usefixtures("workflow_cwd")
+
+
+def make_workflow(name):
+    from workflows.agent_workflow_engine import AgentWorkflow
+    return AgentWorkflow(name)
+
+
+def make_controller(workflow, **kwargs):
+    from workflows.interactive_workflow_controller import InteractiveWorkflowController
+    return InteractiveWorkflowController(workflow, **kwargs)
+
+
+def recording_step(name, calls):
+    def step(data, context):
+        calls.append((name, data))
+        return f"{name}({data})" if not isinstance(data, list) else f"{name}({'+'.join(data)})"
+    return step
+
+
+def two_branch_workflow(calls):
+    workflow = make_workflow("two-branch")
+    workflow.add_step("Clarify", recording_step("clarify", calls), depends_on=[])
+    workflow.add_step("Web", recording_step("web", calls), depends_on=["Clarify"])
+    workflow.add_step("Papers", recording_step("papers", calls), depends_on=["Clarify"])
+    workflow.add_step("Synthesize", recording_step("synth", calls), depends_on=["Web", "Papers"])
+    workflow.add_step("Write", recording_step("write", calls))
+    return workflow
+
+
+class FakeCheckpointStore:
+    def __init__(self, restored=None):
+        self.restored = restored or {}
+        self.saved = {}
+        self.finished = None
+        self.metadata = None
+
+    def begin(self, execution_id, name, labels, input_data, metadata):
+        self.metadata = metadata
+        return True
+
+    def load(self, execution_id, labels):
+        return dict(self.restored), {}
+
+    def restore_context(self, context, snapshot):
+        pass
+
+    def save_step(self, execution_id, index, label, result, context, duration):
+        self.saved[index] = result
+
+    def finish(self, execution_id, success, result=None, error=None):
+        self.finished = (success, result)
+
+
+def run(controller, data):
+    return asyncio.run(controller.run_with_control(data))
+
+
+def test_steps_receive_their_declared_dependencies():
+    calls = []
+    result = run(make_controller(two_branch_workflow(calls)), "q")
+
+    inputs = dict(calls)
+    assert inputs["web"] == "clarify(q)"
+    assert inputs["papers"] == "clarify(q)"  # not the web results
+    assert inputs["synth"] == ["web(clarify(q))", "papers(clarify(q))"]
+    assert inputs["write"] == "synth(web(clarify(q))+papers(clarify(q)))"
+    assert result == "write(synth(web(clarify(q))+papers(clarify(q))))"
+
+
+def test_plain_chain_passes_each_result_on():
+    calls = []
+    workflow = make_workflow("chain")
+    workflow.add_step("One", recording_step("one", calls))
+    workflow.add_step("Two", recording_step("two", calls))
+
+    assert run(make_controller(workflow), "x") == "two(one(x))"
+
+
+def test_skipped_step_passes_its_input_to_dependents():
+    calls = []
+    controller = make_controller(two_branch_workflow(calls))
+    controller.skip_step("Web")
+
+    run(controller, "q")
+
+    assert dict(calls)["synth"] == ["clarify(q)", "papers(clarify(q))"]
+
+
+def test_resume_restores_outputs_by_step():
+    calls = []
+    store = FakeCheckpointStore(restored={0: "clarify(q)", 2: "saved-papers"})
+    controller = make_controller(two_branch_workflow(calls), checkpoint_store=store, execution_id="resume-1")
+
+    result = run(controller, "q")
+
+    assert [name for name, _ in calls] == ["web", "synth", "write"]
+    assert dict(calls)["synth"] == ["web(clarify(q))", "saved-papers"]
+    assert sorted(store.saved) == [1, 3, 4]
+    assert store.finished == (True, result)
+
+
+def test_dependencies_declared_later_still_run_first():
+    calls = []
+    workflow = make_workflow("out-of-order")
+    workflow.add_step("Report", recording_step("report", calls), depends_on=["Fetch"])
+    workflow.add_step("Fetch", recording_step("fetch", calls), depends_on=[])
+
+    run(make_controller(workflow), "x")
+
+    assert [name for name, _ in calls] == ["fetch", "report"]
+
+
+def test_run_workflow_with_control_stores_checkpoint_metadata():
+    store = FakeCheckpointStore()
+    metadata = {"research_query": "q", "workflow_type": "quick"}
+
+    from workflows.interactive_workflow_controller import run_workflow_with_control
+    asyncio.run(run_workflow_with_control(two_branch_workflow([]), "q", checkpoint_store=store,
+                                          execution_id="meta-1", checkpoint_metadata=metadata))
+
+    assert store.metadata == metadata
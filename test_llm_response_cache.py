@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+LLM Response Cache Tests
+
+Wraps stand-in generate functions with LLMResponseCache to check that
+responses are stored under the backend that actually produced them, so a
+fallback answer is never served for the preferred backend.
+
+Run with: python -m pytest test_llm_response_cache.py
+"""
+
+import asyncio
+import os
+import sys
+
+# Add the api_silicon_server directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'api_silicon_server'))
+
+from llm_response_cache import LLMResponseCache, record_generation_model
+
+
+def _fallback_generate(calls):
+    async def generate(prompt):
+        calls.append(prompt)
+        record_generation_model("ollama:llama2")
+        return f"ollama answer to {prompt}"
+    return generate
+
+
+def test_fallback_response_is_stored_under_actual_backend(tmp_path):
+    cache = LLMResponseCache(str(tmp_path))
+    calls = []
+    cached = cache.wrap(_fallback_generate(calls), "mlx:qwen")
+
+    assert asyncio.run(cached("hello")) == "ollama answer to hello"
+    assert cache.get("mlx:qwen", "hello") is None
+    assert cache.get("ollama:llama2", "hello") == "ollama answer to hello"
+
+    # The preferred backend is still asked next time rather than served the fallback answer
+    asyncio.run(cached("hello"))
+    assert len(calls) == 2
+
+
+def test_response_is_served_when_expected_backend_answered(tmp_path):
+    cache = LLMResponseCache(str(tmp_path))
+    calls = []
+
+    async def generate(prompt):
+        calls.append(prompt)
+        record_generation_model("mlx:qwen")
+        return "mlx answer"
+
+    cached = cache.wrap(generate, "mlx:qwen")
+    asyncio.run(cached("hello"))
+    assert asyncio.run(cached("hello")) == "mlx answer"
+    assert len(calls) == 1
+
+
+def test_unreported_backend_uses_expected_model(tmp_path):
+    cache = LLMResponseCache(str(tmp_path))
+
+    async def generate(prompt):
+        return "plain answer"
+
+    asyncio.run(cache.wrap(generate, "ollama:llama2")("hello"))
+    assert cache.get("ollama:llama2", "hello") == "plain answer"
+
+
+def test_concurrent_generations_keep_their_own_backend(tmp_path):
+    cache = LLMResponseCache(str(tmp_path))
+
+    async def generate(prompt):
+        backend = "ollama:llama2" if prompt == "fallback" else "mlx:qwen"
+        await asyncio.sleep(0.01 if prompt == "fallback" else 0)
+        record_generation_model(backend)
+        await asyncio.sleep(0.01 if prompt != "fallback" else 0)
+        return backend
+
+    async def run_both():
+        cached = cache.wrap(generate, "mlx:qwen")
+        await asyncio.gather(cached("fallback"), cached("primary"))
+
+    asyncio.run(run_both())
+    assert cache.get("ollama:llama2", "fallback") == "ollama:llama2"
+    assert cache.get("mlx:qwen", "fallback") is None
+    assert cache.get("mlx:qwen", "primary") == "mlx:qwen"
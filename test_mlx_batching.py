@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+MLX Batching Tests
+
+Runs MLXBatchScheduler against a stand-in BatchGenerator (each request emits
+one token per decode step until its max_tokens) so batching, slicing of the
+decode loop and cancellation can be checked without MLX hardware.
+
+Run with: python -m pytest test_mlx_batching.py
+"""
+
+import asyncio
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+import pytest
+
+# Add the api_silicon_server directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'api_silicon_server'))
+
+import mlx_batching
+from faculty_executors import FacultyExecutor
+from mlx_batching import MLXBatchScheduler
+
+EOS = 0
+
+
+class FakeTokenizer:
+    eos_token_id = EOS
+
+    def encode(self, text):
+        return [ord(char) for char in text]
+
+    def decode(self, tokens):
+        return " ".join(str(token) for token in tokens)
+
+
+class FakeBatchGenerator:
+    """One token per active request per next(); finishes at max_tokens"""
+
+    def __init__(self, model, stop_tokens=None, sampler=None):
+        self.active = {}
+        self.next_uid = 0
+
+    def insert(self, prompts, max_tokens):
+        uids = []
+        for prompt, limit in zip(prompts, max_tokens):
+            self.active[self.next_uid] = [0, limit]
+            uids.append(self.next_uid)
+            self.next_uid += 1
+        return uids
+
+    def remove(self, uids):
+        for uid in uids:
+            self.active.pop(uid, None)
+
+    def next(self):
+        time.sleep(0.002)
+        responses = []
+        for uid, state in list(self.active.items()):
+            state[0] += 1
+            finished = state[0] >= state[1]
+            responses.append(SimpleNamespace(uid=uid, token=state[0], finish_reason="length" if finished else None))
+            if finished:
+                del self.active[uid]
+        return responses
+
+
+@pytest.fixture
+def entry(monkeypatch):
+    monkeypatch.setattr(mlx_batching, "BatchGenerator", FakeBatchGenerator, raising=False)
+    return SimpleNamespace(model_id="fake-model", model=object(), tokenizer=FakeTokenizer())
+
+
+@pytest.fixture
+def executor():
+    executor = FacultyExecutor("llm", max_workers=1, max_queue_depth=8)
+    yield executor
+    executor.shutdown()
+
+
+def test_concurrent_requests_share_decode_steps(entry, executor):
+    scheduler = MLXBatchScheduler(executor, window_ms=20, max_batch_size=8)
+
+    async def run():
+        return await asyncio.gather(*(scheduler.generate(entry, f"prompt {i}", max_tokens=i + 2)
+                                      for i in range(4)))
+
+    results = asyncio.run(run())
+
+    assert results == [" ".join(str(token) for token in range(1, i + 3)) for i in range(4)]
+    assert scheduler.stats["peak_batch_size"] == 4
+    # Longest request (5 tokens) bounds the number of decode rounds
+    assert scheduler.stats["decode_steps"] == 5
+    assert not scheduler.is_busy
+
+
+def test_long_batch_yields_to_other_llm_jobs(entry, executor):
+    scheduler = MLXBatchScheduler(executor, window_ms=0, max_steps_per_job=4)
+    finished_at = {}
+
+    async def run():
+        batch = asyncio.ensure_future(scheduler.generate(entry, "long", max_tokens=60))
+        await asyncio.sleep(0.02)
+        await executor.run(lambda: None)
+        finished_at["other"] = time.time()
+        await batch
+        finished_at["batch"] = time.time()
+
+    asyncio.run(run())
+
+    assert finished_at["other"] < finished_at["batch"]
+    assert scheduler.stats["drain_jobs"] > 1
+    assert scheduler.stats["completed"] == 1
+
+
+def test_cancelled_request_leaves_the_batch(entry, executor):
+    scheduler = MLXBatchScheduler(executor, window_ms=10, max_steps_per_job=2)
+
+    async def run():
+        keep = asyncio.ensure_future(scheduler.generate(entry, "keep", max_tokens=20))
+        drop = asyncio.ensure_future(scheduler.generate(entry, "drop", max_tokens=1000))
+        await asyncio.sleep(0.05)
+        drop.cancel()
+        return await keep
+
+    assert asyncio.run(run()).split()[-1] == "20"
+    assert scheduler.stats["cancelled"] == 1
+    assert scheduler.stats["decode_steps"] < 1000
+
+
+def test_only_one_concurrent_caller_goes_solo(entry, executor):
+    scheduler = MLXBatchScheduler(executor, window_ms=0)
+
+    claims = [scheduler.claim_solo() for _ in range(3)]
+    assert claims == [True, False, False]
+    assert scheduler.is_busy
+
+    scheduler.release_solo()
+    assert not scheduler.is_busy
+    assert scheduler.claim_solo()
+    scheduler.release_solo()
+
+
+def test_no_solo_claim_while_a_batch_is_decoding(entry, executor):
+    scheduler = MLXBatchScheduler(executor, window_ms=0)
+
+    async def run():
+        batch = asyncio.ensure_future(scheduler.generate(entry, "batched", max_tokens=30))
+        await asyncio.sleep(0.01)
+        claimed = scheduler.claim_solo()
+        await batch
+        return claimed
+
+    assert asyncio.run(run()) is False
+    assert scheduler.claim_solo()
+    scheduler.release_solo()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+MLX Prompt Prefix Cache Tests
+
+Runs PromptPrefixCache with a stand-in model whose "KV cache" records the
+tokens prefilled into it, to check prefix reuse, the minimum prefix length
+and per-model eviction without MLX hardware.
+
+Run with: python -m pytest test_mlx_prompt_cache.py
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+# Add the api_silicon_server directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'api_silicon_server'))
+
+import mlx_prompt_cache
+from mlx_prompt_cache import PromptPrefixCache
+
+
+class FakeArray:
+    def __init__(self, items):
+        self.items = list(items)
+
+    @property
+    def size(self):
+        return len(self.items)
+
+    def __getitem__(self, key):
+        return self if key is None else FakeArray(self.items[key])
+
+
+class FakeLayer:
+    def __init__(self):
+        self.tokens = []
+
+    @property
+    def state(self):
+        return self.tokens
+
+
+class FakeModel:
+    def __init__(self):
+        self.prefilled = 0
+
+    def __call__(self, step, cache):
+        cache[0].tokens.extend(step.items)
+        self.prefilled += step.size
+
+
+class WordTokenizer:
+    """One token per word"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def encode(self, text):
+        self.calls += 1
+        return [sum(map(ord, word)) for word in text.split()]
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    monkeypatch.setattr(mlx_prompt_cache, "mx", SimpleNamespace(array=FakeArray, eval=lambda state: None), raising=False)
+    monkeypatch.setattr(mlx_prompt_cache, "make_prompt_cache", lambda model: [FakeLayer()], raising=False)
+    cache = PromptPrefixCache(max_entries=4, min_prefix_tokens=8)
+    cache.available = True
+    return cache
+
+
+def resident(model_id="fake-model"):
+    return SimpleNamespace(model_id=model_id, model=FakeModel(), tokenizer=WordTokenizer())
+
+
+SYSTEM = "System: " + " ".join(f"rule{i}" for i in range(20)) + "\n\n"
+
+
+def test_prefix_is_prefilled_once_and_reused(cache):
+    model = resident()
+
+    suffix, kv = cache.prepare(model, SYSTEM + "Human: hello\n\nAssistant:", SYSTEM)
+    assert len(suffix) == 3
+    assert len(kv[0].tokens) == 21
+    assert model.model.prefilled == 21
+
+    suffix, kv = cache.prepare(model, SYSTEM + "Human: a different question\n\nAssistant:", SYSTEM)
+    assert len(suffix) == 5
+    assert model.model.prefilled == 21  # Second turn only prefills its own suffix
+    assert cache.stats["prefills"] == 1
+    assert cache.stats["hits"] == 2
+    assert cache.stats["reused_tokens"] == 42
+
+
+def test_each_request_gets_its_own_kv_copy(cache):
+    model = resident()
+    _, first = cache.prepare(model, SYSTEM + "Human: one", SYSTEM)
+    first[0].tokens.append(999)
+
+    _, second = cache.prepare(model, SYSTEM + "Human: two", SYSTEM)
+    assert 999 not in second[0].tokens
+
+
+def test_short_prefixes_are_not_cacheable(cache):
+    model = resident()
+    short = "System: be brief\n\n"
+
+    assert not cache.is_cacheable(model, short)
+    assert cache.is_cacheable(model, SYSTEM)
+    assert not cache.is_cacheable(model, None)
+
+    tokens, kv = cache.prepare(model, short + "Human: hi", short)
+    assert kv is None and len(tokens) == 5
+    assert cache.stats["prefills"] == 0
+
+
+def test_prefix_lengths_are_tokenized_once(cache):
+    model = resident()
+    for _ in range(5):
+        cache.is_cacheable(model, SYSTEM)
+    assert model.tokenizer.calls == 1
+
+
+def test_evicting_a_model_drops_its_prefixes(cache):
+    first, second = resident("first"), resident("second")
+    cache.prepare(first, SYSTEM + "Human: hi", SYSTEM)
+    cache.prepare(second, SYSTEM + "Human: hi", SYSTEM)
+
+    cache.evict_model("first")
+
+    assert cache.get_status()["entries"] == 1
+    _, kv = cache.prepare(second, SYSTEM + "Human: again", SYSTEM)
+    assert kv is not None
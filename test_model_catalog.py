@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Model Catalog Tests
+
+Drives ModelCatalog with stubbed Ollama calls (_fetch_tags, _build_details)
+to check a cold read fetches once, stale reads are served from the cache
+while a background refresh runs, an invalidation during a refresh leaves
+the catalog stale, /api/show is skipped for unchanged digests, waiting
+callers reuse a refresh that finished meanwhile and failed refreshes are
+not retried on every read.
+
+Run with: python -m pytest test_model_catalog.py
+"""
+
+import os
+import sys
+import threading
+import time
+import types
+
+import pytest
+
+# Add the roverseer_api_app directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'roverseer_api_app'))
+
+from cognition import model_catalog
+from cognition.model_catalog import ModelCatalog
+
+
+def tag(name, digest="d1"):
+    return {"name": name, "digest": digest, "details": {"parameter_size": "1B"}}
+
+
+class StubOllama:
+    """Answers /api/tags and /api/show for a catalog; fetches can be held open or made to fail"""
+
+    def __init__(self, catalog, tags):
+        self.tags = tags
+        self.fetches = 0
+        self.shown = []
+        self.fail = False
+        self.fetching = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+        catalog._fetch_tags = self.fetch_tags
+        catalog._build_details = self.build_details
+
+    def fetch_tags(self):
+        self.fetches += 1
+        self.fetching.set()
+        assert self.release.wait(5)
+        if self.fail:
+            raise ConnectionError("Ollama unreachable")
+        return list(self.tags), "local"
+
+    def build_details(self, tag_entry, server):
+        self.shown.append(tag_entry["name"])
+        return {"name": tag_entry["name"], "digest": tag_entry.get("digest"), "size": "1B", "shown": True}
+
+    def hold(self):
+        self.fetching.clear()
+        self.release.clear()
+
+
+@pytest.fixture(autouse=True)
+def sort_by_name(monkeypatch):
+    """sort_models_by_size lives in llm_interface, which needs the Pi's hardware libraries"""
+    llm_interface = types.ModuleType("cognition.llm_interface")
+    llm_interface.sort_models_by_size = lambda models, models_info=None: list(models)
+    monkeypatch.setitem(sys.modules, "cognition.llm_interface", llm_interface)
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+def wait_idle(catalog):
+    wait_for(lambda: not catalog._refresh_lock.locked())
+
+
+def test_cold_read_fetches_once():
+    catalog = ModelCatalog(max_age=60)
+    ollama = StubOllama(catalog, [tag("b"), tag("a")])
+
+    assert catalog.get_models() == ["a", "b"]
+    assert catalog.get_sorted_models() == ["a", "b"]
+    assert catalog.get_details("a")["digest"] == "d1"
+    assert ollama.fetches == 1
+
+
+def test_stale_read_serves_cache_and_refreshes_in_background():
+    catalog = ModelCatalog(max_age=60)
+    ollama = StubOllama(catalog, [tag("a")])
+    catalog.get_models()
+
+    catalog._fetched_at -= 120
+    ollama.tags = [tag("a"), tag("b")]
+    ollama.hold()
+
+    assert catalog.get_models() == ["a"]  # Returned while the refresh is held open
+    assert ollama.fetching.wait(5)
+    ollama.release.set()
+    wait_for(lambda: catalog.stats["refreshes"] == 2)
+
+    assert catalog.get_models() == ["a", "b"]
+    assert ollama.fetches == 2
+
+
+def test_invalidate_during_refresh_leaves_catalog_stale():
+    catalog = ModelCatalog(max_age=60)
+    ollama = StubOllama(catalog, [tag("a")])
+    ollama.hold()
+
+    refresher = threading.Thread(target=catalog.refresh)
+    refresher.start()
+    assert ollama.fetching.wait(5)
+    catalog.invalidate()  # Refresh already running - nothing new is started
+    ollama.release.set()
+    refresher.join(5)
+
+    assert ollama.fetches == 1
+    assert catalog.status()["stale"] is True
+
+    catalog.get_models()  # Stale read starts the follow-up refresh
+    wait_for(lambda: catalog.stats["refreshes"] == 2)
+    assert catalog.status()["stale"] is False
+
+
+def test_show_is_skipped_for_unchanged_digests():
+    catalog = ModelCatalog(max_age=60)
+    ollama = StubOllama(catalog, [tag("a"), tag("b")])
+
+    assert catalog.refresh() is True
+    assert sorted(ollama.shown) == ["a", "b"]
+
+    ollama.shown.clear()
+    assert catalog.refresh() is True
+    assert ollama.shown == []
+
+    ollama.tags = [tag("a", digest="d2"), tag("b"), tag("c")]
+    assert catalog.refresh() is True
+    assert sorted(ollama.shown) == ["a", "c"]
+    assert catalog.get_details("a")["digest"] == "d2"
+
+
+def test_waiting_caller_reuses_refresh_that_finished_meanwhile():
+    catalog = ModelCatalog(max_age=60)
+    ollama = StubOllama(catalog, [tag("a")])
+    ollama.hold()
+
+    first = threading.Thread(target=catalog.refresh)
+    first.start()
+    assert ollama.fetching.wait(5)
+
+    outcome = []
+    waiter = threading.Thread(target=lambda: outcome.append(catalog.refresh(if_older_than=time.time())))
+    waiter.start()
+    time.sleep(0.05)
+    ollama.release.set()
+    first.join(5)
+    waiter.join(5)
+
+    assert outcome == [True]
+    assert ollama.fetches == 1
+    assert catalog.get_models() == ["a"]
+
+
+def test_failed_refresh_is_not_retried_on_every_stale_read():
+    catalog = ModelCatalog(max_age=60)
+    ollama = StubOllama(catalog, [tag("a")])
+    catalog.get_models()
+
+    catalog._fetched_at -= 120
+    ollama.fail = True
+    catalog.get_models()
+    wait_for(lambda: catalog.stats["failures"] == 1)
+    wait_idle(catalog)
+
+    for _ in range(5):
+        assert catalog.get_models() == ["a"]
+    time.sleep(0.05)
+    assert ollama.fetches == 2
+
+    catalog._failed_at -= model_catalog.RETRY_DELAY + 1
+    catalog.get_models()
+    wait_for(lambda: catalog.stats["failures"] == 2)
+    assert ollama.fetches == 3
+
+
+def test_failed_cold_fetch_is_throttled():
+    catalog = ModelCatalog(max_age=60)
+    ollama = StubOllama(catalog, [tag("a")])
+    ollama.fail = True
+
+    assert catalog.get_models() == []
+    assert catalog.get_models() == []
+    assert ollama.fetches == 1
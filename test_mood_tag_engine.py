@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Mood Tag Engine Tests
+
+Checks the precompiled mood tag extraction and trigger scanners against the
+straightforward versions they replaced (regex search/sub per tag, one
+`keyword in text` test per keyword), including overlapping and prefix
+keywords and tags the fast path has to hand to the regex.
+
+Run with: python -m pytest test_mood_tag_engine.py
+"""
+
+import json
+import os
+import re
+import sys
+
+import pytest
+
+# Add the roverseer_api_app directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'roverseer_api_app'))
+
+from cognition.mood_tag_engine import (
+    TriggerScanner, USER_MESSAGE_TRIGGERS, detect_context_triggers, extract_tags,
+    extract_tags_batch, user_message_triggers
+)
+
+
+def reference_extract(response):
+    """Tag extraction as contextual_moods did it with a regex search/sub per tag"""
+    extracted = {"personality": None, "mood": None, "clean_response": response}
+    match = re.search(r'<personality>(.*?)</personality>', response)
+    if match:
+        extracted["personality"] = match.group(1)
+        extracted["clean_response"] = re.sub(r'<personality>.*?</personality>', '', response)
+    match = re.search(r'<mood>(.*?)</mood>', response)
+    if match:
+        try:
+            extracted["mood"] = json.loads(match.group(1))
+        except ValueError:
+            extracted["mood"] = match.group(1)
+        extracted["clean_response"] = re.sub(r'<mood>.*?</mood>', '', extracted["clean_response"])
+    extracted["clean_response"] = extracted["clean_response"].strip()
+    return extracted
+
+
+def reference_detect(rules, text):
+    return [trigger for trigger, keywords in rules if any(keyword in text for keyword in keywords)]
+
+
+RESPONSES = [
+    "Plain answer with no tags.  ",
+    "<personality>GlaDOS</personality> Hello there.",
+    'Hi! <mood>{"name": "cheerful", "intensity": 3}</mood>',
+    '<personality>Penphin</personality><mood>{"name": "dreamy"}</mood> Drifting along.',
+    "<mood>not json</mood> still spoken",
+    "<personality>A</personality> twice <personality>B</personality>",
+    "<personality>multi\nline</personality> kept",
+    "<mood>unterminated tag",
+    "</mood> closing first <mood>calm</mood>",
+]
+
+
+@pytest.mark.parametrize("response", RESPONSES)
+def test_extract_tags_matches_regex_extraction(response):
+    assert extract_tags(response) == reference_extract(response)
+
+
+def test_extract_tags_batch():
+    assert extract_tags_batch(RESPONSES) == [reference_extract(response) for response in RESPONSES]
+
+
+MESSAGES = [
+    "",
+    "thanks, that was a great help with my code",
+    "i'm stuck and confused, the build is broken and not working",
+    "it's sunny and warm but i feel sad",
+    "the sunshine is bright; i dream of snowing winter storms",
+    "how does consciousness arise? explain the meaning",
+    "don't understand why the beat drops",
+    "terrible, useless, awful",
+]
+
+
+@pytest.mark.parametrize("message", MESSAGES)
+def test_user_message_scanner_matches_substring_checks(message):
+    assert user_message_triggers([message]) == [reference_detect(USER_MESSAGE_TRIGGERS, message)]
+
+
+def test_prefix_and_overlapping_keywords_are_all_credited():
+    scanner = TriggerScanner([("short", ["sun"]), ("long", ["sunny"]), ("inner", ["nny"]), ("other", ["moon"])])
+
+    assert scanner.detect("a sunny day") == ["short", "long", "inner"]
+    assert scanner.detect("sun") == ["short"]
+    assert scanner.detect("") == []
+
+
+def test_scanner_without_keywords_finds_nothing():
+    assert TriggerScanner([("empty", [])]).detect("anything") == []
+
+
+def test_context_triggers_keep_field_order():
+    context = {
+        "weather": "Clear and Chilly",
+        "time_of_day": "Evening",
+        "current_task": "Programming music",
+        "interaction_type": "compliment",
+        "user_message": "Thanks! The rain left me happy",
+    }
+
+    assert detect_context_triggers(context) == [
+        "sunny", "cold", "evening", "coding", "music", "compliment",
+        "user_happy", "compliment", "rainy"
+    ]
+
+
+def test_unknown_time_of_day_is_ignored():
+    assert detect_context_triggers({"time_of_day": "teatime"}) == []
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Research Library Store Tests
+
+Runs ResearchLibraryStore against a temporary SQLite file to check keyset
+pages neither overlap nor skip items when created_at values tie, bad
+cursors are rejected, the legacy JSON import runs once, deletes keep the
+full-text index in sync and FTS operator characters in search text are
+matched literally instead of raising.
+
+Run with: python -m pytest test_research_library_store.py
+"""
+
+import base64
+import json
+import os
+import sys
+
+import pytest
+
+# Add the api_silicon_server directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'api_silicon_server'))
+
+from research_library_store import ResearchLibraryStore
+
+
+def make_store(tmp_path, **kwargs):
+    return ResearchLibraryStore(str(tmp_path / "library" / "library.sqlite3"), **kwargs)
+
+
+def make_item(research_id, query="solar power", content=None, created_at="2026-01-01T10:00:00", **metadata):
+    return {
+        "id": research_id,
+        "query": query,
+        "content": content if content is not None else f"# {query.title()}\n\nNotes on {query}.",
+        "metadata": {"created_at": created_at, "workflow_type": "comprehensive", **metadata}
+    }
+
+
+def page_through(store, limit, **filters):
+    seen, cursor = [], None
+    while True:
+        items, cursor = store.list(limit=limit, cursor=cursor, **filters)
+        seen.extend(item["id"] for item in items)
+        if cursor is None:
+            return seen
+
+
+def test_cursor_pages_cover_tied_timestamps_exactly_once(tmp_path):
+    store = make_store(tmp_path)
+    for index in range(7):
+        store.save(make_item(f"tied-{index}", created_at="2026-01-01T10:00:00"))
+    for index in range(3):
+        store.save(make_item(f"later-{index}", created_at=f"2026-01-02T10:00:0{index}"))
+
+    seen = page_through(store, limit=3)
+
+    assert len(seen) == 10
+    assert len(set(seen)) == 10
+    assert seen[:3] == ["later-2", "later-1", "later-0"]
+    assert seen[3:] == [f"tied-{index}" for index in reversed(range(7))]
+
+
+def test_cursor_pages_respect_filters(tmp_path):
+    store = make_store(tmp_path)
+    for index in range(5):
+        store.save(make_item(f"grad-{index}", academic_level="graduate"))
+        store.save(make_item(f"ug-{index}", academic_level="undergraduate"))
+
+    assert sorted(page_through(store, limit=2, academic_level="graduate")) == [f"grad-{i}" for i in range(5)]
+
+
+def test_offset_is_honoured_without_cursor(tmp_path):
+    store = make_store(tmp_path)
+    for index in range(5):
+        store.save(make_item(f"item-{index}", created_at=f"2026-01-01T10:00:0{index}"))
+
+    items, next_cursor = store.list(limit=2, offset=2)
+    assert [item["id"] for item in items] == ["item-2", "item-1"]
+    assert next_cursor is not None
+
+
+@pytest.mark.parametrize("cursor", [
+    "not a cursor", "!!!!", "w7_Dqg==", "é",
+    base64.urlsafe_b64encode(b'["only-one"]').decode("ascii"),
+    base64.urlsafe_b64encode(b'{"created_at": "x"}').decode("ascii")
+])
+def test_malformed_cursor_raises_value_error(tmp_path, cursor):
+    store = make_store(tmp_path)
+    store.save(make_item("item"))
+
+    with pytest.raises(ValueError):
+        store.list(cursor=cursor)
+
+
+def test_legacy_json_import_runs_once_unless_forced(tmp_path):
+    legacy_dir = tmp_path / "research_library"
+    legacy_dir.mkdir()
+    for index in range(3):
+        (legacy_dir / f"item-{index}.json").write_text(json.dumps(make_item(f"item-{index}")), encoding="utf-8")
+    (legacy_dir / "broken.json").write_text("{not json", encoding="utf-8")
+
+    store = make_store(tmp_path, legacy_dir=str(legacy_dir))
+    assert store.count() == 3
+    assert store.stats["imported"] == 3
+
+    (legacy_dir / "item-3.json").write_text(json.dumps(make_item("item-3")), encoding="utf-8")
+    assert store.import_json_dir(legacy_dir) == 0
+    store.close()
+
+    reopened = make_store(tmp_path, legacy_dir=str(legacy_dir))
+    assert reopened.count() == 3
+    assert reopened.import_json_dir(legacy_dir, force=True) == 1
+    assert reopened.count() == 4
+
+
+def test_delete_and_resave_keep_fts_in_sync(tmp_path):
+    store = make_store(tmp_path)
+    if not store.fts_available:
+        pytest.skip("SQLite build without FTS5")
+    store.save(make_item("keep", query="tidal energy"))
+    store.save(make_item("drop", query="geothermal energy"))
+
+    assert store.delete("drop") is True
+    assert store.delete("drop") is False
+    items, _ = store.list(search="geothermal")
+    assert items == []
+    items, _ = store.list(search="energy")
+    assert [item["id"] for item in items] == ["keep"]
+
+    store.save(make_item("keep", query="wave power"))
+    assert store.list(search="tidal")[0] == []
+    assert [item["id"] for item in store.list(search="wave")[0]] == ["keep"]
+
+
+@pytest.mark.parametrize("search", ['"', '""', "*", "AND", "NEAR(", "solar AND", "(power", "-", "^", "OR NOT"])
+def test_fts_operators_in_search_text_do_not_raise(tmp_path, search):
+    store = make_store(tmp_path)
+    store.save(make_item("item", query="solar power"))
+
+    items, next_cursor = store.list(search=search)
+    assert isinstance(items, list)
+    assert next_cursor is None
+
+
+def test_search_matches_word_prefixes(tmp_path):
+    store = make_store(tmp_path)
+    store.save(make_item("solar", query="solar power"))
+    store.save(make_item("wind", query="wind power"))
+
+    assert [item["id"] for item in store.list(search="sol pow")[0]] == ["solar"]
+    assert sorted(item["id"] for item in store.list(search="power")[0]) == ["solar", "wind"]
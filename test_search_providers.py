@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Workflow Search Layer Tests
+
+Runs run_search over OfflineSearchProvider instances supplied through
+context["search_providers"] to check providers past the deadline are
+reported as timeouts while the rest are merged, repeat queries are served
+from the cache, cache entries expire and are evicted, and merged results
+are de-duplicated by URL and ranked across providers.
+
+Run with: python -m pytest test_search_providers.py
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+# Add the api_silicon_server directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'api_silicon_server'))
+
+FAST_CORPUS = [
+    {"title": "Sleep and memory consolidation", "url": "https://sleep.example.edu/memory",
+     "snippet": "How sleep supports memory consolidation in adults"},
+    {"title": "Gardening basics", "url": "https://garden.example.com/basics",
+     "snippet": "Soil, water and light for beginners"},
+    {"title": "Sleep deprivation", "url": "https://health.example.org/deprivation",
+     "snippet": "Effects of missing sleep on attention"}
+]
+
+SECOND_CORPUS = [
+    # Same page as the fast provider's first hit (trailing slash and case differ)
+    {"title": "Sleep and memory consolidation (mirror)", "url": "https://SLEEP.example.edu/memory/",
+     "snippet": "Mirror of the memory consolidation article"},
+    {"title": "Memory consolidation during sleep spindles", "url": "https://neuro.example.edu/spindles",
+     "snippet": "Sleep spindles and memory consolidation"}
+]
+
+
+@pytest.fixture
+def search(workflow_cwd):
+    """workflows.tools.search, imported where the workflow engine can open its logs/"""
+    from workflows.tools import search
+    return search
+
+
+@pytest.fixture
+def cache(search, monkeypatch):
+    """A fresh shared cache per test (run_search uses the module-level one)"""
+    fresh = search.SearchResultCache(ttl_seconds=60.0, max_entries=16)
+    monkeypatch.setattr(search, "search_result_cache", fresh)
+    return fresh
+
+
+def make_context(*providers, deadline=0.2):
+    return {"search_providers": list(providers), "search_deadline": deadline}
+
+
+def test_slow_provider_times_out_and_fast_results_are_merged(search, cache):
+    fast = search.OfflineSearchProvider("web", FAST_CORPUS, name="Fast")
+    slow = search.OfflineSearchProvider("web", SECOND_CORPUS, name="Slow", delay=1.0)
+    academic = search.OfflineSearchProvider("academic", name="Papers")
+    context = make_context(fast, slow, academic)
+
+    providers = search._get_providers(context, "web")
+    assert [provider.name for provider in providers] == ["Fast", "Slow"]
+
+    results, report = asyncio.run(search.run_search("sleep memory", providers, context, max_results=5))
+
+    assert report["providers"]["Fast"]["status"] == "ok"
+    assert report["providers"]["Slow"]["status"] == "timeout"
+    assert report["duration"] < 1.0
+    assert {result["source"] for result in results} == {"Fast"}
+    assert [result["url"] for result in results][:1] == ["https://sleep.example.edu/memory"]
+
+
+def test_second_call_is_served_from_cache(search, cache):
+    fast = search.OfflineSearchProvider("web", FAST_CORPUS, name="Fast")
+    context = make_context(fast)
+
+    first, first_report = asyncio.run(search.run_search("Sleep memory?", [fast], context, max_results=5))
+    fast.corpus = []  # A network call now would return nothing
+    second, second_report = asyncio.run(search.run_search("  sleep   MEMORY ", [fast], context, max_results=5))
+
+    assert first_report["providers"]["Fast"]["status"] == "ok"
+    assert second_report["providers"]["Fast"]["status"] == "cached"
+    assert [r["url"] for r in second] == [r["url"] for r in first]
+    assert cache.stats["hits"] == 1
+
+    context["search_cache_bypass"] = True
+    bypassed, bypass_report = asyncio.run(search.run_search("sleep memory", [fast], context, max_results=5))
+    assert bypass_report["providers"]["Fast"]["status"] == "ok"
+    assert bypassed == []
+
+
+def test_cache_entries_expire_after_ttl(search, cache, monkeypatch):
+    fast = search.OfflineSearchProvider("web", FAST_CORPUS, name="Fast")
+    context = make_context(fast)
+    now = [1000.0]
+    monkeypatch.setattr(search.time, "time", lambda: now[0])
+
+    asyncio.run(search.run_search("sleep", [fast], context, max_results=5))
+    now[0] += cache.ttl_seconds + 1
+    _, report = asyncio.run(search.run_search("sleep", [fast], context, max_results=5))
+
+    assert report["providers"]["Fast"]["status"] == "ok"
+    assert cache.stats["expired"] == 1
+    assert cache.stats["hits"] == 0
+
+
+def test_least_recently_used_entries_are_evicted(search, cache):
+    cache.max_entries = 2
+    fast = search.OfflineSearchProvider("web", FAST_CORPUS, name="Fast")
+    context = make_context(fast)
+
+    for query in ("sleep", "memory", "sleep", "gardening"):
+        asyncio.run(search.run_search(query, [fast], context, max_results=5))
+
+    assert cache.stats["evictions"] == 1
+    assert cache.get_status()["entries"] == 2
+    _, report = asyncio.run(search.run_search("sleep", [fast], context, max_results=5))
+    assert report["providers"]["Fast"]["status"] == "cached"
+    _, report = asyncio.run(search.run_search("memory", [fast], context, max_results=5))
+    assert report["providers"]["Fast"]["status"] == "ok"
+
+
+def test_results_are_deduplicated_by_url_and_ranked_across_providers(search, cache):
+    first = search.OfflineSearchProvider("web", FAST_CORPUS, name="First")
+    second = search.OfflineSearchProvider("web", SECOND_CORPUS, name="Second")
+    context = make_context(first, second, deadline=1.0)
+
+    results, report = asyncio.run(search.run_search("sleep memory consolidation", [first, second], context, max_results=5))
+
+    urls = [result["url"].rstrip("/").lower() for result in results]
+    assert len(urls) == len(set(urls))
+    assert urls.count("https://sleep.example.edu/memory") == 1
+    assert {result["source"] for result in results} == {"First", "Second"}
+    assert report["providers"]["Second"]["results"] == 2
+
+    scores = [result["relevance_score"] for result in results]
+    assert scores == sorted(scores, reverse=True)
+    assert [result["rank"] for result in results] == list(range(1, len(results) + 1))
+    assert results[-1]["url"] == "https://health.example.org/deprivation"
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Piper Voice Pool Tests
+
+Drives PiperVoicePool's binary fallback with a stand-in Piper executable
+(reads one line per utterance, writes a WAV file, prints its path) to check
+LRU eviction and that evicting a voice never kills an utterance in flight.
+
+Run with: python -m pytest test_voice_pool.py
+"""
+
+import os
+import stat
+import sys
+import textwrap
+import threading
+import time
+
+import pytest
+
+# Add the api_silicon_server directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'api_silicon_server'))
+
+from voice_pool import PiperVoicePool
+
+
+@pytest.fixture
+def fake_piper(tmp_path):
+    """A Piper stand-in that takes `delay` seconds per utterance"""
+    binary = tmp_path / "piper"
+    binary.write_text(textwrap.dedent(f"""\
+        #!{sys.executable}
+        import os, sys, time
+        args = sys.argv[1:]
+        output_dir = args[args.index("--output_dir") + 1]
+        delay = float(open(args[args.index("--model") + 1]).read() or 0)
+        for count, line in enumerate(sys.stdin):
+            time.sleep(delay)
+            path = os.path.join(output_dir, f"{{count}}.wav")
+            with open(path, "wb") as f:
+                f.write(b"RIFF" + line.strip().encode())
+            print(path, flush=True)
+        """))
+    binary.chmod(binary.stat().st_mode | stat.S_IEXEC)
+
+    def make_voice(name, delay=0.0):
+        model = tmp_path / f"{name}.onnx"
+        model.write_text(str(delay))
+        config = tmp_path / f"{name}.onnx.json"
+        config.write_text("{}")
+        return name, str(model), str(config)
+
+    return str(binary), make_voice
+
+
+def test_binary_voices_stay_resident(fake_piper):
+    binary, make_voice = fake_piper
+    pool = PiperVoicePool(max_voices=2, piper_binary=binary)
+    voice = make_voice("alpha")
+
+    assert pool.synthesize_with_binary(*voice, "hello there") == b"RIFFhello there"
+    assert pool.synthesize_with_binary(*voice, "again") == b"RIFFagain"
+    assert pool.stats["loads"] == 1
+    assert pool.stats["hits"] == 1
+    pool.clear()
+
+
+def test_least_recently_used_voice_is_evicted(fake_piper):
+    binary, make_voice = fake_piper
+    pool = PiperVoicePool(max_voices=2, piper_binary=binary)
+    alpha, beta, gamma = make_voice("alpha"), make_voice("beta"), make_voice("gamma")
+
+    pool.synthesize_with_binary(*alpha, "one")
+    pool.synthesize_with_binary(*beta, "two")
+    pool.synthesize_with_binary(*alpha, "three")
+    pool.synthesize_with_binary(*gamma, "four")
+
+    resident = [voice["voice"] for voice in pool.get_status()["resident_voices"]]
+    assert resident == ["gamma", "alpha"]
+    assert pool.stats["evictions"] == 1
+    pool.clear()
+
+
+def test_eviction_waits_for_in_flight_synthesis(fake_piper):
+    binary, make_voice = fake_piper
+    pool = PiperVoicePool(max_voices=1, piper_binary=binary)
+    slow = make_voice("slow", delay=0.5)
+    pool.prewarm(*slow)
+    process = pool._voices["binary:slow"].engine
+
+    result = {}
+    speaker = threading.Thread(
+        target=lambda: result.setdefault("audio", pool.synthesize_with_binary(*slow, "still talking"))
+    )
+    speaker.start()
+    time.sleep(0.1)
+
+    # Loading another voice evicts "slow" while its utterance is in flight
+    pool.synthesize_with_binary(*make_voice("fast"), "next")
+    assert "binary:slow" not in pool._voices
+    assert process.is_alive()
+
+    speaker.join(timeout=5)
+    assert result["audio"] == b"RIFFstill talking"
+    process.process.wait(timeout=5)
+    assert not process.is_alive()
+    pool.clear()
+
+
+def test_evicted_idle_process_is_closed(fake_piper):
+    binary, make_voice = fake_piper
+    pool = PiperVoicePool(max_voices=1, piper_binary=binary)
+    voice = make_voice("alpha")
+    pool.prewarm(*voice)
+    process = pool._voices["binary:alpha"].engine
+
+    assert pool.evict("alpha")
+    process.process.wait(timeout=5)
+    assert not process.is_alive()
+    assert not os.path.exists(process.output_dir)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Workflow Checkpoint Store Tests
+
+Runs WorkflowCheckpointStore against a temporary SQLite file to check step
+checkpoints and context snapshots round-trip, stale checkpoints are ignored
+when a workflow's steps change, left-over runs are flagged interrupted and
+finished runs are pruned.
+
+Run with: python -m pytest test_workflow_checkpoints.py
+"""
+
+import os
+import sys
+import time
+
+# Add the api_silicon_server directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'api_silicon_server'))
+
+from workflow_checkpoints import WorkflowCheckpointStore, snapshot_context
+
+LABELS = ["Search", "Summarize", "Write"]
+
+
+def make_store(tmp_path, **kwargs):
+    return WorkflowCheckpointStore(str(tmp_path / "checkpoints" / "store.sqlite3"), **kwargs)
+
+
+def test_begin_reports_resume_and_keeps_metadata(tmp_path):
+    store = make_store(tmp_path)
+
+    assert store.begin("run-1", "research", LABELS, "query", {"research_query": "query"}) is False
+    assert store.begin("run-1", "research", LABELS, "other", {"research_query": "other"}) is True
+
+    execution = store.get_execution("run-1")
+    assert execution["status"] == "running"
+    assert execution["input"] == "query"
+    assert execution["metadata"] == {"research_query": "query"}
+    assert execution["total_steps"] == 3
+
+
+def test_steps_and_latest_snapshot_round_trip(tmp_path):
+    store = make_store(tmp_path)
+    store.begin("run-1", "research", LABELS)
+
+    store.save_step("run-1", 0, "Search", ["result"], {"sources": 1, "progress_sink": "live"})
+    store.save_step("run-1", 1, "Summarize", {"summary": "text"}, {"sources": 1, "summary_done": True})
+
+    results, snapshot = store.load("run-1", LABELS)
+    assert results == {0: ["result"], 1: {"summary": "text"}}
+    assert snapshot == {"sources": 1, "summary_done": True}
+    assert store.get_execution("run-1")["completed_steps"] == 2
+
+
+def test_checkpoints_for_changed_steps_are_ignored(tmp_path):
+    store = make_store(tmp_path)
+    store.begin("run-1", "research", LABELS)
+    store.save_step("run-1", 0, "Search", "a")
+    store.save_step("run-1", 1, "Summarize", "b")
+
+    results, _ = store.load("run-1", ["Search", "Outline", "Write"])
+    assert results == {0: "a"}
+
+
+def test_snapshot_leaves_out_runtime_values():
+    context = {"query": "q", "count": 2, "callback": len, "progress_sink": "x", "model": object()}
+    assert snapshot_context(context) == {"query": "q", "count": 2}
+
+
+def test_restore_context_keeps_runtime_keys(tmp_path):
+    store = make_store(tmp_path)
+    context = {"checkpoint_execution_id": "live", "query": "old"}
+
+    store.restore_context(context, {"checkpoint_execution_id": "stale", "query": "new"})
+
+    assert context == {"checkpoint_execution_id": "live", "query": "new"}
+
+
+def test_mark_interrupted_flags_unfinished_runs(tmp_path):
+    store = make_store(tmp_path)
+    store.begin("running", "research", LABELS)
+    store.begin("paused", "research", LABELS)
+    store.set_status("paused", "paused", 1)
+    store.begin("done", "research", LABELS)
+    store.finish("done", True, result="report")
+
+    assert store.mark_interrupted() == 2
+    assert store.get_execution("running")["status"] == "interrupted"
+    assert store.get_execution("paused")["status"] == "interrupted"
+    assert store.get_execution("done")["status"] == "completed"
+    assert store.get_result("done") == "report"
+    assert store.mark_interrupted() == 0
+
+
+def test_prune_drops_only_expired_finished_runs(tmp_path):
+    store = make_store(tmp_path, retention_days=0)
+    store.begin("old", "research", LABELS)
+    store.save_step("old", 0, "Search", "a")
+    store.finish("old", False, error="boom")
+    store.begin("active", "research", LABELS)
+    time.sleep(0.01)
+
+    assert store.prune() == 1
+    assert store.get_execution("old") is None
+    assert store.load("old") == ({}, None)
+    assert store.get_execution("active")["status"] == "running"
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Workflow Progress Hub Tests
+
+Subscribes to WorkflowProgressHub executions to check missed events are
+replayed before live ones, live events reach open streams, streams close
+after the terminal event and a reconnect with the terminal event's id
+closes straight away instead of sending heartbeats forever.
+
+Run with: python -m pytest test_workflow_progress.py
+"""
+
+import asyncio
+import os
+import sys
+
+# Add the api_silicon_server directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'api_silicon_server'))
+
+from workflow_progress import WorkflowProgressHub
+
+
+async def collect(hub, execution_id, last_event_id=0, timeout=1.0):
+    """Event types (None for heartbeats) a subscriber receives before its stream ends"""
+    received = []
+
+    async def follow():
+        async for event in hub.subscribe(execution_id, last_event_id):
+            received.append(event["type"] if event else None)
+
+    await asyncio.wait_for(follow(), timeout)
+    return received
+
+
+def test_backlog_is_replayed_after_last_event_id():
+    hub = WorkflowProgressHub(heartbeat_seconds=0.05)
+    hub.start("run", research_query="query")
+    hub.publish("run", "step_start", {"step": 0})
+    hub.publish("run", "step_completion", {"step": 0})
+    hub.finish("run", {"status": "success"})
+
+    assert asyncio.run(collect(hub, "run")) == ["workflow_start", "step_start", "step_completion", "workflow_complete"]
+    assert asyncio.run(collect(hub, "run", last_event_id=2)) == ["step_completion", "workflow_complete"]
+
+
+def test_live_events_reach_open_streams_until_terminal():
+    hub = WorkflowProgressHub(heartbeat_seconds=0.05)
+    hub.start("run")
+
+    async def run():
+        stream = asyncio.ensure_future(collect(hub, "run"))
+        await asyncio.sleep(0.12)
+        hub.publish("run", "step_start", {"step": 0})
+        await asyncio.sleep(0.01)
+        hub.finish("run", {"status": "error"}, success=False)
+        return await stream
+
+    received = asyncio.run(run())
+    events = [event for event in received if event is not None]
+    assert events == ["workflow_start", "step_start", "workflow_failed"]
+    assert None in received  # Heartbeats while idle
+    assert hub.get("run").subscribers == []
+
+
+def test_reconnect_after_terminal_event_closes_immediately():
+    hub = WorkflowProgressHub(heartbeat_seconds=0.01)
+    hub.start("run")
+    hub.publish("run", "step_start", {"step": 0})
+    hub.finish("run", {"status": "success"})
+    terminal_id = hub.get("run").events[-1]["id"]
+
+    assert asyncio.run(collect(hub, "run", last_event_id=terminal_id, timeout=0.5)) == []
+    assert asyncio.run(collect(hub, "run", last_event_id=terminal_id + 5, timeout=0.5)) == []
+    assert hub.get("run").subscribers == []
+
+
+def test_finished_run_with_dropped_terminal_event_still_closes():
+    hub = WorkflowProgressHub(heartbeat_seconds=0.01, max_events=2)
+    hub.start("run")
+    hub.finish("run", {"status": "success"})
+    for index in range(3):
+        hub.publish("run", "section_text", {"index": index})
+    last_id = hub.get("run").events[-1]["id"]
+
+    assert asyncio.run(collect(hub, "run", last_event_id=last_id, timeout=0.5)) == []
+
+
+def test_unknown_execution_yields_nothing():
+    hub = WorkflowProgressHub(heartbeat_seconds=0.01)
+    assert asyncio.run(collect(hub, "missing", timeout=0.5)) == []
+
+
+def test_resumed_run_continues_event_ids():
+    hub = WorkflowProgressHub(heartbeat_seconds=0.01)
+    hub.start("run")
+    hub.publish("run", "step_start", {"step": 0})
+    hub.finish("run", {"status": "error"}, success=False)
+    followed_to = hub.get("run").events[-1]["id"]
+
+    hub.start("run", resumed_steps=1)
+    hub.publish("run", "step_start", {"step": 1})
+    hub.finish("run", {"status": "success"})
+
+    resumed = hub.get("run").events
+    assert resumed[0]["id"] == followed_to + 1
+    assert asyncio.run(collect(hub, "run", last_event_id=followed_to)) == [
+        "workflow_start", "step_start", "workflow_complete"
+    ]